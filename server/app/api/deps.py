@@ -1,19 +1,22 @@
-from fastapi import Depends, HTTPException, status, Security
+import hmac
+
+from fastapi import Depends, Header, HTTPException, status, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.db.async_session import get_async_db
 from app.db.session import get_db
 from app.lib.jwt import decode_token
 from app.repository import user as user_repository
+from app.repository.aio import user as aio_user_repository
 from app.constants.user_types import UserType
+from app.core.config import settings
 
 security_scheme = HTTPBearer(auto_error=True)
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Security(security_scheme),
-    db: Session = Depends(get_db),
-):
+def _token_subject(credentials: HTTPAuthorizationCredentials) -> str:
     if not credentials or credentials.scheme.lower() != "bearer":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
@@ -21,21 +24,50 @@ def get_current_user(
     payload = decode_token(token)
     if not payload or "sub" not in payload:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return payload["sub"]
+
 
-    email = payload["sub"]
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Security(security_scheme),
+    db: Session = Depends(get_db),
+):
+    email = _token_subject(credentials)
     user = user_repository.get_user_by_email(db, email=email)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
 
 
-def require_recruiter(user=Depends(get_current_user)):
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Security(security_scheme),
+    db: AsyncSession = Depends(get_async_db),
+):
+    email = _token_subject(credentials)
+    user = await aio_user_repository.get_user_by_email(db, email=email)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    return user
+
+
+# the role checks below resolve the user on the engine of the configured DB_MODE
+_current_user = get_current_user_async if settings.DB_MODE == "async" else get_current_user
+
+
+async def require_recruiter(user=Depends(_current_user)):
     if str(user.user_type) != UserType.RECRUITER.value:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only recruiters are allowed for this action")
     return user
 
 
-def require_applicant(user=Depends(get_current_user)):
+async def require_applicant(user=Depends(_current_user)):
     if str(user.user_type) != UserType.APPLICANT.value:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only applicants are allowed for this action")
     return user
+
+
+def require_internal_token(x_internal_token: str | None = Header(default=None)):
+    # Internal endpoints are invisible unless a token is configured
+    if not settings.INTERNAL_METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_internal_token or not hmac.compare_digest(x_internal_token, settings.INTERNAL_METRICS_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal token")
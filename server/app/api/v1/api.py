@@ -1,6 +1,11 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, companies, user, files, job_listings, recruiter, applications, applicant
+from app.core.config import settings
+from app.api.v1.endpoints import auth, companies, user, files, job_listings, recruiter, applications, applicant, internal, saved_searches, search
+
+if settings.DB_MODE == "async":
+    # same paths served by coroutines on the asyncpg engine
+    from app.api.v1.endpoints.aio import auth, companies, user, job_listings, recruiter, applications, applicant
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -11,3 +16,6 @@ api_router.include_router(job_listings.router, prefix="/job-listings", tags=["jo
 api_router.include_router(recruiter.router, prefix="/recruiter", tags=["recruiter"])
 api_router.include_router(applications.router, prefix="/applications", tags=["applications"])
 api_router.include_router(applicant.router, prefix="/applicant", tags=["applicant"])
+api_router.include_router(saved_searches.router, prefix="/saved-searches", tags=["saved_searches"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(internal.router, prefix="/internal", tags=["internal"])
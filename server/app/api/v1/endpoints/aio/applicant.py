@@ -0,0 +1,15 @@
+from typing import List
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_applicant
+from app.db.async_session import get_async_db
+from app.controllers.aio.application import list_my_applications_controller
+from app.schemas.application import MyApplicationListItem
+
+router = APIRouter()
+
+
+@router.get("/applications", response_model=List[MyApplicationListItem])
+async def list_my_applications(current_user=Depends(require_applicant), db: AsyncSession = Depends(get_async_db)):
+    return await list_my_applications_controller(db, current_user=current_user)
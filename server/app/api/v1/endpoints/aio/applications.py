@@ -0,0 +1,72 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_recruiter
+from app.api.v1.endpoints import applications as sync_endpoints
+from app.db.async_session import get_async_db
+from app.controllers.aio import application as app_controller
+from app.schemas.application import (
+    ApplicationListItem,
+    ApplicationsQuery,
+    BulkUpdateApplicationStatusRequest,
+    BulkUpdateApplicationStatusResponse,
+    PagedApplicationsResponse,
+    UpdateApplicationStatusRequest,
+    UpdateApplicationStatusResponse,
+)
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[ApplicationListItem])
+async def list_applications(
+    job_id: UUID = Query(..., description="Job ID to fetch applications for"),
+    db: AsyncSession = Depends(get_async_db),
+    _=Depends(require_recruiter),
+):
+    return await app_controller.list_applications_for_job_controller(db, job_id=job_id)
+
+
+@router.get("/page", response_model=PagedApplicationsResponse)
+async def list_applications_page(
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter),
+    params: ApplicationsQuery = Depends(),
+):
+    return await app_controller.list_applications_page_controller(db, current_user=current_user, query=params)
+
+
+router.add_api_route("/export", sync_endpoints.export_applications, methods=["GET"])
+
+
+@router.patch("/bulk", response_model=BulkUpdateApplicationStatusResponse)
+async def bulk_update_applications(
+    payload: BulkUpdateApplicationStatusRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter),
+):
+    return await app_controller.bulk_update_application_status_controller(
+        db,
+        current_user=current_user,
+        updates=[(u.application_id, u.status) for u in payload.updates],
+        application_ids=payload.application_ids,
+        status_value=payload.status,
+    )
+
+
+@router.patch("/{application_id}", response_model=UpdateApplicationStatusResponse)
+async def update_application(
+    application_id: UUID,
+    payload: UpdateApplicationStatusRequest,
+    db: AsyncSession = Depends(get_async_db),
+    _=Depends(require_recruiter),
+):
+    await app_controller.update_application_status_controller(
+        db,
+        application_id=application_id,
+        status_value=payload.status,
+    )
+    return {"message": "Application status updated"}
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, status, Response, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.endpoints.auth import logout
+from app.schemas.user import UserCreate, UserRegisterResponse, Token, UserLogin
+from app.db.async_session import get_async_db
+from app.controllers.aio import auth as auth_controller
+
+router = APIRouter()
+
+
+@router.post("/register", response_model=UserRegisterResponse, status_code=status.HTTP_201_CREATED)
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    new_user = await auth_controller.register_user_controller(db, user=user)
+    return {"message": "User registered successfully", "user_id": new_user.user_id}
+
+
+@router.post("/login", response_model=Token)
+async def login_for_access_token(response: Response, user_login: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    return await auth_controller.login_controller(response, db=db, user_login=user_login)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(request: Request, db: AsyncSession = Depends(get_async_db)):
+    return await auth_controller.refresh_access_token_controller(request, db=db)
+
+
+router.add_api_route("/logout", logout, methods=["POST"])
@@ -0,0 +1,50 @@
+from uuid import UUID
+from anyio import to_thread
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_recruiter
+from app.db.async_session import get_async_db
+from app.repository.aio import company as company_repository
+from app.schemas.company import CompanyCreate, CompanyUpdate, CompanyResponse
+from app.search.suggest import get_suggester
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[CompanyResponse])
+async def list_companies(db: AsyncSession = Depends(get_async_db)):
+    return await company_repository.list_companies(db)
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+async def create_company(
+    company_in: CompanyCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter),
+):
+    company = await company_repository.create_company(
+        db, recruiter_user_id=current_user.user_id, company_in=company_in
+    )
+    await to_thread.run_sync(get_suggester().apply_companies, [company])
+    return {"message": "Company profile created successfully", "company_id": company.company_id}
+
+
+@router.get("/{company_id}", response_model=CompanyResponse)
+async def get_company(company_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    company = await company_repository.get_company(db, company_id)
+    if not company:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
+    return company
+
+
+@router.put("/{company_id}")
+async def update_company(
+    company_id: UUID,
+    company_update: CompanyUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_recruiter),
+):
+    company = await company_repository.update_company(db, company_id, company_update, current_user)
+    await to_thread.run_sync(get_suggester().apply_companies, [company])
+    return {"message": "Company profile updated successfully", "company": company}
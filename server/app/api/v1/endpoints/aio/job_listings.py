@@ -0,0 +1,157 @@
+"""``/job-listings`` routes for ``DB_MODE=async``.
+
+Export streams from its own sync session, and similar/matches/recommended read
+in-memory indexes that rebuild under thread locks, so those four routes are the
+sync handlers from ``app.api.v1.endpoints.job_listings`` (threadpool). They are
+registered here in the same order so ``/{job_id}`` doesn't shadow them.
+"""
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, BackgroundTasks, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user_async, require_recruiter, require_applicant
+from app.api.v1.endpoints import job_listings as sync_endpoints
+from app.db.async_session import get_async_db
+from app.db.session import get_session_factory
+from app.controllers.aio import job_listing as controller
+from app.controllers.aio import application as application_controller
+from app.controllers import saved_search as saved_search_controller
+from app.schemas.job_listing import (
+    JobListingCreate,
+    JobListingUpdate,
+    JobListingResponse,
+    JobListingsQuery,
+    JobListingFacetsResponse,
+    JobListingListItem,
+    JobRecommendationsResponse,
+    ListView,
+    PagedJobListingsResponse,
+    PagedJobMatchesResponse,
+    SimilarJobsResponse,
+)
+from app.schemas.application import ApplyRequest, ApplyResponse, ApplicationStatusResponse
+
+router = APIRouter()
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+async def create_job_listing(
+    payload: JobListingCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    session_factory=Depends(get_session_factory),
+    current_user=Depends(require_recruiter),
+):
+    job = await controller.create_job_listing_controller(
+        db,
+        current_user=current_user,
+        payload=payload.model_dump(),
+    )
+    background_tasks.add_task(saved_search_controller.percolate_job_listing_controller, session_factory, job.job_id)
+    return {"message": "Job listing created successfully", "job_id": job.job_id}
+
+
+@router.put("/{job_id}")
+async def update_job_listing(
+    job_id: UUID,
+    payload: JobListingUpdate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    session_factory=Depends(get_session_factory),
+    current_user=Depends(require_recruiter),
+):
+    update_data = payload.model_dump(exclude_unset=True)
+    await controller.update_job_listing_controller(
+        db,
+        current_user=current_user,
+        job_id=job_id,
+        update_data=update_data,
+    )
+    if update_data.get("status") == "open":
+        background_tasks.add_task(saved_search_controller.percolate_job_listing_controller, session_factory, job_id)
+    return {"message": "Job listing updated successfully"}
+
+
+@router.get("/", response_model=List[JobListingListItem])
+async def list_job_listings(
+    db: AsyncSession = Depends(get_async_db),
+    company_id: Optional[UUID] = None,
+    limit: Optional[int] = None,
+    view: ListView = "full",
+    fields: Optional[str] = None,
+):
+    jobs = await controller.list_job_listings_controller(db, company_id=company_id, limit=limit, view=view, fields=fields)
+    return sync_endpoints.sparse_response(jobs, fields=fields)
+
+
+router.add_api_route("/export", sync_endpoints.export_job_listings, methods=["GET"])
+
+
+@router.get("/feed", response_model=PagedJobListingsResponse)
+async def list_job_listings_feed(
+    db: AsyncSession = Depends(get_async_db),
+    _=Depends(get_current_user_async),
+    params: JobListingsQuery = Depends(),
+):
+    items, next_cursor = await controller.list_job_listings_paged_controller(db, query=params)
+    response = {"items": items, "next_cursor": next_cursor}
+    if params.include_total:
+        response["total"] = await controller.job_listing_total_controller(db, query=params)
+        response["total_is_estimate"] = params.include_total == "estimate"
+    return sync_endpoints.sparse_response(response, fields=params.fields, items_key="items", model=PagedJobListingsResponse)
+
+
+@router.get("/facets", response_model=JobListingFacetsResponse)
+async def job_listing_facets(
+    db: AsyncSession = Depends(get_async_db),
+    _=Depends(get_current_user_async),
+    params: JobListingsQuery = Depends(),
+):
+    return await controller.job_listing_facets_controller(db, query=params)
+
+
+router.add_api_route("/matches", sync_endpoints.list_job_matches, methods=["GET"], response_model=PagedJobMatchesResponse)
+router.add_api_route(
+    "/recommended", sync_endpoints.list_job_recommendations, methods=["GET"], response_model=JobRecommendationsResponse
+)
+
+
+@router.get("/{job_id}", response_model=JobListingResponse)
+async def get_job_listing(job_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    return await controller.get_job_listing_controller(db, job_id=job_id)
+
+
+router.add_api_route(
+    "/{job_id}/similar", sync_endpoints.list_similar_job_listings, methods=["GET"], response_model=SimilarJobsResponse
+)
+
+
+@router.post("/{job_id}/apply", status_code=status.HTTP_201_CREATED, response_model=ApplyResponse)
+async def apply_to_job(
+    job_id: UUID,
+    payload: ApplyRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_applicant),
+):
+    app = await application_controller.apply_to_job_controller(
+        db,
+        current_user=current_user,
+        job_id=job_id,
+        cover_letter=payload.cover_letter,
+    )
+    return {"message": "Application submitted successfully", "application_id": app.application_id}
+
+
+@router.get("/{job_id}/application/me", response_model=ApplicationStatusResponse)
+async def get_my_application_status(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_applicant),
+):
+    return await application_controller.get_my_application_status_controller(
+        db,
+        current_user=current_user,
+        job_id=job_id,
+    )
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_recruiter
+from app.db.async_session import get_async_db
+from app.controllers.aio.dashboard import get_recruiter_dashboard_stats_controller
+from app.schemas.dashboard import RecruiterDashboardStats
+
+router = APIRouter()
+
+
+@router.get("/dashboard/stats", response_model=RecruiterDashboardStats)
+async def get_dashboard_stats(current_user=Depends(require_recruiter), db: AsyncSession = Depends(get_async_db)):
+    return await get_recruiter_dashboard_stats_controller(db, current_user=current_user)
@@ -0,0 +1,43 @@
+from typing import Union
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user_async
+from app.db.async_session import get_async_db
+from app.schemas.user import (
+    UserProfileApplicantResponse,
+    UserProfileRecruiterResponse,
+    UpdateUserProfile,
+)
+from app.controllers.aio.user import (
+    get_profile_me_controller,
+    update_profile_me_controller,
+    get_profile_by_user_id_controller,
+)
+
+router = APIRouter()
+
+
+@router.get("/me", response_model=Union[UserProfileApplicantResponse, UserProfileRecruiterResponse])
+async def get_me(current_user=Depends(get_current_user_async), db: AsyncSession = Depends(get_async_db)):
+    return await get_profile_me_controller(db, current_user=current_user)
+
+
+@router.put("/me")
+async def update_me(
+    update: UpdateUserProfile,
+    current_user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await update_profile_me_controller(db, current_user=current_user, update=update)
+
+
+@router.get("/{user_id}", response_model=Union[UserProfileApplicantResponse, UserProfileRecruiterResponse])
+async def get_user_by_id(
+    user_id: UUID,
+    current_user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await get_profile_by_user_id_controller(db, user_id=user_id)
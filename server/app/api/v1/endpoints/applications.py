@@ -1,15 +1,22 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, require_recruiter
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
+from app.lib.export import MEDIA_TYPES
 from app.repository import application as repo
 from app.controllers import application as app_controller
 from app.schemas.application import (
     ApplicationListItem,
+    ApplicationStatus,
+    ApplicationsQuery,
+    BulkUpdateApplicationStatusRequest,
+    BulkUpdateApplicationStatusResponse,
+    PagedApplicationsResponse,
     UpdateApplicationStatusRequest,
     UpdateApplicationStatusResponse,
 )
@@ -26,6 +33,50 @@ def list_applications(
     return app_controller.list_applications_for_job_controller(db, job_id=job_id)
 
 
+@router.get("/page", response_model=PagedApplicationsResponse)
+def list_applications_page(
+    db: Session = Depends(get_db),
+    current_user=Depends(require_recruiter),
+    params: ApplicationsQuery = Depends(),
+):
+    return app_controller.list_applications_page_controller(db, current_user=current_user, query=params)
+
+
+@router.get("/export")
+def export_applications(
+    job_id: UUID = Query(..., description="Job ID to export applicants for"),
+    status_filter: Optional[ApplicationStatus] = Query(None, alias="status"),
+    format: Literal["csv", "zip"] = "csv",
+    session_factory=Depends(get_session_factory),
+    current_user=Depends(require_recruiter),
+):
+    # zip: applicants.csv plus each applicant's uploaded resume under resumes/
+    body = app_controller.export_applications_controller(
+        session_factory, current_user=current_user, job_id=job_id, status_value=status_filter, fmt=format
+    )
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="applications-{job_id}.{format}"'},
+    )
+
+
+@router.patch("/bulk", response_model=BulkUpdateApplicationStatusResponse)
+def bulk_update_applications(
+    payload: BulkUpdateApplicationStatusRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_recruiter),
+):
+    # declared before /{application_id}, which would otherwise take "bulk" as an id
+    return app_controller.bulk_update_application_status_controller(
+        db,
+        current_user=current_user,
+        updates=[(u.application_id, u.status) for u in payload.updates],
+        application_ids=payload.application_ids,
+        status_value=payload.status,
+    )
+
+
 @router.patch("/{application_id}", response_model=UpdateApplicationStatusResponse)
 def update_application(
     application_id: UUID,
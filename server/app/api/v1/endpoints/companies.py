@@ -6,6 +6,7 @@ from app.api.deps import require_recruiter
 from app.db.session import get_db
 from app.repository import company as company_repository
 from app.schemas.company import CompanyCreate, CompanyUpdate, CompanyResponse
+from app.search.suggest import get_suggester
 
 router = APIRouter()
 
@@ -24,6 +25,7 @@ def create_company(
     company = company_repository.create_company(
         db, recruiter_user_id=current_user.user_id, company_in=company_in
     )
+    get_suggester().apply_companies([company])
     return {"message": "Company profile created successfully", "company_id": company.company_id}
 
 
@@ -43,4 +45,5 @@ def update_company(
     current_user=Depends(require_recruiter),
 ):
     company = company_repository.update_company(db, company_id, company_update, current_user)
+    get_suggester().apply_companies([company])
     return {"message": "Company profile updated successfully", "company": company}
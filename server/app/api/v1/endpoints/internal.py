@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+
+from app.api.deps import require_internal_token
+from app.db import async_session
+from app.db.pool import pool_status
+from app.db.session import engine, replica_engines
+from app.lib.cache import cache_metrics
+from app.tasks.apply_batcher import get_apply_batcher
+
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    metrics = {"caches": cache_metrics(), "db_pool": pool_status(engine.pool)}
+    if replica_engines:
+        metrics["db_replica_pools"] = [pool_status(replica.pool) for replica in replica_engines]
+    if async_session._engine is not None:
+        metrics["db_pool_async"] = pool_status(async_session._engine.pool)
+        async_replicas = async_session.get_async_replica_engines()
+        if async_replicas:
+            metrics["db_replica_pools_async"] = [pool_status(replica.pool) for replica in async_replicas]
+    apply_batcher = get_apply_batcher()
+    if apply_batcher.running:
+        metrics["apply_batches"] = apply_batcher.stats()
+    return metrics
@@ -1,29 +1,54 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, require_recruiter, require_applicant
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
+from app.lib.export import MEDIA_TYPES
 from app.controllers import job_listing as controller
 from app.controllers import application as application_controller
+from app.controllers import saved_search as saved_search_controller
 from app.schemas.job_listing import (
     JobListingCreate,
     JobListingUpdate,
     JobListingResponse,
     JobListingsQuery,
+    JobListingFacetsResponse,
+    JobListingListItem,
+    JobRecommendationsResponse,
+    ListView,
     PagedJobListingsResponse,
+    PagedJobMatchesResponse,
+    SimilarJobsResponse,
 )
 from app.schemas.application import ApplyRequest, ApplyResponse, ApplicationStatusResponse
 
 router = APIRouter()
 
 
+def sparse_response(content, *, fields: Optional[str], items_key: Optional[str] = None, model=None):
+    """fields= items are already pruned to the selection. Validated against the item union, a selection
+    that happens to satisfy a fuller member would come back with that member's unrequested keys as
+    null, so they bypass response_model; the rest of a paged body still goes through ``model``."""
+    if not fields:
+        return content
+    if items_key is None:
+        return JSONResponse(jsonable_encoder(content))
+    body = model.model_validate({**content, items_key: []}).model_dump(mode="json")
+    body[items_key] = jsonable_encoder(content[items_key])
+    return JSONResponse(body)
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 def create_job_listing(
     payload: JobListingCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
+    session_factory=Depends(get_session_factory),
     current_user=Depends(require_recruiter),
 ):
     job = controller.create_job_listing_controller(
@@ -31,6 +56,8 @@ def create_job_listing(
         current_user=current_user,
         payload=payload.model_dump(),
     )
+    # saved-search alerts are matched after the response is sent
+    background_tasks.add_task(saved_search_controller.percolate_job_listing_controller, session_factory, job.job_id)
     return {"message": "Job listing created successfully", "job_id": job.job_id}
 
 
@@ -38,26 +65,58 @@ def create_job_listing(
 def update_job_listing(
     job_id: UUID,
     payload: JobListingUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
+    session_factory=Depends(get_session_factory),
     current_user=Depends(require_recruiter),
 ):
+    update_data = payload.model_dump(exclude_unset=True)
     controller.update_job_listing_controller(
         db,
         current_user=current_user,
         job_id=job_id,
-        update_data=payload.model_dump(exclude_unset=True),
+        update_data=update_data,
     )
+    # a (re)opened posting is matched against saved searches like a new one; percolation skips searches
+    # already alerted for it, so re-sending status=open on an open posting only queues new matches
+    if update_data.get("status") == "open":
+        background_tasks.add_task(saved_search_controller.percolate_job_listing_controller, session_factory, job_id)
     return {"message": "Job listing updated successfully"}
 
 
-@router.get("/", response_model=List[JobListingResponse])
+@router.get("/", response_model=List[JobListingListItem])
 def list_job_listings(
     db: Session = Depends(get_db),
     company_id: Optional[UUID] = None,
     limit: Optional[int] = None,
+    view: ListView = "full",
+    fields: Optional[str] = None,
+):
+    jobs = controller.list_job_listings_controller(db, company_id=company_id, limit=limit, view=view, fields=fields)
+    return sparse_response(jobs, fields=fields)
+
+
+@router.get("/export")
+def export_job_listings(
+    session_factory=Depends(get_session_factory),
+    _=Depends(get_current_user),
+    company_id: Optional[UUID] = None,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    view: ListView = "full",
+    fields: Optional[str] = None,
 ):
-    jobs = controller.list_job_listings_controller(db, company_id=company_id, limit=limit)
-    return jobs
+    body = controller.export_job_listings_controller(
+        session_factory,
+        company_id=company_id,
+        fmt=format,
+        view=view,
+        fields=fields,
+    )
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="job-listings.{format}"'},
+    )
 
 
 @router.get("/feed", response_model=PagedJobListingsResponse)
@@ -67,15 +126,55 @@ def list_job_listings_feed(
     params: JobListingsQuery = Depends(),
 ):
     items, next_cursor = controller.list_job_listings_paged_controller(db, query=params)
+    response = {"items": items, "next_cursor": next_cursor}
+    if params.include_total:
+        response["total"] = controller.job_listing_total_controller(db, query=params)
+        response["total_is_estimate"] = params.include_total == "estimate"
+    return sparse_response(response, fields=params.fields, items_key="items", model=PagedJobListingsResponse)
+
+
+@router.get("/facets", response_model=JobListingFacetsResponse)
+def job_listing_facets(
+    db: Session = Depends(get_db),
+    _=Depends(get_current_user),
+    params: JobListingsQuery = Depends(),
+):
+    return controller.job_listing_facets_controller(db, query=params)
+
+
+@router.get("/matches", response_model=PagedJobMatchesResponse)
+def list_job_matches(
+    db: Session = Depends(get_db),
+    current_user=Depends(require_applicant),
+    limit: int = 20,
+    cursor: Optional[str] = None,
+):
+    items, next_cursor = controller.list_job_matches_controller(db, current_user=current_user, limit=limit, cursor=cursor)
     return {"items": items, "next_cursor": next_cursor}
 
 
+@router.get("/recommended", response_model=JobRecommendationsResponse)
+def list_job_recommendations(
+    db: Session = Depends(get_db),
+    current_user=Depends(require_applicant),
+    limit: int = 20,
+):
+    items = controller.list_job_recommendations_controller(db, current_user=current_user, limit=limit)
+    return {"items": items}
+
+
 @router.get("/{job_id}", response_model=JobListingResponse)
 def get_job_listing(job_id: UUID, db: Session = Depends(get_db)):
     job = controller.get_job_listing_controller(db, job_id=job_id)
     return job
 
 
+@router.get("/{job_id}/similar", response_model=SimilarJobsResponse)
+def list_similar_job_listings(job_id: UUID, db: Session = Depends(get_db), limit: int = 10):
+    items = controller.list_similar_job_listings_controller(db, job_id=job_id, limit=limit)
+    return {"items": items}
+
+
 @router.post("/{job_id}/apply", status_code=status.HTTP_201_CREATED, response_model=ApplyResponse)
 def apply_to_job(
     job_id: UUID,
@@ -0,0 +1,47 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import require_applicant
+from app.controllers import saved_search as controller
+from app.db.session import get_db
+from app.schemas.saved_search import SavedSearchCreate, SavedSearchCreated, SavedSearchResponse, SearchAlertsResponse
+
+router = APIRouter()
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=SavedSearchCreated)
+def create_saved_search(
+    payload: SavedSearchCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_applicant),
+):
+    search = controller.create_saved_search_controller(db, current_user=current_user, payload=payload.model_dump())
+    return {"message": "Saved search created successfully", "saved_search_id": search.saved_search_id}
+
+
+@router.get("/", response_model=List[SavedSearchResponse])
+def list_saved_searches(db: Session = Depends(get_db), current_user=Depends(require_applicant)):
+    return controller.list_saved_searches_controller(db, current_user=current_user)
+
+
+@router.get("/alerts", response_model=SearchAlertsResponse)
+def claim_search_alerts(
+    db: Session = Depends(get_db),
+    current_user=Depends(require_applicant),
+    limit: int = 20,
+):
+    items = controller.claim_search_alerts_controller(db, current_user=current_user, limit=limit)
+    return {"items": items}
+
+
+@router.delete("/{saved_search_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_saved_search(
+    saved_search_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_applicant),
+):
+    controller.delete_saved_search_controller(db, current_user=current_user, saved_search_id=saved_search_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
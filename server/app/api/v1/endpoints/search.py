@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Query
+
+from app.controllers import search as controller
+from app.schemas.search import SuggestResponse
+
+router = APIRouter()
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+def suggest(
+    prefix: str = Query(..., min_length=1, max_length=100, description="What the user has typed so far"),
+    limit: int = 8,
+):
+    # deliberately no DB session: suggestions come from the in-memory trie on every keystroke
+    return {"prefix": prefix, "items": controller.suggest_controller(prefix=prefix, limit=limit)}
@@ -9,6 +9,9 @@ RESUME_DIR = STATIC_DIR / "resumes"
 PROFILE_PICTURE_DIR = STATIC_DIR / "profile_pictures"
 COMPANY_LOGO_DIR = STATIC_DIR / "company_logos"
 
+# Local (non-served) runtime data such as search index snapshots
+DATA_DIR = APP_DIR / "data"
+
 
 def ensure_static_dirs() -> None:
     """Create static folders if they don't exist."""
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.controllers.application import (
+    _apply_batch_timeout,
+    _bulk_results,
+    _bulk_statuses,
+    _ensure_job_owner,
+    _page_args,
+    _recruiter_company_id,
+)
+from app.db.routing import mark_written
+from app.repository.aio import application as repo
+from app.repository.aio.company import get_recruiter_by_user_id
+from app.schemas.application import ApplicationsQuery
+from app.tasks.apply_batcher import get_apply_batcher
+
+logger = logging.getLogger("app.controllers.aio.application")
+
+
+async def apply_to_job_controller(
+    db: AsyncSession,
+    *,
+    current_user,
+    job_id: UUID,
+    cover_letter: str | None,
+):
+    logger.info("apply_to_job: user=%s job_id=%s", getattr(current_user, "user_id", None), job_id)
+    # One statement checks the job (exists, open), the applicant profile and inserts; the unique
+    # (job_id, applicant_id) index makes a duplicate, including a concurrent one, insert nothing
+    batcher = get_apply_batcher()
+    future = None
+    if batcher.running:
+        await db.close()  # the connection goes back to the pool while the batch is written
+        future = batcher.submit(job_id, current_user.user_id, cover_letter)  # None once stopping
+    if future is not None:
+        try:
+            outcome = await asyncio.wait_for(asyncio.wrap_future(future), batcher.result_timeout)
+        except TimeoutError:
+            raise _apply_batch_timeout(current_user, job_id)
+        mark_written()
+    else:
+        outcome = await repo.apply_to_job(db, job_id=job_id, user_id=current_user.user_id, cover_letter=cover_letter)
+    if outcome.job_open is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job listing not found")
+    if not outcome.has_profile:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Applicant profile not found")
+    if not outcome.job_open:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Job listing is not open for applications")
+    if outcome.application_id is None:
+        logger.warning("duplicate_application: applicant_id=%s job_id=%s", current_user.user_id, job_id)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Already applied to this job")
+
+    logger.info("application_created: application_id=%s", outcome.application_id)
+    return outcome
+
+
+async def get_my_application_status_controller(
+    db: AsyncSession,
+    *,
+    current_user,
+    job_id: UUID,
+):
+    logger.debug("get_my_application_status: user=%s job_id=%s", getattr(current_user, "user_id", None), job_id)
+    await repo.ensure_job_exists(db, job_id=job_id)
+    applicant = await repo.ensure_applicant_profile(db, user_id=current_user.user_id)
+
+    app = await repo.get_application_by_job_and_applicant(db, job_id=job_id, applicant_id=applicant.applicant_id)
+    if not app:
+        logger.info("application_status: not_applied applicant_id=%s job_id=%s", applicant.applicant_id, job_id)
+        return {"has_applied": False, "application_id": None, "status": None}
+    payload = {"has_applied": True, "application_id": app.application_id, "status": str(app.status)}
+    logger.info("application_status: %s", payload)
+    return payload
+
+
+async def list_my_applications_controller(
+    db: AsyncSession,
+    *,
+    current_user,
+):
+    logger.debug("list_my_applications: user=%s", getattr(current_user, "user_id", None))
+    applicant = await repo.ensure_applicant_profile(db, user_id=current_user.user_id)
+    items = await repo.list_applications_for_applicant(db, applicant_id=applicant.applicant_id)
+    logger.info("list_my_applications: applicant_id=%s count=%d", applicant.applicant_id, len(items))
+    return items
+
+
+async def list_applications_for_job_controller(
+    db: AsyncSession,
+    *,
+    job_id: UUID,
+):
+    """Recruiter-facing: list applications for a given job."""
+    logger.debug("list_applications_for_job: job_id=%s", job_id)
+    await repo.ensure_job_exists(db, job_id=job_id)
+    items = await repo.list_applications_for_job(db, job_id=job_id)
+    logger.info("list_applications_for_job: job_id=%s count=%d", job_id, len(items))
+    return items
+
+
+async def list_applications_page_controller(
+    db: AsyncSession,
+    *,
+    current_user,
+    query: ApplicationsQuery,
+):
+    """Recruiter-facing: a filtered page of a job's applications, with per-status counts on the first page."""
+    args = _page_args(query)
+    logger.debug("list_applications_page: %s", args)
+    job = await repo.ensure_job_exists(db, job_id=query.job_id)
+    _ensure_job_owner(
+        await get_recruiter_by_user_id(db, current_user.user_id),
+        job,
+        current_user=current_user,
+        event="list_applications_page_forbidden",
+        detail="Not authorized to view this job's applications",
+    )
+    items, next_cursor, counts = await repo.list_applications_page(db, **args)
+    logger.info("list_applications_page: job_id=%s count=%d has_next=%s", query.job_id, len(items), next_cursor is not None)
+    return {"items": items, "next_cursor": next_cursor, "counts": counts}
+
+
+async def update_application_status_controller(
+    db: AsyncSession,
+    *,
+    application_id: UUID,
+    status_value: str,
+):
+    """Recruiter-facing: update application status."""
+    logger.info("update_application_status: application_id=%s status=%s", application_id, status_value)
+    app = await repo.update_application_status(db, application_id=application_id, status_value=status_value)
+    logger.info("application_status_updated: application_id=%s status=%s", application_id, getattr(app, "status", None))
+    return app
+
+
+async def bulk_update_application_status_controller(
+    db: AsyncSession,
+    *,
+    current_user,
+    updates: list,
+    application_ids: list,
+    status_value: str | None,
+):
+    """Recruiter-facing: many status changes in one statement, with a result per application."""
+    statuses = _bulk_statuses(updates, application_ids, status_value)
+    company_id = _recruiter_company_id(await get_recruiter_by_user_id(db, current_user.user_id))
+    logger.info("bulk_update_application_status: count=%d company_id=%s", len(statuses), company_id)
+    updated = await repo.bulk_update_application_status(db, statuses=statuses, company_id=company_id)
+    logger.info("application_statuses_updated: updated=%d not_found=%d", len(updated), len(statuses) - len(updated))
+    return _bulk_results(statuses, updated)
@@ -0,0 +1,48 @@
+import logging
+from fastapi import Response, Request, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.controllers.auth import _issue_tokens, _refresh_token_subject
+from app.schemas.user import UserCreate, UserLogin
+from app.repository.aio import user as user_repository
+from app.lib.jwt import create_access_token
+
+logger = logging.getLogger("app.controllers.aio.auth")
+
+
+async def register_user_controller(db: AsyncSession, *, user: UserCreate):
+    logger.info("register_user: email=%s", user.email)
+    existing = await user_repository.get_user_by_email(db, email=user.email)
+    if existing:
+        logger.warning("register_user_conflict: email=%s", user.email)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
+    new_user = await user_repository.create_user(db, user=user)
+    logger.info("user_registered: user_id=%s email=%s", new_user.user_id, new_user.email)
+    return new_user
+
+
+async def login_controller(response: Response, *, db: AsyncSession, user_login: UserLogin):
+    logger.info("login_attempt: email=%s", user_login.email)
+    user = await user_repository.authenticate_user(db, user_login.email, user_login.password)
+    if not user:
+        logger.warning("login_failed: email=%s", user_login.email)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    logger.info("login_success: user_id=%s email=%s", user.user_id, user.email)
+    return _issue_tokens(response, user)
+
+
+async def refresh_access_token_controller(request: Request, *, db: AsyncSession):
+    logger.debug("refresh_token_request")
+    email = _refresh_token_subject(request)
+    user = await user_repository.get_user_by_email(db, email=email)
+    if not user:
+        logger.warning("refresh_user_not_found: email=%s", email)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+
+    new_access_token = create_access_token(data={"sub": user.email})
+    logger.info("access_token_refreshed: user_id=%s email=%s", user.user_id, user.email)
+    return {"access_token": new_access_token, "token_type": "bearer"}
@@ -0,0 +1,22 @@
+import logging
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repository.aio.company import get_recruiter_by_user_id
+from app.repository.aio.dashboard import get_recruiter_dashboard_stats
+from app.schemas.dashboard import RecruiterDashboardStats
+
+logger = logging.getLogger("app.controllers.aio.dashboard")
+
+
+async def get_recruiter_dashboard_stats_controller(db: AsyncSession, *, current_user) -> RecruiterDashboardStats:
+    logger.debug("recruiter_dashboard_request: user_id=%s", getattr(current_user, "user_id", None))
+    recruiter = await get_recruiter_by_user_id(db, current_user.user_id)
+    if not recruiter:
+        logger.warning("recruiter_dashboard_forbidden: user_id=%s", getattr(current_user, "user_id", None))
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Recruiter profile not found")
+
+    data = await get_recruiter_dashboard_stats(db, recruiter_id=recruiter.recruiter_id)
+    logger.info("recruiter_dashboard_success: recruiter_id=%s", recruiter.recruiter_id)
+    return RecruiterDashboardStats(**data)
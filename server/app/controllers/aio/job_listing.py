@@ -0,0 +1,158 @@
+"""Async job listing controllers (``DB_MODE=async``).
+
+Reads use ``app.repository.aio.job_listing`` and share cache keys, tags and
+field resolution with ``app.controllers.job_listing``; writes run the sync
+checks and writes through ``run_sync``, then the cache and index updates on a
+worker thread. The in-memory index endpoints (similar,
+matches, recommendations) are not here: they rebuild under ``threading`` locks
+while querying, which would deadlock two coroutines sharing the loop thread,
+so they stay on the threadpool.
+"""
+import logging
+from typing import Optional
+from uuid import UUID
+
+from anyio import to_thread
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db import models
+from app.lib import cache
+from app.controllers import job_listing as sync_controller
+from app.controllers.job_listing import (
+    FACETS_CACHE,
+    FACET_FILTERS,
+    FEED_CACHE,
+    TOTALS_CACHE,
+    _facets_cache_key,
+    _feed_cache_key,
+    _resolve_fields,
+    _total_cache_key,
+)
+from app.repository.aio import job_listing as repo
+from app.schemas.job_listing import JobListingsQuery
+
+logger = logging.getLogger("app.controllers.aio.job_listing")
+
+
+async def get_job_listing_controller(db: AsyncSession, *, job_id: UUID) -> dict:
+    logger.debug("get_job_listing_request: job_id=%s", job_id)
+    job = await repo.get_job_listing(db, job_id)
+    if not job:
+        logger.warning("get_job_listing_not_found: job_id=%s", job_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job listing not found")
+    logger.info("get_job_listing_success: job_id=%s", job_id)
+    return job
+
+
+async def list_job_listings_controller(
+    db: AsyncSession,
+    *,
+    company_id: Optional[UUID] = None,
+    limit: Optional[int] = None,
+    view: str = "full",
+    fields: Optional[str] = None,
+) -> list[dict]:
+    logger.debug("list_job_listings_request: company_id=%s limit=%s view=%s fields=%s", company_id, limit, view, fields)
+    items = await repo.list_job_listings(db, company_id=company_id, limit=limit, fields=_resolve_fields(view, fields))
+    logger.info("list_job_listings_success: company_id=%s count=%d", company_id, len(items))
+    return items
+
+
+async def list_job_listings_paged_controller(
+    db: AsyncSession,
+    *,
+    query: JobListingsQuery,
+) -> tuple[list[dict], Optional[str]]:
+    logger.debug("list_job_listings_paged_request: %s", query.model_dump(exclude_none=True))
+    limit = max(1, min(100, int(query.limit or 20)))
+    fields = _resolve_fields(query.view, query.fields)
+
+    async def _load():
+        return await repo.list_job_listings_paged(
+            db,
+            company_id=query.company_id,
+            location=query.location,
+            title=query.title,
+            match=query.match,
+            job_type=query.job_type,
+            experience_level=query.experience_level,
+            status=query.status,
+            q=query.q,
+            sort_by=query.sort_by,
+            sort_order=query.sort_order,
+            limit=limit,
+            cursor=query.cursor,
+            snippets=query.snippets,
+            fields=fields,
+        )
+
+    feed_cache = cache.get_cache(FEED_CACHE, ttl=settings.FEED_CACHE_TTL_SECONDS)
+    if feed_cache is None:
+        items, next_cursor = await _load()
+    else:
+        tags = [FEED_CACHE] + ([f"company:{query.company_id}"] if query.company_id else [])
+        items, next_cursor = await feed_cache.aget_or_set(
+            _feed_cache_key(query, limit, fields),
+            _load,
+            tags=tags,
+            value_tags=lambda page: [f"job:{item['job_id']}" for item in page[0]],
+        )
+    logger.info("list_job_listings_paged_success: count=%d next_cursor=%s", len(items), next_cursor)
+    return items, next_cursor
+
+
+async def job_listing_facets_controller(db: AsyncSession, *, query: JobListingsQuery) -> dict:
+    filters = query.model_dump(include=set(FACET_FILTERS))
+    logger.debug("job_listing_facets_request: %s", filters)
+
+    async def _load():
+        return await repo.job_listing_facet_counts(db, **filters)
+
+    facets_cache = cache.get_cache(FACETS_CACHE, ttl=settings.FACETS_CACHE_TTL_SECONDS)
+    if facets_cache is None:
+        result = await _load()
+    else:
+        result = await facets_cache.aget_or_set(_facets_cache_key(query), _load, tags=[FACETS_CACHE])
+    logger.info("job_listing_facets_success: total=%s", result.get("total"))
+    return result
+
+
+async def job_listing_total_controller(db: AsyncSession, *, query: JobListingsQuery) -> Optional[int]:
+    mode = query.include_total
+    if mode is None:
+        return None
+    filters = query.model_dump(include=set(FACET_FILTERS))
+
+    async def _load():
+        if mode == "exact":
+            return await repo.count_job_listings(db, **filters)
+        return await repo.estimate_job_listings(db, **filters)
+
+    totals_cache = cache.get_cache(TOTALS_CACHE, ttl=settings.FEED_TOTAL_CACHE_TTL_SECONDS)
+    if totals_cache is None:
+        total = await _load()
+    else:
+        total = await totals_cache.aget_or_set(_total_cache_key(query, mode), _load, tags=[TOTALS_CACHE])
+    logger.info("job_listing_total_success: mode=%s total=%s", mode, total)
+    return total
+
+
+async def create_job_listing_controller(db: AsyncSession, *, current_user, payload: dict) -> models.JobPosting:
+    job = await db.run_sync(sync_controller._create_job_listing, current_user=current_user, payload=payload)
+    # cache invalidation (Redis round trips) and the in-process indexes' locks stay off the event loop
+    await to_thread.run_sync(sync_controller._invalidate_job_caches, job)
+    logger.info("job_listing_created: job_id=%s company_id=%s", job.job_id, job.company_id)
+    return job
+
+
+async def update_job_listing_controller(
+    db: AsyncSession, *, current_user, job_id: UUID, update_data: dict
+) -> models.JobPosting:
+    job = await db.run_sync(
+        sync_controller._update_job_listing, current_user=current_user, job_id=job_id, update_data=update_data
+    )
+    await to_thread.run_sync(sync_controller._invalidate_job_caches, job)
+    logger.info("job_listing_updated: job_id=%s", job.job_id)
+    return job
@@ -0,0 +1,62 @@
+import logging
+from typing import Union
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.controllers import user as sync_controller
+from app.controllers.user import _build_applicant_response, _build_recruiter_response
+from app.repository.aio import user as user_repo
+from app.repository.aio.company import get_recruiter_by_user_id
+from app.schemas.user import (
+    UserProfileApplicantResponse,
+    UserProfileRecruiterResponse,
+    UpdateUserProfile,
+)
+
+logger = logging.getLogger("app.controllers.aio.user")
+
+
+async def _profile(db: AsyncSession, user) -> Union[UserProfileApplicantResponse, UserProfileRecruiterResponse, None]:
+    if user.user_type == "applicant":
+        return _build_applicant_response(user, await user_repo.get_applicant_by_user_id(db, user.user_id))
+    if user.user_type == "recruiter":
+        return _build_recruiter_response(user, await get_recruiter_by_user_id(db, user.user_id))
+    return None
+
+
+async def get_profile_me_controller(
+    db: AsyncSession, *, current_user
+) -> Union[UserProfileApplicantResponse, UserProfileRecruiterResponse]:
+    logger.debug(
+        "get_profile_me_request: user_id=%s user_type=%s",
+        getattr(current_user, "user_id", None),
+        getattr(current_user, "user_type", None),
+    )
+    profile = await _profile(db, current_user)
+    if profile is None:
+        logger.warning("get_profile_me_not_found: user_id=%s", getattr(current_user, "user_id", None))
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User profile not found")
+    logger.info("get_profile_me_success: user_id=%s", getattr(current_user, "user_id", None))
+    return profile
+
+
+async def update_profile_me_controller(db: AsyncSession, *, current_user, update: UpdateUserProfile) -> dict:
+    return await db.run_sync(sync_controller.update_profile_me_controller, current_user=current_user, update=update)
+
+
+async def get_profile_by_user_id_controller(
+    db: AsyncSession, *, user_id: UUID
+) -> Union[UserProfileApplicantResponse, UserProfileRecruiterResponse]:
+    logger.debug("get_profile_by_user_id_request: user_id=%s", user_id)
+    user = await user_repo.get_user_by_id(db, user_id)
+    if not user:
+        logger.warning("get_profile_by_user_id_not_found: user_id=%s", user_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    profile = await _profile(db, user)
+    if profile is None:
+        logger.warning("get_profile_by_user_id_profile_not_found: user_id=%s", user_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User profile not found")
+    logger.info("get_profile_by_user_id_success: user_id=%s", user_id)
+    return profile
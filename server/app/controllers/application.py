@@ -1,13 +1,29 @@
 import logging
+import re
+from pathlib import Path, PurePosixPath
+from typing import Iterator, Optional
+from urllib.parse import urlparse
 from uuid import UUID
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
+from app.constants.paths import RESUME_DIR
+from app.core.config import settings
+from app.db.routing import mark_written
+from app.lib import export
 from app.repository import application as repo
+from app.repository.company import get_recruiter_by_user_id
+from app.schemas.application import ApplicationsQuery
+from app.tasks.apply_batcher import get_apply_batcher
 
 logger = logging.getLogger("app.controllers.application")
 
 
+def _apply_batch_timeout(current_user, job_id: UUID) -> HTTPException:
+    logger.error("apply_batch_timeout: user=%s job_id=%s", getattr(current_user, "user_id", None), job_id)
+    return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Application could not be saved in time")
+
+
 def apply_to_job_controller(
     db: Session,
     *,
@@ -16,21 +32,38 @@ def apply_to_job_controller(
     cover_letter: str | None,
 ):
     logger.info("apply_to_job: user=%s job_id=%s", getattr(current_user, "user_id", None), job_id)
-    # Ensure job exists
-    repo.ensure_job_exists(db, job_id=job_id)
-
-    # Ensure user has an applicant profile
-    applicant = repo.ensure_applicant_profile(db, user_id=current_user.user_id)
-
-    # Check duplicate application
-    existing = repo.get_application_by_job_and_applicant(db, job_id=job_id, applicant_id=applicant.applicant_id)
-    if existing:
-        logger.warning("duplicate_application: applicant_id=%s job_id=%s", applicant.applicant_id, job_id)
+    # One statement checks the job (exists, open), the applicant profile and inserts; the unique
+    # (job_id, applicant_id) index makes a duplicate, including a concurrent one, insert nothing
+    batcher = get_apply_batcher()
+    future = None
+    if batcher.running:
+        # APPLY_BATCHING: written with other concurrent applies in one INSERT and commit. The request's
+        # session gives its pooled connection (checked out by the user lookup) back first: waiting applies
+        # holding every pool slot would leave the batcher none to write them with
+        db.close()
+        # None once the batcher is stopping: the apply is written below on this session instead
+        future = batcher.submit(job_id, current_user.user_id, cover_letter)
+    if future is not None:
+        try:
+            outcome = future.result(timeout=batcher.result_timeout)
+        except TimeoutError:
+            raise _apply_batch_timeout(current_user, job_id)
+        # written on the batcher's session, outside this request's routing state
+        mark_written()
+    else:
+        outcome = repo.apply_to_job(db, job_id=job_id, user_id=current_user.user_id, cover_letter=cover_letter)
+    if outcome.job_open is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job listing not found")
+    if not outcome.has_profile:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Applicant profile not found")
+    if not outcome.job_open:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Job listing is not open for applications")
+    if outcome.application_id is None:
+        logger.warning("duplicate_application: applicant_id=%s job_id=%s", current_user.user_id, job_id)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Already applied to this job")
 
-    app = repo.create_application(db, job_id=job_id, applicant_id=applicant.applicant_id, cover_letter=cover_letter)
-    logger.info("application_created: application_id=%s", getattr(app, "application_id", None))
-    return app
+    logger.info("application_created: application_id=%s", outcome.application_id)
+    return outcome
 
 
 def get_my_application_status_controller(
@@ -83,6 +116,132 @@ def list_applications_for_job_controller(
     return items
 
 
+def _page_args(query: ApplicationsQuery) -> dict:
+    return {
+        "job_id": query.job_id,
+        "status_value": query.status,
+        "q": (query.q or "").strip() or None,
+        "limit": max(1, min(settings.APPLICATIONS_MAX_LIMIT, int(query.limit or 50))),
+        "cursor": query.cursor,
+    }
+
+
+def _ensure_job_owner(recruiter, job, *, current_user, event: str, detail: str) -> None:
+    # a recruiter only sees applications to their own company's postings
+    if not recruiter or recruiter.company_id != job.company_id:
+        logger.warning("%s: user_id=%s job_id=%s", event, getattr(current_user, "user_id", None), job.job_id)
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+def list_applications_page_controller(
+    db: Session,
+    *,
+    current_user,
+    query: ApplicationsQuery,
+):
+    """Recruiter-facing: a filtered page of a job's applications, with per-status counts on the first page."""
+    args = _page_args(query)
+    logger.debug("list_applications_page: %s", args)
+    job = repo.ensure_job_exists(db, job_id=query.job_id)
+    _ensure_job_owner(
+        get_recruiter_by_user_id(db, current_user.user_id),
+        job,
+        current_user=current_user,
+        event="list_applications_page_forbidden",
+        detail="Not authorized to view this job's applications",
+    )
+    items, next_cursor, counts = repo.list_applications_page(db, **args)
+    logger.info("list_applications_page: job_id=%s count=%d has_next=%s", query.job_id, len(items), next_cursor is not None)
+    return {"items": items, "next_cursor": next_cursor, "counts": counts}
+
+
+EXPORT_COLUMNS = ("application_id", "applicant_id", "applicant_name", "applicant_email", "status", "applied_at", "resume_url")
+
+
+def _resume_path(resume_url: Optional[str]) -> Optional[Path]:
+    # uploads are served as <BACKEND_URL>/static/resumes/<file>; anything else isn't ours to bundle
+    if not resume_url:
+        return None
+    url_path = PurePosixPath(urlparse(resume_url).path)
+    if url_path.parent != PurePosixPath("/static/resumes"):
+        return None
+    path = RESUME_DIR / url_path.name
+    return path if path.is_file() else None
+
+
+def _resume_name(item: dict) -> str:
+    name = re.sub(r"[^A-Za-z0-9]+", "_", item["applicant_name"]).strip("_") or "applicant"
+    return f"resumes/{name}_{item['application_id']}.pdf"
+
+
+def export_applications_controller(
+    session_factory,
+    *,
+    current_user,
+    job_id: UUID,
+    status_value: Optional[str] = None,
+    fmt: str = "csv",
+) -> Iterator[bytes]:
+    """Recruiter-facing: a job's applicants as CSV, or a ZIP of that CSV plus their resume PDFs.
+
+    The ZIP reads the applications twice through a server-side cursor, once for applicants.csv
+    and once for the resumes, so neither the rows nor the files are held in memory. Both reads
+    run in the same REPEATABLE READ transaction as the ownership check, so they see the same rows.
+    """
+    logger.debug("export_applications_request: job_id=%s status=%s format=%s", job_id, status_value, fmt)
+    db = session_factory()
+    try:
+        repo.begin_repeatable_read(db)
+        # checked before streaming starts, so an unknown job is a 404 rather than an empty file
+        job = repo.ensure_job_exists(db, job_id=job_id)
+        _ensure_job_owner(
+            get_recruiter_by_user_id(db, current_user.user_id),
+            job,
+            current_user=current_user,
+            event="export_applications_forbidden",
+            detail="Not authorized to export this job's applications",
+        )
+    except Exception:
+        db.close()
+        raise
+
+    def _rows():
+        count = 0
+        try:
+            for item in repo.iter_applications_for_job(
+                db, job_id=job_id, status_value=status_value, batch_size=settings.EXPORT_BATCH_SIZE
+            ):
+                count += 1
+                yield item
+        finally:
+            logger.info("export_applications_rows: job_id=%s format=%s rows=%d", job_id, fmt, count)
+
+    def _listed_rows():
+        for item in _rows():
+            yield {**item, "resume_file": _resume_name(item) if _resume_path(item["resume_url"]) else None}
+
+    def _entries():
+        yield "applicants.csv", export.iter_csv(_listed_rows(), EXPORT_COLUMNS + ("resume_file",))
+        files = 0
+        for item in _rows():
+            path = _resume_path(item["resume_url"])
+            if path is not None:
+                files += 1
+                yield _resume_name(item), export.iter_file(path)
+        logger.info("export_applications_resumes: job_id=%s files=%d", job_id, files)
+
+    def _body():
+        try:
+            if fmt == "csv":
+                yield from export.iter_csv(_rows(), EXPORT_COLUMNS)
+            else:
+                yield from export.iter_zip(_entries())
+        finally:
+            db.close()
+
+    return _body()
+
+
 def update_application_status_controller(
     db: Session,
     *,
@@ -94,3 +253,57 @@ def update_application_status_controller(
     app = repo.update_application_status(db, application_id=application_id, status_value=status_value)
     logger.info("application_status_updated: application_id=%s status=%s", application_id, getattr(app, "status", None))
     return app
+
+
+def _bulk_statuses(updates: list, application_ids: list, status_value: str | None) -> dict:
+    """{application_id: status} from either request form; a repeated id keeps its last status."""
+    if updates and (application_ids or status_value):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Send either updates or application_ids with status")
+    if application_ids and not status_value:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="status is required with application_ids")
+    statuses = dict(updates) if updates else dict.fromkeys(application_ids, status_value)
+    if not statuses:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No applications to update")
+    if len(statuses) > settings.APPLICATIONS_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.APPLICATIONS_BULK_MAX_ITEMS} applications per request",
+        )
+    return statuses
+
+
+def _recruiter_company_id(recruiter) -> UUID:
+    if not recruiter:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Recruiter profile not found")
+    return recruiter.company_id
+
+
+def _bulk_results(statuses: dict, updated: dict) -> dict:
+    results = [
+        {"application_id": application_id, "updated": True, "status": updated[application_id]}
+        if application_id in updated
+        else {"application_id": application_id, "updated": False, "detail": "Application not found"}
+        for application_id in statuses
+    ]
+    return {"updated": len(updated), "not_found": len(statuses) - len(updated), "results": results}
+
+
+def bulk_update_application_status_controller(
+    db: Session,
+    *,
+    current_user,
+    updates: list,
+    application_ids: list,
+    status_value: str | None,
+):
+    """Recruiter-facing: many status changes in one statement, with a result per application.
+
+    Only applications to the recruiter's own company's jobs are updated; any other id is reported
+    as not found, so the response doesn't reveal which ids exist elsewhere.
+    """
+    statuses = _bulk_statuses(updates, application_ids, status_value)
+    company_id = _recruiter_company_id(get_recruiter_by_user_id(db, current_user.user_id))
+    logger.info("bulk_update_application_status: count=%d company_id=%s", len(statuses), company_id)
+    updated = repo.bulk_update_application_status(db, statuses=statuses, company_id=company_id)
+    logger.info("application_statuses_updated: updated=%d not_found=%d", len(updated), len(statuses) - len(updated))
+    return _bulk_results(statuses, updated)
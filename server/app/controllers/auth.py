@@ -51,6 +51,12 @@ def login_controller(response: Response, *, db: Session, user_login: UserLogin):
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    logger.info("login_success: user_id=%s email=%s", getattr(user, "user_id", None), user.email)
+    return _issue_tokens(response, user)
+
+
+def _issue_tokens(response: Response, user) -> dict:
+    """Set the refresh token cookie and return the access token body."""
     access_token = create_access_token(data={"sub": user.email})
     refresh_token = create_refresh_token(data={"sub": user.email})
 
@@ -64,13 +70,24 @@ def login_controller(response: Response, *, db: Session, user_login: UserLogin):
         samesite="none",
         secure=True,
     )
-
-    logger.info("login_success: user_id=%s email=%s", getattr(user, "user_id", None), user.email)
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 def refresh_access_token_controller(request: Request, *, db: Session):
     logger.debug("refresh_token_request")
+    email = _refresh_token_subject(request)
+    user = user_repository.get_user_by_email(db, email=email)
+    if not user:
+        logger.warning("refresh_user_not_found: email=%s", email)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+
+    new_access_token = create_access_token(data={"sub": user.email})
+    logger.info("access_token_refreshed: user_id=%s email=%s", getattr(user, "user_id", None), user.email)
+    return {"access_token": new_access_token, "token_type": "bearer"}
+
+
+def _refresh_token_subject(request: Request) -> str:
+    """Email from the refresh token cookie; 401 when it is missing or invalid."""
     refresh_token = request.cookies.get("refresh_token")
     if not refresh_token:
         logger.warning("refresh_token_missing")
@@ -80,13 +97,4 @@ def refresh_access_token_controller(request: Request, *, db: Session):
     if not payload or "sub" not in payload:
         logger.warning("refresh_token_invalid")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
-
-    email = payload["sub"]
-    user = user_repository.get_user_by_email(db, email=email)
-    if not user:
-        logger.warning("refresh_user_not_found: email=%s", email)
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-
-    new_access_token = create_access_token(data={"sub": user.email})
-    logger.info("access_token_refreshed: user_id=%s email=%s", getattr(user, "user_id", None), user.email)
-    return {"access_token": new_access_token, "token_type": "bearer"}
+    return payload["sub"]
@@ -1,17 +1,100 @@
+import hashlib
+import json
 import logging
-from typing import Optional, Tuple, List
+from typing import Iterator, Optional, Tuple, List
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db import models
+from app.lib import cache, export
 from app.repository import job_listing as repo
+from app.repository import skill as skill_repo
+from app.repository.application import list_applied_job_ids
+from app.repository.user import get_applicant_by_user_id
 from app.schemas.job_listing import JobListingsQuery
+from app.search.backend import get_search_backend
+from app.search.recommend import get_recommender, profile_term_counts
+from app.search.similar import get_similar_jobs
+from app.search.skill_match import get_skill_match_index
+from app.search.suggest import get_suggester
+from app.search.skills import normalize_skills, parse_skills_required
 from app.repository.company import get_recruiter_by_user_id
 
 logger = logging.getLogger("app.controllers.job_listing")
 
+FEED_CACHE = "feed"
+
+
+FACETS_CACHE = "facets"
+FACET_FILTERS = ("company_id", "location", "title", "match", "job_type", "experience_level", "status", "q")
+
+TOTALS_CACHE = "totals"
+
+
+def _query_cache_key(prefix: str, data: dict) -> str:
+    # location/title matching is case-insensitive; q only gets whitespace normalized
+    for field in ("location", "title"):
+        if data.get(field):
+            data[field] = " ".join(data[field].lower().split())
+    if data.get("q"):
+        data["q"] = " ".join(data["q"].split())
+    digest = hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def _feed_cache_key(query: JobListingsQuery, limit: int, fields: Optional[Tuple[str, ...]]) -> str:
+    data = query.model_dump(mode="json", exclude={"view", "include_total"})
+    data["limit"] = limit
+    data["fields"] = sorted(fields) if fields is not None else None
+    return _query_cache_key("feed", data)
+
+
+def _resolve_fields(view: str = "full", fields: Optional[str] = None) -> Optional[Tuple[str, ...]]:
+    """Map view=/fields= to the response fields to load; None means the full listing."""
+    if fields:
+        requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in requested if f not in repo.RESPONSE_FIELDS]
+        if unknown or not requested:
+            logger.warning("list_job_listings_bad_fields: fields=%s", fields)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested",
+            )
+        # job_id identifies the row on the client and is always loaded anyway
+        return ("job_id",) + tuple(f for f in requested if f != "job_id")
+    if view == "summary":
+        return repo.SUMMARY_FIELDS
+    return None
+
+
+def _facets_cache_key(query: JobListingsQuery) -> str:
+    # sorting and pagination don't change the counts
+    return _query_cache_key("facets", query.model_dump(mode="json", include=set(FACET_FILTERS)))
+
+
+def _total_cache_key(query: JobListingsQuery, mode: str) -> str:
+    return _query_cache_key(f"total:{mode}", query.model_dump(mode="json", include=set(FACET_FILTERS)))
+
+
+def _invalidate_job_caches(job: models.JobPosting) -> None:
+    cache.invalidate("feed", f"company:{job.company_id}", f"job:{job.job_id}")
+    search_backend = get_search_backend()
+    if search_backend is not None:
+        search_backend.index_job(job)
+    get_skill_match_index().mark_stale()
+    get_recommender().notify_changed()
+    get_similar_jobs().apply(job)
+    get_suggester().apply_jobs([job])
+
+
+def _resolve_job_skills(db: Session, data: dict) -> None:
+    """Set data["skill_ids"] from data["skills_required"] (when present), adding new skills to the dictionary."""
+    if data.get("skills_required") is not None:
+        data["skill_ids"] = skill_repo.ensure_skill_ids(db, parse_skills_required(data["skills_required"]))
+
 
 def create_job_listing_controller(
     db: Session,
@@ -19,6 +102,14 @@ def create_job_listing_controller(
     current_user,
     payload: dict,
 ) -> models.JobPosting:
+    job = _create_job_listing(db, current_user=current_user, payload=payload)
+    _invalidate_job_caches(job)
+    logger.info("job_listing_created: job_id=%s company_id=%s", getattr(job, "job_id", None), job.company_id)
+    return job
+
+
+def _create_job_listing(db: Session, *, current_user, payload: dict) -> models.JobPosting:
+    """The checks and write behind create_job_listing_controller, without the cache and index updates."""
     logger.info(
         "create_job_listing_request: user_id=%s provided_company_id=%s",
         getattr(current_user, "user_id", None),
@@ -45,13 +136,13 @@ def create_job_listing_controller(
             )
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized for this company")
 
+    _resolve_job_skills(db, payload)
     job = repo.create_job_listing(
         db,
         company_id=company_id,
         recruiter_id=recruiter.recruiter_id,
         data=payload,
     )
-    logger.info("job_listing_created: job_id=%s company_id=%s", getattr(job, "job_id", None), company_id)
     return job
 
 
@@ -62,6 +153,14 @@ def update_job_listing_controller(
     job_id: UUID,
     update_data: dict,
 ) -> models.JobPosting:
+    job = _update_job_listing(db, current_user=current_user, job_id=job_id, update_data=update_data)
+    _invalidate_job_caches(job)
+    logger.info("job_listing_updated: job_id=%s", getattr(job, "job_id", None))
+    return job
+
+
+def _update_job_listing(db: Session, *, current_user, job_id: UUID, update_data: dict) -> models.JobPosting:
+    """The checks and write behind update_job_listing_controller, without the cache and index updates."""
     logger.debug(
         "update_job_listing_request: user_id=%s job_id=%s",
         getattr(current_user, "user_id", None),
@@ -82,9 +181,8 @@ def update_job_listing_controller(
         )
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to update this listing")
 
-    job = repo.update_job_listing(db, job=job, update_data=update_data)
-    logger.info("job_listing_updated: job_id=%s", getattr(job, "job_id", None))
-    return job
+    _resolve_job_skills(db, update_data)
+    return repo.update_job_listing(db, job=job, update_data=update_data)
 
 
 def get_job_listing_controller(db: Session, *, job_id: UUID) -> models.JobPosting:
@@ -97,14 +195,48 @@ def get_job_listing_controller(db: Session, *, job_id: UUID) -> models.JobPostin
     return job
 
 
+def list_similar_job_listings_controller(
+    db: Session,
+    *,
+    job_id: UUID,
+    limit: int = 10,
+) -> list[dict]:
+    """Open postings whose text is closest to ``job_id``'s, by estimated Jaccard similarity of word shingles."""
+    logger.debug("list_similar_job_listings_request: job_id=%s limit=%s", job_id, limit)
+    limit = max(1, min(50, int(limit or 10)))
+    job = repo.get_job_listing_model(db, job_id)
+    if not job:
+        logger.warning("list_similar_job_listings_not_found: job_id=%s", job_id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job listing not found")
+
+    index = get_similar_jobs().index()
+    if index is None:
+        # the index is still being built in the background; lookups never build or refresh it themselves
+        logger.info("list_similar_job_listings_index_building: job_id=%s", job_id)
+        return []
+    hits = index.similar(index.signature(job), limit, exclude=job.job_id)
+    jobs = repo.get_open_job_listings_by_ids(db, [hit_id for _, hit_id in hits])
+    items = []
+    for score, hit_id in hits:
+        found = jobs.get(hit_id)
+        if found is not None:
+            item, _ = found
+            item["similarity"] = score
+            items.append(item)
+    logger.info("list_similar_job_listings_success: job_id=%s count=%d candidates=%d", job_id, len(items), len(hits))
+    return items
+
+
 def list_job_listings_controller(
     db: Session,
     *,
     company_id: Optional[UUID] = None,
     limit: Optional[int] = None,
+    view: str = "full",
+    fields: Optional[str] = None,
 ):
-    logger.debug("list_job_listings_request: company_id=%s limit=%s", company_id, limit)
-    items = repo.list_job_listings(db, company_id=company_id, limit=limit)
+    logger.debug("list_job_listings_request: company_id=%s limit=%s view=%s fields=%s", company_id, limit, view, fields)
+    items = repo.list_job_listings(db, company_id=company_id, limit=limit, fields=_resolve_fields(view, fields))
     logger.info(
         "list_job_listings_success: company_id=%s count=%d",
         company_id,
@@ -113,41 +245,263 @@ def list_job_listings_controller(
     return items
 
 
+def export_job_listings_controller(
+    session_factory,
+    *,
+    company_id: Optional[UUID] = None,
+    fmt: str = "ndjson",
+    view: str = "full",
+    fields: Optional[str] = None,
+) -> Iterator[bytes]:
+    logger.debug("export_job_listings_request: company_id=%s format=%s view=%s fields=%s", company_id, fmt, view, fields)
+    # resolve before streaming starts, so a bad fields= still gets a 400 instead of a broken body
+    selected = _resolve_fields(view, fields)
+    columns = selected or repo.RESPONSE_FIELDS
+
+    def _rows():
+        db = session_factory()
+        count = 0
+        try:
+            for item in repo.iter_job_listings(
+                db, company_id=company_id, fields=selected, batch_size=settings.EXPORT_BATCH_SIZE
+            ):
+                count += 1
+                yield item
+        finally:
+            db.close()
+            logger.info("export_job_listings_done: company_id=%s format=%s rows=%d", company_id, fmt, count)
+
+    if fmt == "csv":
+        return export.iter_csv(_rows(), columns)
+    return export.iter_ndjson(_rows())
+
+
 def list_job_listings_paged_controller(
     db: Session,
     *,
     query: JobListingsQuery,
 ) -> tuple[list[dict], Optional[str]]:
     logger.debug(
-        "list_job_listings_paged_request: company_id=%s location=%s job_type=%s exp=%s status=%s q=%s sort_by=%s sort_order=%s cursor=%s limit=%s",
+        "list_job_listings_paged_request: company_id=%s location=%s title=%s match=%s job_type=%s exp=%s status=%s q=%s snippets=%s view=%s fields=%s sort_by=%s sort_order=%s cursor=%s limit=%s",
         query.company_id,
         query.location,
+        query.title,
+        query.match,
         query.job_type,
         query.experience_level,
         query.status,
         query.q,
+        query.snippets,
+        query.view,
+        query.fields,
         query.sort_by,
         query.sort_order,
         query.cursor,
         query.limit,
     )
     limit = max(1, min(100, int(query.limit or 20)))
-    items, next_cursor = repo.list_job_listings_paged(
-        db,
-        company_id=query.company_id,
-        location=query.location,
-        job_type=query.job_type,
-        experience_level=query.experience_level,
-        status=query.status,
-        q=query.q,
-        sort_by=query.sort_by,
-        sort_order=query.sort_order,
-        limit=limit,
-        cursor=query.cursor,
-    )
+    fields = _resolve_fields(query.view, query.fields)
+
+    def _load():
+        return repo.list_job_listings_paged(
+            db,
+            company_id=query.company_id,
+            location=query.location,
+            title=query.title,
+            match=query.match,
+            job_type=query.job_type,
+            experience_level=query.experience_level,
+            status=query.status,
+            q=query.q,
+            sort_by=query.sort_by,
+            sort_order=query.sort_order,
+            limit=limit,
+            cursor=query.cursor,
+            snippets=query.snippets,
+            fields=fields,
+        )
+
+    feed_cache = cache.get_cache(FEED_CACHE, ttl=settings.FEED_CACHE_TTL_SECONDS)
+    if feed_cache is None:
+        items, next_cursor = _load()
+    else:
+        tags = [FEED_CACHE] + ([f"company:{query.company_id}"] if query.company_id else [])
+        items, next_cursor = feed_cache.get_or_set(
+            _feed_cache_key(query, limit, fields),
+            _load,
+            tags=tags,
+            value_tags=lambda page: [f"job:{item['job_id']}" for item in page[0]],
+        )
     logger.info(
         "list_job_listings_paged_success: count=%d next_cursor=%s",
         len(items) if hasattr(items, "__len__") else -1,
         next_cursor,
     )
     return items, next_cursor
+
+
+def job_listing_facets_controller(
+    db: Session,
+    *,
+    query: JobListingsQuery,
+) -> dict:
+    logger.debug(
+        "job_listing_facets_request: company_id=%s location=%s title=%s match=%s job_type=%s exp=%s status=%s q=%s",
+        query.company_id,
+        query.location,
+        query.title,
+        query.match,
+        query.job_type,
+        query.experience_level,
+        query.status,
+        query.q,
+    )
+
+    def _load():
+        return repo.job_listing_facet_counts(
+            db,
+            company_id=query.company_id,
+            location=query.location,
+            title=query.title,
+            match=query.match,
+            job_type=query.job_type,
+            experience_level=query.experience_level,
+            status=query.status,
+            q=query.q,
+        )
+
+    # not tagged with "feed": facet counts are allowed to lag writes until the TTL expires
+    facets_cache = cache.get_cache(FACETS_CACHE, ttl=settings.FACETS_CACHE_TTL_SECONDS)
+    if facets_cache is None:
+        result = _load()
+    else:
+        result = facets_cache.get_or_set(_facets_cache_key(query), _load, tags=[FACETS_CACHE])
+    logger.info("job_listing_facets_success: total=%s", result.get("total"))
+    return result
+
+
+def job_listing_total_controller(
+    db: Session,
+    *,
+    query: JobListingsQuery,
+) -> Optional[int]:
+    """Total postings matching the feed filters for include_total; None when not requested.
+
+    The value only depends on the filters, so every page of a feed shares one cache entry.
+    """
+    mode = query.include_total
+    if mode is None:
+        return None
+    filters = query.model_dump(include=set(FACET_FILTERS))
+
+    def _load():
+        if mode == "exact":
+            return repo.count_job_listings(db, **filters)
+        return repo.estimate_job_listings(db, **filters)
+
+    # like facets, not tagged with "feed": a total may lag writes until the TTL expires
+    totals_cache = cache.get_cache(TOTALS_CACHE, ttl=settings.FEED_TOTAL_CACHE_TTL_SECONDS)
+    if totals_cache is None:
+        total = _load()
+    else:
+        total = totals_cache.get_or_set(_total_cache_key(query, mode), _load, tags=[TOTALS_CACHE])
+    logger.info("job_listing_total_success: mode=%s total=%s", mode, total)
+    return total
+
+
+def list_job_matches_controller(
+    db: Session,
+    *,
+    current_user,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> tuple[list[dict], Optional[str]]:
+    logger.debug("list_job_matches_request: user_id=%s limit=%s cursor=%s", current_user.user_id, limit, cursor)
+    limit = max(1, min(100, int(limit or 20)))
+    after = repo._decode_rank_cursor(cursor)
+    if cursor and after is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    names = normalize_skills(skill_repo.get_applicant_skills(db, current_user.user_id))
+    skill_ids = skill_repo.get_skill_ids(db, names)
+    if not skill_ids:
+        logger.info("list_job_matches_no_skills: user_id=%s", current_user.user_id)
+        return [], None
+
+    matcher = get_skill_match_index().matcher(db)
+    hits = matcher.top_k(skill_ids.values(), limit + 1, after=(after[0], str(after[1])) if after else None)
+    has_more = len(hits) > limit
+    hits = hits[:limit]
+
+    # the matcher may be a little behind: drop jobs closed since it was built
+    jobs = repo.get_open_job_listings_by_ids(db, [UUID(job_id) for _, job_id in hits])
+    names_by_id = {skill_id: name for name, skill_id in skill_ids.items()}
+    items = []
+    for score, job_id in hits:
+        found = jobs.get(UUID(job_id))
+        if found is None:
+            continue
+        item, job_skill_ids = found
+        item["score"] = score
+        item["matched_skills"] = [names_by_id[i] for i in job_skill_ids if i in names_by_id]
+        items.append(item)
+
+    next_cursor = repo._encode_rank_cursor(hits[-1][0], hits[-1][1]) if has_more and hits else None
+    logger.info("list_job_matches_success: user_id=%s count=%d jobs_indexed=%d", current_user.user_id, len(items), len(matcher))
+    return items, next_cursor
+
+
+def list_job_recommendations_controller(
+    db: Session,
+    *,
+    current_user,
+    limit: int = 20,
+) -> list[dict]:
+    logger.debug("list_job_recommendations_request: user_id=%s limit=%s", current_user.user_id, limit)
+    limit = max(1, min(50, int(limit or 20)))
+    applicant = get_applicant_by_user_id(db, current_user.user_id)
+    counts = profile_term_counts(applicant) if applicant else None
+    if not counts:
+        logger.info("list_job_recommendations_empty_profile: user_id=%s", current_user.user_id)
+        return []
+
+    matrix = get_recommender().matrix()
+    if matrix is None:
+        # built by the background thread; requests never build it
+        logger.info("list_job_recommendations_not_ready: user_id=%s", current_user.user_id)
+        return []
+    applied = list_applied_job_ids(db, applicant_id=applicant.applicant_id)
+    hits = matrix.top_k(counts, limit, exclude=applied)
+
+    jobs = repo.get_open_job_listings_by_ids(db, [job_id for _, job_id in hits])
+    items = []
+    for score, job_id in hits:
+        found = jobs.get(job_id)
+        if found is not None:
+            item, _ = found
+            item["score"] = score
+            items.append(item)
+    logger.info("list_job_recommendations_success: user_id=%s count=%d jobs_indexed=%d", current_user.user_id, len(items), len(matrix))
+    return items
+
+
+def close_expired_job_listings_controller(
+    db: Session,
+    *,
+    batch_size: int = 500,
+    max_batches: int = 20,
+) -> int:
+    """Close open postings past their expires_at, one committed batch at a time; returns how many were closed."""
+    closed: list = []
+    for _ in range(max(1, max_batches)):
+        batch = repo.close_expired_job_listings(db, batch_size=batch_size)
+        closed.extend(batch)
+        if len(batch) < batch_size:
+            break
+    if closed:
+        tags = {f"company:{company_id}" for _, company_id in closed} | {f"job:{job_id}" for job_id, _ in closed}
+        cache.invalidate("feed", *tags)
+        get_skill_match_index().mark_stale()
+        get_recommender().notify_changed()
+        logger.info("close_expired_job_listings_success: closed=%d", len(closed))
+    return len(closed)
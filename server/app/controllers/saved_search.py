@@ -0,0 +1,66 @@
+import logging
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repository import saved_search as repo
+from app.repository.application import ensure_applicant_profile
+from app.repository.job_listing import get_open_job_listings_by_ids
+
+logger = logging.getLogger("app.controllers.saved_search")
+
+
+def create_saved_search_controller(db: Session, *, current_user, payload: dict):
+    logger.info("create_saved_search_request: user_id=%s", current_user.user_id)
+    applicant = ensure_applicant_profile(db, user_id=current_user.user_id)
+    if repo.count_saved_searches(db, applicant_id=applicant.applicant_id) >= settings.SAVED_SEARCHES_PER_APPLICANT:
+        logger.warning("saved_search_limit_reached: applicant_id=%s", applicant.applicant_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.SAVED_SEARCHES_PER_APPLICANT} saved searches are allowed",
+        )
+    name = payload.pop("name", None)
+    search = repo.create_saved_search(db, applicant_id=applicant.applicant_id, name=name, filters=payload)
+    logger.info("saved_search_created: saved_search_id=%s anchor=%s", search.saved_search_id, search.anchor_key)
+    return search
+
+
+def list_saved_searches_controller(db: Session, *, current_user):
+    applicant = ensure_applicant_profile(db, user_id=current_user.user_id)
+    return repo.list_saved_searches(db, applicant_id=applicant.applicant_id)
+
+
+def delete_saved_search_controller(db: Session, *, current_user, saved_search_id: UUID) -> None:
+    applicant = ensure_applicant_profile(db, user_id=current_user.user_id)
+    if not repo.delete_saved_search(db, applicant_id=applicant.applicant_id, saved_search_id=saved_search_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved search not found")
+    logger.info("saved_search_deleted: saved_search_id=%s", saved_search_id)
+
+
+def claim_search_alerts_controller(db: Session, *, current_user, limit: int = 20) -> list[dict]:
+    """Deliver the applicant's pending alerts (each alert is returned once); closed or expired jobs are dropped."""
+    limit = max(1, min(100, int(limit or 20)))
+    applicant = ensure_applicant_profile(db, user_id=current_user.user_id)
+    alerts = repo.claim_search_alerts(db, applicant_id=applicant.applicant_id, limit=limit)
+    jobs = get_open_job_listings_by_ids(db, list({job_id for _, _, job_id, _ in alerts}))
+    items = [
+        {"alert_id": alert_id, "saved_search_id": saved_search_id, "created_at": created_at, "job": jobs[job_id][0]}
+        for alert_id, saved_search_id, job_id, created_at in alerts
+        if job_id in jobs
+    ]
+    logger.info("search_alerts_delivered: applicant_id=%s claimed=%d returned=%d", applicant.applicant_id, len(alerts), len(items))
+    return items
+
+
+def percolate_job_listing_controller(session_factory, job_id: UUID) -> int:
+    """Queue alerts for a newly created posting; runs after the response, in its own session."""
+    try:
+        with session_factory() as db:
+            queued = repo.percolate_job_listing(db, job_id=job_id)
+    except Exception:
+        logger.exception("percolate_job_listing_failed: job_id=%s", job_id)
+        return 0
+    logger.info("percolate_job_listing_success: job_id=%s queued=%d", job_id, queued)
+    return queued
@@ -0,0 +1,16 @@
+import logging
+
+from app.search.suggest import TOP_K, get_suggester
+
+logger = logging.getLogger("app.controllers.search")
+
+
+def suggest_controller(*, prefix: str, limit: int = 8) -> list[dict]:
+    """Typeahead entries for ``prefix``, served from the in-memory trie only (no database access)."""
+    limit = max(1, min(TOP_K, int(limit or 8)))
+    items = [
+        {"text": text, "kind": kind, "weight": weight}
+        for text, kind, weight in get_suggester().suggest(prefix, limit)
+    ]
+    logger.debug("suggest_success: prefix=%r count=%d", prefix, len(items))
+    return items
@@ -1,5 +1,9 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.constants.paths import DATA_DIR
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
@@ -7,6 +11,44 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Internhub Clone"
     API_V1_STR: str = "/api/v1"
     DATABASE_URL: str
+    # Connection pool per process. Sync endpoints run on the anyio threadpool (40 threads), so
+    # pool size + overflow below that makes requests queue for connections (see /internal/metrics)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30  # wait for a free connection before failing the request
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # reconnect connections older than this (-1 never)
+    DB_POOL_PRE_PING: bool = True  # test each connection on checkout; drops ones the server closed
+    # "sync": endpoints run on the threadpool with psycopg2 sessions. "async": the API routes backed by
+    # the job listing/application/user/company/dashboard repositories are served by coroutines on an
+    # asyncpg engine (DATABASE_URL with the driver swapped); background workers, file uploads and
+    # saved searches keep the sync engine, so each mode-"async" process holds two pools of the size above
+    DB_MODE: Literal["sync", "async"] = "sync"
+    # async mode: asyncpg prepares each distinct statement once per connection and keeps up to this many
+    # per connection (0 disables; needed behind PgBouncer in transaction mode). psycopg2 never prepares
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Comma-separated replica URLs (same form as DATABASE_URL; each gets its own pool of the size above).
+    # SELECTs of GET/HEAD requests go to a replica, picked per session; writes, SELECT ... FOR UPDATE and
+    # everything outside a request (background workers) go to the primary
+    READ_REPLICA_URLS: str = ""
+    READ_REPLICA_BALANCE: Literal["round_robin", "least_connections"] = "round_robin"
+    # After a request writes, the client gets a cookie that keeps its reads on the primary for this
+    # long (read-your-writes despite replica lag); 0 disables it
+    READ_YOUR_WRITES_SECONDS: float = 5
+    # Per-request SQL stats: statement count, DB time and rows in a Server-Timing header; requests over
+    # the budget and statements repeated N+ times in one request (N+1 suspects) are logged. Off: no hooks
+    SQL_INSTRUMENTATION: bool = False
+    SQL_QUERY_BUDGET: int = 10
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+    # Group commit for POST /job-listings/{id}/apply: applies arriving within MAX_WAIT_MS of each other
+    # (up to MAX_SIZE) are written as one multi-row INSERT and one commit by a background thread on the
+    # sync engine (in both DB modes); each request still gets its own 201/400/403/404
+    APPLY_BATCHING: bool = False
+    APPLY_BATCH_MAX_SIZE: int = 100
+    APPLY_BATCH_MAX_WAIT_MS: float = 5
+    # PATCH /applications/bulk: applications per request (one UPDATE statement)
+    APPLICATIONS_BULK_MAX_ITEMS: int = 500
+    # GET /applications/page page cap
+    APPLICATIONS_MAX_LIMIT: int = 100
     FRONTEND_URLS: str
     BACKEND_URL: str
 
@@ -15,5 +57,53 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 30  # 30 days
 
+    # Job search: "postgres" (full-text search in SQL) or "memory" (in-process BM25 index)
+    SEARCH_BACKEND: Literal["postgres", "memory"] = "postgres"
+    SEARCH_INDEX_SNAPSHOT_PATH: str = str(DATA_DIR / "search_index.pkl")
+    SEARCH_INDEX_SNAPSHOT_EVERY: int = 500  # writes between snapshots
+    SEARCH_INDEX_REFRESH_SECONDS: float = 30  # catch-up with other workers' writes; 0 = load once
+    SEARCH_MAX_CANDIDATES: int = 10_000
+    # pg_trgm word similarity (0..1) required by match=fuzzy on location/title
+    TRGM_SIMILARITY_THRESHOLD: float = 0.6
+
+    # Result caches: "memory" (per process), "redis" (any Redis-protocol server) or "none"
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_MAX_ENTRIES: int = 10_000  # per cache
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # per cache, measured on pickled values
+    FEED_CACHE_TTL_SECONDS: float = 30
+    FACETS_CACHE_TTL_SECONDS: float = 120  # facet counts may lag writes by up to this long
+    FEED_TOTAL_CACHE_TTL_SECONDS: float = 60  # include_total=estimate|exact results, same lag rule as facets
+
+    # GET /job-listings/ page cap; full dumps go through /job-listings/export
+    JOB_LISTINGS_MAX_LIMIT: int = 100
+    EXPORT_BATCH_SIZE: int = 1000  # rows fetched per server-side cursor round trip
+
+    # GET /job-listings/matches: open jobs' skill vectors are rebuilt after writes or at this age
+    SKILL_MATCH_MAX_AGE_SECONDS: float = 300
+
+    # GET /job-listings/recommended: TF-IDF matrix built and refreshed by a background thread (0: only when a posting changes)
+    RECOMMENDER_REFRESH_SECONDS: float = 30
+    RECOMMENDER_REBUILD_FRACTION: float = 0.2  # full rebuild once changed rows exceed this share
+
+    # GET /job-listings/{id}/similar: LSH index built at startup by a background thread, which then catches
+    # up with other workers' writes at this interval (0: no periodic refresh, only this process's writes)
+    SIMILAR_JOBS_REFRESH_SECONDS: float = 30
+
+    # GET /search/suggest: prefix trie rebuilt at startup, then caught up every N seconds
+    # by a background thread (0 disables it and the endpoint returns no suggestions)
+    SUGGEST_REFRESH_SECONDS: float = 30
+
+    # Expiry sweeper: closes open postings past expires_at every N seconds (0 disables it)
+    JOB_EXPIRY_SWEEP_SECONDS: float = 60
+    JOB_EXPIRY_SWEEP_BATCH_SIZE: int = 500
+    JOB_EXPIRY_SWEEP_MAX_BATCHES: int = 20  # per run; the next run picks up the rest
+
+    # Saved searches: alerts for new postings matching an applicant's stored feed filters
+    SAVED_SEARCHES_PER_APPLICANT: int = 25
+
+    # Internal endpoints (/internal/*) are disabled unless a token is configured
+    INTERNAL_METRICS_TOKEN: str = ""
+
 
 settings = Settings()
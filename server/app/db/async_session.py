@@ -0,0 +1,79 @@
+"""asyncpg engine and ``AsyncSession`` dependency for ``DB_MODE=async``.
+
+The engine is created on first use, so a sync-mode process never imports
+asyncpg. It talks to the same database as ``app.db.session`` (DATABASE_URL
+with the driver swapped) and uses the same pool settings. With
+READ_REPLICA_URLS set, each replica gets an asyncpg engine too and sessions
+route statements with the same ``RoutingSession`` as the sync path.
+"""
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool
+from app.db.routing import ReplicaSet, RoutingSession
+from app.db.session import read_replica_urls
+
+_engine: Optional[AsyncEngine] = None
+_replica_engines: List[AsyncEngine] = []
+_session_factory: Optional[async_sessionmaker] = None
+
+
+def async_database_url(url: str) -> URL:
+    """``url`` with its driver replaced by asyncpg (postgresql+psycopg2://... -> postgresql+asyncpg://...)."""
+    return make_url(url).set(drivername="postgresql+asyncpg")
+
+
+def _create_async_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        async_database_url(url),
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE},
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    global _engine, _replica_engines, _session_factory
+    if _engine is None:
+        _engine = _create_async_engine(settings.DATABASE_URL)
+        _replica_engines = [_create_async_engine(url) for url in read_replica_urls()]
+        routing = {}
+        if _replica_engines:
+            # get_bind runs on the sync Session inside the AsyncSession, so it picks sync-facade engines
+            replicas = ReplicaSet([e.sync_engine for e in _replica_engines], settings.READ_REPLICA_BALANCE)
+            routing = {"sync_session_class": RoutingSession, "replicas": replicas}
+        # expire_on_commit=False: attributes are read after commit (responses, cache invalidation),
+        # and an expired attribute can't lazy-load outside the session's greenlet
+        _session_factory = async_sessionmaker(_engine, autoflush=False, expire_on_commit=False, **routing)
+    return _engine
+
+
+def get_async_replica_engines() -> List[AsyncEngine]:
+    return list(_replica_engines)
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    get_async_engine()
+    return _session_factory
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _engine, _replica_engines, _session_factory
+    if _engine is not None:
+        for replica in _replica_engines:
+            await replica.dispose()
+        await _engine.dispose()
+        _engine = _session_factory = None
+        _replica_engines = []
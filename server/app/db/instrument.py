@@ -0,0 +1,125 @@
+"""Per-request SQL instrumentation.
+
+``install()`` adds ``before/after_cursor_execute`` listeners on the
+``Engine`` class, so every engine (primary, replicas, the sync facade of the
+asyncpg engine) reports into the ``SqlStats`` of the request being served.
+``SqlInstrumentationMiddleware`` opens those stats per request, sends them as
+a ``Server-Timing`` header and logs requests that issue more statements than
+the budget, plus statements repeated often enough to look like an N+1 (the
+same SQL text with different parameters, e.g. one lookup per row of a list).
+
+When SQL_INSTRUMENTATION is off neither is installed, so there is no
+per-statement cost. Statements outside a request (background workers) are
+not counted.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger("app.db")
+
+
+class SqlStats:
+    __slots__ = ("statements", "seconds", "rows", "by_statement")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.by_statement: Counter = Counter()
+
+    def record(self, statement: str, seconds: float, rows: int) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        if rows > 0:
+            self.rows += rows
+        self.by_statement[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(sql, n) for sql, n in self.by_statement.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.statements} queries, {self.rows} rows"'
+
+
+_stats: ContextVar[Optional[SqlStats]] = ContextVar("sql_stats", default=None)
+
+
+def current_stats() -> Optional[SqlStats]:
+    return _stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _stats.get() is not None:
+        context._sql_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _stats.get()
+    started = getattr(context, "_sql_started", None)
+    if stats is None or started is None:
+        return
+    stats.record(statement, time.perf_counter() - started, cursor.rowcount)
+
+
+def install() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstall() -> None:
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SqlInstrumentationMiddleware:
+    """Pure ASGI middleware; the stats cover the whole request, including streamed bodies (the
+    ``Server-Timing`` header goes out with the response head, so it only has what ran before it)."""
+
+    def __init__(self, app, query_budget: int, n_plus_one_threshold: int) -> None:
+        self.app = app
+        self.query_budget = query_budget
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = SqlStats()
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                app_ms = (time.perf_counter() - started) * 1000
+                MutableHeaders(scope=message).append("server-timing", f"{stats.server_timing()}, app;dur={app_ms:.2f}")
+            await send(message)
+
+        token = _stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _stats.reset(token)
+            self._report(scope, stats, time.perf_counter() - started)
+
+    def _report(self, scope, stats: SqlStats, seconds: float) -> None:
+        if stats.statements > self.query_budget:
+            logger.warning(
+                "sql_budget_exceeded: method=%s path=%s statements=%d budget=%d db_ms=%.1f rows=%d total_ms=%.1f",
+                scope["method"], scope["path"], stats.statements, self.query_budget,
+                stats.seconds * 1000, stats.rows, seconds * 1000,
+            )
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "n_plus_one_suspect: method=%s path=%s count=%d statement=%s",
+                scope["method"], scope["path"], count, " ".join(statement.split())[:300],
+            )
@@ -1,7 +1,8 @@
 
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Text, Computed, Index, Integer, BigInteger, UniqueConstraint, and_
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR, ARRAY
 from sqlalchemy.sql import func
+from sqlalchemy.orm import deferred
 import uuid
 
 from app.db.session import Base
@@ -10,7 +11,7 @@ from app.db.session import Base
 class User(Base):
     __tablename__ = "users"
 
-    user_id = Column(UUID(as_uuid=True), primary_key=True, unique=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, nullable=False, index=True)
     password_hash = Column(String, nullable=False)
     first_name = Column(String, nullable=False)
@@ -35,7 +36,7 @@ class Applicant(Base):
 class Company(Base):
     __tablename__ = "companies"
 
-    company_id = Column(UUID(as_uuid=True), primary_key=True, unique=True, default=uuid.uuid4)
+    company_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, unique=True, nullable=False)
     description = Column(Text, nullable=True)
     website_url = Column(String, nullable=True)
@@ -49,14 +50,23 @@ class Recruiter(Base):
     __tablename__ = "recruiters"
 
     recruiter_id = Column(UUID(as_uuid=True), ForeignKey('users.user_id'), primary_key=True)
-    company_id = Column(UUID(as_uuid=True), ForeignKey('companies.company_id'), nullable=False)
+    company_id = Column(UUID(as_uuid=True), ForeignKey('companies.company_id'), nullable=False, index=True)
     updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
 
 
+class Skill(Base):
+    """Canonical skill dictionary; name is the normalized form (see app.search.skills)."""
+    __tablename__ = "skills"
+
+    skill_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+
+
 class JobPosting(Base):
     __tablename__ = "job_postings"
 
-    job_id = Column(UUID(as_uuid=True), primary_key=True, unique=True, default=uuid.uuid4)
+    job_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     company_id = Column(UUID(as_uuid=True), ForeignKey('companies.company_id'), nullable=False)
     recruiter_id = Column(UUID(as_uuid=True), ForeignKey('recruiters.recruiter_id'), nullable=False)
     title = Column(String, nullable=False)
@@ -64,6 +74,8 @@ class JobPosting(Base):
     requirements = Column(Text, nullable=False)
     # Keeping as TEXT to match architecture.md (can later switch to JSONB if desired)
     skills_required = Column(Text, nullable=True)
+    # skills_required resolved against the skills dictionary: sorted skill_id values (sparse skill vector)
+    skill_ids = Column(ARRAY(Integer), nullable=True)
     location = Column(String, nullable=False)
     experience_level = Column(String, nullable=True)
     job_type = Column(Enum('full-time', 'part-time', 'internship', 'contract', name='job_type_enum'), nullable=False)
@@ -72,15 +84,98 @@ class JobPosting(Base):
     expires_at = Column(DateTime, nullable=True)
     status = Column(Enum('open', 'closed', 'draft', name='job_status_enum'), nullable=False)
     updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+    # Weighted full-text document maintained by Postgres (title > skills/location > description > requirements)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(skills_required, '')), 'B') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(location, '')), 'B') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(requirements, '')), 'D')",
+            persisted=True,
+        ),
+    ))
+
+    __table_args__ = (
+        Index("ix_job_postings_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_job_postings_location_trgm", "location", postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"}),
+        Index("ix_job_postings_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        # keyset feed ordering, plus the same ordering restricted to open postings
+        Index("ix_job_postings_posted_at_job_id", posted_at.desc(), job_id.desc()),
+        Index("ix_job_postings_updated_at_job_id", updated_at.desc(), job_id.desc()),
+        Index("ix_job_postings_open_posted_at_job_id", posted_at.desc(), job_id.desc(), postgresql_where=(status == "open")),
+        # expiry sweeper: only open postings that can expire, oldest deadline first
+        Index(
+            "ix_job_postings_open_expires_at",
+            expires_at,
+            postgresql_where=and_(status == "open", expires_at.isnot(None)),
+        ),
+        Index("ix_job_postings_company_posted_at", company_id, posted_at.desc(), job_id.desc()),
+        Index("ix_job_postings_recruiter_status", recruiter_id, status),
+        Index("ix_job_postings_skill_ids", "skill_ids", postgresql_using="gin"),
+    )
 
 
 class Application(Base):
     __tablename__ = "applications"
 
-    application_id = Column(UUID(as_uuid=True), primary_key=True, unique=True, default=uuid.uuid4)
+    application_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     job_id = Column(UUID(as_uuid=True), ForeignKey('job_postings.job_id'), nullable=False)
     applicant_id = Column(UUID(as_uuid=True), ForeignKey('applicants.applicant_id'), nullable=False)
     applied_at = Column(DateTime, nullable=False, default=func.now())
     status = Column(Enum('applied', 'under review', 'shortlisted', 'rejected', 'hired', name='application_status_enum'), nullable=False)
     cover_letter = Column(Text, nullable=True)
     updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # a job's applicants newest first, keyset-paged on (applied_at, application_id)
+        Index("ix_applications_job_applied_at_id", job_id, applied_at.desc(), application_id.desc()),
+        Index("ix_applications_applicant_applied_at", applicant_id, applied_at.desc()),
+        # one application per applicant and job; the apply INSERT's ON CONFLICT target
+        Index("ux_applications_job_applicant", job_id, applicant_id, unique=True),
+    )
+
+
+class SavedSearch(Base):
+    """An applicant's stored feed filters, alerted on new matching postings.
+
+    anchor_key is the one percolation key the search is filed under (see app.search.percolate).
+    """
+    __tablename__ = "saved_searches"
+
+    saved_search_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    applicant_id = Column(UUID(as_uuid=True), ForeignKey('applicants.applicant_id'), nullable=False)
+    name = Column(String, nullable=True)
+    company_id = Column(UUID(as_uuid=True), nullable=True)
+    location = Column(String, nullable=True)
+    title = Column(String, nullable=True)
+    match = Column(String, nullable=False, default="contains")
+    job_type = Column(String, nullable=True)
+    experience_level = Column(String, nullable=True)
+    q = Column(String, nullable=True)
+    anchor_key = Column(String, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("ix_saved_searches_anchor_key", anchor_key),
+        Index("ix_saved_searches_applicant_created_at", applicant_id, created_at.desc()),
+    )
+
+
+class SearchAlert(Base):
+    """Notification queue: one row per (saved search, new matching posting), consumed by setting delivered_at."""
+    __tablename__ = "search_alerts"
+
+    alert_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    saved_search_id = Column(UUID(as_uuid=True), ForeignKey('saved_searches.saved_search_id', ondelete="CASCADE"), nullable=False)
+    applicant_id = Column(UUID(as_uuid=True), ForeignKey('applicants.applicant_id'), nullable=False)
+    job_id = Column(UUID(as_uuid=True), ForeignKey('job_postings.job_id', ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+    delivered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("saved_search_id", "job_id", name="uq_search_alerts_saved_search_job"),
+        # pending alerts per applicant, in queue order
+        Index("ix_search_alerts_pending", applicant_id, alert_id, postgresql_where=(delivered_at.is_(None))),
+    )
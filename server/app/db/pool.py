@@ -0,0 +1,150 @@
+"""Connection pool instrumentation.
+
+``InstrumentedQueuePool`` is a ``QueuePool`` that times every checkout,
+including the time spent blocked on a full pool (and opening a new connection
+when one is needed), and counts checkouts that hit ``pool_timeout``. Pool
+events add how long connections stay checked out and how long DBAPI
+connections live before they are closed (recycled, invalidated, or overflow
+connections discarded on return).
+
+``InstrumentedAsyncQueuePool`` does the same for the asyncpg engine used when
+``DB_MODE=async``; there a checkout that has to wait suspends the request's
+coroutine instead of blocking a thread, but the wait is timed the same way.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.lib.metrics import Histogram
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self.checkout_wait = Histogram()
+        self.checkout_hold = Histogram()
+        self.connection_lifetime = Histogram((1, 10, 60, 300, 600, 1800, 3600, 4 * 3600, 24 * 3600))
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def listen(self, pool: Pool) -> None:
+        """Attach the event hooks; listeners are carried over when the engine recreates its pool."""
+
+        @event.listens_for(pool, "connect")
+        def _connect(dbapi_connection, record):
+            record.info["connected_at"] = time.monotonic()
+            self.incr("connects")
+
+        @event.listens_for(pool, "close")
+        def _close(dbapi_connection, record):
+            connected_at = record.info.pop("connected_at", None)
+            if connected_at is not None:
+                self.connection_lifetime.observe(time.monotonic() - connected_at)
+            self.incr("closes")
+
+        @event.listens_for(pool, "invalidate")
+        def _invalidate(dbapi_connection, record, exception):
+            self.incr("invalidations")
+
+        @event.listens_for(pool, "checkout")
+        def _checkout(dbapi_connection, record, proxy):
+            record.info["checked_out_at"] = time.perf_counter()
+
+        @event.listens_for(pool, "checkin")
+        def _checkin(dbapi_connection, record):
+            checked_out_at = record.info.pop("checked_out_at", None)
+            if checked_out_at is not None:
+                self.checkout_hold.observe(time.perf_counter() - checked_out_at)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            counters = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "closes": self.closes,
+                "invalidations": self.invalidations,
+            }
+        return {
+            **counters,
+            "checkout_wait": self.checkout_wait.as_dict(),
+            "checkout_hold": self.checkout_hold.as_dict(),
+            # connections closed so far (open ones are not included); keyed in ms like the others
+            "connection_lifetime": self.connection_lifetime.as_dict(),
+        }
+
+
+class _TimedCheckout:
+    """Mixin for QueuePool subclasses: time ``_do_get`` into ``self.metrics``."""
+
+    metrics: PoolMetrics
+
+    def _init_metrics(self, metrics: Optional[PoolMetrics], dispatched: bool) -> None:
+        self.metrics = metrics or PoolMetrics()
+        if not dispatched:
+            self.metrics.listen(self)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.checkout_wait.observe(time.perf_counter() - started)
+            self.metrics.incr("timeouts")
+            raise
+        self.metrics.checkout_wait.observe(time.perf_counter() - started)
+        self.metrics.incr("checkouts")
+        return record
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep accumulating into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    def __init__(self, creator, *, metrics: Optional[PoolMetrics] = None, **kw):
+        super().__init__(creator, **kw)
+        self._init_metrics(metrics, dispatched=kw.get("_dispatch") is not None)
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    def __init__(self, creator, *, metrics: Optional[PoolMetrics] = None, **kw):
+        super().__init__(creator, **kw)
+        self._init_metrics(metrics, dispatched=kw.get("_dispatch") is not None)
+
+
+def pool_status(pool: Pool) -> dict:
+    """Live gauges plus the accumulated metrics of an engine's pool."""
+    status = {}
+    if isinstance(pool, QueuePool):
+        overflow = pool.overflow()
+        status = {
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout_seconds": pool.timeout(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # open connections beyond pool_size (negative overflow means the pool is not full yet)
+            "overflow": max(overflow, 0),
+            "connections": pool.size() + overflow,
+        }
+    status["recycle_seconds"] = pool._recycle
+    status["pre_ping"] = pool._pre_ping
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.as_dict())
+    return status
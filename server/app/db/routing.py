@@ -0,0 +1,145 @@
+"""Read-replica routing.
+
+``RoutingSession`` picks an engine per statement in ``get_bind``. Writes
+(flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, raw ``text()`` SQL)
+always go to the primary. A SELECT goes to a replica only while the current request is marked
+read-only and the session has not written yet; the session then keeps that
+replica, so one request never mixes snapshots from two replicas. Sessions
+opened outside a request (background workers, scripts) stay on the primary.
+
+``ReadReplicaMiddleware`` marks GET/HEAD requests read-only, unless the
+client wrote within ``READ_YOUR_WRITES_SECONDS``: a request that wrote sets a
+cookie holding the time until which that client's reads go to the primary, so
+it sees its own writes however far the replicas lag. The cookie is per
+client, not per user, and works across workers without shared state.
+"""
+from __future__ import annotations
+
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Optional, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+
+STICKY_COOKIE = "db_primary_until"
+_READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+class RouteState:
+    __slots__ = ("read_only", "wrote")
+
+    def __init__(self, read_only: bool) -> None:
+        self.read_only = read_only
+        self.wrote = False
+
+
+# set per request by the middleware; threadpool endpoints see it through the copied context
+_route: ContextVar[Optional[RouteState]] = ContextVar("db_route", default=None)
+
+
+def current_route() -> Optional[RouteState]:
+    return _route.get()
+
+
+def mark_written() -> None:
+    """Record a write made for the current request outside its session (e.g. by the apply batcher),
+    so the client still gets the read-your-writes cookie."""
+    state = _route.get()
+    if state is not None:
+        state.wrote = True
+
+
+class ReplicaSet:
+    """The replica engines and the balancing policy used to pick one for a session."""
+
+    def __init__(self, engines: Sequence[Engine], balance: str = "round_robin") -> None:
+        if not engines:
+            raise ValueError("ReplicaSet needs at least one engine")
+        self.engines = list(engines)
+        self.balance = balance
+        self._counter = itertools.count()
+
+    def choose(self) -> Engine:
+        start = next(self._counter) % len(self.engines)
+        if self.balance == "round_robin":
+            return self.engines[start]
+        # least_connections: fewest connections checked out; ties rotate so one replica isn't always first
+        rotated = self.engines[start:] + self.engines[:start]
+        return min(rotated, key=lambda engine: engine.pool.checkedout())
+
+
+def _is_write(clause) -> bool:
+    if clause is None:
+        return False
+    if isinstance(clause, TextClause):
+        return True  # raw SQL may write (e.g. the apply INSERT ... RETURNING)
+    return bool(getattr(clause, "is_dml", False)) or getattr(clause, "_for_update_arg", None) is not None
+
+
+class RoutingSession(Session):
+    def __init__(self, *, replicas: ReplicaSet, **kw) -> None:
+        super().__init__(**kw)
+        self._replicas = replicas
+        self._replica: Optional[Engine] = None
+        self._wrote = False
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if self._flushing or _is_write(clause):
+            self._wrote = True
+            state = _route.get()
+            if state is not None:
+                state.wrote = True
+            return primary
+        state = _route.get()
+        # clause is None for Session.connection(): raw work that may write
+        if clause is None or self._wrote or state is None or not state.read_only:
+            return primary
+        if self._replica is None:
+            self._replica = self._replicas.choose()
+        return self._replica
+
+
+class ReadReplicaMiddleware:
+    """Pure ASGI middleware; it sets the route state for the whole request, including streamed bodies."""
+
+    def __init__(self, app, sticky_seconds: float) -> None:
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+
+    def _sticky(self, scope, now: float) -> bool:
+        raw = HTTPConnection(scope).cookies.get(STICKY_COOKIE)
+        try:
+            until = float(raw) if raw else 0.0
+        except ValueError:
+            return False
+        # a forged far-future value only buys one window
+        return now < until <= now + self.sticky_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        now = time.time()
+        state = RouteState(read_only=scope["method"] in _READ_METHODS and not self._sticky(scope, now))
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and state.wrote and self.sticky_seconds > 0:
+                until = time.time() + self.sticky_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{STICKY_COOKIE}={until:.3f}; Max-Age={int(self.sticky_seconds) + 1}; Path=/; "
+                    "HttpOnly; SameSite=none; Secure",
+                )
+            await send(message)
+
+        token = _route.set(state)
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _route.reset(token)
@@ -2,13 +2,37 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool
+from app.db.routing import ReplicaSet, RoutingSession
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _create_engine(url: str):
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
+def read_replica_urls() -> list[str]:
+    return [url.strip() for url in settings.READ_REPLICA_URLS.split(",") if url.strip()]
+
+
+engine = _create_engine(SQLALCHEMY_DATABASE_URL)
+replica_engines = [_create_engine(url) for url in read_replica_urls()]
+if replica_engines:
+    SessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=engine,
+        class_=RoutingSession, replicas=ReplicaSet(replica_engines, settings.READ_REPLICA_BALANCE),
+    )
+else:
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
@@ -18,3 +42,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_session_factory():
+    """For streaming responses: the body is produced after get_db's cleanup runs, so the
+    generator opens (and closes) its own session."""
+    return SessionLocal
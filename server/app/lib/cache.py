@@ -0,0 +1,450 @@
+"""Tag-invalidated result cache.
+
+Entries are stored under a key together with a set of tags (for example
+``"feed"``, ``"company:<id>"``, ``"job:<id>"``). Invalidating a tag drops
+every entry carrying it. Each tag also has a version counter: a value computed
+on a miss is only stored if none of its tags were invalidated while it was
+being computed, so a write racing with a slow read cannot leave stale data
+behind.
+
+Two backends share the same interface:
+
+- ``InMemoryCache``: per-process LRU with TTL, bounded by entry count and by
+  the approximate (pickled) size of the stored values.
+- ``RedisCache``: any server speaking the Redis protocol (RESP2), reached with
+  a small built-in client so no extra dependency is needed.
+"""
+from __future__ import annotations
+
+import abc
+import pickle
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from urllib.parse import urlparse
+
+from anyio import to_thread
+
+MISS = object()
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.stale_sets = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "sets": self.sets,
+            "stale_sets": self.stale_sets,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
+
+
+class TaggedCache(abc.ABC):
+    """Interface shared by the cache backends."""
+
+    def __init__(self, *, default_ttl: float) -> None:
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Any:
+        ...
+
+    @abc.abstractmethod
+    def tag_versions(self, tags: Iterable[str]) -> dict:
+        ...
+
+    @abc.abstractmethod
+    def set(self, key: str, value: Any, *, tags: Iterable[str], versions: dict, ttl: Optional[float] = None) -> bool:
+        """Store ``value`` unless a tag in ``versions`` moved since it was read. Returns whether it was stored."""
+        ...
+
+    @abc.abstractmethod
+    def invalidate(self, *tags: str) -> None:
+        ...
+
+    def info(self) -> dict:
+        return {}
+
+    def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        *,
+        tags: Iterable[str],
+        value_tags: Optional[Callable[[Any], Iterable[str]]] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Return the cached value for ``key`` or compute and store it.
+
+        ``tags`` are known up front and version-checked; ``value_tags`` derives
+        extra tags from the computed value (e.g. one per returned row).
+        """
+        value = self._lookup(key)
+        if value is not MISS:
+            return value
+        tags = list(tags)
+        versions = self.tag_versions(tags)
+        value = compute()
+        self._store(key, value, tags, versions, value_tags, ttl)
+        return value
+
+    async def aget_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        *,
+        tags: Iterable[str],
+        value_tags: Optional[Callable[[Any], Iterable[str]]] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """``get_or_set`` for a coroutine function ``compute`` (the DB_MODE=async request path).
+
+        The backend calls run on a worker thread: for Redis they are blocking socket round
+        trips, and the in-memory lock is shared with the threadpool.
+        """
+        tags = list(tags)
+        value, versions = await to_thread.run_sync(self._lookup_versions, key, tags)
+        if value is not MISS:
+            return value
+        value = await compute()
+        await to_thread.run_sync(self._store, key, value, tags, versions, value_tags, ttl)
+        return value
+
+    def _lookup_versions(self, key: str, tags: list) -> tuple[Any, Optional[dict]]:
+        # one thread hop for the lookup and, on a miss, the tag versions to check the store against
+        value = self._lookup(key)
+        return value, self.tag_versions(tags) if value is MISS else None
+
+    def _lookup(self, key: str) -> Any:
+        value = self.get(key)
+        if value is not MISS:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+        return value
+
+    def _store(self, key, value, tags: list, versions: dict, value_tags, ttl) -> None:
+        if value_tags is not None:
+            tags.extend(tag for tag in value_tags(value) if tag not in versions)
+        if self.set(key, value, tags=tags, versions=versions, ttl=ttl):
+            self.stats.sets += 1
+        else:
+            self.stats.stale_sets += 1
+
+
+class InMemoryCache(TaggedCache):
+    def __init__(self, *, default_ttl: float, max_entries: int = 10_000, max_bytes: int = 64 * 1024 * 1024) -> None:
+        super().__init__(default_ttl=default_ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (expires_at, size, tags, value); insertion order doubles as LRU order
+        self._entries: OrderedDict[str, tuple[float, int, tuple, Any]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._tag_versions: dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            if entry[0] <= time.monotonic():
+                self._drop(key)
+                return MISS
+            self._entries.move_to_end(key)
+            return entry[3]
+
+    def tag_versions(self, tags: Iterable[str]) -> dict:
+        with self._lock:
+            return {tag: self._tag_versions.get(tag, 0) for tag in tags}
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str], versions: dict, ttl: Optional[float] = None) -> bool:
+        tags = tuple(tags)
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            return False
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if any(self._tag_versions.get(tag, 0) != version for tag, version in versions.items()):
+                return False
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (expires_at, size, tags, value)
+            self._bytes += size
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.stats.evictions += 1
+        return True
+
+    def invalidate(self, *tags: str) -> None:
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+                for key in self._keys_by_tag.pop(tag, ()):
+                    if key in self._entries:
+                        self._drop(key)
+            self.stats.invalidations += 1
+
+    def _drop(self, key: str) -> None:
+        _, size, tags, _ = self._entries.pop(key)
+        self._bytes -= size
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def info(self) -> dict:
+        with self._lock:
+            return {"backend": "memory", "entries": len(self._entries), "bytes": self._bytes}
+
+
+class RespError(Exception):
+    pass
+
+
+class RespConnection:
+    """Minimal blocking RESP2 client: enough for GET/SET/DEL/INCR/MGET/SADD/SMEMBERS."""
+
+    def __init__(self, url: str, *, timeout: float = 1.0) -> None:
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int((parsed.path or "/0").lstrip("/") or 0)
+        self.password = parsed.password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._file = self._sock.makefile("rb")
+        if self.password:
+            self._roundtrip([("AUTH", self.password)])
+        if self.db:
+            self._roundtrip([("SELECT", self.db)])
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+                self._file = None
+
+    @staticmethod
+    def _encode(args: tuple) -> bytes:
+        out = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            out.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(out)
+
+    def _read(self) -> Any:
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("connection closed by server")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            # returned, not raised, so the caller can still read the replies queued behind it
+            return RespError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self._file.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            if length < 0:
+                return None
+            return [self._read() for _ in range(length)]
+        raise ConnectionError(f"unexpected reply: {line!r}")
+
+    def _roundtrip(self, commands: list[tuple]) -> list:
+        self._sock.sendall(b"".join(self._encode(cmd) for cmd in commands))
+        replies = [self._read() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def pipeline(self, *commands: tuple) -> list:
+        """Send several commands in one round trip and return their replies."""
+        with self._lock:
+            for attempt in (0, 1):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._roundtrip(list(commands))
+                except RespError:
+                    raise  # every reply was read, so the connection is still in step
+                except Exception as exc:
+                    # replies may be left unread on the socket: continue on a fresh connection
+                    self.close()
+                    if attempt or not isinstance(exc, OSError):
+                        raise
+
+    def execute(self, *args) -> Any:
+        return self.pipeline(args)[0]
+
+
+class RedisCache(TaggedCache):
+    """Tagged cache on a Redis-protocol server.
+
+    Values are pickled; the server is assumed to be a trusted internal
+    component. Entries live under ``prefix``; the ``tag:<name>`` sets of
+    member keys and ``tagv:<name>`` version counters live under
+    ``tag_prefix``, which the named caches share, so invalidating a tag
+    through any of them (or ``invalidate()``) reaches all of them, in every
+    process. Connection errors degrade to cache misses.
+    """
+
+    def __init__(
+        self, url: str, *, default_ttl: float, prefix: str = "internhub:", tag_prefix: Optional[str] = None
+    ) -> None:
+        super().__init__(default_ttl=default_ttl)
+        self.conn = RespConnection(url)
+        self.prefix = prefix
+        self.tag_prefix = prefix if tag_prefix is None else tag_prefix
+        self.errors = 0
+
+    def _k(self, name: str) -> str:
+        return self.prefix + name
+
+    def _t(self, name: str) -> str:
+        return self.tag_prefix + name
+
+    def get(self, key: str) -> Any:
+        try:
+            raw = self.conn.execute("GET", self._k(key))
+        except (OSError, RespError):
+            self.errors += 1
+            return MISS
+        return MISS if raw is None else pickle.loads(raw)
+
+    def tag_versions(self, tags: Iterable[str]) -> dict:
+        tags = list(tags)
+        if not tags:
+            return {}
+        try:
+            values = self.conn.execute("MGET", *[self._t(f"tagv:{tag}") for tag in tags])
+        except (OSError, RespError):
+            self.errors += 1
+            return {tag: None for tag in tags}
+        return {tag: int(v) if v is not None else 0 for tag, v in zip(tags, values)}
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str], versions: dict, ttl: Optional[float] = None) -> bool:
+        tags = list(tags)
+        if None in versions.values():
+            return False
+        ttl_ms = int((self.default_ttl if ttl is None else ttl) * 1000)
+        commands = [("SET", self._k(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), "PX", ttl_ms)]
+        for tag in tags:
+            commands.append(("SADD", self._t(f"tag:{tag}"), self._k(key)))
+            commands.append(("PEXPIRE", self._t(f"tag:{tag}"), ttl_ms * 2))
+        try:
+            self.conn.pipeline(*commands)
+            # re-check after writing: if a tag moved meanwhile, the entry may be stale
+            if self.tag_versions(versions) != versions:
+                self.conn.execute("DEL", self._k(key))
+                return False
+        except (OSError, RespError):
+            self.errors += 1
+            return False
+        return True
+
+    def invalidate(self, *tags: str) -> None:
+        try:
+            replies = self.conn.pipeline(
+                *[("INCR", self._t(f"tagv:{tag}")) for tag in tags],
+                *[("SMEMBERS", self._t(f"tag:{tag}")) for tag in tags],
+            )
+            keys = {member for members in replies[len(tags):] for member in (members or [])}
+            if keys or tags:
+                self.conn.execute("DEL", *keys, *[self._t(f"tag:{tag}") for tag in tags])
+        except (OSError, RespError):
+            self.errors += 1
+            return
+        self.stats.invalidations += 1
+
+    def info(self) -> dict:
+        return {"backend": "redis", "host": self.conn.host, "port": self.conn.port, "errors": self.errors}
+
+
+REDIS_PREFIX = "internhub:"
+
+_caches: dict[str, TaggedCache] = {}
+_caches_lock = threading.Lock()
+_redis_tags: Optional[RedisCache] = None
+
+
+def get_cache(name: str, *, ttl: float) -> Optional[TaggedCache]:
+    """Return the named result cache for this process (None when caching is disabled)."""
+    from app.core.config import settings
+
+    if settings.CACHE_BACKEND == "none":
+        return None
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                if settings.CACHE_BACKEND == "redis":
+                    cache = RedisCache(
+                        settings.CACHE_REDIS_URL, default_ttl=ttl, prefix=f"{REDIS_PREFIX}{name}:", tag_prefix=REDIS_PREFIX
+                    )
+                else:
+                    cache = InMemoryCache(
+                        default_ttl=ttl,
+                        max_entries=settings.CACHE_MAX_ENTRIES,
+                        max_bytes=settings.CACHE_MAX_BYTES,
+                    )
+                _caches[name] = cache
+    return cache
+
+
+def invalidate(*tags: str) -> None:
+    """Invalidate ``tags`` in every cache: the ones created in this process, or with the Redis
+    backend the shared tags on the server, whether or not this process has used a cache yet."""
+    from app.core.config import settings
+
+    global _redis_tags
+    if settings.CACHE_BACKEND == "redis":
+        if _redis_tags is None:
+            with _caches_lock:
+                if _redis_tags is None:
+                    _redis_tags = RedisCache(settings.CACHE_REDIS_URL, default_ttl=0, prefix=REDIS_PREFIX)
+        _redis_tags.invalidate(*tags)
+        return
+    for cache in list(_caches.values()):
+        cache.invalidate(*tags)
+
+
+def cache_metrics() -> dict:
+    return {name: {**cache.stats.as_dict(), **cache.info()} for name, cache in _caches.items()}
@@ -0,0 +1,69 @@
+"""In-process metric primitives reported by the internal metrics endpoint."""
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Optional, Sequence
+
+# upper bucket bounds in seconds, 1 ms .. 30 s
+DEFAULT_BOUNDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; thread-safe, constant memory."""
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * (len(self.bounds) + 1)  # last bucket is +Inf
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.bounds, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th observation (None when empty or beyond the last bound)."""
+        with self._lock:
+            return self._quantile(list(self.counts), self.count, q)
+
+    def _quantile(self, counts: list, count: int, q: float) -> Optional[float]:
+        if not count:
+            return None
+        rank = q * count
+        seen = 0
+        for bound, n in zip(self.bounds, counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return None
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            counts, count, total, peak = list(self.counts), self.count, self.total, self.max
+        labels = [f"{bound * 1000:g}" for bound in self.bounds] + ["+Inf"]
+
+        def _ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "count": count,
+            "sum_ms": _ms(total),
+            "mean_ms": _ms(total / count) if count else None,
+            "max_ms": _ms(peak),
+            "p50_ms": _ms(self._quantile(counts, count, 0.5)),
+            "p95_ms": _ms(self._quantile(counts, count, 0.95)),
+            "p99_ms": _ms(self._quantile(counts, count, 0.99)),
+            # observations per bucket, keyed by the bucket's upper bound in ms
+            "buckets_ms": dict(zip(labels, counts)),
+        }
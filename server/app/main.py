@@ -1,4 +1,6 @@
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -9,13 +11,65 @@ from app.api.v1.api import api_router
 from app.core.config import settings
 from app.constants.paths import ensure_static_dirs, STATIC_DIR
 from app.core.logger import setup_logging
+from app.db.async_session import dispose_async_engine
+from app.db import instrument
+from app.db.routing import ReadReplicaMiddleware
+from app.db.session import SessionLocal, replica_engines
+from app.search.backend import get_search_backend
+from app.search.recommend import get_recommender
+from app.search.similar import get_similar_jobs
+from app.search.suggest import get_suggester
+from app.tasks.apply_batcher import get_apply_batcher
+from app.tasks.expiry import get_expiry_sweeper
 
 # Initialize logging early
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # in-process search index: loaded (snapshot + catch-up) and kept fresh by a background thread;
+    # the feed uses Postgres full-text search until it is ready
+    search_backend = get_search_backend()
+    if search_backend is not None:
+        search_backend.start(SessionLocal)
+    # builds the recommendation matrix in the background, then keeps it fresh
+    recommender = get_recommender()
+    recommender.start(SessionLocal)
+    # LSH index behind /job-listings/{job_id}/similar, built and caught up by a background thread
+    similar_jobs = get_similar_jobs()
+    similar_jobs.start(SessionLocal)
+    # typeahead trie; lookups never query the database
+    suggester = get_suggester() if settings.SUGGEST_REFRESH_SECONDS > 0 else None
+    if suggester is not None:
+        suggester.start(SessionLocal)
+    # closes open postings past expires_at in small SKIP LOCKED batches
+    sweeper = get_expiry_sweeper() if settings.JOB_EXPIRY_SWEEP_SECONDS > 0 else None
+    if sweeper is not None:
+        sweeper.start(SessionLocal)
+    # coalesces concurrent applies into one INSERT and commit
+    apply_batcher = get_apply_batcher() if settings.APPLY_BATCHING else None
+    if apply_batcher is not None:
+        apply_batcher.start(SessionLocal)
+    yield
+    if apply_batcher is not None:
+        apply_batcher.stop()
+    if sweeper is not None:
+        sweeper.stop()
+    if suggester is not None:
+        suggester.stop()
+    similar_jobs.stop()
+    recommender.stop()
+    if search_backend is not None:
+        search_backend.stop()
+        search_backend.save_snapshot()
+    await dispose_async_engine()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -25,6 +79,16 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if replica_engines:
+    # marks GET/HEAD requests read-only so their SELECTs can go to a replica
+    app.add_middleware(ReadReplicaMiddleware, sticky_seconds=settings.READ_YOUR_WRITES_SECONDS)
+if settings.SQL_INSTRUMENTATION:
+    instrument.install()
+    app.add_middleware(
+        instrument.SqlInstrumentationMiddleware,
+        query_budget=settings.SQL_QUERY_BUDGET,
+        n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD,
+    )
 
 # Ensure static directories exist and mount them for serving
 ensure_static_dirs()
@@ -0,0 +1,144 @@
+"""Async counterparts of ``app.repository.application`` for ``DB_MODE=async``."""
+import uuid
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from app.db.models import Application, JobPosting, Applicant, User, Company
+from app.repository.application import (
+    APPLICATION_BY_JOB_AND_APPLICANT,
+    APPLICATION_LIST_COLUMNS,
+    APPLY_TO_JOB,
+    BULK_UPDATE_APPLICATION_STATUS,
+    LOCK_APPLICATIONS_IN_ORDER,
+    _list_item,
+    applications_page_query,
+    applications_page_result,
+    bulk_update_params,
+)
+from app.repository.job_listing import JOB_BY_ID, _decode_cursor
+from app.repository.user import APPLICANT_BY_USER_ID
+
+
+async def get_application_by_job_and_applicant(db: AsyncSession, *, job_id: UUID, applicant_id: UUID) -> Application | None:
+    return await db.scalar(APPLICATION_BY_JOB_AND_APPLICANT, {"job_id": job_id, "applicant_id": applicant_id})
+
+
+async def apply_to_job(db: AsyncSession, *, job_id: UUID, user_id: UUID, cover_letter: str | None) -> Row:
+    params = {"job_id": job_id, "user_id": user_id, "application_id": uuid.uuid4(), "cover_letter": cover_letter}
+    outcome = (await db.execute(APPLY_TO_JOB, params)).one()
+    await db.commit()
+    return outcome
+
+
+async def create_application(db: AsyncSession, *, job_id: UUID, applicant_id: UUID, cover_letter: str | None) -> Application:
+    app = Application(
+        job_id=job_id,
+        applicant_id=applicant_id,
+        status="applied",
+        cover_letter=cover_letter,
+    )
+    db.add(app)
+    await db.commit()
+    await db.refresh(app)
+    return app
+
+
+async def ensure_job_exists(db: AsyncSession, *, job_id: UUID) -> JobPosting:
+    job = await db.scalar(JOB_BY_ID, {"job_id": job_id})
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job listing not found")
+    return job
+
+
+async def ensure_applicant_profile(db: AsyncSession, *, user_id: UUID) -> Applicant:
+    applicant = await db.scalar(APPLICANT_BY_USER_ID, {"user_id": user_id})
+    if not applicant:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Applicant profile not found")
+    return applicant
+
+
+async def list_applications_for_job(db: AsyncSession, *, job_id: UUID):
+    rows = await db.execute(
+        select(*APPLICATION_LIST_COLUMNS)
+        .join(Applicant, Applicant.applicant_id == Application.applicant_id)
+        .join(User, User.user_id == Applicant.applicant_id)
+        .where(Application.job_id == job_id)
+        .order_by(Application.applied_at.desc(), Application.application_id.desc())
+    )
+    return [_list_item(r) for r in rows]
+
+
+async def list_applications_page(
+    db: AsyncSession,
+    *,
+    job_id: UUID,
+    status_value: Optional[str] = None,
+    q: Optional[str] = None,
+    limit: int,
+    cursor: Optional[str] = None,
+):
+    after = _decode_cursor(cursor)
+    with_counts = after is None
+    stmt = applications_page_query(
+        job_id=job_id, status_value=status_value, q=q, after=after, limit=limit, with_counts=with_counts
+    )
+    return applications_page_result(await db.execute(stmt), limit=limit, with_counts=with_counts)
+
+
+async def update_application_status(db: AsyncSession, *, application_id: UUID, status_value: str) -> Application:
+    app = await db.scalar(select(Application).where(Application.application_id == application_id).limit(1))
+    if not app:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
+    app.status = status_value
+    await db.commit()
+    await db.refresh(app)
+    return app
+
+
+async def bulk_update_application_status(db: AsyncSession, *, statuses: dict, company_id: UUID) -> dict:
+    params = bulk_update_params(statuses, company_id)
+    await db.execute(LOCK_APPLICATIONS_IN_ORDER, {"application_ids": params["application_ids"], "company_id": company_id})
+    rows = (await db.execute(BULK_UPDATE_APPLICATION_STATUS, params)).all()
+    await db.commit()
+    return {row.application_id: row.status for row in rows}
+
+
+async def list_applied_job_ids(db: AsyncSession, *, applicant_id: UUID) -> set:
+    return set(await db.scalars(select(Application.job_id).where(Application.applicant_id == applicant_id)))
+
+
+async def list_applications_for_applicant(db: AsyncSession, *, applicant_id: UUID):
+    rows = await db.execute(
+        select(
+            Application.application_id,
+            Application.status,
+            JobPosting.job_id,
+            JobPosting.title.label("job_title"),
+            JobPosting.job_type,
+            JobPosting.location.label("job_location"),
+            Company.company_id,
+            Company.name.label("company_name"),
+        )
+        .join(JobPosting, JobPosting.job_id == Application.job_id)
+        .join(Company, Company.company_id == JobPosting.company_id)
+        .where(Application.applicant_id == applicant_id)
+        .order_by(Application.applied_at.desc())
+    )
+    return [
+        {
+            "application_id": r.application_id,
+            "status": str(r.status),
+            "job_id": r.job_id,
+            "job_title": r.job_title,
+            "job_type": str(r.job_type),
+            "job_location": r.job_location,
+            "company_id": r.company_id,
+            "company_name": r.company_name,
+        }
+        for r in rows
+    ]
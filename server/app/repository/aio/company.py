@@ -0,0 +1,31 @@
+"""Async counterparts of ``app.repository.company``; create/update reuse the sync code via ``run_sync``."""
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Company, Recruiter
+from app.repository import company as sync_repo
+from app.repository.company import COMPANY_BY_ID, RECRUITER_BY_USER_ID
+from app.schemas.company import CompanyCreate, CompanyUpdate
+
+
+async def get_company(db: AsyncSession, company_id: UUID) -> Company | None:
+    return await db.scalar(COMPANY_BY_ID, {"company_id": company_id})
+
+
+async def list_companies(db: AsyncSession) -> list[Company]:
+    return list(await db.scalars(select(Company).order_by(Company.name.asc())))
+
+
+async def get_recruiter_by_user_id(db: AsyncSession, user_id: UUID) -> Recruiter | None:
+    return await db.scalar(RECRUITER_BY_USER_ID, {"user_id": user_id})
+
+
+async def create_company(db: AsyncSession, *, recruiter_user_id: UUID, company_in: CompanyCreate) -> Company:
+    return await db.run_sync(sync_repo.create_company, recruiter_user_id=recruiter_user_id, company_in=company_in)
+
+
+async def update_company(db: AsyncSession, company_id: UUID, company_update: CompanyUpdate, current_user: Any) -> Company:
+    return await db.run_sync(sync_repo.update_company, company_id, company_update, current_user)
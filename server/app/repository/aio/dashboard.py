@@ -0,0 +1,33 @@
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import JobPosting, Application
+
+
+async def get_recruiter_dashboard_stats(db: AsyncSession, *, recruiter_id: UUID) -> dict:
+    """Same counts as ``app.repository.dashboard.get_recruiter_dashboard_stats``, in one round trip."""
+    jobs_q = select(JobPosting.job_id, JobPosting.status).where(JobPosting.recruiter_id == recruiter_id).subquery()
+    total_applications = (
+        select(func.count(Application.application_id))
+        .join(jobs_q, jobs_q.c.job_id == Application.job_id)
+        .scalar_subquery()
+    )
+    row = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(jobs_q.c.status == "open"),
+                func.count().filter(jobs_q.c.status == "draft"),
+                total_applications,
+            ).select_from(jobs_q)
+        )
+    ).one()
+    total_jobs, total_open_jobs, total_draft_jobs, total_apps = row
+    return {
+        "total_jobs": int(total_jobs or 0),
+        "total_open_jobs": int(total_open_jobs or 0),
+        "total_draft_jobs": int(total_draft_jobs or 0),
+        "total_applications": int(total_apps or 0),
+    }
@@ -0,0 +1,104 @@
+"""Async counterparts of ``app.repository.job_listing`` for ``DB_MODE=async``.
+
+Point lookups and the plain listing are native ``select()`` statements. The
+feed, facets, totals and writes share their query builders (text search,
+trigram filters, keyset cursors, EXPLAIN estimates) with the sync module, so
+they run it through ``AsyncSession.run_sync``: the sync code executes in a
+greenlet on the event loop and every statement is awaited on the asyncpg
+connection, so no thread is held either way. The one CPU-bound step, BM25
+ranking in the in-process search index, runs on a worker thread first.
+"""
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from anyio import to_thread
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models import JobPosting, Company
+from app.repository import job_listing as sync_repo
+from app.repository.job_listing import (
+    JOB_BY_ID,
+    JOB_WITH_COMPANY_NAME_BY_ID,
+    SUMMARY_FIELDS,
+    _live,
+    _load_only,
+    _to_response_dict,
+)
+
+
+def _with_company_name():
+    return select(JobPosting, Company.name.label("company_name")).join(Company, Company.company_id == JobPosting.company_id)
+
+
+async def get_job_listing(db: AsyncSession, job_id: UUID) -> dict | None:
+    row = (await db.execute(JOB_WITH_COMPANY_NAME_BY_ID, {"job_id": job_id})).first()
+    if not row:
+        return None
+    job, company_name = row
+    return _to_response_dict(job, company_name=company_name)
+
+
+async def get_job_listing_model(db: AsyncSession, job_id: UUID) -> JobPosting | None:
+    return await db.scalar(JOB_BY_ID, {"job_id": job_id})
+
+
+async def list_job_listings(
+    db: AsyncSession,
+    *,
+    company_id: Optional[UUID] = None,
+    limit: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> List[dict]:
+    stmt = _load_only(_with_company_name(), fields)
+    if company_id:
+        stmt = stmt.where(JobPosting.company_id == company_id)
+    max_limit = settings.JOB_LISTINGS_MAX_LIMIT
+    stmt = stmt.order_by(JobPosting.posted_at.desc()).limit(
+        min(limit, max_limit) if isinstance(limit, int) and limit > 0 else max_limit
+    )
+    rows = await db.execute(stmt)
+    return [_to_response_dict(job, company_name=company_name, fields=fields) for job, company_name in rows]
+
+
+async def get_open_job_listings_by_ids(db: AsyncSession, job_ids: List[UUID]) -> dict:
+    if not job_ids:
+        return {}
+    stmt = _load_only(_with_company_name(), SUMMARY_FIELDS, extra=("skill_ids",))
+    rows = await db.execute(stmt.where(JobPosting.job_id.in_(job_ids), JobPosting.status == "open", _live()))
+    return {
+        job.job_id: (_to_response_dict(job, company_name=company_name, fields=SUMMARY_FIELDS), job.skill_ids or [])
+        for job, company_name in rows
+    }
+
+
+async def list_job_listings_paged(db: AsyncSession, **kwargs) -> Tuple[List[dict], Optional[str]]:
+    search_backend = sync_repo.ranking_backend(kwargs.get("q"), kwargs.get("sort_by", "posted_at"))
+    if search_backend is not None:
+        kwargs["search_hits"] = await to_thread.run_sync(search_backend.search, kwargs["q"])
+    return await db.run_sync(sync_repo.list_job_listings_paged, **kwargs)
+
+
+async def job_listing_facet_counts(db: AsyncSession, **kwargs) -> dict:
+    return await db.run_sync(sync_repo.job_listing_facet_counts, **kwargs)
+
+
+async def count_job_listings(db: AsyncSession, **filters) -> int:
+    return await db.run_sync(sync_repo.count_job_listings, **filters)
+
+
+async def estimate_job_listings(db: AsyncSession, **filters) -> int:
+    return await db.run_sync(sync_repo.estimate_job_listings, **filters)
+
+
+async def create_job_listing(db: AsyncSession, *, company_id: UUID, recruiter_id: UUID, data: dict) -> JobPosting:
+    return await db.run_sync(sync_repo.create_job_listing, company_id=company_id, recruiter_id=recruiter_id, data=data)
+
+
+async def update_job_listing(db: AsyncSession, *, job: JobPosting, update_data: dict) -> JobPosting:
+    return await db.run_sync(sync_repo.update_job_listing, job=job, update_data=update_data)
+
+
+async def close_expired_job_listings(db: AsyncSession, *, batch_size: int = 500) -> List[Tuple[UUID, UUID]]:
+    return await db.run_sync(sync_repo.close_expired_job_listings, batch_size=batch_size)
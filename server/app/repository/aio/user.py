@@ -0,0 +1,53 @@
+"""Async counterparts of ``app.repository.user`` for ``DB_MODE=async``.
+
+bcrypt hashing/verification takes tens of milliseconds of CPU, so it runs in a
+worker thread instead of on the event loop.
+"""
+from anyio import to_thread
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from app.db.models import User, Applicant
+from app.schemas.user import UserCreate
+from app.lib.security import get_password_hash, verify_password
+from app.constants.user_types import UserType
+from app.repository.user import APPLICANT_BY_USER_ID, USER_BY_EMAIL, USER_BY_ID
+
+
+async def create_user(db: AsyncSession, user: UserCreate) -> User:
+    if user.user_type not in [UserType.APPLICANT, UserType.RECRUITER]:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid user_type")
+
+    hashed_password = await to_thread.run_sync(get_password_hash, user.password)
+    db_user = User(
+        email=user.email,
+        password_hash=hashed_password,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        user_type=user.user_type
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
+    return await db.scalar(USER_BY_EMAIL, {"email": email})
+
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> User | None:
+    user = await get_user_by_email(db, email)
+    if not user:
+        return None
+    if not await to_thread.run_sync(verify_password, password, user.password_hash):
+        return None
+    return user
+
+
+async def get_user_by_id(db: AsyncSession, user_id) -> User | None:
+    return await db.scalar(USER_BY_ID, {"user_id": user_id})
+
+
+async def get_applicant_by_user_id(db: AsyncSession, user_id) -> Applicant | None:
+    return await db.scalar(APPLICANT_BY_USER_ID, {"user_id": user_id})
@@ -1,17 +1,136 @@
+import uuid
+from datetime import datetime
+from typing import Iterator, Optional, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import JSON, Boolean, Text, bindparam, func, or_, select, text, true, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
 from uuid import UUID
 
 from app.db.models import Application, JobPosting, Applicant, User, Company
+from app.repository.job_listing import JOB_BY_ID, _decode_cursor, _encode_cursor, _escape_like
+from app.repository.user import APPLICANT_BY_USER_ID
 from fastapi import HTTPException, status
 
+APPLICATION_BY_JOB_AND_APPLICANT = (
+    select(Application)
+    .where(Application.job_id == bindparam("job_id"), Application.applicant_id == bindparam("applicant_id"))
+    .limit(1)
+)
 
-def get_application_by_job_and_applicant(db: Session, *, job_id: UUID, applicant_id: UUID) -> Application | None:
-    return (
-        db.query(Application)
-        .filter(and_(Application.job_id == job_id, Application.applicant_id == applicant_id))
-        .first()
+
+# One statement for the whole apply: look up the job and the applicant profile, insert only if the
+# job is open (same rule as job_listing._live) and let the (job_id, applicant_id) unique index turn a
+# duplicate, including a concurrent one, into no row instead of an error.
+# Returns one row: job_open (NULL: no such job), has_profile, application_id (NULL: not inserted).
+# Written as text(): the postgresql insert() construct has no cache key, so it would be recompiled on
+# every call. INSERT ... SELECT resolves untyped values as text, so the enum literal is cast (the
+# UUID parameters are rendered with a cast by both drivers)
+APPLY_TO_JOB = (
+    text(
+        """
+        WITH job AS (
+            SELECT job_id, status = 'open' AND (expires_at IS NULL OR expires_at > LOCALTIMESTAMP) AS is_open
+            FROM job_postings
+            WHERE job_id = :job_id
+        ), applicant AS (
+            SELECT applicant_id FROM applicants WHERE applicant_id = :user_id
+        ), inserted AS (
+            INSERT INTO applications (application_id, job_id, applicant_id, status, cover_letter, applied_at, updated_at)
+            SELECT :application_id, job.job_id, applicant.applicant_id,
+                   CAST('applied' AS application_status_enum), :cover_letter, now(), now()
+            FROM job CROSS JOIN applicant
+            WHERE job.is_open
+            ON CONFLICT (job_id, applicant_id) DO NOTHING
+            RETURNING application_id
+        )
+        SELECT (SELECT is_open FROM job) AS job_open,
+               EXISTS (SELECT 1 FROM applicant) AS has_profile,
+               (SELECT application_id FROM inserted) AS application_id
+        """
+    )
+    .bindparams(
+        bindparam("job_id", type_=Application.job_id.type),
+        bindparam("user_id", type_=Applicant.applicant_id.type),
+        bindparam("application_id", type_=Application.application_id.type),
+        bindparam("cover_letter", type_=Text),
     )
+    .columns(job_open=Boolean, has_profile=Boolean, application_id=Application.application_id.type)
+)
+
+
+def apply_to_job(db: Session, *, job_id: UUID, user_id: UUID, cover_letter: str | None) -> Row:
+    """Validate and insert in one round trip; the caller maps the returned row to a response."""
+    params = {"job_id": job_id, "user_id": user_id, "application_id": uuid.uuid4(), "cover_letter": cover_letter}
+    outcome = db.execute(APPLY_TO_JOB, params).one()
+    db.commit()
+    return outcome
+
+
+# APPLY_TO_JOB for a batch of requests (the group-commit path, app.tasks.apply_batcher): one row per
+# request, keyed by the application_id generated for it. Rows are inserted in (job_id, applicant_id)
+# order so concurrent batches take index locks in the same order and cannot deadlock each other
+APPLY_TO_JOBS = (
+    text(
+        """
+        WITH req AS (
+            SELECT * FROM unnest(:application_ids, :job_ids, :user_ids, :cover_letters)
+                AS r(application_id, job_id, user_id, cover_letter)
+        ), checked AS (
+            SELECT req.application_id, req.job_id, req.user_id, req.cover_letter,
+                   j.status = 'open' AND (j.expires_at IS NULL OR j.expires_at > LOCALTIMESTAMP) AS job_open,
+                   a.applicant_id IS NOT NULL AS has_profile
+            FROM req
+            LEFT JOIN job_postings j ON j.job_id = req.job_id
+            LEFT JOIN applicants a ON a.applicant_id = req.user_id
+        ), inserted AS (
+            INSERT INTO applications (application_id, job_id, applicant_id, status, cover_letter, applied_at, updated_at)
+            SELECT application_id, job_id, user_id,
+                   CAST('applied' AS application_status_enum), cover_letter, now(), now()
+            FROM checked
+            WHERE job_open AND has_profile
+            ORDER BY job_id, user_id
+            ON CONFLICT (job_id, applicant_id) DO NOTHING
+            RETURNING application_id
+        )
+        SELECT checked.application_id AS request_id, checked.job_open, checked.has_profile,
+               inserted.application_id
+        FROM checked
+        LEFT JOIN inserted ON inserted.application_id = checked.application_id
+        """
+    )
+    .bindparams(
+        bindparam("application_ids", type_=ARRAY(Application.application_id.type)),
+        bindparam("job_ids", type_=ARRAY(Application.job_id.type)),
+        bindparam("user_ids", type_=ARRAY(Applicant.applicant_id.type)),
+        bindparam("cover_letters", type_=ARRAY(Text)),
+    )
+    .columns(
+        request_id=Application.application_id.type,
+        job_open=Boolean,
+        has_profile=Boolean,
+        application_id=Application.application_id.type,
+    )
+)
+
+
+def apply_to_jobs(db: Session, requests: Sequence[tuple[UUID, UUID, str | None]]) -> list[Row]:
+    """``apply_to_job`` for many (job_id, user_id, cover_letter) requests in one statement and one
+    commit; returns their outcomes in request order."""
+    request_ids = [uuid.uuid4() for _ in requests]
+    params = {
+        "application_ids": request_ids,
+        "job_ids": [job_id for job_id, _, _ in requests],
+        "user_ids": [user_id for _, user_id, _ in requests],
+        "cover_letters": [cover_letter for _, _, cover_letter in requests],
+    }
+    by_request = {row.request_id: row for row in db.execute(APPLY_TO_JOBS, params)}
+    db.commit()
+    return [by_request[request_id] for request_id in request_ids]
+
+
+def get_application_by_job_and_applicant(db: Session, *, job_id: UUID, applicant_id: UUID) -> Application | None:
+    return db.scalars(APPLICATION_BY_JOB_AND_APPLICANT, {"job_id": job_id, "applicant_id": applicant_id}).first()
 
 
 def create_application(db: Session, *, job_id: UUID, applicant_id: UUID, cover_letter: str | None) -> Application:
@@ -28,51 +147,181 @@ def create_application(db: Session, *, job_id: UUID, applicant_id: UUID, cover_l
 
 
 def ensure_job_exists(db: Session, *, job_id: UUID) -> JobPosting:
-    job = db.query(JobPosting).filter(JobPosting.job_id == job_id).first()
+    job = db.scalars(JOB_BY_ID, {"job_id": job_id}).first()
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job listing not found")
     return job
 
 
 def ensure_applicant_profile(db: Session, *, user_id: UUID) -> Applicant:
-    applicant = db.query(Applicant).filter(Applicant.applicant_id == user_id).first()
+    applicant = db.scalars(APPLICANT_BY_USER_ID, {"user_id": user_id}).first()
     if not applicant:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Applicant profile not found")
     return applicant
 
 
+APPLICATION_LIST_COLUMNS = (
+    Application.application_id,
+    Application.applicant_id,
+    Application.status,
+    Application.applied_at,
+    Applicant.resume_url,
+    User.first_name,
+    User.last_name,
+    User.email,
+)
+
+
+def _list_item(r) -> dict:
+    return {
+        "application_id": r.application_id,
+        "applicant_id": r.applicant_id,
+        "status": str(r.status),
+        "resume_url": r.resume_url,
+        "applicant_name": f"{r.first_name} {r.last_name}",
+        "applicant_email": r.email,
+    }
+
+
 def list_applications_for_job(db: Session, *, job_id: UUID):
     """
     Returns list of applications for a job with applicant name and resume url.
     """
     # join applications -> applicants (resume_url) -> users (name)
     q = (
-        db.query(
-            Application.application_id,
-            Application.applicant_id,
-            Application.status,
-            Applicant.resume_url,
-            User.first_name,
-            User.last_name,
-            User.email,
-        )
+        db.query(*APPLICATION_LIST_COLUMNS)
         .join(Applicant, Applicant.applicant_id == Application.applicant_id)
         .join(User, User.user_id == Applicant.applicant_id)
         .filter(Application.job_id == job_id)
-        .order_by(Application.applied_at.desc())
+        .order_by(Application.applied_at.desc(), Application.application_id.desc())
     )
-    rows = q.all()
-    return [
-        {
-            "application_id": r.application_id,
-            "applicant_id": r.applicant_id,
-            "status": str(r.status),
-            "resume_url": r.resume_url,
-            "applicant_name": f"{r.first_name} {r.last_name}",
-            "applicant_email": r.email,
-        }
-        for r in rows
-    ]
+    return [_list_item(r) for r in q.all()]
+
+
+def begin_repeatable_read(db: Session) -> None:
+    """Start ``db``'s transaction at REPEATABLE READ so every read in it sees one snapshot.
+
+    The connection is opened on the bind its SELECTs route to (a replica during a read-only
+    request), since the isolation level only applies to that connection.
+    """
+    db.connection(
+        bind_arguments={"bind": db.get_bind(clause=select(Application.application_id))},
+        execution_options={"isolation_level": "REPEATABLE READ"},
+    )
+
+
+def iter_applications_for_job(
+    db: Session,
+    *,
+    job_id: UUID,
+    status_value: Optional[str] = None,
+    batch_size: int = 1000,
+) -> Iterator[dict]:
+    """Yield a job's applications, newest first, through a server-side cursor (``yield_per``
+    fetches ``batch_size`` rows per round trip instead of buffering the result)."""
+    q = (
+        db.query(*APPLICATION_LIST_COLUMNS)
+        .join(Applicant, Applicant.applicant_id == Application.applicant_id)
+        .join(User, User.user_id == Applicant.applicant_id)
+        .filter(Application.job_id == job_id)
+    )
+    if status_value:
+        q = q.filter(Application.status == status_value)
+    q = q.order_by(Application.applied_at.desc(), Application.application_id.desc()).yield_per(batch_size)
+    for r in q:
+        yield {**_list_item(r), "applied_at": r.applied_at}
+
+
+def _applicant_prefix(q: str):
+    # applicant name or email starting with q; matched within one job's applications only
+    pattern = f"{_escape_like(q)}%"
+    return or_(
+        User.first_name.ilike(pattern, escape="\\"),
+        User.last_name.ilike(pattern, escape="\\"),
+        (User.first_name + " " + User.last_name).ilike(pattern, escape="\\"),
+        User.email.ilike(pattern, escape="\\"),
+    )
+
+
+def applications_page_query(
+    *,
+    job_id: UUID,
+    status_value: Optional[str],
+    q: Optional[str],
+    after: Optional[tuple[datetime, UUID]],
+    limit: int,
+    with_counts: bool,
+):
+    """One page (limit + 1 rows) of a job's applications, newest first, walked by the
+    ix_applications_job_applied_at_id index with a (applied_at, application_id) keyset.
+
+    With ``with_counts`` the same statement also returns ``counts``, a JSON object of status ->
+    applications matching ``q`` (ignoring ``status_value``), computed by a GROUP BY over the job's
+    rows; the page is outer-joined to that single row so the counts come back for an empty page too.
+    """
+    page = (
+        select(*APPLICATION_LIST_COLUMNS)
+        .join(Applicant, Applicant.applicant_id == Application.applicant_id)
+        .join(User, User.user_id == Applicant.applicant_id)
+        .where(Application.job_id == job_id)
+    )
+    if q:
+        page = page.where(_applicant_prefix(q))
+    if status_value:
+        page = page.where(Application.status == status_value)
+    if after is not None:
+        page = page.where(tuple_(Application.applied_at, Application.application_id) < tuple_(*after))
+    page = page.order_by(Application.applied_at.desc(), Application.application_id.desc()).limit(limit + 1)
+    if not with_counts:
+        return page
+
+    by_status = select(Application.status, func.count().label("n")).where(Application.job_id == job_id)
+    if q:
+        by_status = by_status.join(User, User.user_id == Application.applicant_id).where(_applicant_prefix(q))
+    by_status = by_status.group_by(Application.status).subquery("by_status")
+    counts = select(
+        func.json_object_agg(by_status.c.status, by_status.c.n, type_=JSON).label("counts")
+    ).subquery("counts")
+    page = page.subquery("page")
+    return (
+        select(counts.c.counts, page)
+        .select_from(counts.outerjoin(page, true()))
+        .order_by(page.c.applied_at.desc(), page.c.application_id.desc())
+    )
+
+
+def applications_page_result(rows, *, limit: int, with_counts: bool):
+    """(items, next_cursor, counts) from the rows of ``applications_page_query``."""
+    rows = list(rows)
+    counts = None
+    if with_counts:
+        found = (rows[0].counts if rows else None) or {}
+        counts = {s: int(found.get(s, 0)) for s in Application.status.type.enums}
+        rows = [r for r in rows if r.application_id is not None]  # the empty page's outer-join row
+    items = [{**_list_item(r), "applied_at": r.applied_at} for r in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = _encode_cursor(last.applied_at, last.application_id)
+    return items, next_cursor, counts
+
+
+def list_applications_page(
+    db: Session,
+    *,
+    job_id: UUID,
+    status_value: Optional[str] = None,
+    q: Optional[str] = None,
+    limit: int,
+    cursor: Optional[str] = None,
+):
+    """A page of a job's applications; per-status counts come with the first page (no cursor)."""
+    after = _decode_cursor(cursor)
+    with_counts = after is None
+    stmt = applications_page_query(
+        job_id=job_id, status_value=status_value, q=q, after=after, limit=limit, with_counts=with_counts
+    )
+    return applications_page_result(db.execute(stmt), limit=limit, with_counts=with_counts)
 
 
 def update_application_status(db: Session, *, application_id: UUID, status_value: str) -> Application:
@@ -85,6 +334,65 @@ def update_application_status(db: Session, *, application_id: UUID, status_value
     return app
 
 
+# Concurrent bulk updates of overlapping applications must lock their rows in one order or they can
+# deadlock. The UPDATE's join below locks rows in whatever order its plan visits them, whatever the
+# order of the bound ids, so the rows are locked first by this SELECT, in application_id order.
+# Both statements only touch applications to jobs of :company_id, the calling recruiter's company
+LOCK_APPLICATIONS_IN_ORDER = text(
+    """
+    SELECT a.application_id FROM applications AS a
+    JOIN job_postings AS jp ON jp.job_id = a.job_id AND jp.company_id = :company_id
+    WHERE a.application_id = ANY(:application_ids)
+    ORDER BY a.application_id FOR UPDATE OF a
+    """
+).bindparams(
+    bindparam("application_ids", type_=ARRAY(Application.application_id.type)),
+    bindparam("company_id", type_=JobPosting.company_id.type),
+)
+
+# Many status changes in one statement, run after LOCK_APPLICATIONS_IN_ORDER in the same transaction;
+# unknown ids and other companies' applications just return no row
+BULK_UPDATE_APPLICATION_STATUS = (
+    text(
+        """
+        UPDATE applications AS a
+        SET status = CAST(v.status AS application_status_enum), updated_at = now()
+        FROM unnest(:application_ids, :statuses) AS v(application_id, status), job_postings AS jp
+        WHERE a.application_id = v.application_id AND jp.job_id = a.job_id AND jp.company_id = :company_id
+        RETURNING a.application_id, a.status
+        """
+    )
+    .bindparams(
+        bindparam("application_ids", type_=ARRAY(Application.application_id.type)),
+        bindparam("statuses", type_=ARRAY(Text)),
+        bindparam("company_id", type_=JobPosting.company_id.type),
+    )
+    .columns(application_id=Application.application_id.type, status=Text)
+)
+
+
+def bulk_update_params(statuses: dict, company_id: UUID) -> dict:
+    """Bind parameters for BULK_UPDATE_APPLICATION_STATUS from {application_id: status}."""
+    ids = sorted(statuses)
+    return {"application_ids": ids, "statuses": [statuses[i] for i in ids], "company_id": company_id}
+
+
+def bulk_update_application_status(db: Session, *, statuses: dict, company_id: UUID) -> dict:
+    """Apply {application_id: status} in one UPDATE and one commit (after locking the rows in id
+    order); returns {application_id: status} for the applications that exist and belong to jobs
+    of ``company_id``."""
+    params = bulk_update_params(statuses, company_id)
+    db.execute(LOCK_APPLICATIONS_IN_ORDER, {"application_ids": params["application_ids"], "company_id": company_id})
+    rows = db.execute(BULK_UPDATE_APPLICATION_STATUS, params).all()
+    db.commit()
+    return {row.application_id: row.status for row in rows}
+
+
+def list_applied_job_ids(db: Session, *, applicant_id: UUID) -> set:
+    rows = db.query(Application.job_id).filter(Application.applicant_id == applicant_id).all()
+    return {job_id for (job_id,) in rows}
+
+
 def list_applications_for_applicant(db: Session, *, applicant_id: UUID):
     """
     Returns list of applications for an applicant with joined job and company info.
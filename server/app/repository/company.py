@@ -1,14 +1,19 @@
 from typing import Any
 from uuid import UUID
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.db.models import Company, Recruiter, User
 from app.schemas.company import CompanyCreate, CompanyUpdate
 
+# built once; see app.repository.user
+COMPANY_BY_ID = select(Company).where(Company.company_id == bindparam("company_id")).limit(1)
+RECRUITER_BY_USER_ID = select(Recruiter).where(Recruiter.recruiter_id == bindparam("user_id")).limit(1)
+
 
 def get_company(db: Session, company_id: UUID) -> Company | None:
-    return db.query(Company).filter(Company.company_id == company_id).first()
+    return db.scalars(COMPANY_BY_ID, {"company_id": company_id}).first()
 
 
 def list_companies(db: Session) -> list[Company]:
@@ -16,7 +21,7 @@ def list_companies(db: Session) -> list[Company]:
 
 
 def get_recruiter_by_user_id(db: Session, user_id: UUID) -> Recruiter | None:
-    return db.query(Recruiter).filter(Recruiter.recruiter_id == user_id).first()
+    return db.scalars(RECRUITER_BY_USER_ID, {"user_id": user_id}).first()
 
 
 def create_company(db: Session, *, recruiter_user_id: UUID, company_in: CompanyCreate) -> Company:
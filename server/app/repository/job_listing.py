@@ -1,16 +1,72 @@
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from fastapi import HTTPException, status
 
+from app.core.config import settings
 from app.db.models import JobPosting, Company
-from sqlalchemy import or_, and_
+from app.search.backend import get_search_backend
+from sqlalchemy import or_, and_, bindparam, func, cast, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import REGCONFIG, DOUBLE_PRECISION
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
 import uuid as uuidlib
 
+# Must match the text search configuration used by JobPosting.search_vector
+SEARCH_CONFIG = "english"
+SNIPPET_OPTIONS = "MaxFragments=2, MaxWords=25, MinWords=8, StartSel=<mark>, StopSel=</mark>"
 
-def _to_response_dict(job: JobPosting, *, company_name: str) -> dict:
+
+# Columns behind each response field; company_name comes from the join
+RESPONSE_FIELDS = (
+    "job_id",
+    "company_id",
+    "company_name",
+    "recruiter_id",
+    "title",
+    "description",
+    "requirements",
+    "skills_required",
+    "location",
+    "experience_level",
+    "job_type",
+    "salary_range",
+    "expires_at",
+    "status",
+    "posted_at",
+    "updated_at",
+)
+# What a feed card renders (view=summary): no description/requirements TEXT columns
+SUMMARY_FIELDS = (
+    "job_id",
+    "company_id",
+    "company_name",
+    "title",
+    "location",
+    "experience_level",
+    "job_type",
+    "expires_at",
+    "status",
+    "posted_at",
+    "updated_at",
+)
+
+
+def _load_only(qy, fields: Optional[Tuple[str, ...]], *, extra: Tuple[str, ...] = ()):
+    """Restrict the JobPosting columns loaded to ``fields`` (plus ``extra``); None loads everything."""
+    if fields is None:
+        return qy
+    names = [f for f in dict.fromkeys(fields + extra) if f != "company_name"]
+    return qy.options(load_only(*(getattr(JobPosting, name) for name in names)))
+
+
+def _to_response_dict(job: JobPosting, *, company_name: str, fields: Optional[Tuple[str, ...]] = None) -> dict:
+    if fields is not None:
+        values = {"company_name": company_name}
+        return {f: values[f] if f in values else getattr(job, f) for f in fields}
     return {
         "job_id": job.job_id,
         "company_id": job.company_id,
@@ -31,13 +87,18 @@ def _to_response_dict(job: JobPosting, *, company_name: str) -> dict:
     }
 
 
+# detail lookups, built once (see app.repository.user)
+JOB_WITH_COMPANY_NAME_BY_ID = (
+    select(JobPosting, Company.name.label("company_name"))
+    .join(Company, Company.company_id == JobPosting.company_id)
+    .where(JobPosting.job_id == bindparam("job_id"))
+    .limit(1)
+)
+JOB_BY_ID = select(JobPosting).where(JobPosting.job_id == bindparam("job_id")).limit(1)
+
+
 def get_job_listing(db: Session, job_id: UUID) -> dict | None:
-    row = (
-        db.query(JobPosting, Company.name.label("company_name"))
-        .join(Company, Company.company_id == JobPosting.company_id)
-        .filter(JobPosting.job_id == job_id)
-        .first()
-    )
+    row = db.execute(JOB_WITH_COMPANY_NAME_BY_ID, {"job_id": job_id}).first()
     if not row:
         return None
     job, company_name = row
@@ -46,7 +107,7 @@ def get_job_listing(db: Session, job_id: UUID) -> dict | None:
 
 def get_job_listing_model(db: Session, job_id: UUID) -> JobPosting | None:
     """Return the raw JobPosting model. Useful when controller needs attributes or to update the row."""
-    return db.query(JobPosting).filter(JobPosting.job_id == job_id).first()
+    return db.scalars(JOB_BY_ID, {"job_id": job_id}).first()
 
 
 def list_job_listings(
@@ -54,15 +115,52 @@ def list_job_listings(
     *,
     company_id: Optional[UUID] = None,
     limit: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
 ) -> List[dict]:
     q = db.query(JobPosting, Company.name.label("company_name")).join(Company, Company.company_id == JobPosting.company_id)
+    q = _load_only(q, fields)
     if company_id:
         q = q.filter(JobPosting.company_id == company_id)
     q = q.order_by(JobPosting.posted_at.desc())
-    if isinstance(limit, int) and limit > 0:
-        q = q.limit(limit)
+    # never unbounded: bulk reads go through iter_job_listings
+    max_limit = settings.JOB_LISTINGS_MAX_LIMIT
+    q = q.limit(min(limit, max_limit) if isinstance(limit, int) and limit > 0 else max_limit)
     rows = q.all()
-    return [_to_response_dict(job, company_name=company_name) for job, company_name in rows]
+    return [_to_response_dict(job, company_name=company_name, fields=fields) for job, company_name in rows]
+
+
+def iter_job_listings(
+    db: Session,
+    *,
+    company_id: Optional[UUID] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    batch_size: int = 1000,
+) -> Iterator[dict]:
+    """Yield every matching listing, newest first, through a server-side cursor.
+
+    ``yield_per`` turns on ``stream_results`` so psycopg2 fetches ``batch_size`` rows
+    at a time from a named cursor instead of buffering the whole result set.
+    """
+    q = db.query(JobPosting, Company.name.label("company_name")).join(Company, Company.company_id == JobPosting.company_id)
+    q = _load_only(q, fields)
+    if company_id:
+        q = q.filter(JobPosting.company_id == company_id)
+    q = q.order_by(JobPosting.posted_at.desc(), JobPosting.job_id.desc()).yield_per(batch_size)
+    for job, company_name in q:
+        yield _to_response_dict(job, company_name=company_name, fields=fields)
+
+
+def get_open_job_listings_by_ids(db: Session, job_ids: List[UUID]) -> dict:
+    """Summary dicts plus skill ids for the open postings among ``job_ids``, keyed by job_id."""
+    if not job_ids:
+        return {}
+    q = db.query(JobPosting, Company.name.label("company_name")).join(Company, Company.company_id == JobPosting.company_id)
+    q = _load_only(q, SUMMARY_FIELDS, extra=("skill_ids",))
+    rows = q.filter(JobPosting.job_id.in_(job_ids), JobPosting.status == "open", _live()).all()
+    return {
+        job.job_id: (_to_response_dict(job, company_name=company_name, fields=SUMMARY_FIELDS), job.skill_ids or [])
+        for job, company_name in rows
+    }
 
 
 def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
@@ -79,11 +177,118 @@ def _encode_cursor(ts: datetime, job_id: UUID) -> str:
     return f"{ts.isoformat()}|{str(job_id)}"
 
 
+def _decode_rank_cursor(cursor: Optional[str]) -> Optional[Tuple[float, UUID]]:
+    if not cursor:
+        return None
+    try:
+        rank_str, uuid_str = cursor.split("|", 1)
+        return float(rank_str), UUID(uuid_str)
+    except Exception:
+        return None
+
+
+def _encode_rank_cursor(rank: float, job_id: UUID) -> str:
+    # repr() round-trips the float exactly, so the keyset equality check stays stable
+    return f"{float(rank)!r}|{str(job_id)}"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _text_filter(column, value: str, *, fuzzy: bool):
+    """Substring or typo-tolerant match on a trigram-indexed column.
+
+    Both shapes keep the bare column on the indexed side so the GIN (gin_trgm_ops)
+    index can serve them: ILIKE '%...%' for substrings, and ``value <% column``
+    (word similarity above ``pg_trgm.word_similarity_threshold``) for fuzzy matches.
+    """
+    if fuzzy:
+        return literal(value).op("<%")(column)
+    return column.ilike(f"%{_escape_like(value)}%", escape="\\")
+
+
+def _set_similarity_threshold(db: Session) -> None:
+    # transaction-local, so pooled connections don't keep the setting
+    db.execute(
+        select(func.set_config("pg_trgm.word_similarity_threshold", str(settings.TRGM_SIMILARITY_THRESHOLD), True))
+    )
+
+
+def _search_query(q: str):
+    return func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), q)
+
+
+def _snippet(tsq):
+    return func.ts_headline(cast(SEARCH_CONFIG, REGCONFIG), JobPosting.description, tsq, SNIPPET_OPTIONS).label("snippet")
+
+
+def _live():
+    """Postings that have not expired yet.
+
+    expires_at is a naive timestamp, so compare against LOCALTIMESTAMP rather than
+    now(): a timestamptz comparison would cast the column and bypass its index.
+    """
+    return or_(JobPosting.expires_at.is_(None), JobPosting.expires_at > func.localtimestamp())
+
+
+def _apply_feed_filters(
+    db: Session,
+    qy,
+    *,
+    company_id: Optional[UUID] = None,
+    location: Optional[str] = None,
+    title: Optional[str] = None,
+    match: str = "contains",
+    job_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    status: Optional[str] = None,
+):
+    if status in (None, "open"):
+        # postings past expires_at drop out of the open feed even before the sweeper closes them;
+        # status=closed must still list the ones it has closed
+        qy = qy.filter(_live())
+    if company_id:
+        qy = qy.filter(JobPosting.company_id == company_id)
+    fuzzy = match == "fuzzy"
+    if fuzzy and (location or title):
+        _set_similarity_threshold(db)
+    if location:
+        qy = qy.filter(_text_filter(JobPosting.location, location, fuzzy=fuzzy))
+    if title:
+        qy = qy.filter(_text_filter(JobPosting.title, title, fuzzy=fuzzy))
+    if job_type:
+        qy = qy.filter(JobPosting.job_type == job_type)
+    if experience_level:
+        qy = qy.filter(JobPosting.experience_level == experience_level)
+    if status:
+        qy = qy.filter(JobPosting.status == status)
+    return qy
+
+
+def _apply_search_filter(db: Session, qy, q: Optional[str]):
+    """Restrict ``qy`` to postings matching ``q``.
+
+    Always the GIN-indexed search_vector match, also with the in-process index: its hits are
+    capped at SEARCH_MAX_CANDIDATES, so they can rank a feed but not count every match.
+    """
+    if not q:
+        return qy
+    return qy.filter(JobPosting.search_vector.op("@@")(_search_query(q)))
+
+
+def ranking_backend(q: Optional[str], sort_by: str):
+    """The in-process search index when it ranks this feed (relevance sort with a search term), else None."""
+    return get_search_backend() if q and sort_by == "relevance" else None
+
+
 def list_job_listings_paged(
     db: Session,
     *,
     company_id: Optional[UUID] = None,
     location: Optional[str] = None,
+    title: Optional[str] = None,
+    match: str = "contains",
     job_type: Optional[str] = None,
     experience_level: Optional[str] = None,
     status: Optional[str] = None,
@@ -92,65 +297,278 @@ def list_job_listings_paged(
     sort_order: str = "desc",
     limit: int = 20,
     cursor: Optional[str] = None,
+    snippets: bool = False,
+    fields: Optional[Tuple[str, ...]] = None,
+    search_hits: Optional[List[Tuple[float, UUID]]] = None,
 ) -> Tuple[List[dict], Optional[str]]:
+    """One keyset page of the feed.
+
+    ``search_hits`` is the ranking backend's ``search(q)`` when the caller already ran it
+    (the async path does, on a worker thread).
+    """
     # base query with company join for name
     qy = db.query(JobPosting, Company.name.label("company_name")).join(Company, Company.company_id == JobPosting.company_id)
+    # the next cursor is built from the sort timestamp, so keep it loaded even when not requested
+    qy = _load_only(qy, fields, extra=("updated_at" if sort_by == "updated_at" else "posted_at",))
+    qy = _apply_feed_filters(
+        db,
+        qy,
+        company_id=company_id,
+        location=location,
+        title=title,
+        match=match,
+        job_type=job_type,
+        experience_level=experience_level,
+        status=status,
+    )
 
-    # filters
-    if company_id:
-        qy = qy.filter(JobPosting.company_id == company_id)
-    if location:
-        qy = qy.filter(JobPosting.location.ilike(f"%{location}%"))
-    if job_type:
-        qy = qy.filter(JobPosting.job_type == job_type)
-    if experience_level:
-        qy = qy.filter(JobPosting.experience_level == experience_level)
-    if status:
-        qy = qy.filter(JobPosting.status == status)
-    if q:
-        like = f"%{q}%"
-        qy = qy.filter(
-            or_(
-                JobPosting.title.ilike(like),
-                JobPosting.description.ilike(like),
-                JobPosting.location.ilike(like),
-            )
+    real_limit = max(1, min(100, int(limit)))
+
+    # full-text search: relevance pages come from the in-process BM25 index when configured and
+    # loaded. Its hits stop at SEARCH_MAX_CANDIDATES, which is fine for ranking but would silently
+    # drop matches from a date-sorted feed, so other sorts use the GIN index on search_vector
+    tsq = None
+    search_backend = ranking_backend(q, sort_by)
+    hits = search_hits
+    if hits is None and search_backend is not None:
+        hits = search_backend.search(q)
+    if hits is not None:
+        if not hits:
+            return [], None
+        if snippets:
+            # BM25 picks the rows; the fragments are highlighted by the same ts_headline as the SQL path
+            qy = qy.add_columns(_snippet(_search_query(q)))
+        return _page_by_search_rank(
+            qy, hits, sort_order=sort_order, limit=real_limit, cursor=cursor, fields=fields, snippets=snippets
         )
+    if q:
+        tsq = _search_query(q)
+        qy = qy.filter(JobPosting.search_vector.op("@@")(tsq))
+        if snippets:
+            qy = qy.add_columns(_snippet(tsq))
+
+    # relevance ordering only makes sense with a search term
+    by_relevance = sort_by == "relevance" and tsq is not None
+    # ts_rank_cd returns float4; widen it so the value echoed back in the cursor compares exactly
+    rank = cast(func.ts_rank_cd(JobPosting.search_vector, tsq), DOUBLE_PRECISION) if by_relevance else None
+    if rank is not None:
+        qy = qy.add_columns(rank.label("rank"))
 
     # sorting
-    sort_col = JobPosting.updated_at if sort_by == "updated_at" else JobPosting.posted_at
+    if rank is not None:
+        sort_col = rank
+    else:
+        sort_col = JobPosting.updated_at if sort_by == "updated_at" else JobPosting.posted_at
     if sort_order == "asc":
         qy = qy.order_by(sort_col.asc(), JobPosting.job_id.asc())
     else:
         qy = qy.order_by(sort_col.desc(), JobPosting.job_id.desc())
 
     # cursor
-    cur = _decode_cursor(cursor)
+    cur = _decode_rank_cursor(cursor) if rank is not None else _decode_cursor(cursor)
     if cur is not None:
-        ts, jid = cur
+        key, jid = cur
         if sort_order == "asc":
-            cond = or_(sort_col > ts, and_(sort_col == ts, JobPosting.job_id > jid))
+            cond = or_(sort_col > key, and_(sort_col == key, JobPosting.job_id > jid))
         else:
-            cond = or_(sort_col < ts, and_(sort_col == ts, JobPosting.job_id < jid))
+            cond = or_(sort_col < key, and_(sort_col == key, JobPosting.job_id < jid))
         qy = qy.filter(cond)
 
     # limit + 1 to know if next page exists
-    real_limit = max(1, min(100, int(limit)))
     rows = qy.limit(real_limit + 1).all()
 
     has_more = len(rows) > real_limit
     rows = rows[:real_limit]
 
-    items = [_to_response_dict(job, company_name=company_name) for job, company_name in rows]
+    items = []
+    for row in rows:
+        item = _to_response_dict(row[0], company_name=row[1], fields=fields)
+        if snippets and q:
+            item["snippet"] = row.snippet
+        items.append(item)
+
     next_cursor = None
     if has_more and rows:
         last_job: JobPosting = rows[-1][0]
-        last_ts: datetime = getattr(last_job, 'updated_at' if sort_by == 'updated_at' else 'posted_at')
-        next_cursor = _encode_cursor(last_ts, last_job.job_id)
+        if rank is not None:
+            next_cursor = _encode_rank_cursor(rows[-1].rank, last_job.job_id)
+        else:
+            last_ts: datetime = getattr(last_job, 'updated_at' if sort_by == 'updated_at' else 'posted_at')
+            next_cursor = _encode_cursor(last_ts, last_job.job_id)
 
     return items, next_cursor
 
 
+# grouping(job_type, experience_level, location) is a bitmask with a 1 for every column
+# that is NOT part of the row's grouping set
+FACET_COLUMNS = ("job_type", "experience_level", "location")
+_FACET_BY_GROUPING = {0b011: "job_type", 0b101: "experience_level", 0b110: "location"}
+FACET_VALUE_LIMIT = 20
+
+
+def job_listing_facet_counts(
+    db: Session,
+    *,
+    company_id: Optional[UUID] = None,
+    location: Optional[str] = None,
+    title: Optional[str] = None,
+    match: str = "contains",
+    job_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    status: Optional[str] = None,
+    q: Optional[str] = None,
+    max_values: int = FACET_VALUE_LIMIT,
+) -> dict:
+    """Count matching postings per job_type, experience_level and location.
+
+    All facets come from one ``GROUP BY GROUPING SETS (job_type, experience_level,
+    location, ())`` scan over the same filters as the feed; the empty set is the total.
+    Each facet keeps its ``max_values`` most common non-null values.
+    """
+    grouping = func.grouping(JobPosting.job_type, JobPosting.experience_level, JobPosting.location)
+    qy = db.query(
+        JobPosting.job_type,
+        JobPosting.experience_level,
+        JobPosting.location,
+        grouping.label("grouping"),
+        func.count().label("count"),
+    )
+    qy = _apply_feed_filters(
+        db,
+        qy,
+        company_id=company_id,
+        location=location,
+        title=title,
+        match=match,
+        job_type=job_type,
+        experience_level=experience_level,
+        status=status,
+    )
+
+    qy = _apply_search_filter(db, qy, q)
+    qy = qy.group_by(
+        func.grouping_sets(JobPosting.job_type, JobPosting.experience_level, JobPosting.location, tuple_())
+    )
+
+    total = 0
+    facets: dict = {name: [] for name in FACET_COLUMNS}
+    for row in qy.all():
+        if row.grouping == 0b111:
+            total = row.count
+            continue
+        name = _FACET_BY_GROUPING.get(row.grouping)
+        value = getattr(row, name) if name else None
+        if value is not None:
+            facets[name].append({"value": value, "count": row.count})
+
+    for name, values in facets.items():
+        values.sort(key=lambda v: (-v["count"], v["value"]))
+        del values[max_values:]
+    return {"total": total, "facets": facets}
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <stmt>``, executed with the statement's own bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _feed_total_query(
+    db: Session,
+    column,
+    *,
+    company_id: Optional[UUID] = None,
+    location: Optional[str] = None,
+    title: Optional[str] = None,
+    match: str = "contains",
+    job_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    status: Optional[str] = None,
+    q: Optional[str] = None,
+):
+    qy = _apply_feed_filters(
+        db,
+        db.query(column),
+        company_id=company_id,
+        location=location,
+        title=title,
+        match=match,
+        job_type=job_type,
+        experience_level=experience_level,
+        status=status,
+    )
+    return _apply_search_filter(db, qy, q)
+
+
+def count_job_listings(db: Session, **filters) -> int:
+    """Exact number of postings matching the feed filters (``q`` included); as costly as scanning them."""
+    qy = _feed_total_query(db, func.count(JobPosting.job_id), **filters)
+    return int(qy.scalar() or 0)
+
+
+def estimate_job_listings(db: Session, **filters) -> int:
+    """Planner's row estimate for the feed filters: EXPLAIN only plans the query, so this reads no rows.
+
+    Accuracy follows the table statistics (ANALYZE); substring and fuzzy matches are the roughest.
+    """
+    qy = _feed_total_query(db, JobPosting.job_id, **filters)
+    plan = db.execute(_Explain(qy.statement)).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _page_by_search_rank(
+    qy,
+    hits: List[Tuple[float, UUID]],
+    *,
+    sort_order: str,
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[Tuple[str, ...]] = None,
+    snippets: bool = False,
+) -> Tuple[List[dict], Optional[str]]:
+    """Page through ranked search hits, applying the SQL filters to one chunk of ids at a time."""
+    if sort_order == "asc":
+        hits = hits[::-1]
+    cur = _decode_rank_cursor(cursor)
+    if cur is not None:
+        key = (cur[0], str(cur[1]))
+        if sort_order == "asc":
+            hits = [hit for hit in hits if (hit[0], str(hit[1])) > key]
+        else:
+            hits = [hit for hit in hits if (hit[0], str(hit[1])) < key]
+
+    page: List[Tuple[float, tuple]] = []
+    chunk_size = max(50, 2 * (limit + 1))
+    for start in range(0, len(hits), chunk_size):
+        chunk = hits[start:start + chunk_size]
+        found = {row[0].job_id: row for row in qy.filter(JobPosting.job_id.in_([job_id for _, job_id in chunk])).all()}
+        page.extend((score, found[job_id]) for score, job_id in chunk if job_id in found)
+        if len(page) > limit:
+            break
+
+    has_more = len(page) > limit
+    page = page[:limit]
+    items = []
+    for _, row in page:
+        item = _to_response_dict(row[0], company_name=row[1], fields=fields)
+        if snippets:
+            item["snippet"] = row.snippet
+        items.append(item)
+    next_cursor = None
+    if has_more and page:
+        score, last_row = page[-1]
+        next_cursor = _encode_rank_cursor(score, last_row[0].job_id)
+    return items, next_cursor
+
+
 def create_job_listing(
     db: Session,
     *,
@@ -171,6 +589,7 @@ def create_job_listing(
         salary_range=data.get("salary_range"),
         expires_at=data.get("expires_at"),
         status=data.get("status", "open"),
+        skill_ids=data.get("skill_ids"),
     )
     db.add(job)
     db.commit()
@@ -195,6 +614,7 @@ def update_job_listing(
         "salary_range",
         "expires_at",
         "status",
+        "skill_ids",
     }
     for field, value in update_data.items():
         if field in allowed and value is not None:
@@ -203,3 +623,31 @@ def update_job_listing(
     db.commit()
     db.refresh(job)
     return job
+
+
+def close_expired_job_listings(db: Session, *, batch_size: int = 500) -> List[Tuple[UUID, UUID]]:
+    """Close up to ``batch_size`` open postings whose expires_at has passed; returns (job_id, company_id) pairs.
+
+    One statement per batch: the expired rows are picked through the open-expiry partial
+    index and locked with ``FOR UPDATE SKIP LOCKED``, so concurrent sweepers (one per app
+    worker) split the backlog instead of queueing behind each other or behind a recruiter
+    editing the same row. updated_at moves too, so change-feed readers pick the rows up.
+    """
+    expired = (
+        select(JobPosting.job_id)
+        .where(JobPosting.status == "open", JobPosting.expires_at < func.localtimestamp())
+        .order_by(JobPosting.expires_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(JobPosting)
+        .where(JobPosting.job_id.in_(expired))
+        .values(status="closed", updated_at=func.now())
+        .returning(JobPosting.job_id, JobPosting.company_id)
+        .execution_options(synchronize_session=False)
+    )
+    rows = db.execute(stmt).all()
+    db.commit()
+    return [(job_id, company_id) for job_id, company_id in rows]
@@ -0,0 +1,153 @@
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import String, and_, cast, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import REGCONFIG, insert
+from sqlalchemy.orm import Session
+
+from app.db.models import JobPosting, SavedSearch, SearchAlert
+from app.repository.job_listing import SEARCH_CONFIG, _set_similarity_threshold
+from app.search.percolate import anchor_key, has_required_terms, posting_keys
+
+SAVED_SEARCH_FILTERS = ("company_id", "location", "title", "match", "job_type", "experience_level", "q")
+
+
+def query_lexemes(db: Session, q: Optional[str]) -> List[str]:
+    """Lexemes every match of ``q`` must contain, normalized by Postgres like the search_vector; [] if none are required."""
+    if not has_required_terms(q):
+        return []
+    lexemes = db.execute(select(func.tsvector_to_array(func.to_tsvector(cast(SEARCH_CONFIG, REGCONFIG), q)))).scalar()
+    return list(lexemes or [])
+
+
+def create_saved_search(db: Session, *, applicant_id: UUID, name: Optional[str], filters: dict) -> SavedSearch:
+    filters = {field: filters.get(field) for field in SAVED_SEARCH_FILTERS}
+    filters["match"] = filters["match"] or "contains"
+    search = SavedSearch(
+        applicant_id=applicant_id,
+        name=name,
+        anchor_key=anchor_key(**{k: v for k, v in filters.items() if k != "q"}, q_lexemes=query_lexemes(db, filters["q"])),
+        **filters,
+    )
+    db.add(search)
+    db.commit()
+    db.refresh(search)
+    return search
+
+
+def count_saved_searches(db: Session, *, applicant_id: UUID) -> int:
+    return db.query(func.count(SavedSearch.saved_search_id)).filter(SavedSearch.applicant_id == applicant_id).scalar() or 0
+
+
+def list_saved_searches(db: Session, *, applicant_id: UUID) -> List[SavedSearch]:
+    return (
+        db.query(SavedSearch)
+        .filter(SavedSearch.applicant_id == applicant_id)
+        .order_by(SavedSearch.created_at.desc())
+        .all()
+    )
+
+
+def delete_saved_search(db: Session, *, applicant_id: UUID, saved_search_id: UUID) -> bool:
+    deleted = (
+        db.query(SavedSearch)
+        .filter(SavedSearch.saved_search_id == saved_search_id, SavedSearch.applicant_id == applicant_id)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return bool(deleted)
+
+
+def _like_pattern(column):
+    # '%' || escaped(column) || '%', matching _text_filter's ILIKE with the value taken from a column
+    escaped = func.replace(func.replace(func.replace(column, "\\", "\\\\"), "%", "\\%"), "_", "\\_")
+    return literal("%") + escaped + literal("%")
+
+
+def _text_match(job_column, search_column):
+    """The saved search's location/title filter (NULL means no filter), as _text_filter would apply it."""
+    return or_(
+        search_column.is_(None),
+        and_(SavedSearch.match == "fuzzy", search_column.op("<%")(job_column)),
+        and_(SavedSearch.match != "fuzzy", job_column.ilike(_like_pattern(search_column), escape="\\")),
+    )
+
+
+def percolate_job_listing(db: Session, *, job_id: UUID) -> int:
+    """Queue a search alert for every saved search the (open, unexpired) posting matches; returns how many.
+
+    The posting's percolation keys select the candidate searches through the anchor_key
+    index; one INSERT ... SELECT then checks their full filters against the posting and
+    queues the matches. Re-running for the same posting queues nothing new.
+    """
+    row = (
+        db.query(JobPosting, func.tsvector_to_array(JobPosting.search_vector).label("lexemes"))
+        .filter(
+            JobPosting.job_id == job_id,
+            JobPosting.status == "open",
+            or_(JobPosting.expires_at.is_(None), JobPosting.expires_at > func.localtimestamp()),
+        )
+        .first()
+    )
+    if row is None:
+        return 0
+    job, lexemes = row
+    keys = posting_keys(
+        company_id=job.company_id,
+        location=job.location,
+        title=job.title,
+        job_type=job.job_type,
+        experience_level=job.experience_level,
+        lexemes=lexemes or (),
+    )
+    _set_similarity_threshold(db)
+    matches = (
+        select(SavedSearch.saved_search_id, SavedSearch.applicant_id, JobPosting.job_id)
+        .where(
+            JobPosting.job_id == job_id,
+            SavedSearch.anchor_key.in_(keys),
+            or_(SavedSearch.company_id.is_(None), SavedSearch.company_id == JobPosting.company_id),
+            or_(SavedSearch.job_type.is_(None), SavedSearch.job_type == cast(JobPosting.job_type, String)),
+            or_(SavedSearch.experience_level.is_(None), SavedSearch.experience_level == JobPosting.experience_level),
+            _text_match(JobPosting.location, SavedSearch.location),
+            _text_match(JobPosting.title, SavedSearch.title),
+            or_(
+                SavedSearch.q.is_(None),
+                JobPosting.search_vector.op("@@")(func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), SavedSearch.q)),
+            ),
+        )
+    )
+    stmt = (
+        insert(SearchAlert)
+        .from_select(["saved_search_id", "applicant_id", "job_id"], matches)
+        .on_conflict_do_nothing(index_elements=[SearchAlert.saved_search_id, SearchAlert.job_id])
+    )
+    queued = db.execute(stmt).rowcount
+    db.commit()
+    return queued
+
+
+def claim_search_alerts(db: Session, *, applicant_id: UUID, limit: int = 50) -> List[tuple]:
+    """Pop up to ``limit`` pending alerts, oldest first: (alert_id, saved_search_id, job_id, created_at) rows.
+
+    Claimed rows are marked delivered in the same statement; SKIP LOCKED lets concurrent
+    consumers (a page load and a mail digest, say) take disjoint alerts.
+    """
+    pending = (
+        select(SearchAlert.alert_id)
+        .where(SearchAlert.applicant_id == applicant_id, SearchAlert.delivered_at.is_(None))
+        .order_by(SearchAlert.alert_id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(SearchAlert)
+        .where(SearchAlert.alert_id.in_(pending))
+        .values(delivered_at=func.now())
+        .returning(SearchAlert.alert_id, SearchAlert.saved_search_id, SearchAlert.job_id, SearchAlert.created_at)
+        .execution_options(synchronize_session=False)
+    )
+    rows = db.execute(stmt).all()
+    db.commit()
+    return sorted(rows, key=lambda r: r[0])
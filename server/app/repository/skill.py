@@ -0,0 +1,47 @@
+from typing import Iterable, List
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.db.models import Applicant, Skill
+
+
+def get_skill_ids(db: Session, names: Iterable[str]) -> dict[str, int]:
+    """Look up already-normalized names; unknown names are simply absent from the result."""
+    names = list(names)
+    if not names:
+        return {}
+    rows = db.execute(select(Skill.name, Skill.skill_id).where(Skill.name.in_(names))).all()
+    return {name: skill_id for name, skill_id in rows}
+
+
+def ensure_skill_ids(db: Session, names: Iterable[str]) -> List[int]:
+    """Resolve normalized names to ids, adding missing ones to the dictionary.
+
+    Runs in the caller's transaction; ON CONFLICT makes concurrent inserts of the
+    same new skill safe.
+    """
+    names = list(names)
+    if not names:
+        return []
+    known = get_skill_ids(db, names)
+    missing = [name for name in names if name not in known]
+    if missing:
+        db.execute(insert(Skill).values([{"name": name} for name in missing]).on_conflict_do_nothing(index_elements=[Skill.name]))
+        known.update(get_skill_ids(db, missing))
+    return sorted({known[name] for name in names if name in known})
+
+
+def get_skill_names(db: Session, skill_ids: Iterable[int]) -> dict[int, str]:
+    skill_ids = list(skill_ids)
+    if not skill_ids:
+        return {}
+    rows = db.execute(select(Skill.skill_id, Skill.name).where(Skill.skill_id.in_(skill_ids))).all()
+    return {skill_id: name for skill_id, name in rows}
+
+
+def get_applicant_skills(db: Session, applicant_id: UUID) -> list:
+    skills = db.query(Applicant.skills).filter(Applicant.applicant_id == applicant_id).scalar()
+    return skills if isinstance(skills, list) else []
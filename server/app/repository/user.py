@@ -1,3 +1,4 @@
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from app.db.models import User, Applicant
 from app.schemas.user import UserCreate
@@ -5,6 +6,12 @@ from app.lib.security import get_password_hash, verify_password
 from app.constants.user_types import UserType
 from fastapi import HTTPException, status
 
+# Built once: a module-level statement memoizes its cache key, so each call skips constructing
+# the query and walking it for the compiled-SQL cache lookup (see scripts/bench_lookups.py)
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+USER_BY_ID = select(User).where(User.user_id == bindparam("user_id")).limit(1)
+APPLICANT_BY_USER_ID = select(Applicant).where(Applicant.applicant_id == bindparam("user_id")).limit(1)
+
 
 def create_user(db: Session, user: UserCreate) -> User:
     # Validate user_type against the Enum
@@ -26,7 +33,7 @@ def create_user(db: Session, user: UserCreate) -> User:
 
 
 def get_user_by_email(db: Session, email: str) -> User | None:
-    return db.query(User).filter(User.email == email).first()
+    return db.scalars(USER_BY_EMAIL, {"email": email}).first()
 
 
 def authenticate_user(db: Session, email: str, password: str) -> User | None:
@@ -39,8 +46,8 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
 
 
 def get_user_by_id(db: Session, user_id) -> User | None:
-    return db.query(User).filter(User.user_id == user_id).first()
+    return db.scalars(USER_BY_ID, {"user_id": user_id}).first()
 
 
 def get_applicant_by_user_id(db: Session, user_id) -> Applicant | None:
-    return db.query(Applicant).filter(Applicant.applicant_id == user_id).first()
+    return db.scalars(APPLICANT_BY_USER_ID, {"user_id": user_id}).first()
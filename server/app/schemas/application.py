@@ -1,7 +1,10 @@
+from datetime import datetime
 from pydantic import BaseModel
-from typing import Optional, Literal
+from typing import Dict, List, Optional, Literal
 from uuid import UUID
 
+ApplicationStatus = Literal["applied", "under review", "shortlisted", "rejected", "hired"]
+
 
 class ApplyRequest(BaseModel):
     cover_letter: Optional[str] = None
@@ -27,6 +30,25 @@ class ApplicationListItem(BaseModel):
     status: Literal["applied", "under review", "shortlisted", "rejected", "hired"]
 
 
+class ApplicationsQuery(BaseModel):
+    job_id: UUID
+    status: Optional[ApplicationStatus] = None
+    q: Optional[str] = None  # applicant first/last/full name or email prefix, case-insensitive
+    limit: int = 50
+    cursor: Optional[str] = None  # "<applied_at ISO>|<application_uuid>"
+
+
+class ApplicationPageItem(ApplicationListItem):
+    applied_at: datetime
+
+
+class PagedApplicationsResponse(BaseModel):
+    items: List[ApplicationPageItem]
+    next_cursor: Optional[str] = None
+    # first page only: applications per status matching q, regardless of the status filter
+    counts: Optional[Dict[ApplicationStatus, int]] = None
+
+
 class UpdateApplicationStatusRequest(BaseModel):
     status: Literal["applied", "under review", "shortlisted", "rejected", "hired"]
 
@@ -35,6 +57,31 @@ class UpdateApplicationStatusResponse(BaseModel):
     message: str
 
 
+class ApplicationStatusUpdate(BaseModel):
+    application_id: UUID
+    status: ApplicationStatus
+
+
+class BulkUpdateApplicationStatusRequest(BaseModel):
+    # either a status per application, or one status for all of application_ids
+    updates: List[ApplicationStatusUpdate] = []
+    application_ids: List[UUID] = []
+    status: Optional[ApplicationStatus] = None
+
+
+class BulkUpdateApplicationStatusResult(BaseModel):
+    application_id: UUID
+    updated: bool
+    status: Optional[ApplicationStatus] = None  # the new status, when updated
+    detail: Optional[str] = None
+
+
+class BulkUpdateApplicationStatusResponse(BaseModel):
+    updated: int
+    not_found: int
+    results: List[BulkUpdateApplicationStatusResult]
+
+
 class MyApplicationListItem(BaseModel):
     application_id: UUID
     status: Literal["applied", "under review", "shortlisted", "rejected", "hired"]
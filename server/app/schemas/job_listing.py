@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import Optional, Literal, List
+from typing import Optional, Literal, List, Union
 from uuid import UUID as UUIDType
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_serializer
 
 
 JobType = Literal["full-time", "part-time", "internship", "contract"]
 JobStatus = Literal["open", "closed", "draft"]
+ListView = Literal["full", "summary"]
+TotalMode = Literal["estimate", "exact"]
 
 
 class JobListingBase(BaseModel):
@@ -55,20 +57,125 @@ class JobListingsQuery(BaseModel):
     # filters
     company_id: Optional[UUIDType] = None
     location: Optional[str] = None
+    title: Optional[str] = None
+    match: Literal["contains", "fuzzy"] = "contains"  # how location/title are matched; fuzzy tolerates typos
     job_type: Optional[JobType] = None
     experience_level: Optional[str] = None
     status: Optional[JobStatus] = None
-    q: Optional[str] = None  # search in title/description
+    q: Optional[str] = None  # web-search syntax over title/skills/location/description/requirements
+    snippets: bool = False  # include highlighted description fragments when searching
+
+    # response shape: "summary" drops the long text columns; fields= picks columns explicitly
+    view: ListView = "full"
+    fields: Optional[str] = None  # comma-separated response fields, e.g. "job_id,title,location"
 
-    # sorting
-    sort_by: Literal["posted_at", "updated_at"] = "posted_at"
+    # sorting ("relevance" requires q, otherwise falls back to posted_at)
+    sort_by: Literal["posted_at", "updated_at", "relevance"] = "posted_at"
     sort_order: Literal["asc", "desc"] = "desc"
 
     # pagination
     limit: int = 20
-    cursor: Optional[str] = None  # encoded as "<timestamp ISO>|<job_uuid>"
+    cursor: Optional[str] = None  # "<timestamp ISO>|<job_uuid>", or "<rank>|<job_uuid>" for relevance
+
+    # total matching postings: "estimate" is the planner's guess (cheap), "exact" a cached COUNT(*)
+    include_total: Optional[TotalMode] = None
+
+
+class JobListingFeedItem(JobListingResponse):
+    snippet: Optional[str] = None
+
+
+class JobListingSummary(BaseModel):
+    """Feed card shape returned for view=summary."""
+    job_id: UUIDType
+    company_id: UUIDType
+    company_name: str
+    title: str
+    location: str
+    experience_level: Optional[str] = None
+    job_type: JobType
+    expires_at: Optional[datetime] = None
+    status: JobStatus
+    posted_at: datetime
+    updated_at: datetime
+    snippet: Optional[str] = None
+
+
+class JobMatchItem(JobListingSummary):
+    score: float  # share of the job's required skills the applicant has
+    matched_skills: List[str] = []
+
+
+class PagedJobMatchesResponse(BaseModel):
+    items: List[JobMatchItem]
+    next_cursor: Optional[str] = None  # "<score>|<job_uuid>"
+
+
+class SimilarJobItem(JobListingSummary):
+    similarity: float  # estimated Jaccard similarity of title/description/skills word pairs
+
+
+class SimilarJobsResponse(BaseModel):
+    items: List[SimilarJobItem]
+
+
+class JobRecommendationItem(JobListingSummary):
+    score: float  # cosine similarity between the applicant profile and the posting
+
+
+class JobRecommendationsResponse(BaseModel):
+    items: List[JobRecommendationItem]
+
+
+class JobListingSparseItem(BaseModel):
+    """Arbitrary fields= selection; only the requested fields are serialized."""
+    job_id: Optional[UUIDType] = None
+    company_id: Optional[UUIDType] = None
+    company_name: Optional[str] = None
+    recruiter_id: Optional[UUIDType] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    requirements: Optional[str] = None
+    skills_required: Optional[str] = None
+    location: Optional[str] = None
+    experience_level: Optional[str] = None
+    job_type: Optional[JobType] = None
+    salary_range: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    status: Optional[JobStatus] = None
+    posted_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    snippet: Optional[str] = None
+
+    @model_serializer(mode="wrap")
+    def _only_set_fields(self, handler):
+        data = handler(self)
+        return {k: v for k, v in data.items() if k in self.model_fields_set}
+
+
+# full items validate as the first member, view=summary as the second, fields= as the last
+JobListingListItem = Union[JobListingResponse, JobListingSummary, JobListingSparseItem]
+JobListingPageItem = Union[JobListingFeedItem, JobListingSummary, JobListingSparseItem]
 
 
 class PagedJobListingsResponse(BaseModel):
-    items: List[JobListingResponse]
+    items: List[JobListingPageItem]
     next_cursor: Optional[str] = None
+    total: Optional[int] = None  # only with include_total
+    total_is_estimate: Optional[bool] = None
+
+
+class FacetValue(BaseModel):
+    value: str
+    count: int
+
+
+class JobListingFacets(BaseModel):
+    job_type: List[FacetValue] = []
+    experience_level: List[FacetValue] = []
+    location: List[FacetValue] = []
+
+
+class JobListingFacetsResponse(BaseModel):
+    total: int
+    facets: JobListingFacets
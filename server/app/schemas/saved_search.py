@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.schemas.job_listing import JobListingSummary, JobType
+
+
+class SavedSearchCreate(BaseModel):
+    name: Optional[str] = None
+    # the JobListingsQuery filters an alert is matched on (status is implied: new open postings)
+    company_id: Optional[UUID] = None
+    location: Optional[str] = None
+    title: Optional[str] = None
+    match: Literal["contains", "fuzzy"] = "contains"
+    job_type: Optional[JobType] = None
+    experience_level: Optional[str] = None
+    q: Optional[str] = None
+
+
+class SavedSearchResponse(SavedSearchCreate):
+    saved_search_id: UUID
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SavedSearchCreated(BaseModel):
+    message: str
+    saved_search_id: UUID
+
+
+class SearchAlertItem(BaseModel):
+    alert_id: int
+    saved_search_id: UUID
+    created_at: datetime
+    job: JobListingSummary
+
+
+class SearchAlertsResponse(BaseModel):
+    items: List[SearchAlertItem]
@@ -0,0 +1,16 @@
+from typing import List, Literal
+
+from pydantic import BaseModel
+
+SuggestionKind = Literal["title", "company", "location", "skill"]
+
+
+class SuggestionItem(BaseModel):
+    text: str
+    kind: SuggestionKind
+    weight: int  # open postings carrying it (companies: 1 + their open postings)
+
+
+class SuggestResponse(BaseModel):
+    prefix: str
+    items: List[SuggestionItem]
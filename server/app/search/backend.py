@@ -0,0 +1,171 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import JobPosting
+from app.search.inverted_index import InvertedIndex
+
+logger = logging.getLogger("app.search")
+
+BUILD_RETRY_SECONDS = 30  # retry interval for a failed first load when there is no periodic refresh
+
+
+def _job_fields(job) -> dict:
+    return {
+        "title": job.title,
+        "description": job.description,
+        "requirements": job.requirements,
+        "skills_required": job.skills_required,
+    }
+
+
+class MemorySearchBackend:
+    """Serves the feed's relevance-ranked ``q`` from an in-process BM25 index.
+
+    A background thread (``start``) loads the index, from the on-disk snapshot
+    when one exists (catching up on rows updated since it was written) or else
+    by a single scan of ``job_postings``. It then catches up with postings
+    written by other workers every ``refresh_seconds`` (0: loaded once, no
+    periodic refresh) and writes the snapshot once ``snapshot_every`` postings
+    were indexed since the last one. Writes made through this process are
+    indexed right away (``index_job``). Searches never query the database;
+    until the first load finishes ``search`` returns None.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        *,
+        refresh_seconds: float = 30,
+        snapshot_every: int = 500,
+        max_candidates: int = 10_000,
+    ):
+        self.snapshot_path = Path(snapshot_path)
+        self.refresh_seconds = refresh_seconds
+        self.snapshot_every = snapshot_every
+        self.max_candidates = max_candidates
+        self._index: Optional[InvertedIndex] = None
+        self._writes_since_snapshot = 0
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def index(self) -> Optional[InvertedIndex]:
+        return self._index
+
+    def _load(self, db: Session) -> InvertedIndex:
+        index = InvertedIndex.load(self.snapshot_path)
+        if index is None:
+            logger.info("search_index_rebuild: path=%s", self.snapshot_path)
+            index = InvertedIndex()
+            for job in db.query(JobPosting).yield_per(1000):
+                index.add(job.job_id, _job_fields(job), updated_at=job.updated_at)
+        else:
+            logger.info("search_index_snapshot_loaded: docs=%d watermark=%s", len(index), index.watermark)
+            self._catch_up(db, index)
+        logger.info("search_index_ready: docs=%d", len(index))
+        return index
+
+    def _catch_up(self, db: Session, index: InvertedIndex) -> int:
+        rows = db.query(JobPosting)
+        watermark = index.watermark
+        if watermark is not None:
+            # >= because several rows can share the watermark timestamp
+            rows = rows.filter(JobPosting.updated_at >= watermark)
+        changed = 0
+        for job in rows.yield_per(1000):
+            if job.updated_at == watermark and job.job_id in index:
+                continue  # already indexed at this version
+            index.add(job.job_id, _job_fields(job), updated_at=job.updated_at)
+            changed += 1
+        return changed
+
+    def refresh(self, db: Session) -> None:
+        """Load the index on first use, then index postings changed since its watermark."""
+        with self._refresh_lock:
+            index = self._index
+            if index is None:
+                self._index = self._load(db)
+                return
+            changed = self._catch_up(db, index)
+            if changed:
+                self._writes_since_snapshot += changed
+                logger.info("search_index_refreshed: changed=%d docs=%d", changed, len(index))
+            if self.snapshot_every and self._writes_since_snapshot >= self.snapshot_every:
+                self.save_snapshot()
+
+    def index_job(self, job) -> None:
+        """Incrementally (re-)index a single posting after it was written."""
+        index = self._index
+        if index is None:
+            # not loaded yet; the row is picked up by the initial load
+            return
+        index.add(job.job_id, _job_fields(job), updated_at=job.updated_at)
+        self._writes_since_snapshot += 1
+
+    def search(self, q: str) -> Optional[list[tuple[float, UUID]]]:
+        """Matching job ids as ``(score, job_id)``, ordered by score then job_id (both descending);
+        None while the index is still loading."""
+        index = self._index
+        if index is None:
+            return None
+        hits = index.search(q, k=self.max_candidates)
+        hits.sort(key=lambda hit: (hit[0], str(hit[1])), reverse=True)
+        return hits
+
+    def save_snapshot(self) -> None:
+        if self._index is None:
+            return
+        self._writes_since_snapshot = 0
+        self._index.save(self.snapshot_path)
+        logger.info("search_index_snapshot_saved: docs=%d path=%s", len(self._index), self.snapshot_path)
+
+    def start(self, session_factory) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+
+        def _run():
+            # first pass loads the index right away, then catch up every interval until stopped
+            while not self._stop.is_set():
+                try:
+                    with session_factory() as db:
+                        self.refresh(db)
+                except Exception:
+                    logger.exception("search_index_refresh_failed")
+                if self.refresh_seconds <= 0 and self._index is not None:
+                    return
+                self._stop.wait(self.refresh_seconds if self.refresh_seconds > 0 else BUILD_RETRY_SECONDS)
+
+        self._worker = threading.Thread(target=_run, name="search-index-refresh", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            if not self._worker.is_alive():
+                self._worker = None
+
+
+_backend: Optional[MemorySearchBackend] = None
+
+
+def get_search_backend() -> Optional[MemorySearchBackend]:
+    """Return the in-process search backend, or None when search is served by Postgres."""
+    global _backend
+    if settings.SEARCH_BACKEND != "memory":
+        return None
+    if _backend is None:
+        _backend = MemorySearchBackend(
+            Path(settings.SEARCH_INDEX_SNAPSHOT_PATH),
+            refresh_seconds=settings.SEARCH_INDEX_REFRESH_SECONDS,
+            snapshot_every=settings.SEARCH_INDEX_SNAPSHOT_EVERY,
+            max_candidates=settings.SEARCH_MAX_CANDIDATES,
+        )
+    return _backend
@@ -0,0 +1,246 @@
+"""In-memory inverted index with BM25 ranking.
+
+Postings are stored per term as two parallel ``array`` objects (document
+numbers and weighted term frequencies), which keeps a million-document index
+at a fraction of the memory a dict-of-dicts would need. Document numbers are
+assigned monotonically, so every postings list stays sorted and appends are
+O(1).
+
+Updates follow the usual segment-style approach: re-indexing a document
+tombstones its old document number and appends a fresh one. Document
+frequencies keep counting tombstoned entries until the next compaction,
+exactly like deleted-but-unmerged documents in Lucene.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Hashable, Iterable, Optional
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[+#]+|(?:\.[a-z0-9]+)+)?")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or our the to we will with you your".split()
+)
+
+# Field boosts applied to term frequencies (a cheap BM25F approximation)
+FIELD_WEIGHTS = {
+    "title": 3,
+    "skills_required": 2,
+    "description": 1,
+    "requirements": 1,
+}
+
+SNAPSHOT_VERSION = 1
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    if not text:
+        return []
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class InvertedIndex:
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> (docnums, weighted term frequencies)
+        self._postings: dict[str, tuple[array, array]] = {}
+        self._doc_keys: list[Optional[Hashable]] = []
+        self._doc_lens = array("I")
+        self._docnum_by_key: dict[Hashable, int] = {}
+        self._live_docs = 0
+        self._live_len = 0
+        # max(updated_at) over indexed documents; used to catch up after loading a snapshot
+        self.watermark: Optional[datetime] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._live_docs
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._docnum_by_key
+
+    @property
+    def dead_docs(self) -> int:
+        return len(self._doc_keys) - self._live_docs
+
+    def add(self, key: Hashable, fields: dict[str, Optional[str]], *, updated_at: Optional[datetime] = None) -> None:
+        """Index (or re-index) a document under ``key``."""
+        tfs: dict[str, int] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(fields.get(field)):
+                tfs[token] = tfs.get(token, 0) + weight
+        doc_len = sum(tfs.values())
+
+        with self._lock:
+            self._tombstone(key)
+            docnum = len(self._doc_keys)
+            self._doc_keys.append(key)
+            self._doc_lens.append(doc_len)
+            self._docnum_by_key[key] = docnum
+            for term, tf in tfs.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("I"), array("H"))
+                postings[0].append(docnum)
+                postings[1].append(min(tf, 0xFFFF))
+            self._live_docs += 1
+            self._live_len += doc_len
+            if updated_at is not None and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+            if self.dead_docs > 1000 and self.dead_docs * 4 > len(self._doc_keys):
+                self.compact()
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._tombstone(key)
+
+    def _tombstone(self, key: Hashable) -> None:
+        docnum = self._docnum_by_key.pop(key, None)
+        if docnum is None:
+            return
+        self._doc_keys[docnum] = None
+        self._live_docs -= 1
+        self._live_len -= self._doc_lens[docnum]
+
+    def compact(self) -> None:
+        """Drop tombstoned documents and renumber the survivors."""
+        with self._lock:
+            remap = array("i", [-1]) * len(self._doc_keys)
+            doc_keys: list[Optional[Hashable]] = []
+            doc_lens = array("I")
+            for docnum, key in enumerate(self._doc_keys):
+                if key is None:
+                    continue
+                remap[docnum] = len(doc_keys)
+                doc_keys.append(key)
+                doc_lens.append(self._doc_lens[docnum])
+
+            postings: dict[str, tuple[array, array]] = {}
+            for term, (docnums, tfs) in self._postings.items():
+                new_docnums, new_tfs = array("I"), array("H")
+                for docnum, tf in zip(docnums, tfs):
+                    mapped = remap[docnum]
+                    if mapped >= 0:
+                        new_docnums.append(mapped)
+                        new_tfs.append(tf)
+                if new_docnums:
+                    postings[term] = (new_docnums, new_tfs)
+
+            self._postings = postings
+            self._doc_keys = doc_keys
+            self._doc_lens = doc_lens
+            self._docnum_by_key = {key: i for i, key in enumerate(doc_keys)}
+
+    def search(self, query: str, k: Optional[int] = None) -> list[tuple[float, Hashable]]:
+        """Return ``(score, key)`` pairs for documents containing every query term, best first.
+
+        With ``k`` set, only the top-k are kept (heap selection instead of a full sort).
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._live_docs:
+            return []
+
+        # grab a consistent view; compaction swaps these containers wholesale
+        with self._lock:
+            all_postings, doc_keys, doc_lens = self._postings, self._doc_keys, self._doc_lens
+            avg_len = (self._live_len / self._live_docs) or 1.0
+        n_docs = len(doc_keys)
+        k1, b = self.k1, self.b
+
+        postings_by_term = []
+        for term in terms:
+            postings = all_postings.get(term)
+            if postings is None:
+                return []
+            postings_by_term.append(postings)
+        # walk the rarest term first so the candidate set starts (and stays) small
+        postings_by_term.sort(key=lambda p: len(p[0]))
+
+        scores: dict[int, float] = {}
+        for i, (docnums, tfs) in enumerate(postings_by_term):
+            df = len(docnums)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            if i == 0:
+                for docnum, tf in zip(docnums, tfs):
+                    if doc_keys[docnum] is None:
+                        continue
+                    norm = k1 * (1.0 - b + b * doc_lens[docnum] / avg_len)
+                    scores[docnum] = idf * tf * (k1 + 1.0) / (tf + norm)
+            elif len(scores) * max(1, df.bit_length()) < df:
+                # few candidates left: binary-search them in the (sorted) postings list
+                next_scores: dict[int, float] = {}
+                for docnum, prev in scores.items():
+                    pos = bisect_left(docnums, docnum)
+                    if pos == df or docnums[pos] != docnum:
+                        continue
+                    tf = tfs[pos]
+                    norm = k1 * (1.0 - b + b * doc_lens[docnum] / avg_len)
+                    next_scores[docnum] = prev + idf * tf * (k1 + 1.0) / (tf + norm)
+                scores = next_scores
+            else:
+                next_scores = {}
+                for docnum, tf in zip(docnums, tfs):
+                    prev = scores.get(docnum)
+                    if prev is None:
+                        continue
+                    norm = k1 * (1.0 - b + b * doc_lens[docnum] / avg_len)
+                    next_scores[docnum] = prev + idf * tf * (k1 + 1.0) / (tf + norm)
+                scores = next_scores
+            if not scores:
+                return []
+
+        ranked: Iterable[tuple[float, int]] = ((score, docnum) for docnum, score in scores.items())
+        if k is not None:
+            top = heapq.nlargest(k, ranked)
+        else:
+            top = sorted(ranked, reverse=True)
+        return [(score, doc_keys[docnum]) for score, docnum in top]
+
+    def save(self, path: Path) -> None:
+        """Atomically write a snapshot of the index to ``path``."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            state = {
+                "version": SNAPSHOT_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "postings": self._postings,
+                "doc_keys": self._doc_keys,
+                "doc_lens": self._doc_lens,
+                "watermark": self.watermark,
+            }
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp, "wb") as fh:
+                pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["InvertedIndex"]:
+        """Load a snapshot written by :meth:`save`; returns None if missing or incompatible."""
+        try:
+            with open(path, "rb") as fh:
+                state = pickle.load(fh)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        index = cls(k1=state["k1"], b=state["b"])
+        index._postings = state["postings"]
+        index._doc_keys = state["doc_keys"]
+        index._doc_lens = state["doc_lens"]
+        index._docnum_by_key = {key: i for i, key in enumerate(index._doc_keys) if key is not None}
+        index._live_docs = len(index._docnum_by_key)
+        index._live_len = sum(index._doc_lens[i] for i in index._docnum_by_key.values())
+        index.watermark = state["watermark"]
+        return index
@@ -0,0 +1,94 @@
+"""Percolation keys for saved searches.
+
+A saved search is filed under a single anchor key taken from its most selective
+predicate, and a new posting lists every key it could satisfy. A search can only
+match a posting whose keys include its anchor, so percolating a posting reads just
+those candidates instead of every saved search; the full filters are then checked
+in SQL with the feed's own semantics (app.repository.saved_search).
+
+Every anchor is a necessary condition of its search:
+- company_id, job_type and experience_level are equality filters
+- a `q` without OR/negation needs every one of its lexemes in the posting's search_vector
+- a substring (match=contains) location/title needs each of its 3-character windows
+  in the posting's value; fuzzy matches give no such guarantee and are never anchors
+Searches with none of these go under ANY_KEY, which every posting emits.
+"""
+from typing import Iterable, List, Optional
+
+ANY_KEY = "*"
+NGRAM = 3
+
+# rough English letter frequency, most common first; rarer windows are more selective anchors
+_LETTER_RANK = {c: i for i, c in enumerate("etaoinsrhldcumfpgwybvkxjqz")}
+
+
+def _ngrams(value: str) -> set:
+    value = value.lower()
+    return {value[i:i + NGRAM] for i in range(len(value) - NGRAM + 1)}
+
+
+def _rarity(gram: str) -> int:
+    # whitespace is everywhere; digits and punctuation are rare
+    return sum(0 if c.isspace() else _LETTER_RANK.get(c, len(_LETTER_RANK)) for c in gram)
+
+
+def _rarest_ngram(value: str) -> Optional[str]:
+    grams = _ngrams(value)
+    if not grams:
+        return None
+    return max(sorted(grams), key=_rarity)
+
+
+def has_required_terms(q: Optional[str]) -> bool:
+    """True when every lexeme of ``q`` must appear in a match (websearch syntax without OR or -term)."""
+    if not q or not q.strip():
+        return False
+    return not any(token.lower() == "or" or token.startswith("-") for token in q.split())
+
+
+def anchor_key(
+    *,
+    company_id=None,
+    location: Optional[str] = None,
+    title: Optional[str] = None,
+    match: str = "contains",
+    job_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    q_lexemes: Iterable[str] = (),
+) -> str:
+    """The key a saved search is filed under: its most selective necessary predicate, roughly."""
+    if company_id:
+        return f"company:{company_id}"
+    lexemes = sorted(set(q_lexemes))
+    if lexemes:
+        # longer lexemes tend to be rarer
+        return f"term:{max(lexemes, key=len)}"
+    if match == "contains":
+        for field, value in (("location", location), ("title", title)):
+            gram = _rarest_ngram(value) if value else None
+            if gram:
+                return f"{field}:{gram}"
+    if experience_level:
+        return f"experience:{experience_level}"
+    if job_type:
+        return f"job_type:{job_type}"
+    return ANY_KEY
+
+
+def posting_keys(
+    *,
+    company_id,
+    location: str,
+    title: str,
+    job_type: str,
+    experience_level: Optional[str] = None,
+    lexemes: Iterable[str] = (),
+) -> List[str]:
+    """Every anchor key a posting satisfies."""
+    keys = {ANY_KEY, f"company:{company_id}", f"job_type:{job_type}"}
+    if experience_level:
+        keys.add(f"experience:{experience_level}")
+    keys.update(f"location:{gram}" for gram in _ngrams(location or ""))
+    keys.update(f"title:{gram}" for gram in _ngrams(title or ""))
+    keys.update(f"term:{lexeme}" for lexeme in lexemes)
+    return sorted(keys)
@@ -0,0 +1,422 @@
+"""TF-IDF job recommendations.
+
+Open postings are kept as L2-normalized TF-IDF rows stored column-major
+(CSC: ``col_ptr``, ``row_ids``, ``data`` NumPy arrays). Scoring an applicant
+is one sparse matrix x sparse vector product: the columns of the profile's
+terms are gathered, weighted, and summed per posting with a single
+``bincount``. Cost grows with the postings of the profile's terms, not with
+the whole matrix, and there is no per-posting Python work.
+
+The matrix has two segments. The base segment is built in batches from a
+full scan. The delta segment holds postings that changed afterwards; their
+base rows are masked out. IDF weights are frozen at build time. Terms first
+seen in the delta get the rarest-term weight. When the delta grows past
+``rebuild_fraction`` of the base, a full rebuild folds it back in and
+recomputes IDF.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, load_only
+
+from app.core.config import settings
+from app.db.models import JobPosting
+from app.search.inverted_index import tokenize
+
+logger = logging.getLogger("app.search")
+
+BUILD_RETRY_SECONDS = 30  # retry interval for a failed first build when there is no periodic refresh
+
+JOB_FIELD_WEIGHTS = {"title": 2, "description": 1, "requirements": 1}
+PROFILE_FIELD_WEIGHTS = {"skills": 3, "headline": 2, "experience": 1, "bio": 1}
+
+
+def _flatten_text(value) -> str:
+    """Join every string inside a JSONB value (lists of dicts for experience, lists of str for skills)."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(_flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(_flatten_text(v) for v in value)
+    return ""
+
+
+def term_counts(fields: dict, weights: dict) -> Counter:
+    counts: Counter = Counter()
+    for field, weight in weights.items():
+        for token in tokenize(_flatten_text(fields.get(field))):
+            counts[token] += weight
+    return counts
+
+
+def job_term_counts(job) -> Counter:
+    return term_counts({field: getattr(job, field) for field in JOB_FIELD_WEIGHTS}, JOB_FIELD_WEIGHTS)
+
+
+def change_key(job) -> Optional[tuple]:
+    """(updated_at, job_id): the watermark position of a posting; job_id breaks timestamp ties."""
+    return None if job.updated_at is None else (job.updated_at, job.job_id)
+
+
+def _later(watermark: Optional[tuple], key: Optional[tuple]) -> Optional[tuple]:
+    if key is None:
+        return watermark
+    return key if watermark is None or key > watermark else watermark
+
+
+def profile_term_counts(applicant) -> Counter:
+    return term_counts({field: getattr(applicant, field, None) for field in PROFILE_FIELD_WEIGHTS}, PROFILE_FIELD_WEIGHTS)
+
+
+class _Segment:
+    """Immutable block of TF-IDF rows stored column-major (CSC).
+
+    ``col_ptr[t]:col_ptr[t + 1]`` slices ``row_ids``/``data`` to the postings of
+    term ``t``, so a product only reads the columns of the profile's terms.
+    """
+
+    def __init__(self, job_ids: list, col_ptr: np.ndarray, row_ids: np.ndarray, data: np.ndarray):
+        self.job_ids = job_ids
+        self.col_ptr = col_ptr
+        self.row_ids = row_ids
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def scores(self, q_ids: np.ndarray, q_weights: np.ndarray) -> np.ndarray:
+        """Sparse matrix x sparse vector: the selected columns gathered and summed per row in one bincount."""
+        if not len(self):
+            return np.zeros(0, dtype=np.float64)
+        keep = q_ids < len(self.col_ptr) - 1
+        q_ids, q_weights = q_ids[keep], q_weights[keep]
+        starts = self.col_ptr[q_ids]
+        lengths = self.col_ptr[q_ids + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.zeros(len(self), dtype=np.float64)
+        # positions of every selected posting, built without a Python loop over terms
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        positions = np.arange(total, dtype=np.int64) + offsets
+        weights = self.data[positions] * np.repeat(q_weights, lengths)
+        return np.bincount(self.row_ids[positions], weights=weights, minlength=len(self))
+
+
+def _build_segment(job_ids: list, lengths: np.ndarray, indices: np.ndarray, counts: np.ndarray, idf: np.ndarray) -> _Segment:
+    """Raw term counts laid out row after row -> L2-normalized sublinear TF-IDF columns."""
+    indices = indices.astype(np.int32)
+    rows = np.repeat(np.arange(len(job_ids), dtype=np.int32), lengths)
+    data = (1.0 + np.log(counts)) * idf[indices]
+    norms = np.sqrt(np.bincount(rows, weights=data.astype(np.float64) ** 2, minlength=len(job_ids)))
+    norms[norms == 0] = 1.0
+    data = (data / norms[rows]).astype(np.float32)
+
+    # row-major -> column-major
+    order = np.argsort(indices, kind="stable")
+    col_ptr = np.zeros(len(idf) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=len(idf)), out=col_ptr[1:])
+    return _Segment(job_ids, col_ptr, rows[order], data[order])
+
+
+def _segment_from_rows(rows: dict, idf: np.ndarray) -> _Segment:
+    """rows: job_id -> (term ids, raw counts)."""
+    if not rows:
+        empty = np.zeros(0)
+        return _build_segment([], empty.astype(np.int64), empty.astype(np.int32), empty.astype(np.float32), idf)
+    lengths = np.fromiter((len(ids) for ids, _ in rows.values()), dtype=np.int64, count=len(rows))
+    indices = np.concatenate([ids for ids, _ in rows.values()])
+    counts = np.concatenate([c for _, c in rows.values()])
+    return _build_segment(list(rows), lengths, indices, counts, idf)
+
+
+class TfidfJobMatrix:
+    def __init__(self, vocab: dict[str, int], idf: np.ndarray, base: _Segment, watermark: Optional[tuple]):
+        self.vocab = vocab
+        self.idf = idf
+        self.base = base
+        self.base_alive = np.ones(len(base), dtype=bool)
+        self._base_row = {job_id: row for row, job_id in enumerate(base.job_ids)}
+        self._delta_rows: dict = {}
+        self._delta_pos: dict = {}
+        self.delta = _segment_from_rows({}, idf)
+        self.watermark = watermark
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, postings: Iterable, *, batch_size: int = 5000) -> "TfidfJobMatrix":
+        """Build from ``postings`` (objects with job_id, title, description, requirements, updated_at).
+
+        Term ids and counts are packed into NumPy arrays once per batch, so the scan
+        holds roughly the final non-zeros and no per-posting objects. IDF weighting
+        and row normalization are one vectorized step at the end.
+        """
+        started = time.perf_counter()
+        vocab: dict[str, int] = {}
+        df: list[int] = []
+        job_ids: list = []
+        chunks: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        lengths: list[int] = []
+        ids: list[int] = []
+        values: list[float] = []
+        watermark = None
+
+        def _flush():
+            if lengths:
+                chunks.append((
+                    np.asarray(lengths, dtype=np.int64),
+                    np.asarray(ids, dtype=np.int32),
+                    np.asarray(values, dtype=np.float32),
+                ))
+            lengths.clear()
+            ids.clear()
+            values.clear()
+
+        for job in postings:
+            watermark = _later(watermark, change_key(job))
+            counts = job_term_counts(job)
+            if not counts:
+                continue
+            for term, count in counts.items():
+                term_id = vocab.get(term)
+                if term_id is None:
+                    term_id = vocab[term] = len(df)
+                    df.append(0)
+                df[term_id] += 1
+                ids.append(term_id)
+                values.append(count)
+            job_ids.append(job.job_id)
+            lengths.append(len(counts))
+            if len(lengths) >= batch_size:
+                _flush()
+        _flush()
+
+        n_docs = len(job_ids)
+        idf = (np.log((1 + n_docs) / (1 + np.asarray(df, dtype=np.float64))) + 1.0).astype(np.float32)
+        if chunks:
+            base = _build_segment(job_ids, *(np.concatenate(parts) for parts in zip(*chunks)), idf)
+        else:
+            base = _segment_from_rows({}, idf)
+        matrix = cls(vocab, idf, base, watermark)
+        logger.info(
+            "recommender_matrix_built: jobs=%d terms=%d nnz=%d elapsed_ms=%.1f",
+            n_docs, len(vocab), matrix.base.nnz, (time.perf_counter() - started) * 1000,
+        )
+        return matrix
+
+    def __len__(self) -> int:
+        return int(self.base_alive.sum()) + len(self.delta)
+
+    @property
+    def delta_size(self) -> int:
+        return len(self._delta_rows)
+
+    @property
+    def churn(self) -> int:
+        """Rows changed or removed since the base segment was built."""
+        return self.delta_size + int(len(self.base_alive) - self.base_alive.sum())
+
+    def _vectorize(self, counts: Counter, *, grow: bool) -> tuple[np.ndarray, np.ndarray]:
+        ids, values = [], []
+        for term, count in counts.items():
+            term_id = self.vocab.get(term)
+            if term_id is None:
+                if not grow:
+                    continue
+                # unseen at build time: weight it like the rarest term until the next rebuild
+                term_id = self.vocab[term] = len(self.idf)
+                self.idf = np.append(self.idf, self.idf.max() if len(self.idf) else 1.0).astype(np.float32)
+            ids.append(term_id)
+            values.append(count)
+        return np.asarray(ids, dtype=np.int32), np.asarray(values, dtype=np.float32)
+
+    def apply_changes(self, upserts: Iterable, removals: Iterable = (), *, watermark: Optional[tuple] = None) -> None:
+        """Re-vectorize changed open postings and drop closed/deleted ones.
+
+        The watermark advances past the upserts, and to ``watermark`` (the last change read,
+        removals included) when given.
+        """
+        with self._lock:
+            self.watermark = _later(self.watermark, watermark)
+            alive = self.base_alive.copy()
+            delta_rows = dict(self._delta_rows)
+            for job_id in removals:
+                delta_rows.pop(job_id, None)
+                row = self._base_row.get(job_id)
+                if row is not None:
+                    alive[row] = False
+            for job in upserts:
+                row = self._base_row.get(job.job_id)
+                if row is not None:
+                    alive[row] = False
+                counts = job_term_counts(job)
+                if counts:
+                    delta_rows[job.job_id] = self._vectorize(counts, grow=True)
+                else:
+                    delta_rows.pop(job.job_id, None)
+                self.watermark = _later(self.watermark, change_key(job))
+            delta = _segment_from_rows(delta_rows, self.idf)
+            self._delta_rows, self._delta_pos = delta_rows, {job_id: n for n, job_id in enumerate(delta_rows)}
+            self.delta, self.base_alive = delta, alive
+
+    def profile_vector(self, counts: Counter, idf: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Normalized sublinear TF-IDF weights of a profile as sparse (term ids, weights)."""
+        idf = self.idf if idf is None else idf
+        ids, values = self._vectorize(counts, grow=False)
+        keep = ids < len(idf)
+        ids, values = ids[keep], values[keep]
+        weights = (1.0 + np.log(values)) * idf[ids]
+        if len(ids):
+            weights /= np.linalg.norm(weights)
+        return ids, weights
+
+    def top_k(self, counts: Counter, k: int, *, exclude: Iterable = ()) -> list[Tuple[float, object]]:
+        """Best ``k`` (cosine score, job_id) pairs for a profile, highest first."""
+        # a consistent view of the segments; the product itself runs without the lock
+        with self._lock:
+            base, alive, delta, delta_pos, idf = self.base, self.base_alive, self.delta, self._delta_pos, self.idf
+        q_ids, q_weights = self.profile_vector(counts, idf)
+        if not len(q_ids):
+            return []
+        scores = np.concatenate([np.where(alive, base.scores(q_ids, q_weights), 0.0), delta.scores(q_ids, q_weights)])
+        job_ids = base.job_ids + delta.job_ids
+        for job_id in exclude:
+            row = self._base_row.get(job_id)
+            if row is not None:
+                scores[row] = 0.0
+            pos = delta_pos.get(job_id)
+            if pos is not None:
+                scores[len(base) + pos] = 0.0
+        if k < len(scores):
+            top = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(float(scores[i]), job_ids[i]) for i in top if scores[i] > 0]
+
+
+def _postings(db: Session):
+    return db.query(JobPosting).options(
+        load_only(
+            JobPosting.job_id,
+            JobPosting.title,
+            JobPosting.description,
+            JobPosting.requirements,
+            JobPosting.status,
+            JobPosting.updated_at,
+        )
+    )
+
+
+class JobRecommender:
+    """Process-wide TF-IDF matrix over open postings, kept fresh by a background thread."""
+
+    def __init__(self, *, refresh_seconds: float, rebuild_fraction: float = 0.2, batch_size: int = 5000):
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_fraction = rebuild_fraction
+        self.batch_size = batch_size
+        self._matrix: Optional[TfidfJobMatrix] = None
+        self._build_lock = threading.Lock()
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def matrix(self) -> Optional[TfidfJobMatrix]:
+        """The current matrix, or None until the background thread has built it; reads never build."""
+        return self._matrix
+
+    def _build(self, db: Session) -> TfidfJobMatrix:
+        rows = _postings(db).filter(JobPosting.status == "open").yield_per(self.batch_size)
+        return TfidfJobMatrix.build(rows, batch_size=self.batch_size)
+
+    def refresh(self, db: Session) -> None:
+        """Build the matrix on first use, then fold postings changed since its watermark into the delta (or rebuild)."""
+        with self._build_lock:
+            if self._matrix is None:
+                self._matrix = self._build(db)
+                return
+            self._refresh_locked(db)
+
+    def _refresh_locked(self, db: Session) -> None:
+        matrix = self._matrix
+        q = _postings(db)
+        if matrix.watermark is not None:
+            # strictly past the last (updated_at, job_id) read, so rows sharing a timestamp are neither
+            # skipped nor re-applied on every pass
+            q = q.filter(tuple_(JobPosting.updated_at, JobPosting.job_id) > tuple_(*matrix.watermark))
+        changed = q.all()
+        if not changed:
+            return
+        upserts = [job for job in changed if job.status == "open"]
+        removals = [job.job_id for job in changed if job.status != "open"]
+        last = None
+        for job in changed:
+            last = _later(last, change_key(job))
+        matrix.apply_changes(upserts, removals, watermark=last)
+        if matrix.churn > self.rebuild_fraction * max(len(matrix.base), 1):
+            self._matrix = self._build(db)
+        logger.info("recommender_refreshed: changed=%d delta=%d", len(changed), self._matrix.delta_size)
+
+    def notify_changed(self) -> None:
+        """Wake the worker early after a posting was written."""
+        self._changed.set()
+
+    def start(self, session_factory) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        self._changed.set()  # first pass runs right away and builds the matrix
+
+        def _run():
+            while not self._stop.is_set():
+                if self.refresh_seconds > 0:
+                    timeout = self.refresh_seconds
+                else:
+                    # no periodic refresh: catch up only when notified, retrying a failed first build
+                    timeout = BUILD_RETRY_SECONDS if self._matrix is None else None
+                self._changed.wait(timeout)
+                self._changed.clear()
+                if self._stop.is_set():
+                    break
+                try:
+                    with session_factory() as db:
+                        self.refresh(db)
+                except Exception:
+                    logger.exception("recommender_refresh_failed")
+
+        self._worker = threading.Thread(target=_run, name="recommender-refresh", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._changed.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            if not self._worker.is_alive():
+                self._worker = None
+
+
+_recommender: Optional[JobRecommender] = None
+
+
+def get_recommender() -> JobRecommender:
+    global _recommender
+    if _recommender is None:
+        _recommender = JobRecommender(
+            refresh_seconds=settings.RECOMMENDER_REFRESH_SECONDS,
+            rebuild_fraction=settings.RECOMMENDER_REBUILD_FRACTION,
+        )
+    return _recommender
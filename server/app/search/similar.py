@@ -0,0 +1,287 @@
+"""Related postings from MinHash signatures and an LSH band index.
+
+A posting's title + description + skills_required is reduced to word shingles
+(adjacent token pairs). Its MinHash signature keeps, for each of ``NUM_PERM``
+hash functions, the smallest hash over the shingles; the share of positions two
+signatures agree on estimates the Jaccard similarity of their shingle sets.
+
+The signature is cut into ``BANDS`` bands of ``ROWS`` values and each band is
+hashed into a bucket. Two postings with Jaccard similarity ``s`` share at least
+one bucket with probability ``1 - (1 - s**ROWS)**BANDS`` (about 0.5 at s=0.4 and
+0.99 at s=0.6), so a lookup only scores its bucket mates instead of every posting.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session, load_only
+
+from app.core.config import settings
+from app.db.models import JobPosting
+from app.search.inverted_index import tokenize
+
+logger = logging.getLogger("app.search")
+
+BUILD_RETRY_SECONDS = 30  # retry interval for a failed first build when there is no periodic refresh
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_FIELDS = ("title", "description", "skills_required")
+
+_EMPTY = np.iinfo(np.uint32).max
+_SHIFT = np.uint64(32)
+# hashed shingles per vectorized chunk; bounds the (NUM_PERM, chunk) uint64 temporary to ~16 MB
+_CHUNK_SHINGLES = 16_384
+
+
+def shingles(job) -> set:
+    tokens = tokenize(" ".join(getattr(job, field, None) or "" for field in SHINGLE_FIELDS))
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+class MinHasher:
+    """``NUM_PERM`` multiply-add-shift hashes h(x) = ((a*x + b) mod 2**64) >> 32 over CRC32 shingle ids.
+
+    The family is universal for 32-bit keys and needs no division, so hashing
+    stays a couple of wrapping uint64 multiplies per (shingle, permutation).
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = (rng.integers(0, 1 << 63, num_perm, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self.b = rng.integers(0, 1 << 63, num_perm, dtype=np.uint64)
+
+    def signatures(self, shingle_sets: List[set]) -> np.ndarray:
+        """(len(shingle_sets), num_perm) uint32 signatures; an empty set gets the all-max signature."""
+        sigs = np.full((len(shingle_sets), self.num_perm), _EMPTY, dtype=np.uint32)
+        start = 0
+        while start < len(shingle_sets):
+            # take documents until the chunk holds enough shingles (always at least one document)
+            end, total = start, 0
+            while end < len(shingle_sets) and (end == start or total + len(shingle_sets[end]) <= _CHUNK_SHINGLES):
+                total += len(shingle_sets[end])
+                end += 1
+            chunk = shingle_sets[start:end]
+            lengths = np.fromiter((len(s) for s in chunk), dtype=np.int64, count=len(chunk))
+            if total:
+                ids = np.fromiter(
+                    (zlib.crc32(shingle.encode()) for s in chunk for shingle in s), dtype=np.uint64, count=total
+                )
+                # permutations along rows, so the per-document minimum reduces contiguous slices
+                hashed = self.a[:, None] * ids
+                hashed += self.b[:, None]
+                hashed >>= _SHIFT
+                nonempty = lengths > 0
+                offsets = (np.cumsum(lengths) - lengths)[nonempty]
+                rows = np.flatnonzero(nonempty) + start
+                sigs[rows] = np.minimum.reduceat(hashed, offsets, axis=1).T
+            start = end
+        return sigs
+
+
+# odd multipliers folding each band's ROWS values into one 64-bit bucket key (wrapping arithmetic)
+_BAND_MIX = np.random.default_rng(2).integers(1, 1 << 62, ROWS, dtype=np.uint64) | np.uint64(1)
+
+
+def band_keys(sigs: np.ndarray) -> np.ndarray:
+    """(n, BANDS) bucket keys for (n, NUM_PERM) signatures."""
+    bands = sigs.reshape(len(sigs), BANDS, ROWS).astype(np.uint64)
+    with np.errstate(over="ignore"):
+        return (bands * _BAND_MIX).sum(axis=2, dtype=np.uint64)
+
+
+class LSHIndex:
+    """Signatures of open postings plus one bucket map per band; safe for concurrent readers."""
+
+    def __init__(self, hasher: Optional[MinHasher] = None):
+        self.hasher = hasher or MinHasher()
+        self._sigs: dict = {}
+        self._keys: dict = {}
+        self._buckets: List[dict] = [{} for _ in range(BANDS)]
+        self.watermark: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sigs)
+
+    def signature(self, job) -> np.ndarray:
+        """The indexed signature of ``job``, or a freshly computed one (closed or unseen postings)."""
+        sig = self._sigs.get(job.job_id)
+        if sig is None:
+            sig = self.hasher.signatures([shingles(job)])[0]
+        return sig
+
+    def upsert(self, jobs: Iterable) -> None:
+        jobs = list(jobs)
+        if not jobs:
+            return
+        sigs = self.hasher.signatures([shingles(job) for job in jobs])
+        keys = band_keys(sigs)
+        with self._lock:
+            for job, sig, job_keys in zip(jobs, sigs, keys.tolist()):
+                self._discard(job.job_id)
+                self._sigs[job.job_id] = sig
+                self._keys[job.job_id] = job_keys
+                for band, key in enumerate(job_keys):
+                    self._buckets[band].setdefault(key, set()).add(job.job_id)
+                updated_at = getattr(job, "updated_at", None)
+                if updated_at is not None and (self.watermark is None or updated_at > self.watermark):
+                    self.watermark = updated_at
+
+    def remove(self, job_ids: Iterable) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                self._discard(job_id)
+
+    def _discard(self, job_id) -> None:
+        keys = self._keys.pop(job_id, None)
+        if keys is None:
+            return
+        del self._sigs[job_id]
+        for band, key in enumerate(keys):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(job_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def similar(self, sig: np.ndarray, k: int, *, exclude=None) -> List[Tuple[float, object]]:
+        """Best ``k`` (estimated Jaccard, job_id) bucket mates of a signature, highest first."""
+        keys = band_keys(sig[None, :])[0].tolist()
+        with self._lock:
+            candidates = set()
+            for band, key in enumerate(keys):
+                candidates.update(self._buckets[band].get(key, ()))
+            candidates.discard(exclude)
+            if not candidates:
+                return []
+            job_ids = list(candidates)
+            matrix = np.stack([self._sigs[job_id] for job_id in job_ids])
+        scores = (matrix == sig).mean(axis=1)
+        if k < len(scores):
+            top = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(float(scores[i]), job_ids[i]) for i in top]
+
+
+def _postings(db: Session):
+    return db.query(JobPosting).options(
+        load_only(
+            JobPosting.job_id,
+            JobPosting.title,
+            JobPosting.description,
+            JobPosting.skills_required,
+            JobPosting.status,
+            JobPosting.updated_at,
+        )
+    )
+
+
+class SimilarJobs:
+    """Process-wide LSH index over open postings.
+
+    A background thread (``start``) builds the index and then catches up with
+    postings written by other workers every ``refresh_seconds`` (0: built once,
+    no periodic refresh). Writes made through this process are applied right away
+    (``apply``). Lookups never query the database; until the first build
+    finishes ``index()`` is None.
+    """
+
+    def __init__(self, *, refresh_seconds: float, batch_size: int = 2000):
+        self.refresh_seconds = refresh_seconds
+        self.batch_size = batch_size
+        self._index: Optional[LSHIndex] = None
+        self._build_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def index(self) -> Optional[LSHIndex]:
+        return self._index
+
+    def _build(self, db: Session) -> LSHIndex:
+        started = time.perf_counter()
+        index = LSHIndex()
+        batch: list = []
+        for job in _postings(db).filter(JobPosting.status == "open").yield_per(self.batch_size):
+            batch.append(job)
+            if len(batch) >= self.batch_size:
+                index.upsert(batch)
+                batch = []
+        index.upsert(batch)
+        logger.info("similar_index_built: jobs=%d elapsed_ms=%.1f", len(index), (time.perf_counter() - started) * 1000)
+        return index
+
+    def refresh(self, db: Session) -> None:
+        """Build the index on first use, then apply postings changed since its watermark."""
+        with self._build_lock:
+            index = self._index
+            if index is None:
+                self._index = self._build(db)
+                return
+            q = _postings(db)
+            if index.watermark is not None:
+                # >= because several rows can share the watermark timestamp; re-applying is harmless
+                q = q.filter(JobPosting.updated_at >= index.watermark)
+            changed = q.all()
+            index.upsert(job for job in changed if job.status == "open")
+            index.remove(job.job_id for job in changed if job.status != "open")
+            if changed:
+                logger.info("similar_index_refreshed: changed=%d jobs=%d", len(changed), len(index))
+
+    def apply(self, job) -> None:
+        """Reflect a posting written in this process (no-op until the index is first built)."""
+        index = self._index
+        if index is None:
+            return
+        if job.status == "open":
+            index.upsert([job])
+        else:
+            index.remove([job.job_id])
+
+    def start(self, session_factory) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+
+        def _run():
+            # first pass builds the index right away, then catch up every interval until stopped
+            while not self._stop.is_set():
+                try:
+                    with session_factory() as db:
+                        self.refresh(db)
+                except Exception:
+                    logger.exception("similar_index_refresh_failed")
+                if self.refresh_seconds <= 0 and self._index is not None:
+                    return
+                self._stop.wait(self.refresh_seconds if self.refresh_seconds > 0 else BUILD_RETRY_SECONDS)
+
+        self._worker = threading.Thread(target=_run, name="similar-jobs-refresh", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            self._worker = None
+
+
+_similar: Optional[SimilarJobs] = None
+
+
+def get_similar_jobs() -> SimilarJobs:
+    global _similar
+    if _similar is None:
+        _similar = SimilarJobs(refresh_seconds=settings.SIMILAR_JOBS_REFRESH_SECONDS)
+    return _similar
@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import JobPosting
+
+logger = logging.getLogger("app.search")
+
+
+class SkillMatcher:
+    """Open jobs' skill vectors in CSR form, scored against an applicant in one pass.
+
+    Rows are sorted by job id, so for equal scores a larger row index is a larger
+    job id; that gives (score, job_id) keyset pagination without a Python sort.
+    A job's score is the fraction of its required skills the applicant has.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[object, Sequence[int]]]):
+        # jobs without any recognised skill can never match; leave them out so every row is non-empty
+        rows = sorted(((str(job_id), skill_ids) for job_id, skill_ids in rows if skill_ids), key=lambda r: r[0])
+        self.job_ids = np.array([job_id for job_id, _ in rows], dtype=object)
+        self._sorted_ids = np.array(self.job_ids, dtype=str) if rows else np.array([], dtype=str)
+        lengths = np.fromiter((len(set(ids)) for _, ids in rows), dtype=np.int32, count=len(rows))
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = np.fromiter(
+            (skill_id for _, ids in rows for skill_id in sorted(set(ids))), dtype=np.int32, count=int(self.indptr[-1])
+        )
+        self.lengths = lengths
+        self.max_skill_id = int(self.indices.max()) if len(self.indices) else 0
+        self.built_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def scores(self, skill_ids: Iterable[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (matched skill count, score) for every row."""
+        have = np.zeros(self.max_skill_id + 1, dtype=np.int32)
+        ids = np.fromiter((i for i in skill_ids if 0 <= i <= self.max_skill_id), dtype=np.int64)
+        have[ids] = 1
+        if not len(self):
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float64)
+        matched = np.add.reduceat(have[self.indices], self.indptr[:-1])
+        return matched, matched / self.lengths
+
+    def top_k(
+        self,
+        skill_ids: Iterable[int],
+        k: int,
+        *,
+        after: Optional[Tuple[float, str]] = None,
+    ) -> List[Tuple[float, str]]:
+        """Best ``k`` (score, job_id) pairs, descending, strictly after the ``after`` keyset."""
+        matched, score = self.scores(skill_ids)
+        candidates = matched > 0
+        if after is not None:
+            after_score, after_id = after
+            # row index < position of after_id  <=>  job_id < after_id
+            pos = int(np.searchsorted(self._sorted_ids, str(after_id), side="left"))
+            before = np.arange(len(self)) < pos
+            candidates &= (score < after_score) | ((score == after_score) & before)
+        idx = np.flatnonzero(candidates)
+        if not len(idx) or k <= 0:
+            return []
+        if len(idx) > k:
+            # cheap O(n) cut to the k-th best score, then an exact ordering on what is left
+            threshold = np.partition(score[idx], len(idx) - k)[len(idx) - k]
+            idx = idx[score[idx] >= threshold]
+        order = np.lexsort((idx, score[idx]))[::-1][:k]
+        best = idx[order]
+        return [(float(score[i]), self.job_ids[i]) for i in best]
+
+
+class SkillMatchIndex:
+    """Process-wide SkillMatcher over open postings, rebuilt when stale."""
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self._matcher: Optional[SkillMatcher] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def mark_stale(self) -> None:
+        self._dirty = True
+
+    def _is_stale(self) -> bool:
+        matcher = self._matcher
+        return matcher is None or self._dirty or time.monotonic() - matcher.built_at > self.max_age_seconds
+
+    def matcher(self, db: Session) -> SkillMatcher:
+        if self._is_stale():
+            with self._lock:
+                if self._is_stale():
+                    self._dirty = False
+                    started = time.perf_counter()
+                    rows = (
+                        db.query(JobPosting.job_id, JobPosting.skill_ids)
+                        .filter(JobPosting.status == "open", JobPosting.skill_ids.isnot(None))
+                        .yield_per(5000)
+                    )
+                    self._matcher = SkillMatcher(rows)
+                    logger.info(
+                        "skill_matcher_built: jobs=%d elapsed_ms=%.1f",
+                        len(self._matcher),
+                        (time.perf_counter() - started) * 1000,
+                    )
+        return self._matcher
+
+
+_index: Optional[SkillMatchIndex] = None
+
+
+def get_skill_match_index() -> SkillMatchIndex:
+    global _index
+    if _index is None:
+        _index = SkillMatchIndex(settings.SKILL_MATCH_MAX_AGE_SECONDS)
+    return _index
@@ -0,0 +1,58 @@
+import re
+from typing import Iterable, List, Optional
+
+# Separators used in the free-text skills_required column
+_SPLIT_RE = re.compile(r"[,;|\n]+")
+_SPACE_RE = re.compile(r"\s+")
+
+# Spellings that name the same skill; keys and values are already normalized
+ALIASES = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "golang": "go",
+    "py": "python",
+    "python3": "python",
+    "ml": "machine learning",
+    "k8s": "kubernetes",
+    "amazon web services": "aws",
+    "c sharp": "c#",
+    "cpp": "c++",
+}
+
+MAX_SKILL_LENGTH = 64
+
+
+def normalize_skill(raw: str) -> Optional[str]:
+    """Canonical dictionary key for one skill name, or None if nothing is left."""
+    name = _SPACE_RE.sub(" ", raw).strip().rstrip(".").lower()
+    if not name or len(name) > MAX_SKILL_LENGTH:
+        return None
+    return ALIASES.get(name, name)
+
+
+def normalize_skills(names: Iterable[str]) -> List[str]:
+    """Normalize and de-duplicate, keeping first-seen order."""
+    out = {}
+    for raw in names:
+        if not isinstance(raw, str):
+            continue
+        name = normalize_skill(raw)
+        if name:
+            out[name] = None
+    return list(out)
+
+
+def parse_skills_required(text: Optional[str]) -> List[str]:
+    """Split a job's comma-separated skills_required into normalized skill names."""
+    if not text:
+        return []
+    return normalize_skills(_SPLIT_RE.split(text))
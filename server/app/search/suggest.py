@@ -0,0 +1,426 @@
+"""Typeahead suggestions from a frequency-weighted prefix trie.
+
+Entries are (kind, key) pairs: posting titles, locations and skills weighted by
+the number of open postings that carry them, and company names weighted by one
+plus their open postings. Each entry is indexed under its normalized text and
+under the text from each of its next few word starts, so "dev" also finds
+"Backend Developer".
+
+Every trie node caches the best ``TOP_K`` entries of its subtree, so a lookup is
+one dict step per prefix character plus a slice. Below ``FULL_DEPTH`` characters
+the trie is a burst trie: a leaf keeps up to ``BUCKET_SIZE`` whole strings in
+sorted order (longer prefixes bisect into them) and only splits by the next
+character once it outgrows that, which keeps the long tails of unique titles
+from costing one node per character. Writes recompute the cached lists
+bottom-up along the touched paths only.
+"""
+from __future__ import annotations
+
+import heapq
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy.orm import Session, load_only
+
+from app.core.config import settings
+from app.db.models import Company, JobPosting
+from app.search.skills import parse_skills_required
+
+logger = logging.getLogger("app.search")
+
+TOP_K = 10
+FULL_DEPTH = 8  # every prefix up to this many characters has its own node
+BUCKET_SIZE = 32  # strings a deeper leaf holds before it splits
+WORD_STARTS = 4  # index the phrase from each of its first four words
+
+_SPACE_RE = re.compile(r"\s+")
+
+Entry = Tuple[str, str]  # (kind, normalized key)
+
+
+def normalize(text: Optional[str]) -> str:
+    return _SPACE_RE.sub(" ", text or "").strip().lower()
+
+
+def indexed_strings(key: str) -> set:
+    words = key.split(" ")
+    return {" ".join(words[i:]) for i in range(min(len(words), WORD_STARTS))}
+
+
+class _Node:
+    __slots__ = ("children", "entries", "best", "top")
+
+    def __init__(self):
+        self.children: dict = {}
+        # sorted (indexed string, kind, key): strings ending at this node, plus, for a leaf at
+        # FULL_DEPTH or deeper, every string below it; replaced rather than mutated so readers
+        # can iterate it without the writer's lock
+        self.entries: tuple = ()
+        self.best: tuple = ()  # best TOP_K (-weight, kind, key) among entries
+        self.top: tuple = ()  # best TOP_K (-weight, kind, key) in the subtree
+
+
+class SuggestTrie:
+    """Weighted prefix trie. Writers must be serialized by the caller; readers need no lock."""
+
+    def __init__(self, top_k: int = TOP_K):
+        self.top_k = top_k
+        self._root = _Node()
+        self._weights: Dict[Entry, int] = {}
+        self._display: Dict[Entry, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def weight(self, entry: Entry) -> int:
+        return self._weights.get(entry, 0)
+
+    def suggest(self, prefix: str, limit: int = TOP_K) -> List[Tuple[str, str, int]]:
+        """Up to ``limit`` (text, kind, weight) entries starting with ``prefix``, heaviest first."""
+        prefix = normalize(prefix)
+        node = self._root
+        for depth, ch in enumerate(prefix):
+            child = node.children.get(ch)
+            if child is None:
+                if depth >= FULL_DEPTH and not node.children:
+                    top = self._scan_bucket(node.entries, prefix, limit)
+                    break
+                return []
+            node = child
+        else:
+            top = node.top[:limit]
+        display = self._display
+        return [(display.get((kind, key), key), kind, -neg) for neg, kind, key in top]
+
+    def _scan_bucket(self, entries: tuple, prefix: str, limit: int) -> list:
+        weights = self._weights
+        matches = set()
+        for i in range(bisect_left(entries, (prefix,)), len(entries)):
+            s, kind, key = entries[i]
+            if not s.startswith(prefix):
+                break
+            matches.add((-weights.get((kind, key), 0), kind, key))
+        return heapq.nsmallest(limit, matches)
+
+    def apply(self, deltas: Mapping[Entry, int], display: Optional[Mapping[Entry, str]] = None) -> None:
+        """Add weight deltas (an entry is dropped once its weight reaches zero)."""
+        display = display or {}
+        previous: Dict[Entry, int] = {}
+        touched: dict = {}  # id(node) -> (depth, parent, char, node)
+        leaves: dict = {}  # id(node) -> (node, depth, added, removed, changed)
+        for entry, delta in deltas.items():
+            if not delta:
+                if entry in display and entry in self._weights:
+                    self._display[entry] = display[entry]  # same weight, so the cached lists stand
+                continue
+            old = previous[entry] = self._weights.get(entry, 0)
+            new = old + delta
+            if new > 0:
+                self._weights[entry] = new
+                if entry in display:
+                    self._display[entry] = display[entry]
+            else:
+                self._weights.pop(entry, None)
+                self._display.pop(entry, None)
+            kind, key = entry
+            for s in indexed_strings(key):
+                node, depth = self._root, 0
+                # split on every character up to FULL_DEPTH, then only through burst nodes
+                while depth < len(s) and (depth < FULL_DEPTH or node.children):
+                    ch = s[depth]
+                    child = node.children.get(ch)
+                    if child is None:
+                        child = node.children[ch] = _Node()
+                    depth += 1
+                    touched[id(child)] = (depth, node, ch, child)
+                    node = child
+                _, _, added, removed, changed = leaves.setdefault(id(node), (node, depth, set(), set(), set()))
+                changed.add(entry)
+                if (old > 0) != (new > 0):
+                    (added if new > 0 else removed).add((s, kind, key))
+        for node, depth, added, removed, changed in leaves.values():
+            entries = _merge_sorted(node.entries, added, removed)
+            if depth >= FULL_DEPTH and not node.children and len(entries) > BUCKET_SIZE:
+                self._burst(node, depth, entries)
+            else:
+                node.entries = entries
+                node.best = self._best(node, changed, previous)
+        for depth, parent, ch, node in sorted(touched.values(), key=lambda t: t[0], reverse=True):
+            self._merge_top(node)
+            if not node.top:
+                parent.children.pop(ch, None)
+        if touched:
+            self._merge_top(self._root)
+
+    def _best(self, node: _Node, changed: Optional[set] = None, previous: Optional[dict] = None) -> tuple:
+        """Best entries of ``node`` itself, rescanning them only if a listed one lost weight."""
+        weights = self._weights
+        if changed is not None:
+            listed = {(kind, key) for _, kind, key in node.best}
+            if not any(weights.get(e, 0) < previous[e] for e in changed & listed):
+                # unlisted entries that did not change still rank below every listed one
+                candidates = {t for t in node.best if (t[1], t[2]) not in changed}
+                candidates.update((-weights[e], e[0], e[1]) for e in changed if e in weights)
+                return tuple(heapq.nsmallest(self.top_k, candidates))
+        return tuple(heapq.nsmallest(self.top_k, {(-weights[(kind, key)], kind, key) for _, kind, key in node.entries}))
+
+    def _burst(self, node: _Node, depth: int, entries: tuple) -> None:
+        """Split an oversized leaf's strings into child leaves by their next character."""
+        stay, split = [], {}
+        for item in entries:
+            if len(item[0]) > depth:
+                split.setdefault(item[0][depth], []).append(item)
+            else:
+                stay.append(item)
+        children = {}
+        for ch, items in split.items():
+            child = children[ch] = _Node()
+            if len(items) > BUCKET_SIZE:
+                self._burst(child, depth + 1, tuple(items))
+            else:
+                child.entries = tuple(items)
+                child.best = self._best(child)
+            self._merge_top(child)
+        # children are complete before they are attached, so a concurrent reader never sees them half built
+        node.children = children
+        node.entries = tuple(stay)
+        node.best = self._best(node)
+
+    def _merge_top(self, node: _Node) -> None:
+        candidates = set(node.best)
+        for child in node.children.values():
+            candidates.update(child.top)
+        node.top = tuple(heapq.nsmallest(self.top_k, candidates))
+
+
+def _merge_sorted(entries: tuple, added: set, removed: set) -> tuple:
+    """``entries`` plus ``added`` minus ``removed``, still sorted; a few changes splice in place."""
+    if not added and not removed:
+        return entries
+    if len(added) + len(removed) > 8:
+        return tuple(sorted(added.union(entries) - removed))
+    for item in removed:
+        i = bisect_left(entries, item)
+        if i < len(entries) and entries[i] == item:
+            entries = entries[:i] + entries[i + 1:]
+    for item in added:
+        i = bisect_left(entries, item)
+        if i == len(entries) or entries[i] != item:
+            entries = entries[:i] + (item,) + entries[i:]
+    return entries
+
+
+def posting_entries(job) -> List[Tuple[Entry, str]]:
+    """(entry, display text) pairs an open posting contributes (company names are tracked separately)."""
+    out = {}
+    for kind, text in (("title", job.title), ("location", job.location)):
+        key = normalize(text)
+        if key:
+            out[(kind, key)] = _SPACE_RE.sub(" ", text).strip()
+    for skill in parse_skills_required(job.skills_required):
+        out[("skill", skill)] = skill
+    return list(out.items())
+
+
+def _postings(db: Session):
+    return db.query(JobPosting).options(
+        load_only(
+            JobPosting.job_id,
+            JobPosting.company_id,
+            JobPosting.title,
+            JobPosting.location,
+            JobPosting.skills_required,
+            JobPosting.status,
+            JobPosting.updated_at,
+        )
+    )
+
+
+def _companies(db: Session):
+    return db.query(Company).options(load_only(Company.company_id, Company.name, Company.updated_at))
+
+
+class Suggester:
+    """Process-wide suggestion trie, built and kept fresh by a background thread.
+
+    Lookups only read the trie (they return nothing until the first build has
+    finished). Writes made through this process are applied right away; postings
+    and companies written by other workers are picked up from updated_at every
+    ``refresh_seconds``.
+    """
+
+    def __init__(self, *, refresh_seconds: float, batch_size: int = 5000):
+        self.refresh_seconds = refresh_seconds
+        self.batch_size = batch_size
+        self.trie: Optional[SuggestTrie] = None
+        self._job_entries: dict = {}  # job_id -> (company_id, entries) counted for an open posting
+        self._company_keys: dict = {}  # company_id -> normalized name
+        self._company_jobs: Counter = Counter()  # company_id -> open postings
+        self._versions: dict = {}  # job_id / company_id -> newest updated_at applied
+        self._job_watermark = None
+        self._company_watermark = None
+        self._lock = threading.Lock()  # serializes every writer of the trie and the maps above
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def suggest(self, prefix: str, limit: int = TOP_K) -> List[Tuple[str, str, int]]:
+        trie = self.trie
+        return trie.suggest(prefix, limit) if trie is not None else []
+
+    def _stale(self, key, updated_at) -> bool:
+        """True for a row older than the version of it already applied.
+
+        refresh reads its rows before taking the lock, so a posting or company this
+        process wrote (and applied) in the meantime must not be rolled back by them.
+        """
+        if updated_at is None:
+            return False
+        seen = self._versions.get(key)
+        if seen is not None and updated_at < seen:
+            return True
+        self._versions[key] = updated_at
+        return False
+
+    def _jobs_delta(self, jobs: Iterable, deltas: Counter, display: dict) -> None:
+        for job in jobs:
+            if self._stale(job.job_id, job.updated_at):
+                continue
+            previous = self._job_entries.pop(job.job_id, None)
+            if previous is not None:
+                company_id, entries = previous
+                for entry in entries:
+                    deltas[entry] -= 1
+                self._company_delta(company_id, -1, deltas)
+            if job.status == "open":
+                pairs = posting_entries(job)
+                for entry, text in pairs:
+                    deltas[entry] += 1
+                    display.setdefault(entry, text)
+                self._company_delta(job.company_id, 1, deltas)
+                self._job_entries[job.job_id] = (job.company_id, tuple(entry for entry, _ in pairs))
+            if job.updated_at is not None and (self._job_watermark is None or job.updated_at > self._job_watermark):
+                self._job_watermark = job.updated_at
+
+    def _company_delta(self, company_id, delta: int, deltas: Counter) -> None:
+        self._company_jobs[company_id] += delta
+        if self._company_jobs[company_id] <= 0:
+            del self._company_jobs[company_id]
+        key = self._company_keys.get(company_id)
+        if key is not None:
+            deltas[("company", key)] += delta
+
+    def _companies_delta(self, companies: Iterable, deltas: Counter, display: dict) -> None:
+        for company in companies:
+            if self._stale(company.company_id, company.updated_at):
+                continue
+            key = normalize(company.name)
+            old = self._company_keys.get(company.company_id)
+            weight = 1 + self._company_jobs.get(company.company_id, 0)
+            if old != key:
+                if old is not None:
+                    deltas[("company", old)] -= weight
+                if key:
+                    deltas[("company", key)] += weight
+                    self._company_keys[company.company_id] = key
+                else:
+                    self._company_keys.pop(company.company_id, None)
+            if key:
+                deltas[("company", key)] += 0  # keeps the entry in the batch so a re-cased name is shown
+                display[("company", key)] = _SPACE_RE.sub(" ", company.name).strip()
+            updated_at = company.updated_at
+            if updated_at is not None and (self._company_watermark is None or updated_at > self._company_watermark):
+                self._company_watermark = updated_at
+
+    def apply_jobs(self, jobs: Iterable) -> None:
+        """Reflect postings written in this process (no-op until the first build)."""
+        if self.trie is None:
+            return
+        with self._lock:
+            deltas, display = Counter(), {}
+            self._jobs_delta(jobs, deltas, display)
+            self.trie.apply(deltas, display)
+
+    def apply_companies(self, companies: Iterable) -> None:
+        if self.trie is None:
+            return
+        with self._lock:
+            deltas, display = Counter(), {}
+            self._companies_delta(companies, deltas, display)
+            self.trie.apply(deltas, display)
+
+    def build(self, db: Session) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            self._job_entries, self._company_keys, self._company_jobs, self._versions = {}, {}, Counter(), {}
+            self._job_watermark = self._company_watermark = None
+            deltas, display = Counter(), {}
+            self._jobs_delta(_postings(db).filter(JobPosting.status == "open").yield_per(self.batch_size), deltas, display)
+            self._companies_delta(_companies(db).yield_per(self.batch_size), deltas, display)
+            trie = SuggestTrie()
+            trie.apply(deltas, display)
+            self.trie = trie
+        logger.info("suggest_index_built: entries=%d elapsed_ms=%.1f", len(trie), (time.perf_counter() - started) * 1000)
+
+    def refresh(self, db: Session) -> None:
+        """Apply postings and companies changed since the watermarks (builds the trie on first use)."""
+        if self.trie is None:
+            self.build(db)
+            return
+        # the queries run without the lock, so requests applying their own writes never wait on them
+        jobs = _postings(db)
+        if self._job_watermark is not None:
+            # >= because several rows can share the watermark timestamp; re-applying is harmless
+            jobs = jobs.filter(JobPosting.updated_at >= self._job_watermark)
+        companies = _companies(db)
+        if self._company_watermark is not None:
+            companies = companies.filter(Company.updated_at >= self._company_watermark)
+        changed_jobs, changed_companies = jobs.all(), companies.all()
+        with self._lock:
+            deltas, display = Counter(), {}
+            self._jobs_delta(changed_jobs, deltas, display)
+            self._companies_delta(changed_companies, deltas, display)
+            self.trie.apply(deltas, display)
+        if changed_jobs or changed_companies:
+            logger.info(
+                "suggest_index_refreshed: jobs=%d companies=%d entries=%d",
+                len(changed_jobs), len(changed_companies), len(self.trie),
+            )
+
+    def start(self, session_factory) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+
+        def _run():
+            # first pass builds the trie right away, then catch up every interval until stopped
+            while not self._stop.is_set():
+                try:
+                    with session_factory() as db:
+                        self.refresh(db)
+                except Exception:
+                    logger.exception("suggest_refresh_failed")
+                self._stop.wait(self.refresh_seconds)
+
+        self._worker = threading.Thread(target=_run, name="suggest-refresh", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            self._worker = None
+
+
+_suggester: Optional[Suggester] = None
+
+
+def get_suggester() -> Suggester:
+    global _suggester
+    if _suggester is None:
+        _suggester = Suggester(refresh_seconds=settings.SUGGEST_REFRESH_SECONDS)
+    return _suggester
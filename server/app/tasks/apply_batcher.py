@@ -0,0 +1,137 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.repository.application import apply_to_jobs
+
+logger = logging.getLogger("app.tasks")
+
+STOP_TIMEOUT_SECONDS = 5
+
+
+class ApplyBatcher:
+    """Group commit for applications: one background thread collects the applies submitted within
+    ``max_wait_seconds`` of the first one (up to ``max_batch_size``), runs them as one multi-row
+    INSERT in one transaction and resolves each caller's future with its own outcome row.
+
+    While a batch is being written the next one queues up, so batches grow with load and the
+    commit rate stays at one per flush. Callers close their request session before they wait, so
+    they hold no connection the batcher might need, and wait at most ``result_timeout`` seconds.
+    """
+
+    def __init__(self, max_batch_size: int = 100, max_wait_seconds: float = 0.005, result_timeout: float = 60):
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.result_timeout = result_timeout
+        self.batches = 0
+        self.requests = 0
+        self.largest_batch = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        # orders submits against stop(), so nothing is queued after the worker's final drain
+        self._submit_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None
+
+    def submit(self, job_id: UUID, user_id: UUID, cover_letter: str | None) -> Optional[Future]:
+        """Queue an apply for the next batch; None once ``stop()`` was called (the caller writes it itself)."""
+        future: Future = Future()
+        with self._submit_lock:
+            if self._stop.is_set():
+                return None
+            self._queue.put(((job_id, user_id, cover_letter), future))
+        return future
+
+    def _collect(self) -> list:
+        try:
+            first = self._queue.get(timeout=0.5)
+        except queue.Empty:
+            return []
+        batch = [first] if first is not None else []
+        deadline = time.monotonic() + self.max_wait_seconds
+        while batch and len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:  # stop() wake-up
+                break
+            batch.append(item)
+        return batch
+
+    def flush(self, session_factory, batch: list) -> None:
+        futures = [future for _, future in batch]
+        try:
+            with session_factory() as db:
+                outcomes = apply_to_jobs(db, [request for request, _ in batch])
+        except Exception as exc:
+            logger.exception("apply_batch_failed: size=%d", len(batch))
+            for future in futures:
+                future.set_exception(exc)
+            return
+        self.batches += 1
+        self.requests += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for future, outcome in zip(futures, outcomes):
+            future.set_result(outcome)
+
+    def start(self, session_factory) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+
+        def _run():
+            # after stop() the queue is drained, so no submitted apply is left waiting
+            while not self._stop.is_set() or not self._queue.empty():
+                batch = self._collect()
+                if batch:
+                    self.flush(session_factory, batch)
+
+        self._worker = threading.Thread(target=_run, name="apply-batcher", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        with self._submit_lock:
+            self._stop.set()
+        self._queue.put(None)  # wakes the worker instead of waiting out its poll
+        if self._worker is not None:
+            self._worker.join(timeout=STOP_TIMEOUT_SECONDS)
+            if self._worker.is_alive():
+                # still flushing; it resolves what is queued and exits on its own
+                logger.warning("apply_batcher_stop_timeout: queued=%d", self._queue.qsize())
+            else:
+                self._worker = None
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "avg_batch": round(self.requests / self.batches, 1) if self.batches else 0,
+            "largest_batch": self.largest_batch,
+            "queued": self._queue.qsize(),
+        }
+
+
+_batcher: Optional[ApplyBatcher] = None
+
+
+def get_apply_batcher() -> ApplyBatcher:
+    global _batcher
+    if _batcher is None:
+        _batcher = ApplyBatcher(
+            max_batch_size=settings.APPLY_BATCH_MAX_SIZE,
+            max_wait_seconds=settings.APPLY_BATCH_MAX_WAIT_MS / 1000,
+            # a request's batch can queue behind one being written, and each flush may wait up to
+            # the pool timeout for a connection
+            result_timeout=2 * (settings.DB_POOL_TIMEOUT_SECONDS + settings.APPLY_BATCH_MAX_WAIT_MS / 1000),
+        )
+    return _batcher
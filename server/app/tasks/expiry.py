@@ -0,0 +1,64 @@
+import logging
+import threading
+from typing import Optional
+
+from app.controllers.job_listing import close_expired_job_listings_controller
+from app.core.config import settings
+
+logger = logging.getLogger("app.tasks")
+
+
+class ExpirySweeper:
+    """Background thread closing expired postings every ``interval_seconds``.
+
+    Safe to run in every app worker: each batch locks its rows with SKIP LOCKED, so
+    concurrent sweepers take disjoint batches.
+    """
+
+    def __init__(self, interval_seconds: float, batch_size: int = 500, max_batches: int = 20):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def sweep(self, session_factory) -> int:
+        with session_factory() as db:
+            return close_expired_job_listings_controller(db, batch_size=self.batch_size, max_batches=self.max_batches)
+
+    def start(self, session_factory) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+
+        def _run():
+            # first pass right away, then every interval until stopped
+            while not self._stop.is_set():
+                try:
+                    self.sweep(session_factory)
+                except Exception:
+                    logger.exception("expiry_sweep_failed")
+                self._stop.wait(self.interval_seconds)
+
+        self._worker = threading.Thread(target=_run, name="expiry-sweeper", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+            self._worker = None
+
+
+_sweeper: Optional[ExpirySweeper] = None
+
+
+def get_expiry_sweeper() -> ExpirySweeper:
+    global _sweeper
+    if _sweeper is None:
+        _sweeper = ExpirySweeper(
+            interval_seconds=settings.JOB_EXPIRY_SWEEP_SECONDS,
+            batch_size=settings.JOB_EXPIRY_SWEEP_BATCH_SIZE,
+            max_batches=settings.JOB_EXPIRY_SWEEP_MAX_BATCHES,
+        )
+    return _sweeper
@@ -0,0 +1,58 @@
+"""Unique index on applications (job_id, applicant_id)
+
+Revision ID: 0b3c2e3bb93c
+Revises: dcd8359bea14
+Create Date: 2026-10-18 19:02:41.118406
+
+The apply path inserts with ON CONFLICT (job_id, applicant_id) DO NOTHING,
+which needs this index as its arbiter. Duplicates left by the old
+check-then-insert race are deleted first, keeping each applicant's earliest
+application. The index is built CONCURRENTLY; if a duplicate slips in
+between the two steps the build fails and leaves an INVALID index behind:
+drop it and re-run.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b3c2e3bb93c'
+down_revision: Union[str, Sequence[str], None] = 'dcd8359bea14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DELETE_DUPLICATES = """
+DELETE FROM applications a
+USING applications b
+WHERE a.job_id = b.job_id
+  AND a.applicant_id = b.applicant_id
+  AND (a.applied_at, a.application_id) > (b.applied_at, b.application_id)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(DELETE_DUPLICATES)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ux_applications_job_applicant',
+            'applications',
+            ['job_id', 'applicant_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ux_applications_job_applicant',
+            table_name='applications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
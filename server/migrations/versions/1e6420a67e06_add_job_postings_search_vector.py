@@ -0,0 +1,56 @@
+"""Add weighted full-text search vector to job postings
+
+Revision ID: 1e6420a67e06
+Revises: 90cf7ea696db
+Create Date: 2026-10-18 09:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e6420a67e06'
+down_revision: Union[str, Sequence[str], None] = '90cf7ea696db'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(skills_required, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(location, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(requirements, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A STORED generated column is computed for every existing row while the
+    # column is added, so this also backfills the current catalog.
+    op.add_column(
+        'job_postings',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_job_postings_search_vector',
+        'job_postings',
+        ['search_vector'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_postings_search_vector', table_name='job_postings', postgresql_using='gin')
+    op.drop_column('job_postings', 'search_vector')
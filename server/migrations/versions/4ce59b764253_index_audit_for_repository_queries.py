@@ -0,0 +1,100 @@
+"""Index audit: add indexes used by repository queries, drop redundant PK uniques
+
+Revision ID: 4ce59b764253
+Revises: a24b486c9d30
+Create Date: 2026-10-18 13:05:27.640915
+
+Indexes are built with CREATE INDEX CONCURRENTLY (outside a transaction), so
+the migration can run against a live database without blocking writes. If a
+concurrent build fails it leaves an INVALID index behind; drop it and re-run.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4ce59b764253'
+down_revision: Union[str, Sequence[str], None] = 'a24b486c9d30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial predicate)
+INDEXES = [
+    # feed keyset ordering: ORDER BY posted_at/updated_at, job_id (either direction)
+    ('ix_job_postings_posted_at_job_id', 'job_postings', [sa.text('posted_at DESC'), sa.text('job_id DESC')], None),
+    ('ix_job_postings_updated_at_job_id', 'job_postings', [sa.text('updated_at DESC'), sa.text('job_id DESC')], None),
+    ('ix_job_postings_open_posted_at_job_id', 'job_postings', [sa.text('posted_at DESC'), sa.text('job_id DESC')], sa.text("status = 'open'")),
+    # list_job_listings(company_id=...) and the company filter on the feed; also covers the FK
+    ('ix_job_postings_company_posted_at', 'job_postings', ['company_id', sa.text('posted_at DESC'), sa.text('job_id DESC')], None),
+    # recruiter dashboard counts by status; also covers the FK
+    ('ix_job_postings_recruiter_status', 'job_postings', ['recruiter_id', 'status'], None),
+    # recruiter applicant list / duplicate-application check / dashboard join
+    ('ix_applications_job_applied_at', 'applications', ['job_id', sa.text('applied_at DESC')], None),
+    # "my applications" for an applicant
+    ('ix_applications_applicant_applied_at', 'applications', ['applicant_id', sa.text('applied_at DESC')], None),
+    ('ix_recruiters_company_id', 'recruiters', ['company_id'], None),
+]
+
+# Tables whose primary key was also declared UNIQUE, giving a second identical index
+PK_DUPLICATE_TABLES = {
+    'users': 'user_id',
+    'companies': 'company_id',
+    'job_postings': 'job_id',
+    'applications': 'application_id',
+}
+
+DROP_PK_DUPLICATE_UNIQUES = """
+DO $$
+DECLARE
+    con record;
+BEGIN
+    FOR con IN
+        SELECT u.conname, u.conrelid::regclass AS tbl
+        FROM pg_constraint u
+        JOIN pg_constraint p ON p.conrelid = u.conrelid AND p.contype = 'p'
+        WHERE u.contype = 'u'
+          AND u.conkey = p.conkey
+          AND u.conrelid = '{table}'::regclass
+    LOOP
+        BEGIN
+            EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', con.tbl, con.conname);
+        EXCEPTION WHEN dependent_objects_still_exist THEN
+            -- a foreign key was bound to this index instead of the primary key; keep it
+            RAISE NOTICE 'keeping %: referenced by a foreign key', con.conname;
+        END;
+    END LOOP;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+    for table in PK_DUPLICATE_TABLES:
+        op.execute(DROP_PK_DUPLICATE_UNIQUES.format(table=table))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, pk in PK_DUPLICATE_TABLES.items():
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_{pk}_key UNIQUE ({pk})")
+
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,60 @@
+"""Keyset index for a job's applications
+
+Revision ID: 5e1d7a9c4f20
+Revises: 0b3c2e3bb93c
+Create Date: 2026-10-18 21:14:06.552310
+
+GET /applications/page walks a job's applications newest first with an
+(applied_at, application_id) keyset. The new index carries the tiebreaker
+in the same direction, so every page is one index range scan; it replaces
+ix_applications_job_applied_at, which is its prefix. Both are built and
+dropped CONCURRENTLY.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1d7a9c4f20'
+down_revision: Union[str, Sequence[str], None] = '0b3c2e3bb93c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_applications_job_applied_at_id',
+            'applications',
+            ['job_id', sa.text('applied_at DESC'), sa.text('application_id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_applications_job_applied_at',
+            table_name='applications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_applications_job_applied_at',
+            'applications',
+            ['job_id', sa.text('applied_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_applications_job_applied_at_id',
+            table_name='applications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,49 @@
+"""Partial index on open postings' expires_at for the expiry sweeper
+
+Revision ID: 6167530be14c
+Revises: 664f2603d34c
+Create Date: 2026-10-18 16:02:41.518204
+
+The sweeper closes open postings whose expires_at has passed in small batches;
+this index holds just the open postings that can expire, so each batch reads its
+oldest deadlines directly. Closed postings leave the index (and the existing
+open-feed partial index) as the sweeper flips them. Built CONCURRENTLY, as in
+the index audit migration.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6167530be14c'
+down_revision: Union[str, Sequence[str], None] = '664f2603d34c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_job_postings_open_expires_at',
+            'job_postings',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'open' AND expires_at IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_job_postings_open_expires_at',
+            table_name='job_postings',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,91 @@
+"""Add skill dictionary and per-job skill id vectors
+
+Revision ID: 664f2603d34c
+Revises: 4ce59b764253
+Create Date: 2026-10-18 15:21:09.332871
+
+Existing postings are backfilled from skills_required using the application's
+normalization rules (app.search.skills), in batches.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.search.skills import parse_skills_required
+
+
+# revision identifiers, used by Alembic.
+revision: str = '664f2603d34c'
+down_revision: Union[str, Sequence[str], None] = '4ce59b764253'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH = 1000
+
+
+def _backfill_skill_ids() -> None:
+    if op.get_context().as_sql:
+        # offline (--sql) mode has no rows to read; run the upgrade online to backfill
+        return
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT job_id, skills_required FROM job_postings "
+                "WHERE skills_required IS NOT NULL AND (CAST(:last_id AS uuid) IS NULL OR job_id > CAST(:last_id AS uuid)) "
+                "ORDER BY job_id LIMIT :batch"
+            ),
+            {"last_id": last_id, "batch": BACKFILL_BATCH},
+        ).all()
+        if not rows:
+            return
+        parsed = {job_id: parse_skills_required(text) for job_id, text in rows}
+        names = sorted({name for skills in parsed.values() for name in skills})
+        if names:
+            bind.execute(
+                sa.text("INSERT INTO skills (name) SELECT unnest(CAST(:names AS varchar[])) ON CONFLICT (name) DO NOTHING"),
+                {"names": names},
+            )
+            ids = dict(bind.execute(sa.text("SELECT name, skill_id FROM skills WHERE name = ANY(:names)"), {"names": names}).all())
+            bind.execute(
+                sa.text("UPDATE job_postings SET skill_ids = :skill_ids WHERE job_id = :job_id"),
+                [
+                    {"job_id": job_id, "skill_ids": sorted({ids[name] for name in skills})}
+                    for job_id, skills in parsed.items()
+                    if skills
+                ],
+            )
+        last_id = str(rows[-1][0])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'skills',
+        sa.Column('skill_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('skill_id'),
+        sa.UniqueConstraint('name'),
+    )
+    op.add_column('job_postings', sa.Column('skill_ids', postgresql.ARRAY(sa.Integer()), nullable=True))
+    _backfill_skill_ids()
+    op.create_index(
+        'ix_job_postings_skill_ids',
+        'job_postings',
+        ['skill_ids'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_postings_skill_ids', table_name='job_postings', postgresql_using='gin')
+    op.drop_column('job_postings', 'skill_ids')
+    op.drop_table('skills')
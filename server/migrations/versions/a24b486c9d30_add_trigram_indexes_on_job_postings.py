@@ -0,0 +1,46 @@
+"""Add pg_trgm indexes on job posting location and title
+
+Revision ID: a24b486c9d30
+Revises: 1e6420a67e06
+Create Date: 2026-10-18 11:40:02.187342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a24b486c9d30'
+down_revision: Union[str, Sequence[str], None] = '1e6420a67e06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_job_postings_location_trgm',
+        'job_postings',
+        ['location'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'location': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_job_postings_title_trgm',
+        'job_postings',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_postings_title_trgm', table_name='job_postings', postgresql_using='gin')
+    op.drop_index('ix_job_postings_location_trgm', table_name='job_postings', postgresql_using='gin')
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,78 @@
+"""Add saved searches and the search alert queue
+
+Revision ID: dcd8359bea14
+Revises: 6167530be14c
+Create Date: 2026-10-18 17:10:52.204317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dcd8359bea14'
+down_revision: Union[str, Sequence[str], None] = '6167530be14c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'saved_searches',
+        sa.Column('saved_search_id', sa.UUID(), nullable=False),
+        sa.Column('applicant_id', sa.UUID(), nullable=False),
+        sa.Column('name', sa.String(), nullable=True),
+        sa.Column('company_id', sa.UUID(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('title', sa.String(), nullable=True),
+        sa.Column('match', sa.String(), nullable=False, server_default='contains'),
+        sa.Column('job_type', sa.String(), nullable=True),
+        sa.Column('experience_level', sa.String(), nullable=True),
+        sa.Column('q', sa.String(), nullable=True),
+        sa.Column('anchor_key', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(['applicant_id'], ['applicants.applicant_id']),
+        sa.PrimaryKeyConstraint('saved_search_id'),
+    )
+    # percolation looks searches up by the keys a new posting emits
+    op.create_index('ix_saved_searches_anchor_key', 'saved_searches', ['anchor_key'], unique=False)
+    op.create_index(
+        'ix_saved_searches_applicant_created_at',
+        'saved_searches',
+        ['applicant_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+    op.create_table(
+        'search_alerts',
+        sa.Column('alert_id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('saved_search_id', sa.UUID(), nullable=False),
+        sa.Column('applicant_id', sa.UUID(), nullable=False),
+        sa.Column('job_id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('delivered_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['saved_search_id'], ['saved_searches.saved_search_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['applicant_id'], ['applicants.applicant_id']),
+        sa.ForeignKeyConstraint(['job_id'], ['job_postings.job_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('alert_id'),
+        sa.UniqueConstraint('saved_search_id', 'job_id', name='uq_search_alerts_saved_search_job'),
+    )
+    op.create_index(
+        'ix_search_alerts_pending',
+        'search_alerts',
+        ['applicant_id', 'alert_id'],
+        unique=False,
+        postgresql_where=sa.text('delivered_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_search_alerts_pending', table_name='search_alerts', postgresql_where=sa.text('delivered_at IS NULL'))
+    op.drop_table('search_alerts')
+    op.drop_index('ix_saved_searches_applicant_created_at', table_name='saved_searches')
+    op.drop_index('ix_saved_searches_anchor_key', table_name='saved_searches')
+    op.drop_table('saved_searches')
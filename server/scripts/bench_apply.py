@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Benchmark a burst of applications to one popular posting.
+
+Three apply paths, each run by ``--concurrency`` workers with their own connection:
+- checks: job lookup, applicant lookup, duplicate check, INSERT, refresh (five round trips; the
+  duplicate check races, so concurrent repeats fail on the unique index instead of returning 400)
+- single: the one ``INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING`` statement
+- batched: the same through the group-commit batcher (APPLY_BATCHING), which writes the applies
+  queued within ``--batch-wait-ms`` (up to ``--batch-size``) as one INSERT and one commit
+
+``--applicants`` temporary applicants apply once each, plus ``--repeat-fraction`` of them a second
+time (double submits). Reports latency percentiles, throughput and outcome counts for the sync
+engine (psycopg2, threads) and the async engine (asyncpg, tasks), with the commits issued per second. The applicants and applications
+it creates are deleted afterwards. Needs the unique index from migration 0b3c2e3bb93c and an open
+posting without expiry (scripts/seed.py or scripts/bench_async.py).
+
+Run: python server/scripts/bench_apply.py --database-url postgresql://user:pw@localhost/app
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+for name, value in (("SECRET_KEY", "bench"), ("FRONTEND_URLS", "http://localhost"), ("BACKEND_URL", "http://localhost")):
+    os.environ.setdefault(name, value)
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, delete, event, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.controllers import application as controller
+from app.controllers.aio import application as aio_controller
+from app.db.async_session import async_database_url
+from app.db.models import Applicant, Application, JobPosting, User
+from app.repository import application as repo
+from app.repository.aio import application as aio_repo
+from app.tasks import apply_batcher
+
+
+def _checks(db, job_id, user):
+    # the apply controller before the single-statement path
+    repo.ensure_job_exists(db, job_id=job_id)
+    applicant = repo.ensure_applicant_profile(db, user_id=user.user_id)
+    if repo.get_application_by_job_and_applicant(db, job_id=job_id, applicant_id=applicant.applicant_id):
+        raise HTTPException(status_code=400, detail="Already applied to this job")
+    return repo.create_application(db, job_id=job_id, applicant_id=applicant.applicant_id, cover_letter="bench")
+
+
+async def _aio_checks(db, job_id, user):
+    await aio_repo.ensure_job_exists(db, job_id=job_id)
+    applicant = await aio_repo.ensure_applicant_profile(db, user_id=user.user_id)
+    if await aio_repo.get_application_by_job_and_applicant(db, job_id=job_id, applicant_id=applicant.applicant_id):
+        raise HTTPException(status_code=400, detail="Already applied to this job")
+    return await aio_repo.create_application(db, job_id=job_id, applicant_id=applicant.applicant_id, cover_letter="bench")
+
+
+def _single(db, job_id, user):
+    return controller.apply_to_job_controller(db, current_user=user, job_id=job_id, cover_letter="bench")
+
+
+async def _aio_single(db, job_id, user):
+    return await aio_controller.apply_to_job_controller(db, current_user=user, job_id=job_id, cover_letter="bench")
+
+
+class _User:
+    __slots__ = ("user_id",)
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+
+
+def _outcome(exc: Exception | None) -> str:
+    if exc is None:
+        return "201"
+    if isinstance(exc, HTTPException):
+        return str(exc.status_code)
+    if isinstance(exc, IntegrityError) or "UniqueViolation" in type(exc).__name__ or "unique" in str(exc).lower():
+        return "unique violation (500)"
+    return type(exc).__name__
+
+
+_commits = [0]
+
+
+@event.listens_for(Engine, "commit")
+def _count_commit(conn):
+    _commits[0] += 1
+
+
+class _Batching:
+    """Runs the batcher the controllers use while APPLY_BATCHING is on, for one measurement."""
+
+    def __init__(self, engine, enabled: bool, batch_size: int, wait_ms: float):
+        self.engine, self.enabled = engine, enabled
+        self.batcher = apply_batcher.ApplyBatcher(max_batch_size=batch_size, max_wait_seconds=wait_ms / 1000)
+
+    def __enter__(self):
+        if self.enabled:
+            apply_batcher._batcher = self.batcher
+            self.batcher.start(sessionmaker(bind=self.engine))
+        return self
+
+    def __exit__(self, *exc):
+        if self.enabled:
+            self.batcher.stop()
+            apply_batcher._batcher = None
+
+
+def _report(label: str, latencies: list[float], outcomes: Counter, seconds: float, commits: int) -> None:
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        f"  {label:<8} {len(latencies) / seconds:6.0f} applies/s {commits / seconds:6.0f} commits/s   "
+        f"p50={q[49] * 1000:6.2f} ms  p95={q[94] * 1000:6.2f} ms  p99={q[98] * 1000:6.2f} ms   "
+        + "  ".join(f"{k}={v}" for k, v in sorted(outcomes.items()))
+    )
+
+
+def _create_applicants(engine, n: int) -> list:
+    user_ids = [uuid.uuid4() for _ in range(n)]
+    with Session(engine) as db:
+        db.execute(insert(User), [
+            {"user_id": u, "email": f"bench-apply-{u}@example.com", "password_hash": "x", "first_name": "Bench",
+             "last_name": "Applicant", "user_type": "applicant"}
+            for u in user_ids
+        ])
+        db.execute(insert(Applicant), [{"applicant_id": u} for u in user_ids])
+        db.commit()
+    return user_ids
+
+
+def _drop_applicants(engine, user_ids) -> None:
+    with Session(engine) as db:
+        db.execute(delete(Application).where(Application.applicant_id.in_(user_ids)))
+        db.execute(delete(Applicant).where(Applicant.applicant_id.in_(user_ids)))
+        db.execute(delete(User).where(User.user_id.in_(user_ids)))
+        db.commit()
+
+
+def _cleanup(engine, job_id) -> None:
+    with Session(engine) as db:
+        db.execute(delete(Application).where(Application.job_id == job_id, Application.cover_letter == "bench"))
+        db.commit()
+
+
+PATHS = (("checks", False), ("single", False), ("batched", True))
+
+
+def bench_sync(engine, job_id, burst, args) -> None:
+    concurrency = args.concurrency
+    print(f"sync, psycopg2, {concurrency} threads")
+    for label, batched in PATHS:
+        apply = _checks if label == "checks" else _single
+        work = list(burst)
+        latencies, outcomes, lock = [], Counter(), threading.Lock()
+
+        def worker():
+            with Session(engine) as db:
+                while True:
+                    with lock:
+                        if not work:
+                            return
+                        user = work.pop()
+                    started, exc = time.perf_counter(), None
+                    try:
+                        apply(db, job_id, user)
+                    except Exception as e:
+                        exc = e
+                        db.rollback()
+                    elapsed = time.perf_counter() - started
+                    with lock:
+                        latencies.append(elapsed)
+                        outcomes[_outcome(exc)] += 1
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        with _Batching(engine, batched, args.batch_size, args.batch_wait_ms):
+            _commits[0], started = 0, time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            seconds, commits = time.perf_counter() - started, _commits[0]
+        _report(label, latencies, outcomes, seconds, commits)
+        _cleanup(engine, job_id)
+
+
+async def bench_async(sync_engine, job_id, burst, args) -> None:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    concurrency = args.concurrency
+    engine = create_async_engine(async_database_url(args.database_url), pool_size=concurrency, max_overflow=0)
+    print(f"async, asyncpg, {concurrency} tasks (batched: the batcher writes on the sync engine)")
+    for label, batched in PATHS:
+        apply = _aio_checks if label == "checks" else _aio_single
+        work = list(burst)
+        latencies, outcomes = [], Counter()
+
+        async def worker():
+            async with AsyncSession(engine) as db:
+                while work:
+                    user = work.pop()
+                    started, exc = time.perf_counter(), None
+                    try:
+                        await apply(db, job_id, user)
+                    except Exception as e:
+                        exc = e
+                        await db.rollback()
+                    latencies.append(time.perf_counter() - started)
+                    outcomes[_outcome(exc)] += 1
+
+        with _Batching(sync_engine, batched, args.batch_size, args.batch_wait_ms):
+            _commits[0], started = 0, time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            seconds, commits = time.perf_counter() - started, _commits[0]
+        _report(label, latencies, outcomes, seconds, commits)
+        _cleanup(sync_engine, job_id)
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="seeded database (rows are created, then deleted)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--applicants", type=int, default=2000, help="distinct applicants in the burst")
+    parser.add_argument("--repeat-fraction", type=float, default=0.1, help="share of applicants that submit twice")
+    parser.add_argument("--batch-size", type=int, default=100, help="APPLY_BATCH_MAX_SIZE for the batched path")
+    parser.add_argument("--batch-wait-ms", type=float, default=5, help="APPLY_BATCH_MAX_WAIT_MS for the batched path")
+    args = parser.parse_args()
+    logging.getLogger("app.controllers").setLevel(logging.ERROR)  # one log line per apply otherwise
+
+    engine = create_engine(args.database_url, pool_size=args.concurrency, max_overflow=0)
+    with Session(engine) as db:
+        job_id = db.scalar(select(JobPosting.job_id).where(JobPosting.status == "open", JobPosting.expires_at.is_(None)).limit(1))
+        if job_id is None:
+            sys.exit("the database needs an open job posting without expiry (run scripts/seed.py)")
+    user_ids = _create_applicants(engine, args.applicants)
+    users = [_User(user_id) for user_id in user_ids]
+    rng = random.Random(7)
+    burst = users + rng.sample(users, int(len(users) * args.repeat_fraction))
+    rng.shuffle(burst)
+    print(f"job {job_id}: {len(users)} applicants, {len(burst)} submissions")
+
+    try:
+        bench_sync(engine, job_id, burst, args)
+        asyncio.run(bench_async(engine, job_id, burst, args))
+    finally:
+        _drop_applicants(engine, user_ids)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
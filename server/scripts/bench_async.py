@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Benchmark API throughput with DB_MODE=sync and DB_MODE=async under many concurrent connections.
+
+It creates the schema in the given (throwaway) database, seeds a recruiter, an
+applicant, one company and ``--jobs`` postings, then for each mode starts a
+single uvicorn worker and drives it with ``--concurrency`` keep-alive
+connections for ``--duration`` seconds. Each connection loops over a mix of
+database-backed reads (job detail, /users/me, recruiter dashboard, a feed page)
+and the script reports requests/second, latency percentiles, errors, and the
+pool's checkout wait from /internal/metrics.
+
+Result caches and background workers are turned off so every request reaches
+the database. The load generator is split across ``--client-procs`` processes
+so it is not the bottleneck.
+
+Run: python server/scripts/bench_async.py --database-url postgresql://user:pw@localhost/bench --concurrency 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+SECRET_KEY = "bench-secret"
+INTERNAL_TOKEN = "bench-internal"
+
+
+def _server_env(database_url: str, mode: str, pool: dict | None = None) -> dict:
+    return {
+        **(pool or {}),
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DB_MODE": mode,
+        "SECRET_KEY": SECRET_KEY,
+        "FRONTEND_URLS": "http://localhost",
+        "BACKEND_URL": "http://localhost",
+        "INTERNAL_METRICS_TOKEN": INTERNAL_TOKEN,
+        "CACHE_BACKEND": "none",
+        "RECOMMENDER_REFRESH_SECONDS": "0",
+        "SIMILAR_JOBS_REFRESH_SECONDS": "0",
+        "SUGGEST_REFRESH_SECONDS": "0",
+        "JOB_EXPIRY_SWEEP_SECONDS": "0",
+        "LOG_LEVEL": "WARNING",
+    }
+
+
+def setup(database_url: str, jobs: int) -> dict:
+    """Create the schema and seed rows; returns the ids and tokens the load generator needs."""
+    os.environ.update(_server_env(database_url, "sync"))  # before app.* reads its settings
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+
+    from app.db.models import Applicant, Company, JobPosting, Recruiter, User
+    from app.db.session import Base
+    from app.lib.jwt import create_access_token
+
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        try:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            trgm = True
+        except Exception:
+            trgm = False
+    if not trgm:
+        # the feed's fuzzy match needs pg_trgm; the benchmark doesn't use it
+        table = Base.metadata.tables["job_postings"]
+        table.indexes = {ix for ix in table.indexes if not ix.name.endswith("_trgm")}
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    rnd = random.Random(5)
+    with Session(engine) as db:
+        recruiter = User(email="recruiter@bench.example", password_hash="x", first_name="R", last_name="B", user_type="recruiter")
+        applicant = User(email="applicant@bench.example", password_hash="x", first_name="A", last_name="B", user_type="applicant")
+        company = Company(name="Bench Corp")
+        db.add_all([recruiter, applicant, company])
+        db.flush()
+        db.add_all([
+            Recruiter(recruiter_id=recruiter.user_id, company_id=company.company_id),
+            Applicant(applicant_id=applicant.user_id, skills=["python"]),
+        ])
+        db.flush()
+        start = datetime(2024, 1, 1)
+        postings = [
+            JobPosting(
+                company_id=company.company_id,
+                recruiter_id=recruiter.user_id,
+                title=f"{rnd.choice(['Backend', 'Data', 'Frontend', 'ML'])} {rnd.choice(['Intern', 'Engineer'])}",
+                description="Build and run services. " * 20,
+                requirements="Python, SQL. " * 10,
+                skills_required="python, sql",
+                location=rnd.choice(["Pune", "Mumbai", "Remote", "Delhi"]),
+                job_type="internship",
+                status=rnd.choice(["open", "open", "open", "draft"]),
+                posted_at=start + timedelta(minutes=i),
+                updated_at=start + timedelta(minutes=i),
+            )
+            for i in range(jobs)
+        ]
+        db.add_all(postings)
+        db.commit()
+        job_ids = [str(job.job_id) for job in rnd.sample(postings, min(500, jobs))]
+        seeded = {
+            "job_ids": job_ids,
+            "recruiter_token": create_access_token({"sub": recruiter.email}),
+            "applicant_token": create_access_token({"sub": applicant.email}),
+        }
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    engine.dispose()
+    return seeded
+
+
+def _requests(seeded: dict) -> list[tuple[str, str]]:
+    recruiter = seeded["recruiter_token"]
+    applicant = seeded["applicant_token"]
+    mix = [(f"/api/v1/job-listings/{job_id}", "") for job_id in seeded["job_ids"][:50]]
+    return mix + [
+        ("/api/v1/users/me", applicant),
+        ("/api/v1/users/me", recruiter),
+        ("/api/v1/recruiter/dashboard/stats", recruiter),
+        ("/api/v1/job-listings/feed?limit=20&view=summary", applicant),
+    ]
+
+
+async def _connection(host: str, port: int, requests: list, deadline: float, rnd: random.Random,
+                      latencies: list, errors: list) -> None:
+    """One keep-alive HTTP/1.1 connection issuing requests back to back (a minimal client, cheaper than httpx)."""
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        errors.append(1)
+        return
+    try:
+        while time.perf_counter() < deadline:
+            path, token = rnd.choice(requests)
+            auth = f"Authorization: Bearer {token}\r\n" if token else ""
+            t = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n{auth}\r\n".encode())
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            if head.startswith(b"HTTP/1.1 200"):
+                latencies.append(time.perf_counter() - t)
+            else:
+                errors.append(1)
+    except (OSError, asyncio.IncompleteReadError):
+        errors.append(1)
+    finally:
+        writer.close()
+
+
+async def _drive(base_url: str, requests: list, connections: int, duration: float, seed: int) -> tuple[list, int]:
+    host, port = base_url.rsplit("//", 1)[1].split(":")
+    latencies: list[float] = []
+    errors: list[int] = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        _connection(host, int(port), requests, deadline, random.Random(seed * 100_000 + i), latencies, errors)
+        for i in range(connections)
+    ))
+    return latencies, len(errors)
+
+
+def _client_proc(args):
+    base_url, requests, connections, duration, seed = args
+    return asyncio.run(_drive(base_url, requests, connections, duration, seed))
+
+
+def _wait_ready(base_url: str, proc: subprocess.Popen, timeout: float = 60) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            if httpx.get(f"{base_url}/api/v1/companies/", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError("server did not become ready")
+
+
+def run_mode(mode: str, args, seeded: dict) -> None:
+    import httpx
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning",
+         "--no-access-log", "--backlog", str(max(2048, args.concurrency * 2))],
+        cwd=ROOT_DIR,
+        env=_server_env(args.database_url, mode, args.pool_env),
+    )
+    try:
+        _wait_ready(base_url, server)
+        requests = _requests(seeded)
+        per_proc = [args.concurrency // args.client_procs + (1 if i < args.concurrency % args.client_procs else 0)
+                    for i in range(args.client_procs)]
+        # short warm-up so connection setup and first-query planning aren't measured
+        asyncio.run(_drive(base_url, requests, min(50, args.concurrency), 2, seed=99))
+        started = time.perf_counter()
+        with multiprocessing.get_context("spawn").Pool(args.client_procs) as pool:
+            results = pool.map(_client_proc, [(base_url, requests, n, args.duration, i) for i, n in enumerate(per_proc)])
+        elapsed = time.perf_counter() - started
+        # requests still queued in the server finish (or time out on the pool) before this is answered
+        metrics = httpx.get(
+            f"{base_url}/api/v1/internal/metrics", headers={"X-Internal-Token": INTERNAL_TOKEN}, timeout=300
+        ).json()
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+    latencies = sorted(lat for lats, _ in results for lat in lats)
+    errors = sum(e for _, e in results)
+    pool_key = "db_pool_async" if mode == "async" else "db_pool"
+    wait = metrics[pool_key]["checkout_wait"]
+
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else float("nan")
+
+    print(
+        f"{mode:>5}  pool={metrics[pool_key]['size']}+{metrics[pool_key]['max_overflow']}  conns={args.concurrency}  ok={len(latencies):>7,}  errors={errors:>5}  "
+        f"rps={len(latencies) / elapsed:8.1f}  p50={pct(0.5):7.1f}ms  p95={pct(0.95):7.1f}ms  p99={pct(0.99):7.1f}ms  "
+        f"pool_wait_p99={wait['p99_ms']}ms  pool_timeouts={metrics[pool_key]['timeouts']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", required=True, help="throwaway database; its tables are dropped and recreated")
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--client-procs", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--modes", nargs="+", choices=["sync", "async"], default=["sync", "async"])
+    parser.add_argument("--pool-size", type=int, help="DB_POOL_SIZE for the server (default: the app's)")
+    parser.add_argument("--max-overflow", type=int, help="DB_MAX_OVERFLOW for the server (default: the app's)")
+    args = parser.parse_args()
+    args.pool_env = {
+        name: str(value)
+        for name, value in (("DB_POOL_SIZE", args.pool_size), ("DB_MAX_OVERFLOW", args.max_overflow))
+        if value is not None
+    }
+
+    seeded = setup(args.database_url, args.jobs)
+    print(f"seeded {args.jobs:,} postings; {args.duration:.0f}s per mode, {args.client_procs} client processes")
+    for mode in args.modes:
+        run_mode(mode, args, seeded)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark the hot point lookups (user by email, recruiter by user id, job exists, job detail).
+
+Each lookup is run four ways:
+- query:    the legacy ``db.query(...).filter(...).first()`` the repositories used to build per call
+- select:   a 2.0 ``select()`` built per call
+- lambda:   ``lambda_stmt`` (cached on the lambda's code location; closure values become parameters)
+- prebuilt: the module-level statement with ``bindparam`` the repositories use now
+
+Without ``--database-url`` it reports the Python cost of producing the statement and its cache key
+(what a call pays before the compiled SQL is found in the engine's cache). With it, it also times
+whole calls through a sync Session (psycopg2) and an AsyncSession (asyncpg), the latter with the
+prepared-statement cache on and off. The database needs at least one user, recruiter and posting
+(scripts/seed.py or scripts/bench_async.py); nothing is written.
+
+Run: python server/scripts/bench_lookups.py --database-url postgresql://user:pw@localhost/app
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+for name, value in (("SECRET_KEY", "bench"), ("FRONTEND_URLS", "http://localhost"), ("BACKEND_URL", "http://localhost")):
+    os.environ.setdefault(name, value)
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from sqlalchemy import create_engine, lambda_stmt, select
+from sqlalchemy.orm import Query, Session
+
+from app.db.async_session import async_database_url
+from app.db.models import Company, JobPosting, Recruiter, User
+from app.repository.company import RECRUITER_BY_USER_ID
+from app.repository.job_listing import JOB_BY_ID, JOB_WITH_COMPANY_NAME_BY_ID
+from app.repository.user import USER_BY_EMAIL
+
+
+def _variants(keys: dict) -> dict:
+    """lookup -> {variant: (build() -> statement, params)}; every statement yields the same rows."""
+    email, user_id, job_id = keys["email"], keys["user_id"], keys["job_id"]
+
+    def job_detail_select():
+        return (
+            select(JobPosting, Company.name.label("company_name"))
+            .join(Company, Company.company_id == JobPosting.company_id)
+            .where(JobPosting.job_id == job_id)
+            .limit(1)
+        )
+
+    return {
+        "user by email": {
+            "query": (lambda: Query(User).filter(User.email == email).limit(1), None),
+            "select": (lambda: select(User).where(User.email == email).limit(1), None),
+            "lambda": (lambda: lambda_stmt(lambda: select(User).where(User.email == email).limit(1)), None),
+            "prebuilt": (lambda: USER_BY_EMAIL, {"email": email}),
+        },
+        "recruiter by user id": {
+            "query": (lambda: Query(Recruiter).filter(Recruiter.recruiter_id == user_id).limit(1), None),
+            "select": (lambda: select(Recruiter).where(Recruiter.recruiter_id == user_id).limit(1), None),
+            "lambda": (lambda: lambda_stmt(lambda: select(Recruiter).where(Recruiter.recruiter_id == user_id).limit(1)), None),
+            "prebuilt": (lambda: RECRUITER_BY_USER_ID, {"user_id": user_id}),
+        },
+        "job exists": {
+            "query": (lambda: Query(JobPosting).filter(JobPosting.job_id == job_id).limit(1), None),
+            "select": (lambda: select(JobPosting).where(JobPosting.job_id == job_id).limit(1), None),
+            "lambda": (lambda: lambda_stmt(lambda: select(JobPosting).where(JobPosting.job_id == job_id).limit(1)), None),
+            "prebuilt": (lambda: JOB_BY_ID, {"job_id": job_id}),
+        },
+        "job detail": {
+            "query": (
+                lambda: Query((JobPosting, Company.name.label("company_name")))
+                .join(Company, Company.company_id == JobPosting.company_id)
+                .filter(JobPosting.job_id == job_id)
+                .limit(1),
+                None,
+            ),
+            "select": (job_detail_select, None),
+            "lambda": (lambda: lambda_stmt(job_detail_select), None),
+            "prebuilt": (lambda: JOB_WITH_COMPANY_NAME_BY_ID, {"job_id": job_id}),
+        },
+    }
+
+
+def _statement(built):
+    # a legacy Query executes the select() it compiles to
+    return built._statement_20() if isinstance(built, Query) else built
+
+
+def _per_call_us(fn, seconds: float) -> float:
+    for _ in range(200):
+        fn()
+    calls, started = 0, time.perf_counter()
+    while True:
+        for _ in range(100):
+            fn()
+        calls += 100
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return elapsed / calls * 1e6
+
+
+def bench_build(variants: dict, seconds: float) -> None:
+    print("statement + cache key, no database (us per call)")
+    for lookup, by_variant in variants.items():
+        row = {name: _per_call_us(lambda b=build: _statement(b())._generate_cache_key(), seconds)
+               for name, (build, _) in by_variant.items()}
+        print(f"  {lookup:<22}" + "".join(f"{name}={us:7.1f}  " for name, us in row.items()))
+
+
+def bench_sync(database_url: str, variants: dict, seconds: float) -> None:
+    engine = create_engine(database_url)
+    print("sync Session, psycopg2, full call incl. round trip (us per call)")
+    with Session(engine) as db:
+        for lookup, by_variant in variants.items():
+            row = {}
+            for name, (build, params) in by_variant.items():
+                def call(build=build, params=params):
+                    db.execute(_statement(build()), params).first()
+                    db.expunge_all()  # materialize a fresh object each call, as separate requests would
+                row[name] = _per_call_us(call, seconds)
+            print(f"  {lookup:<22}" + "".join(f"{name}={us:7.1f}  " for name, us in row.items()))
+    engine.dispose()
+
+
+async def bench_async(database_url: str, variants: dict, seconds: float) -> None:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    for cache_size in (100, 0):
+        engine = create_async_engine(
+            async_database_url(database_url), connect_args={"prepared_statement_cache_size": cache_size}
+        )
+        print(f"AsyncSession, asyncpg, prepared_statement_cache_size={cache_size} (us per call)")
+        async with AsyncSession(engine) as db:
+            for lookup, by_variant in variants.items():
+                row = {}
+                for name, (build, params) in by_variant.items():
+                    stmt_of = build if name != "query" else (lambda b=build: _statement(b()))
+                    for _ in range(200):
+                        (await db.execute(stmt_of(), params)).first()
+                    calls, started = 0, time.perf_counter()
+                    while time.perf_counter() - started < seconds:
+                        (await db.execute(stmt_of(), params)).first()
+                        db.expunge_all()
+                        calls += 1
+                    row[name] = (time.perf_counter() - started) / calls * 1e6
+                print(f"  {lookup:<22}" + "".join(f"{name}={us:7.1f}  " for name, us in row.items()))
+        await engine.dispose()
+
+
+def _keys(database_url: str | None) -> dict:
+    if not database_url:
+        import uuid
+
+        return {"email": "someone@example.com", "user_id": uuid.uuid4(), "job_id": uuid.uuid4()}
+    engine = create_engine(database_url)
+    with Session(engine) as db:
+        email = db.scalar(select(User.email).limit(1))
+        user_id = db.scalar(select(Recruiter.recruiter_id).limit(1))
+        job_id = db.scalar(select(JobPosting.job_id).limit(1))
+    engine.dispose()
+    if not (email and user_id and job_id):
+        sys.exit("the database needs a user, a recruiter and a job posting (run scripts/seed.py)")
+    return {"email": email, "user_id": user_id, "job_id": job_id}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="seeded database to run the lookups against (read-only)")
+    parser.add_argument("--seconds", type=float, default=1.0, help="time per measurement")
+    args = parser.parse_args()
+
+    variants = _variants(_keys(args.database_url))
+    bench_build(variants, args.seconds)
+    if args.database_url:
+        bench_sync(args.database_url, variants, args.seconds)
+        asyncio.run(bench_async(args.database_url, variants, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Benchmark saved-search percolation against re-running every saved search.
+
+For each size it generates synthetic saved searches (a mix of company, q, location,
+title, job_type and experience filters, some fuzzy, some with OR; words and cities
+drawn from Zipf distributions) and a stream of new postings, then reports for each
+posting:
+- candidates: saved searches whose anchor key is among the posting's keys
+- percolate: key extraction, candidate lookup and full evaluation of the candidates
+- scan: evaluating every saved search against the posting (the approach this replaces)
+
+Filters are evaluated in Python with lowercase word sets standing in for tsvector
+lexemes. With ``--database-url`` the anchor lookup also runs in Postgres: the
+searches are COPY'd into a temporary table with a btree index on anchor_key and
+each posting's candidate count is timed with and without the anchor predicate.
+
+Run: python server/scripts/bench_percolate.py --sizes 100000 1000000
+     python server/scripts/bench_percolate.py --database-url postgresql://... --sizes 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from app.search.percolate import anchor_key, has_required_terms, posting_keys
+
+
+SYLLABLES = ["ka", "ri", "po", "lan", "de", "mu", "sha", "ve", "to", "ner", "gu", "bal", "chi", "ra", "mo", "zen", "ti", "qua"]
+SKILLS = ["python", "sql", "react", "django", "fastapi", "docker", "kubernetes", "excel", "figma", "pandas", "aws", "typescript"]
+JOB_TYPES = ["full-time", "part-time", "internship", "contract"]
+EXPERIENCE = ["fresher", "0-1 years", "1-3 years", "3-5 years"]
+
+
+def _words(n: int, seed: int, syllables: int) -> list[str]:
+    rnd = random.Random(seed)
+    words: dict[str, None] = {}
+    while len(words) < n:
+        words["".join(rnd.choices(SYLLABLES, k=syllables))] = None
+    return list(words)
+
+
+# word and city popularity follow a Zipf curve, like real postings
+VOCAB = SKILLS + _words(5000, seed=1, syllables=3)
+VOCAB_WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCAB))]
+LOCATIONS = [w.title() for w in _words(300, seed=2, syllables=2)]
+LOCATION_WEIGHTS = [1 / (rank + 1) for rank in range(len(LOCATIONS))]
+TITLE_WORDS = VOCAB[:200]
+COMPANIES = [uuid.UUID(int=i + 1) for i in range(20_000)]
+
+
+def generate_searches(n: int, seed: int = 3):
+    rnd = random.Random(seed)
+    for _ in range(n):
+        search = {"company_id": None, "location": None, "title": None, "match": "contains",
+                  "job_type": None, "experience_level": None, "q": None}
+        if rnd.random() < 0.03:
+            search["company_id"] = rnd.choice(COMPANIES)
+        if rnd.random() < 0.75:
+            # searchers skip the near-universal words at the head of the curve
+            terms = list(dict.fromkeys(rnd.choices(VOCAB[10:3000], weights=VOCAB_WEIGHTS[10:3000], k=rnd.randint(1, 3))))
+            search["q"] = " or ".join(terms) if len(terms) > 1 and rnd.random() < 0.1 else " ".join(terms)
+        if rnd.random() < 0.7:
+            city = rnd.choices(LOCATIONS, weights=LOCATION_WEIGHTS)[0]
+            search["location"] = city if rnd.random() < 0.7 else city[: rnd.randint(3, len(city))].lower()
+            search["match"] = "fuzzy" if rnd.random() < 0.1 else "contains"
+        if rnd.random() < 0.1:
+            search["title"] = rnd.choice(TITLE_WORDS)
+        if rnd.random() < 0.4:
+            search["job_type"] = rnd.choice(JOB_TYPES)
+        if rnd.random() < 0.2:
+            search["experience_level"] = rnd.choice(EXPERIENCE)
+        yield search
+
+
+def generate_postings(n: int, seed: int = 9):
+    rnd = random.Random(seed)
+    for _ in range(n):
+        title = " ".join(rnd.sample(TITLE_WORDS, 2)).title()
+        location = rnd.choices(LOCATIONS, weights=LOCATION_WEIGHTS)[0]
+        words = rnd.choices(VOCAB, weights=VOCAB_WEIGHTS, k=60)
+        yield {
+            "company_id": rnd.choice(COMPANIES),
+            "location": location,
+            "title": title,
+            "job_type": rnd.choice(JOB_TYPES),
+            "experience_level": rnd.choice(EXPERIENCE),
+            "lexemes": sorted(set(" ".join([title, location, *words]).lower().split())),
+        }
+
+
+def _lexemes(q: str | None) -> list[str]:
+    return q.lower().split() if has_required_terms(q) else []
+
+
+def _matches(search: dict, job: dict, words: set) -> bool:
+    if search["company_id"] is not None and search["company_id"] != job["company_id"]:
+        return False
+    if search["job_type"] is not None and search["job_type"] != job["job_type"]:
+        return False
+    if search["experience_level"] is not None and search["experience_level"] != job["experience_level"]:
+        return False
+    for field in ("location", "title"):
+        value = search[field]
+        if value is None:
+            continue
+        if search["match"] == "fuzzy":
+            # stand-in for word similarity: same first three letters
+            if value[:3].lower() not in job[field].lower():
+                return False
+        elif value.lower() not in job[field].lower():
+            return False
+    q = search["q"]
+    if q:
+        if " or " in q:
+            return any(t in words for t in q.split(" or "))
+        return all(t in words for t in q.lower().split())
+    return True
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered) * 1000:8.3f}ms p95={p95 * 1000:8.3f}ms"
+
+
+def bench_memory(searches: list[dict], postings: list[dict], scans: int) -> list[str]:
+    t0 = time.perf_counter()
+    anchors = [
+        anchor_key(**{k: v for k, v in s.items() if k != "q"}, q_lexemes=_lexemes(s["q"])) for s in searches
+    ]
+    by_anchor: dict[str, list[int]] = defaultdict(list)
+    for i, key in enumerate(anchors):
+        by_anchor[key].append(i)
+    print(f"  index    build={time.perf_counter() - t0:8.2f}s  distinct anchors={len(by_anchor):,}")
+
+    candidates, matched, samples = [], [], []
+    for job in postings:
+        t = time.perf_counter()
+        words = set(job["lexemes"])
+        ids = [i for key in posting_keys(**job) for i in by_anchor.get(key, ())]
+        hits = [i for i in ids if _matches(searches[i], job, words)]
+        samples.append(time.perf_counter() - t)
+        candidates.append(len(ids))
+        matched.append(len(hits))
+    print(
+        f"  percolate {_summary(samples)}  candidates avg={statistics.mean(candidates):,.0f}"
+        f" ({statistics.mean(candidates) / len(searches):.2%})  matches avg={statistics.mean(matched):,.0f}"
+    )
+
+    samples = []
+    for job in postings[:scans]:
+        t = time.perf_counter()
+        words = set(job["lexemes"])
+        hits = [i for i, s in enumerate(searches) if _matches(s, job, words)]
+        samples.append(time.perf_counter() - t)
+    print(f"  scan      {_summary(samples)}  (every saved search, {len(samples)} postings)")
+    return anchors
+
+
+def bench_postgres(searches: list[dict], anchors: list[str], postings: list[dict], database_url: str) -> None:
+    import psycopg2
+
+    conn = psycopg2.connect(database_url.replace("postgresql+psycopg2://", "postgresql://"))
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "CREATE TEMP TABLE bench_saved_searches ("
+                " anchor_key text NOT NULL, company_id uuid, job_type text, experience_level text)"
+            )
+            buf = io.StringIO()
+            for s, key in zip(searches, anchors):
+                row = [key, s["company_id"], s["job_type"], s["experience_level"]]
+                buf.write("\t".join("\\N" if v is None else str(v) for v in row) + "\n")
+            buf.seek(0)
+            t0 = time.perf_counter()
+            cur.copy_expert("COPY bench_saved_searches FROM STDIN", buf)
+            cur.execute("CREATE INDEX ON bench_saved_searches (anchor_key)")
+            cur.execute("ANALYZE bench_saved_searches")
+            print(f"  postgres  load={time.perf_counter() - t0:8.2f}s")
+
+            filters = (
+                " AND (company_id IS NULL OR company_id = %s)"
+                " AND (job_type IS NULL OR job_type = %s)"
+                " AND (experience_level IS NULL OR experience_level = %s)"
+            )
+            for label, anchored in (("anchored", True), ("full scan", False)):
+                samples = []
+                for job in postings[: 50 if anchored else 5]:
+                    params = [str(job["company_id"]), job["job_type"], job["experience_level"]]
+                    sql = "SELECT count(*) FROM bench_saved_searches WHERE true"
+                    if anchored:
+                        sql += " AND anchor_key = ANY(%s)"
+                        params.insert(0, posting_keys(**job))
+                    t = time.perf_counter()
+                    cur.execute(sql + filters, params)
+                    cur.fetchone()
+                    samples.append(time.perf_counter() - t)
+                print(f"  postgres  {label:9} {_summary(samples)}")
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--postings", type=int, default=200, help="new postings percolated per size")
+    parser.add_argument("--scans", type=int, default=5, help="postings also checked against every search")
+    parser.add_argument("--database-url", default=None, help="also time the candidate lookup in Postgres")
+    args = parser.parse_args()
+
+    postings = list(generate_postings(args.postings))
+    for n in args.sizes:
+        print(f"== {n:,} saved searches")
+        searches = list(generate_searches(n))
+        anchors = bench_memory(searches, postings, args.scans)
+        if args.database_url:
+            bench_postgres(searches, anchors, postings, args.database_url)
+
+
+if __name__ == "__main__":
+    main()
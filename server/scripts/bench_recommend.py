@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark the TF-IDF recommendation matrix.
+
+For each catalog size it generates synthetic postings and reports:
+- the batched matrix build time and its size (non-zeros, MB)
+- the time to fold a burst of changed postings into the delta segment
+- top-k latency for a set of applicant profiles (one sparse matrix-vector product each)
+- for comparison, a per-posting Python loop that computes the same dot products
+
+Run: python server/scripts/bench_recommend.py --sizes 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import types
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from app.search.recommend import TfidfJobMatrix, profile_term_counts
+
+
+ROLES = ["python", "java", "frontend", "backend", "data", "marketing", "design", "sales", "devops", "android", "ios", "ml"]
+LEVELS = ["intern", "junior", "engineer", "analyst", "associate", "developer", "specialist"]
+SKILLS = ["python", "sql", "react", "django", "fastapi", "docker", "kubernetes", "excel", "figma", "pandas", "aws", "typescript", "go", "rust", "c++"]
+FILLER = (
+    "work with the team on customer facing features build reliable services write tests review code "
+    "collaborate with product analyse metrics ship improvements every week learn quickly own problems"
+).split()
+
+PROFILES = [
+    {"headline": "Backend developer", "skills": ["python", "fastapi", "sql"], "bio": "I like building services"},
+    {"headline": "Frontend engineer", "skills": ["react", "typescript", "figma"]},
+    {"headline": "Data analyst", "skills": ["pandas", "sql", "excel"], "experience": [{"title": "Analyst intern"}]},
+    {"headline": "DevOps", "skills": ["docker", "kubernetes", "aws", "go"]},
+]
+K = 20
+
+
+def generate(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(n):
+        skills = rnd.sample(SKILLS, 3)
+        yield types.SimpleNamespace(
+            job_id=uuid.UUID(int=rnd.getrandbits(128)),
+            title=f"{rnd.choice(ROLES).title()} {rnd.choice(LEVELS).title()}",
+            description=" ".join(rnd.choices(FILLER, k=40) + skills),
+            requirements=" ".join(rnd.choices(FILLER, k=15) + rnd.sample(SKILLS, 2)),
+            status="open",
+            updated_at=start + timedelta(minutes=i),
+        )
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered) * 1000:8.3f}ms p95={p95 * 1000:8.3f}ms"
+
+
+def bench_matrix(jobs: list, repeat: int, changes: int) -> None:
+    t0 = time.perf_counter()
+    matrix = TfidfJobMatrix.build(iter(jobs), batch_size=5000)
+    base = matrix.base
+    size_mb = (base.col_ptr.nbytes + base.row_ids.nbytes + base.data.nbytes) / 1e6
+    print(f"  build    {time.perf_counter() - t0:8.2f}s  terms={len(matrix.idf):,} nnz={base.nnz:,} size={size_mb:.1f}MB")
+
+    rnd = random.Random(11)
+    changed = [
+        types.SimpleNamespace(**{**vars(job), "title": job.title + " " + rnd.choice(SKILLS), "updated_at": datetime(2025, 1, 1)})
+        for job in rnd.sample(jobs, changes)
+    ]
+    t0 = time.perf_counter()
+    matrix.apply_changes(changed)
+    print(f"  refresh  {(time.perf_counter() - t0) * 1000:8.2f}ms  ({changes} changed postings into the delta)")
+
+    for profile in PROFILES:
+        counts = profile_term_counts(types.SimpleNamespace(**profile))
+        samples = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            matrix.top_k(counts, K)
+            samples.append(time.perf_counter() - t)
+        print(f"  top{K}    {profile['headline']!r:22} {_summary(samples)}")
+
+    # the same product computed one posting at a time, for scale
+    counts = profile_term_counts(types.SimpleNamespace(**PROFILES[0]))
+    q_ids, q_weights = matrix.profile_vector(counts)
+    q_terms = dict(zip(q_ids.tolist(), q_weights.tolist()))
+    rows = [{} for _ in range(len(base))]
+    for term in range(len(base.col_ptr) - 1):
+        for pos in range(base.col_ptr[term], base.col_ptr[term + 1]):
+            rows[base.row_ids[pos]][term] = float(base.data[pos])
+    samples = []
+    for _ in range(max(1, repeat // 10)):
+        t = time.perf_counter()
+        scored = [(sum(w * row.get(term, 0.0) for term, w in q_terms.items()), n) for n, row in enumerate(rows)]
+        sorted(scored, reverse=True)[:K]
+        samples.append(time.perf_counter() - t)
+    print(f"  loop     {PROFILES[0]['headline']!r:22} {_summary(samples)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--changes", type=int, default=500, help="postings changed between refreshes")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        print(f"== {n:,} postings")
+        bench_matrix(list(generate(n)), args.repeat, min(args.changes, n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-process BM25 search index against the ILIKE search path.
+
+For each catalog size it generates synthetic postings, builds the inverted
+index and times a fixed set of feed queries (top 21 results, like one feed
+page). The ILIKE side runs the same three-column ILIKE predicate the feed used
+before full-text search, either against Postgres (``--database-url``, loaded
+into a temporary table via COPY) or, without a database, as an in-Python
+substring scan, which is a lower bound for a sequential ILIKE scan.
+
+Run: python server/scripts/bench_search.py --sizes 10000 100000 1000000
+     python server/scripts/bench_search.py --database-url postgresql://... --sizes 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from app.search.inverted_index import InvertedIndex
+
+
+ROLES = ["python", "java", "frontend", "backend", "data", "marketing", "design", "sales", "devops", "android", "ios", "ml"]
+LEVELS = ["intern", "junior", "engineer", "analyst", "associate", "developer", "specialist"]
+SKILLS = ["python", "sql", "react", "django", "fastapi", "docker", "kubernetes", "excel", "figma", "pandas", "aws", "typescript", "go", "rust", "c++"]
+LOCATIONS = ["Bangalore", "Pune", "Mumbai", "Delhi", "Hyderabad", "Chennai", "Remote", "Kolkata", "Noida", "Gurgaon"]
+FILLER = (
+    "work with the team on customer facing features build reliable services write tests review code "
+    "collaborate with product analyse metrics ship improvements every week learn quickly own problems"
+).split()
+
+QUERIES = ["python", "python intern", "react typescript", "data analyst sql", "kubernetes", "ml engineer pandas"]
+PAGE = 21
+
+
+def generate(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(n):
+        skills = rnd.sample(SKILLS, 3)
+        yield {
+            "job_id": uuid.UUID(int=rnd.getrandbits(128)),
+            "title": f"{rnd.choice(ROLES).title()} {rnd.choice(LEVELS).title()}",
+            "description": " ".join(rnd.choices(FILLER, k=40) + skills),
+            "requirements": " ".join(rnd.choices(FILLER, k=15)),
+            "skills_required": ",".join(skills),
+            "location": rnd.choice(LOCATIONS),
+            "posted_at": start + timedelta(minutes=i),
+        }
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered) * 1000:8.3f}ms p95={p95 * 1000:8.3f}ms"
+
+
+def bench_index(docs: list[dict], repeat: int) -> None:
+    t0 = time.perf_counter()
+    index = InvertedIndex()
+    for doc in docs:
+        index.add(doc["job_id"], doc)
+    print(f"  memory  build={time.perf_counter() - t0:8.2f}s")
+    for q in QUERIES:
+        samples = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            index.search(q, k=PAGE)
+            samples.append(time.perf_counter() - t)
+        print(f"  memory  {q!r:24} {_summary(samples)}")
+
+
+def bench_python_scan(docs: list[dict], repeat: int) -> None:
+    lowered = [(d["title"].lower(), d["description"].lower(), d["location"].lower(), d["posted_at"]) for d in docs]
+    for q in QUERIES:
+        needle = q.lower()
+        samples = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            hits = [row for row in lowered if needle in row[0] or needle in row[1] or needle in row[2]]
+            hits.sort(key=lambda row: row[3], reverse=True)
+            hits[:PAGE]
+            samples.append(time.perf_counter() - t)
+        print(f"  scan    {q!r:24} {_summary(samples)}")
+
+
+def bench_postgres(docs: list[dict], repeat: int, database_url: str) -> None:
+    import psycopg2
+
+    conn = psycopg2.connect(database_url.replace("postgresql+psycopg2://", "postgresql://"))
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "CREATE TEMP TABLE bench_job_postings ("
+                " job_id uuid PRIMARY KEY, title text, description text, location text, posted_at timestamp)"
+            )
+            buf = io.StringIO()
+            for d in docs:
+                buf.write(f"{d['job_id']}\t{d['title']}\t{d['description']}\t{d['location']}\t{d['posted_at'].isoformat()}\n")
+            buf.seek(0)
+            t0 = time.perf_counter()
+            cur.copy_expert("COPY bench_job_postings FROM STDIN", buf)
+            cur.execute("ANALYZE bench_job_postings")
+            print(f"  ilike   load={time.perf_counter() - t0:8.2f}s")
+            for q in QUERIES:
+                like = f"%{q}%"
+                samples = []
+                for _ in range(repeat):
+                    t = time.perf_counter()
+                    cur.execute(
+                        "SELECT job_id FROM bench_job_postings"
+                        " WHERE title ILIKE %s OR description ILIKE %s OR location ILIKE %s"
+                        " ORDER BY posted_at DESC, job_id DESC LIMIT %s",
+                        (like, like, like, PAGE),
+                    )
+                    cur.fetchall()
+                    samples.append(time.perf_counter() - t)
+                print(f"  ilike   {q!r:24} {_summary(samples)}")
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default=None, help="run the ILIKE side against Postgres")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        print(f"== {n:,} postings")
+        docs = list(generate(n))
+        bench_index(docs, args.repeat)
+        if args.database_url:
+            bench_postgres(docs, args.repeat, args.database_url)
+        else:
+            bench_python_scan(docs, max(1, args.repeat // 4))
+
+
+if __name__ == "__main__":
+    main()
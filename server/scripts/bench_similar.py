@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark the MinHash/LSH similar-postings index.
+
+For each catalog size it generates synthetic postings (with a share of reposted
+near-duplicates) and reports:
+- the batched index build time
+- the time to upsert a burst of edited postings
+- lookup latency for postings already in the index (stored signature, bucket scan, top-k)
+- for comparison, scoring the same signature against every posting
+
+Run: python server/scripts/bench_similar.py --sizes 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import types
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from app.search.similar import LSHIndex
+
+
+ROLES = ["python", "java", "frontend", "backend", "data", "marketing", "design", "sales", "devops", "android", "ios", "ml"]
+LEVELS = ["intern", "junior", "engineer", "analyst", "associate", "developer", "specialist"]
+SKILLS = ["python", "sql", "react", "django", "fastapi", "docker", "kubernetes", "excel", "figma", "pandas", "aws", "typescript"]
+VOCAB = [f"w{i}" for i in range(3000)]
+VOCAB_WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCAB))]
+K = 10
+
+
+def generate(n: int, seed: int = 7, duplicate_share: float = 0.1):
+    rnd = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    jobs = []
+    for i in range(n):
+        if jobs and rnd.random() < duplicate_share:
+            source = rnd.choice(jobs)
+            description = source.description + " " + " ".join(rnd.choices(VOCAB, weights=VOCAB_WEIGHTS, k=5))
+            title = source.title
+        else:
+            description = " ".join(rnd.choices(VOCAB, weights=VOCAB_WEIGHTS, k=80))
+            title = f"{rnd.choice(ROLES).title()} {rnd.choice(LEVELS).title()}"
+        jobs.append(types.SimpleNamespace(
+            job_id=uuid.UUID(int=rnd.getrandbits(128)),
+            title=title,
+            description=description,
+            skills_required=", ".join(rnd.sample(SKILLS, 3)),
+            status="open",
+            updated_at=start + timedelta(minutes=i),
+        ))
+    return jobs
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered) * 1000:8.3f}ms p95={p95 * 1000:8.3f}ms"
+
+
+def bench_index(jobs: list, lookups: int, changes: int) -> None:
+    index = LSHIndex()
+    t0 = time.perf_counter()
+    for start in range(0, len(jobs), 2000):
+        index.upsert(jobs[start:start + 2000])
+    print(f"  build    {time.perf_counter() - t0:8.2f}s  jobs={len(index):,}")
+
+    rnd = random.Random(11)
+    changed = [types.SimpleNamespace(**{**vars(job), "title": job.title + " remote"}) for job in rnd.sample(jobs, changes)]
+    t0 = time.perf_counter()
+    index.upsert(changed)
+    print(f"  upsert   {(time.perf_counter() - t0) * 1000:8.2f}ms  ({changes} edited postings)")
+
+    probes = rnd.sample(jobs, lookups)
+    samples, found = [], 0
+    for job in probes:
+        t = time.perf_counter()
+        hits = index.similar(index.signature(job), K, exclude=job.job_id)
+        samples.append(time.perf_counter() - t)
+        found += bool(hits)
+    print(f"  similar  {_summary(samples)}  (probes with a neighbour: {found}/{len(probes)})")
+
+    ids = list(index._sigs)
+    matrix = np.stack([index._sigs[job_id] for job_id in ids])
+    samples = []
+    for job in probes[: max(1, lookups // 10)]:
+        t = time.perf_counter()
+        scores = (matrix == index.signature(job)).mean(axis=1)
+        np.argpartition(scores, len(scores) - K)[len(scores) - K:]
+        samples.append(time.perf_counter() - t)
+    print(f"  scan     {_summary(samples)}  (every signature)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--changes", type=int, default=500, help="postings edited after the build")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        print(f"== {n:,} postings")
+        jobs = generate(n)
+        bench_index(jobs, min(args.lookups, n), min(args.changes, n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark the typeahead prefix trie.
+
+For each catalog size it generates synthetic postings and companies and reports:
+- the trie build time and number of entries
+- the time to apply a burst of edited postings
+- lookup latency for prefixes of 1 to 20 characters typed from real entries
+- for comparison, a scan over every entry's indexed strings for the same prefixes
+
+Run: python server/scripts/bench_suggest.py --sizes 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import types
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Ensure the project root (server directory) is on sys.path so `app.*` imports work
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from app.search.suggest import Suggester, indexed_strings
+
+
+ROLES = ["python", "java", "frontend", "backend", "data", "marketing", "design", "sales", "devops", "android", "ios", "ml",
+         "content", "finance", "hr", "operations", "product", "research", "qa", "security"]
+LEVELS = ["intern", "junior", "engineer", "analyst", "associate", "developer", "specialist", "trainee", "executive"]
+SKILLS = ["python", "sql", "react", "django", "fastapi", "docker", "kubernetes", "excel", "figma", "pandas", "aws",
+          "typescript", "go", "rust", "c++", "java", "spring", "tableau", "power bi", "seo"]
+SYLLABLES = ["ka", "ri", "po", "lan", "de", "mu", "sha", "ve", "to", "ner", "gu", "bal", "chi", "ra", "mo", "zen"]
+
+
+def _names(n: int, rnd: random.Random, syllables: int) -> list[str]:
+    names: dict[str, None] = {}
+    while len(names) < n:
+        names["".join(rnd.choices(SYLLABLES, k=syllables)).title()] = None
+    return list(names)
+
+
+class _Rows(list):
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def yield_per(self, n):
+        return iter(self)
+
+
+class _DB:
+    def __init__(self, jobs, companies):
+        self.jobs, self.companies = _Rows(jobs), _Rows(companies)
+
+    def query(self, model):
+        return self.jobs if model.__name__ == "JobPosting" else self.companies
+
+
+def generate(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    companies = [
+        types.SimpleNamespace(company_id=uuid.UUID(int=i + 1), name=f"{name} Labs", updated_at=datetime(2024, 1, 1))
+        for i, name in enumerate(_names(max(10, n // 20), rnd, 4))
+    ]
+    cities = _names(400, rnd, 3)
+    teams = _names(max(10, n // 5), rnd, 4)  # a third of titles name a team, so titles stay mostly distinct
+    start = datetime(2024, 1, 1)
+    jobs = [
+        types.SimpleNamespace(
+            job_id=uuid.UUID(int=rnd.getrandbits(128)),
+            company_id=rnd.choice(companies).company_id,
+            title=" ".join(
+                [rnd.choice(["", "Senior ", "Remote "]) + rnd.choice(ROLES).title(), rnd.choice(LEVELS).title()]
+                + ([rnd.choice(teams), "Team"] if rnd.random() < 0.33 else [])
+            ),
+            location=rnd.choices(cities, weights=[1 / (r + 1) for r in range(len(cities))])[0],
+            skills_required=", ".join(rnd.sample(SKILLS, 4)),
+            status="open",
+            updated_at=start + timedelta(minutes=i),
+        )
+        for i in range(n)
+    ]
+    return jobs, companies
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered) * 1e6:8.1f}us p95={p95 * 1e6:8.1f}us"
+
+
+def bench(jobs: list, companies: list, lookups: int, changes: int) -> None:
+    suggester = Suggester(refresh_seconds=60)
+    t0 = time.perf_counter()
+    suggester.build(_DB(jobs, companies))
+    trie = suggester.trie
+    print(f"  build    {time.perf_counter() - t0:8.2f}s  entries={len(trie):,}")
+
+    rnd = random.Random(11)
+    edited = [types.SimpleNamespace(**{**vars(job), "title": job.title + " Intern"}) for job in rnd.sample(jobs, changes)]
+    t0 = time.perf_counter()
+    suggester.apply_jobs(edited)
+    print(f"  apply    {(time.perf_counter() - t0) * 1000:8.2f}ms  ({changes} edited postings)")
+
+    keys = [key for _, key in trie._weights]
+    prefixes = []
+    for _ in range(lookups):
+        key = rnd.choice(keys)
+        prefixes.append(key[: rnd.randint(1, min(20, len(key)))])
+    samples = []
+    for prefix in prefixes:
+        t = time.perf_counter()
+        suggester.suggest(prefix, 8)
+        samples.append(time.perf_counter() - t)
+    print(f"  suggest  {_summary(samples)}")
+
+    entries = [(w, kind, key, indexed_strings(key)) for (kind, key), w in trie._weights.items()]
+    samples = []
+    for prefix in prefixes[: max(1, lookups // 100)]:
+        t = time.perf_counter()
+        hits = [(w, kind, key) for w, kind, key, strings in entries if any(s.startswith(prefix) for s in strings)]
+        sorted(hits, reverse=True)[:8]
+        samples.append(time.perf_counter() - t)
+    print(f"  scan     {_summary(samples)}  (every entry)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--changes", type=int, default=200, help="postings edited after the build")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        print(f"== {n:,} postings")
+        jobs, companies = generate(n)
+        bench(jobs, companies, args.lookups, min(args.changes, n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# tests/db/test_async_session.py
+
+import asyncio
+
+from app.db import async_session
+
+
+def test_async_database_url_swaps_the_driver():
+    url = async_session.async_database_url("postgresql+psycopg2://u:p%40ss@db:5432/app")
+    assert url.drivername == "postgresql+asyncpg"
+    assert (url.username, url.password, url.host, url.port, url.database) == ("u", "p@ss", "db", 5432, "app")
+    url = async_session.async_database_url("postgresql://u@/app?host=/tmp/pg")
+    assert url.drivername == "postgresql+asyncpg" and url.query == {"host": "/tmp/pg"}
+
+
+def test_get_async_db_closes_the_session(monkeypatch):
+    events = []
+
+    class FakeSession:
+        async def __aenter__(self):
+            events.append("open")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append("close")
+
+    monkeypatch.setattr(async_session, "get_async_session_factory", lambda: FakeSession)
+
+    async def run():
+        gen = async_session.get_async_db()
+        db = await gen.__anext__()
+        assert isinstance(db, FakeSession)
+        await gen.aclose()
+
+    asyncio.run(run())
+    assert events == ["open", "close"]
@@ -0,0 +1,105 @@
+# tests/db/test_instrument.py
+
+import logging
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from app.db import instrument
+from app.db.instrument import SqlInstrumentationMiddleware, SqlStats
+
+
+@pytest.fixture
+def engine():
+    instrument.install()
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO t (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    yield engine
+    instrument.uninstall()
+    engine.dispose()
+
+
+def _app(engine, budget=3, threshold=3):
+    app = FastAPI()
+    app.add_middleware(SqlInstrumentationMiddleware, query_budget=budget, n_plus_one_threshold=threshold)
+
+    @app.get("/list")
+    def list_rows():
+        with engine.connect() as conn:
+            return {"rows": len(conn.execute(text("SELECT id, name FROM t")).all())}
+
+    @app.get("/n-plus-one")
+    def n_plus_one():
+        with engine.connect() as conn:
+            ids = [row.id for row in conn.execute(text("SELECT id FROM t"))]
+            names = [conn.execute(text("SELECT name FROM t WHERE id = :id"), {"id": i}).scalar() for i in ids * 2]
+        return {"names": names}
+
+    @app.get("/stats")
+    async def stats():
+        return {"statements": instrument.current_stats().statements}
+
+    return app
+
+
+def _server_timing(response):
+    header = response.headers["server-timing"]
+    match = re.match(r'db;dur=([\d.]+);desc="(\d+) queries, (\d+) rows", app;dur=([\d.]+)$', header)
+    assert match, header
+    return float(match[1]), int(match[2]), int(match[3]), float(match[4])
+
+
+def test_counts_statements_rows_and_time_per_request(engine, caplog):
+    client = TestClient(_app(engine))
+    with caplog.at_level(logging.WARNING, logger="app.db"):
+        response = client.get("/list")
+    assert response.json() == {"rows": 3}
+    db_ms, statements, rows, app_ms = _server_timing(response)
+    assert statements == 1 and rows >= 0 and 0 <= db_ms <= app_ms
+    assert caplog.records == []
+
+    # a fresh count per request
+    assert _server_timing(client.get("/stats"))[1] == 0
+    assert instrument.current_stats() is None
+
+
+def test_logs_budget_overruns_and_n_plus_one_suspects(engine, caplog):
+    client = TestClient(_app(engine))
+    with caplog.at_level(logging.WARNING, logger="app.db"):
+        response = client.get("/n-plus-one")
+    assert _server_timing(response)[1] == 7
+    messages = [r.getMessage() for r in caplog.records]
+    assert any(m.startswith("sql_budget_exceeded: method=GET path=/n-plus-one statements=7 budget=3") for m in messages)
+    suspects = [m for m in messages if m.startswith("n_plus_one_suspect")]
+    assert suspects == ["n_plus_one_suspect: method=GET path=/n-plus-one count=6 statement=SELECT name FROM t WHERE id = ?"]
+
+
+def test_statements_outside_requests_are_not_counted(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert instrument.current_stats() is None
+
+
+def test_install_is_idempotent_and_uninstall_removes_the_hooks():
+    instrument.install()
+    instrument.install()
+    assert event.contains(Engine, "after_cursor_execute", instrument._after_cursor_execute)
+    instrument.uninstall()
+    assert not event.contains(Engine, "before_cursor_execute", instrument._before_cursor_execute)
+    assert not event.contains(Engine, "after_cursor_execute", instrument._after_cursor_execute)
+
+
+def test_stats_repeated_orders_by_count():
+    stats = SqlStats()
+    for statement, n in (("a", 2), ("b", 5), ("c", 3)):
+        for _ in range(n):
+            stats.record(statement, 0.001, -1)
+    assert stats.repeated(3) == [("b", 5), ("c", 3)]
+    assert stats.rows == 0 and stats.statements == 10
@@ -0,0 +1,51 @@
+# tests/db/test_pool.py
+
+import sqlite3
+
+import pytest
+from sqlalchemy import exc
+
+from app.db.pool import InstrumentedQueuePool, pool_status
+
+
+def _pool(**kw):
+    return InstrumentedQueuePool(lambda: sqlite3.connect(":memory:", check_same_thread=False), **kw)
+
+
+def test_checkout_wait_hold_and_gauges():
+    pool = _pool(pool_size=1, max_overflow=1, timeout=0.05)
+    first = pool.connect()
+    second = pool.connect()  # overflow connection
+
+    status = pool_status(pool)
+    assert status["checked_out"] == 2 and status["overflow"] == 1 and status["connections"] == 2
+
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+
+    second.close()  # overflow connections are closed on return
+    first.close()
+    status = pool_status(pool)
+    assert status["checked_out"] == 0 and status["overflow"] == 0 and status["connections"] == 1
+    assert status["checkouts"] == 2 and status["timeouts"] == 1
+    assert status["checkout_wait"]["count"] == 3
+    assert status["checkout_wait"]["max_ms"] >= 50
+    assert status["checkout_hold"]["count"] == 2
+    assert status["connects"] == 2 and status["closes"] == 1
+    assert status["connection_lifetime"]["count"] == 1
+
+
+def test_invalidation_and_recreate_keep_metrics():
+    pool = _pool(pool_size=2, max_overflow=0, pre_ping=True, recycle=60)
+    conn = pool.connect()
+    conn.invalidate()
+    conn.close()
+
+    fresh = pool.recreate()
+    assert fresh.metrics is pool.metrics
+    fresh.connect().close()
+
+    status = pool_status(fresh)
+    assert status["invalidations"] == 1 and status["connects"] == 2
+    assert status["recycle_seconds"] == 60 and status["pre_ping"] is True
+    assert status["checkouts"] == 2
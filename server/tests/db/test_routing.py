@@ -0,0 +1,196 @@
+# tests/db/test_routing.py
+
+import os
+import time
+import types
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text, update
+from sqlalchemy.orm import sessionmaker
+
+from app.db import routing
+from app.db.models import Company
+from app.db.routing import STICKY_COOKIE, ReadReplicaMiddleware, ReplicaSet, RouteState, RoutingSession
+
+
+def _engines(n):
+    return [create_engine("sqlite://") for _ in range(n)]
+
+
+def _session(primary, replicas):
+    if not isinstance(replicas, ReplicaSet):
+        replicas = ReplicaSet(replicas)
+    return RoutingSession(bind=primary, replicas=replicas)
+
+
+def _in_request(read_only):
+    state = RouteState(read_only)
+    return state, routing._route.set(state)
+
+
+def test_reads_of_a_read_only_request_go_to_one_replica():
+    primary, *engines = _engines(3)
+    replicas = ReplicaSet(engines)
+    state, token = _in_request(read_only=True)
+    try:
+        db = _session(primary, replicas)
+        first = db.get_bind(Company, clause=select(Company))
+        assert first in engines
+        assert db.get_bind(Company, clause=select(Company.name)) is first  # sticks for the session
+        assert _session(primary, replicas).get_bind(Company, clause=select(Company)) is not first
+        assert not state.wrote
+    finally:
+        routing._route.reset(token)
+
+
+def test_writes_and_locking_reads_go_to_the_primary_and_pin_the_session():
+    primary, replica = _engines(2)
+    state, token = _in_request(read_only=True)
+    try:
+        db = _session(primary, [replica])
+        assert db.get_bind(Company, clause=select(Company).with_for_update()) is primary
+        assert state.wrote
+        # reads after a write see it
+        assert db.get_bind(Company, clause=select(Company)) is primary
+
+        db = _session(primary, [replica])
+        assert db.get_bind(Company, clause=update(Company).values(name="x")) is primary
+        assert db.get_bind(Company, clause=select(Company)) is primary
+        assert _session(primary, [replica]).get_bind() is primary  # Session.connection()
+        assert _session(primary, [replica]).get_bind(clause=text("INSERT INTO t VALUES (1)")) is primary  # raw SQL
+    finally:
+        routing._route.reset(token)
+
+
+def test_everything_goes_to_the_primary_outside_read_only_requests():
+    primary, replica = _engines(2)
+    assert _session(primary, [replica]).get_bind(Company, clause=select(Company)) is primary  # no request
+    state, token = _in_request(read_only=False)
+    try:
+        assert _session(primary, [replica]).get_bind(Company, clause=select(Company)) is primary
+    finally:
+        routing._route.reset(token)
+
+
+def test_sessionmaker_passes_replicas_through():
+    primary, replica = _engines(2)
+    factory = sessionmaker(bind=primary, class_=RoutingSession, replicas=ReplicaSet([replica]))
+    state, token = _in_request(read_only=True)
+    try:
+        assert factory().get_bind(Company, clause=select(Company)) is replica
+    finally:
+        routing._route.reset(token)
+
+
+def test_round_robin_and_least_connections():
+    a, b, c = (types.SimpleNamespace(name=n, pool=types.SimpleNamespace(checkedout=lambda: 0)) for n in "abc")
+    round_robin = ReplicaSet([a, b, c])
+    assert [round_robin.choose().name for _ in range(4)] == ["a", "b", "c", "a"]
+
+    busy = {"a": 3, "b": 1, "c": 1}
+    for engine in (a, b, c):
+        engine.pool.checkedout = lambda name=engine.name: busy[name]
+    least = ReplicaSet([a, b, c], "least_connections")
+    assert [least.choose().name for _ in range(3)] == ["b", "b", "c"]  # ties rotate
+
+    with pytest.raises(ValueError):
+        ReplicaSet([])
+
+
+def _probe_app(sticky_seconds=5):
+    app = FastAPI()
+    app.add_middleware(ReadReplicaMiddleware, sticky_seconds=sticky_seconds)
+
+    def state():
+        current = routing.current_route()
+        return {"read_only": current.read_only}
+
+    @app.get("/read")
+    def read():
+        return state()
+
+    @app.post("/write")
+    def write():
+        routing.current_route().wrote = True  # what RoutingSession.get_bind records on a write
+        return state()
+
+    @app.post("/noop")
+    def noop():
+        return state()
+
+    return app
+
+
+def test_middleware_marks_reads_and_sets_sticky_cookie_after_writes():
+    client = TestClient(_probe_app(), base_url="https://testserver")
+    response = client.get("/read")
+    assert response.json() == {"read_only": True} and STICKY_COOKIE not in response.cookies
+
+    response = client.post("/noop")
+    assert response.json() == {"read_only": False} and STICKY_COOKIE not in response.cookies
+
+    response = client.post("/write")
+    assert STICKY_COOKIE in response.cookies
+    assert float(response.cookies[STICKY_COOKIE]) == pytest.approx(time.time() + 5, abs=2)
+    # the client's next reads stay on the primary
+    assert client.get("/read").json() == {"read_only": False}
+
+    assert routing.current_route() is None
+
+
+def test_middleware_ignores_expired_or_forged_cookies():
+    client = TestClient(_probe_app(), base_url="https://testserver")
+    for until in (time.time() - 1, time.time() + 3600, "junk"):
+        client.cookies.set(STICKY_COOKIE, str(until))
+        assert client.get("/read").json() == {"read_only": True}
+
+
+def test_sticky_window_can_be_disabled():
+    client = TestClient(_probe_app(sticky_seconds=0), base_url="https://testserver")
+    assert STICKY_COOKIE not in client.post("/write").cookies
+
+
+# --- against two real Postgres instances (set TEST_DATABASE_URL and TEST_REPLICA_DATABASE_URL) ---
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+TEST_REPLICA_DATABASE_URL = os.getenv("TEST_REPLICA_DATABASE_URL")
+
+
+@pytest.mark.skipif(
+    not (TEST_DATABASE_URL and TEST_REPLICA_DATABASE_URL), reason="TEST_DATABASE_URL/TEST_REPLICA_DATABASE_URL not set"
+)
+def test_routing_against_two_instances():
+    # the "replica" is an independent instance, so where a row is found shows which one was read
+    primary, replica = create_engine(TEST_DATABASE_URL), create_engine(TEST_REPLICA_DATABASE_URL)
+    table = Company.__table__
+    for engine in (primary, replica):
+        table.drop(engine, checkfirst=True)
+        table.create(engine)
+    factory = sessionmaker(bind=primary, class_=RoutingSession, replicas=ReplicaSet([replica]))
+    try:
+        with factory() as db:
+            db.add(Company(company_id=uuid.uuid4(), name="on-primary"))
+            db.commit()
+        with replica.begin() as conn:
+            conn.execute(table.insert().values(company_id=uuid.uuid4(), name="on-replica"))
+
+        state, token = _in_request(read_only=True)
+        try:
+            with factory() as db:
+                assert db.scalars(select(Company.name)).all() == ["on-replica"]
+                db.add(Company(company_id=uuid.uuid4(), name="written-in-get"))
+                db.commit()
+                assert sorted(db.scalars(select(Company.name)).all()) == ["on-primary", "written-in-get"]
+            assert state.wrote
+        finally:
+            routing._route.reset(token)
+
+        with factory() as db:
+            assert sorted(db.scalars(select(Company.name)).all()) == ["on-primary", "written-in-get"]
+    finally:
+        for engine in (primary, replica):
+            table.drop(engine, checkfirst=True)
+            engine.dispose()
@@ -0,0 +1,274 @@
+# tests/endpoints/test_aio_endpoints.py
+# DB_MODE=async routers, mounted on their own app (the shared app is built for the configured mode)
+
+import asyncio
+import threading
+import types
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.api.v1.endpoints import job_listings as sync_job_listings
+from app.api.v1.endpoints.aio import applications, companies, job_listings, recruiter, user
+from app.db.async_session import get_async_db
+
+USER = types.SimpleNamespace(user_id=str(uuid4()), user_type="recruiter", email="r@example.com", first_name="R", last_name="B")
+
+
+@pytest.fixture
+def aio_client():
+    app = FastAPI()
+    app.include_router(companies.router, prefix="/companies")
+    app.include_router(user.router, prefix="/users")
+    app.include_router(job_listings.router, prefix="/job-listings")
+    app.include_router(recruiter.router, prefix="/recruiter")
+    app.include_router(applications.router, prefix="/applications")
+
+    async def _fake_db():
+        yield types.SimpleNamespace()
+
+    app.dependency_overrides[get_async_db] = _fake_db
+    app.dependency_overrides[deps.get_current_user_async] = lambda: USER
+    app.dependency_overrides[deps.require_recruiter] = lambda: USER
+    return TestClient(app)
+
+
+def test_job_listing_detail_and_feed(aio_client, monkeypatch):
+    job_id = uuid4()
+
+    async def fake_get(db, *, job_id):
+        return {"job_id": job_id, "company_id": uuid4(), "company_name": "Acme", "recruiter_id": uuid4(),
+                "title": "Backend Intern", "description": "d", "requirements": "r", "location": "Pune",
+                "job_type": "internship", "status": "open", "posted_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00"}
+
+    async def fake_paged(db, *, query):
+        return [], "next"
+
+    async def fake_total(db, *, query):
+        return 42
+
+    monkeypatch.setattr(job_listings.controller, "get_job_listing_controller", fake_get)
+    monkeypatch.setattr(job_listings.controller, "list_job_listings_paged_controller", fake_paged)
+    monkeypatch.setattr(job_listings.controller, "job_listing_total_controller", fake_total)
+
+    resp = aio_client.get(f"/job-listings/{job_id}")
+    assert resp.status_code == 200 and resp.json()["title"] == "Backend Intern"
+
+    resp = aio_client.get("/job-listings/feed", params={"include_total": "exact"})
+    assert resp.json() == {"items": [], "next_cursor": "next", "total": 42, "total_is_estimate": False}
+
+
+def test_threadpool_routes_keep_their_order():
+    paths = [route.path for route in job_listings.router.routes if "GET" in route.methods]
+    assert paths.index("/export") < paths.index("/{job_id}")
+    assert paths.index("/matches") < paths.index("/{job_id}")
+    by_path = {route.path: route.endpoint for route in job_listings.router.routes}
+    assert by_path["/{job_id}/similar"] is sync_job_listings.list_similar_job_listings
+    assert by_path["/recommended"] is sync_job_listings.list_job_recommendations
+
+
+def test_companies_and_dashboard(aio_client, monkeypatch):
+    company_id = uuid4()
+
+    async def fake_list(db):
+        return [{"name": "Acme", "company_id": company_id}]
+
+    async def fake_get(db, cid):
+        return None
+
+    async def fake_stats(db, *, current_user):
+        return {"total_jobs": 3, "total_open_jobs": 2, "total_draft_jobs": 1, "total_applications": 9}
+
+    monkeypatch.setattr(companies.company_repository, "list_companies", fake_list)
+    monkeypatch.setattr(companies.company_repository, "get_company", fake_get)
+    monkeypatch.setattr(recruiter, "get_recruiter_dashboard_stats_controller", fake_stats)
+
+    assert aio_client.get("/companies/").json() == [{"name": "Acme", "company_id": str(company_id), "description": None,
+                                                     "website_url": None, "logo_url": None, "industry": None,
+                                                     "headquarters": None}]
+    assert aio_client.get(f"/companies/{uuid4()}").status_code == 404
+    assert aio_client.get("/recruiter/dashboard/stats").json()["total_applications"] == 9
+
+
+def test_users_me(aio_client, monkeypatch):
+    from app.controllers.aio import user as user_controller
+
+    async def fake_applicant(db, user_id):
+        return None
+
+    async def fake_recruiter(db, user_id):
+        return types.SimpleNamespace(company_id=None)
+
+    monkeypatch.setattr(user_controller.user_repo, "get_applicant_by_user_id", fake_applicant)
+    monkeypatch.setattr(user_controller, "get_recruiter_by_user_id", fake_recruiter)
+
+    resp = aio_client.get("/users/me")
+    assert resp.status_code == 200
+    assert resp.json()["user_id"] == USER.user_id and resp.json()["company_id"] is None
+
+
+def test_apply_to_job_is_one_statement(aio_client, monkeypatch):
+    from app.repository.aio import application as application_repo
+
+    applicant = types.SimpleNamespace(user_id=uuid4(), user_type="applicant")
+    aio_client.app.dependency_overrides[deps.require_applicant] = lambda: applicant
+    calls = []
+
+    async def fake_apply(db, *, job_id, user_id, cover_letter):
+        calls.append((job_id, user_id, cover_letter))
+        return types.SimpleNamespace(job_open=True, has_profile=True, application_id=None if len(calls) > 1 else uuid4())
+
+    monkeypatch.setattr(application_repo, "apply_to_job", fake_apply)
+    job_id = uuid4()
+    resp = aio_client.post(f"/job-listings/{job_id}/apply", json={"cover_letter": "Hi"})
+    assert resp.status_code == 201 and calls == [(job_id, applicant.user_id, "Hi")]
+    resp = aio_client.post(f"/job-listings/{job_id}/apply", json={"cover_letter": "Hi"})
+    assert resp.status_code == 400 and resp.json()["detail"] == "Already applied to this job"
+
+
+def test_apply_to_job_awaits_the_batcher_when_running(aio_client, monkeypatch):
+    from concurrent.futures import Future
+    from app.controllers.aio import application as application_ctrl
+
+    aio_client.app.dependency_overrides[deps.require_applicant] = lambda: types.SimpleNamespace(user_id=uuid4())
+
+    def submit(job_id, user_id, cover_letter):
+        future = Future()
+        future.set_result(types.SimpleNamespace(job_open=False, has_profile=True, application_id=None))
+        return future
+
+    closed = []
+
+    async def request_db():
+        async def close():
+            closed.append(True)
+
+        yield types.SimpleNamespace(close=close)
+
+    aio_client.app.dependency_overrides[get_async_db] = request_db
+    monkeypatch.setattr(application_ctrl, "get_apply_batcher", lambda: types.SimpleNamespace(running=True, submit=submit, result_timeout=5))
+    resp = aio_client.post(f"/job-listings/{uuid4()}/apply", json={"cover_letter": "Hi"})
+    assert resp.status_code == 400 and resp.json()["detail"] == "Job listing is not open for applications"
+    assert closed == [True]  # the session's connection went back to the pool before waiting on the batch
+
+
+def test_bulk_update_applications(aio_client, monkeypatch):
+    from app.controllers.aio import application as application_ctrl
+    from app.repository.aio import application as application_repo
+
+    found, missing = uuid4(), uuid4()
+
+    async def recruiter(db, user_id):
+        return types.SimpleNamespace(company_id="c1")
+
+    async def fake_bulk(db, *, statuses, company_id):
+        assert company_id == "c1"
+        return {found: statuses[found]}
+
+    monkeypatch.setattr(application_ctrl, "get_recruiter_by_user_id", recruiter)
+    monkeypatch.setattr(application_repo, "bulk_update_application_status", fake_bulk)
+    updates = [{"application_id": str(found), "status": "shortlisted"}, {"application_id": str(missing), "status": "hired"}]
+    resp = aio_client.patch("/applications/bulk", json={"updates": updates})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["updated"], body["not_found"]) == (1, 1)
+    assert [r["updated"] for r in body["results"]] == [True, False]
+
+
+def test_applications_page(aio_client, monkeypatch):
+    from datetime import datetime
+
+    from app.controllers.aio import application as application_ctrl
+    from app.repository.aio import application as application_repo
+
+    async def job_exists(db, *, job_id):
+        return types.SimpleNamespace(job_id=job_id, company_id="c1")
+
+    async def recruiter(db, user_id):
+        return types.SimpleNamespace(company_id="c1")
+
+    item = {"application_id": str(uuid4()), "applicant_id": str(uuid4()), "applicant_name": "Ann Lee",
+            "applicant_email": "ann@example.com", "resume_url": None, "status": "applied",
+            "applied_at": datetime(2026, 1, 2)}
+
+    async def fake_page(db, **kwargs):
+        return [item], None, {"applied": 1} if kwargs["cursor"] is None else None
+
+    monkeypatch.setattr(application_repo, "ensure_job_exists", job_exists)
+    monkeypatch.setattr(application_ctrl, "get_recruiter_by_user_id", recruiter)
+    monkeypatch.setattr(application_repo, "list_applications_page", fake_page)
+    body = aio_client.get("/applications/page", params={"job_id": str(uuid4()), "q": "ann"}).json()
+    assert body["counts"] == {"applied": 1} and body["items"][0]["applied_at"] == "2026-01-02T00:00:00"
+    body = aio_client.get("/applications/page", params={"job_id": str(uuid4()), "cursor": "x|y"}).json()
+    assert body["counts"] is None
+
+    # a recruiter of another company
+    async def other_recruiter(db, user_id):
+        return types.SimpleNamespace(company_id="c2")
+
+    monkeypatch.setattr(application_ctrl, "get_recruiter_by_user_id", other_recruiter)
+    resp = aio_client.get("/applications/page", params={"job_id": str(uuid4())})
+    assert resp.status_code == 403 and resp.json()["detail"] == "Not authorized to view this job's applications"
+
+
+def test_applications_export_uses_the_sync_streaming_endpoint(aio_client, monkeypatch):
+    from app.db.session import get_session_factory
+    from app.repository import application as sync_application_repo
+
+    from app.controllers import application as sync_application_ctrl
+
+    company_id = uuid4()
+    monkeypatch.setattr(
+        sync_application_repo, "ensure_job_exists", lambda db, job_id: types.SimpleNamespace(company_id=company_id)
+    )
+    monkeypatch.setattr(sync_application_repo, "begin_repeatable_read", lambda db: None)
+    monkeypatch.setattr(sync_application_repo, "iter_applications_for_job", lambda db, **kwargs: iter([]))
+    monkeypatch.setattr(
+        sync_application_ctrl, "get_recruiter_by_user_id", lambda db, user_id: types.SimpleNamespace(company_id=company_id)
+    )
+    aio_client.app.dependency_overrides[get_session_factory] = lambda: (lambda: types.SimpleNamespace(close=lambda: None))
+    resp = aio_client.get("/applications/export", params={"job_id": str(uuid4())})
+    assert resp.status_code == 200 and resp.text.startswith("application_id,applicant_id,")
+
+
+def test_write_side_effects_run_off_the_event_loop(aio_client, monkeypatch):
+    from app.controllers import job_listing as sync_ctrl
+    from app.controllers.aio import job_listing as aio_ctrl
+
+    loop_threads, hook_threads = [], []
+    job = types.SimpleNamespace(job_id=uuid4(), company_id=uuid4())
+
+    class FakeAsyncDB:
+        async def run_sync(self, fn, **kwargs):
+            loop_threads.append(threading.current_thread())
+            return fn(None, **kwargs)
+
+    monkeypatch.setattr(sync_ctrl, "_create_job_listing", lambda db, current_user, payload: job)
+    monkeypatch.setattr(sync_ctrl, "_update_job_listing", lambda db, current_user, job_id, update_data: job)
+    monkeypatch.setattr(sync_ctrl, "_invalidate_job_caches", lambda j: hook_threads.append(threading.current_thread()))
+
+    async def writes():
+        db = FakeAsyncDB()
+        assert await aio_ctrl.create_job_listing_controller(db, current_user=USER, payload={}) is job
+        assert await aio_ctrl.update_job_listing_controller(db, current_user=USER, job_id=job.job_id, update_data={}) is job
+
+    asyncio.run(writes())
+    assert len(hook_threads) == 2 and not set(hook_threads) & set(loop_threads)
+
+    applied = []
+    monkeypatch.setattr(
+        companies, "get_suggester",
+        lambda: types.SimpleNamespace(apply_companies=lambda rows: applied.append(threading.current_thread())),
+    )
+
+    async def fake_create(db, *, recruiter_user_id, company_in):
+        loop_threads.append(threading.current_thread())
+        return types.SimpleNamespace(company_id=uuid4())
+
+    monkeypatch.setattr(companies.company_repository, "create_company", fake_create)
+    assert aio_client.post("/companies/", json={"name": "Acme"}).status_code == 201
+    assert len(applied) == 1 and applied[0] is not loop_threads[-1]
@@ -1,7 +1,15 @@
 # tests/controllers/test_applications_endpoints.py
 
+import csv
+import io
+import zipfile
+from datetime import datetime
+from types import SimpleNamespace
 from uuid import uuid4
 
+import pytest
+from fastapi import HTTPException
+
 
 def test_list_applications(client, monkeypatch):
     # require_recruiter already overridden by conftest
@@ -13,6 +21,59 @@ def test_list_applications(client, monkeypatch):
     assert isinstance(resp.json(), list)
 
 
+def _page_job(monkeypatch, recruiter_company="c1"):
+    import app.controllers.application as app_ctrl
+    import app.repository.application as app_repo
+    monkeypatch.setattr(app_repo, "ensure_job_exists", lambda db, job_id: SimpleNamespace(job_id=job_id, company_id="c1"))
+    monkeypatch.setattr(
+        app_ctrl, "get_recruiter_by_user_id", lambda db, user_id: SimpleNamespace(company_id=recruiter_company)
+    )
+
+
+def test_applications_page_forwards_filters_and_caps_the_limit(client, monkeypatch):
+    import app.repository.application as app_repo
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "APPLICATIONS_MAX_LIMIT", 10)
+    _page_job(monkeypatch)
+    calls = []
+
+    def fake_page(db, **kwargs):
+        calls.append(kwargs)
+        return [], "next", {"applied": 3, "hired": 1}
+
+    monkeypatch.setattr(app_repo, "list_applications_page", fake_page)
+    job_id = uuid4()
+
+    resp = client.get("/api/v1/applications/page", params={"job_id": str(job_id), "status": "hired", "q": "  ann ", "limit": 500})
+    assert resp.status_code == 200
+    assert resp.json() == {"items": [], "next_cursor": "next", "counts": {"applied": 3, "hired": 1}}
+    assert calls == [{"job_id": job_id, "status_value": "hired", "q": "ann", "limit": 10, "cursor": None}]
+
+    assert client.get("/api/v1/applications/page", params={"job_id": str(job_id), "status": "archived"}).status_code == 422
+
+
+def test_applications_page_of_another_companys_job_is_403(client, monkeypatch):
+    import app.repository.application as app_repo
+    _page_job(monkeypatch, recruiter_company="c2")
+    monkeypatch.setattr(app_repo, "list_applications_page", lambda db, **kwargs: pytest.fail("listed"))
+
+    resp = client.get("/api/v1/applications/page", params={"job_id": str(uuid4())})
+    assert resp.status_code == 403
+    assert resp.json()["error"]["detail"] == "Not authorized to view this job's applications"
+
+
+def test_applications_page_for_unknown_job_is_404(client, monkeypatch):
+    import app.repository.application as app_repo
+    from fastapi import HTTPException
+
+    def missing(db, job_id):
+        raise HTTPException(status_code=404, detail="Job listing not found")
+
+    monkeypatch.setattr(app_repo, "ensure_job_exists", missing)
+    resp = client.get("/api/v1/applications/page", params={"job_id": str(uuid4())})
+    assert resp.status_code == 404
+
+
 def test_update_application(client, monkeypatch):
     import app.controllers.application as app_ctrl
     monkeypatch.setattr(app_ctrl, "update_application_status_controller", lambda db, application_id, status_value: None)
@@ -20,3 +81,166 @@ def test_update_application(client, monkeypatch):
     resp = client.patch(f"/api/v1/applications/{uuid4()}", json={"status": "shortlisted"})
     assert resp.status_code == 200
     assert resp.json()["message"] == "Application status updated"
+
+
+def test_bulk_update_reports_a_result_per_application(client, monkeypatch):
+    import app.controllers.application as app_ctrl
+    import app.repository.application as app_repo
+    found, missing = uuid4(), uuid4()
+    calls = []
+
+    def fake_bulk(db, statuses, company_id):
+        calls.append(statuses)
+        assert company_id == "c1"
+        return {k: v for k, v in statuses.items() if k == found}
+
+    monkeypatch.setattr(app_ctrl, "get_recruiter_by_user_id", lambda db, user_id: SimpleNamespace(company_id="c1"))
+    monkeypatch.setattr(app_repo, "bulk_update_application_status", fake_bulk)
+
+    resp = client.patch("/api/v1/applications/bulk", json={"application_ids": [str(found), str(missing)], "status": "rejected"})
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "updated": 1,
+        "not_found": 1,
+        "results": [
+            {"application_id": str(found), "updated": True, "status": "rejected", "detail": None},
+            {"application_id": str(missing), "updated": False, "status": None, "detail": "Application not found"},
+        ],
+    }
+
+    # per-application statuses; a repeated id keeps its last status
+    updates = [
+        {"application_id": str(found), "status": "shortlisted"},
+        {"application_id": str(found), "status": "hired"},
+    ]
+    resp = client.patch("/api/v1/applications/bulk", json={"updates": updates})
+    assert resp.json()["results"] == [{"application_id": str(found), "updated": True, "status": "hired", "detail": None}]
+    assert calls[-1] == {found: "hired"}
+
+
+def test_bulk_update_needs_a_recruiter_profile(client, monkeypatch):
+    import app.controllers.application as app_ctrl
+    import app.repository.application as app_repo
+
+    monkeypatch.setattr(app_ctrl, "get_recruiter_by_user_id", lambda db, user_id: None)
+    monkeypatch.setattr(app_repo, "bulk_update_application_status", lambda *a, **k: pytest.fail("updated"))
+    resp = client.patch("/api/v1/applications/bulk", json={"application_ids": [str(uuid4())], "status": "hired"})
+    assert resp.status_code == 403 and resp.json()["error"]["detail"] == "Recruiter profile not found"
+
+
+def test_bulk_update_rejects_ambiguous_or_oversized_requests(client, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "APPLICATIONS_BULK_MAX_ITEMS", 2)
+    one = {"application_id": str(uuid4()), "status": "hired"}
+    for body, detail in (
+        ({}, "No applications to update"),
+        ({"application_ids": [str(uuid4())]}, "status is required with application_ids"),
+        ({"updates": [one], "status": "hired"}, "Send either updates or application_ids with status"),
+        ({"application_ids": [str(uuid4()) for _ in range(3)], "status": "hired"}, "At most 2 applications per request"),
+    ):
+        resp = client.patch("/api/v1/applications/bulk", json=body)
+        assert resp.status_code == 400 and resp.json()["error"]["detail"] == detail
+
+    resp = client.patch("/api/v1/applications/bulk", json={"application_ids": [str(uuid4())], "status": "archived"})
+    assert resp.status_code == 422
+
+
+def _export_session_factory(monkeypatch, items, missing_job=False, recruiter_company="c1"):
+    from app.main import app
+    from app.db.session import get_session_factory
+    import app.controllers.application as app_ctrl
+    import app.repository.application as app_repo
+
+    sessions = []
+
+    class FakeSession:
+        closed = False
+        isolation_level = None
+
+        def get_bind(self, clause=None):
+            return "primary"
+
+        def connection(self, bind_arguments=None, execution_options=None):
+            self.isolation_level = execution_options["isolation_level"]
+
+        def close(self):
+            self.closed = True
+
+    def factory():
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    def ensure_job_exists(db, job_id):
+        if missing_job:
+            raise HTTPException(status_code=404, detail="Job listing not found")
+        return SimpleNamespace(job_id=job_id, company_id="c1")
+
+    def iter_applications_for_job(db, **kwargs):
+        assert db.isolation_level == "REPEATABLE READ" and not db.closed
+        return iter(items)
+
+    monkeypatch.setattr(app_repo, "ensure_job_exists", ensure_job_exists)
+    monkeypatch.setattr(app_repo, "iter_applications_for_job", iter_applications_for_job)
+    monkeypatch.setattr(
+        app_ctrl, "get_recruiter_by_user_id", lambda db, user_id: SimpleNamespace(company_id=recruiter_company)
+    )
+    monkeypatch.setitem(app.dependency_overrides, get_session_factory, lambda: factory)
+    return sessions
+
+
+def _export_item(name, resume_url):
+    return {"application_id": str(uuid4()), "applicant_id": str(uuid4()), "applicant_name": name,
+            "applicant_email": "a@example.com", "status": "applied", "applied_at": datetime(2026, 1, 2),
+            "resume_url": resume_url}
+
+
+def test_export_applications_streams_csv(client, monkeypatch):
+    items = [_export_item("Ann Lee", None), _export_item("Bo, Jr", "http://x/static/resumes/r.pdf")]
+    sessions = _export_session_factory(monkeypatch, items)
+
+    resp = client.get("/api/v1/applications/export", params={"job_id": str(uuid4())})
+    assert resp.status_code == 200 and resp.headers["content-type"].startswith("text/csv")
+    assert resp.headers["content-disposition"].startswith('attachment; filename="applications-')
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert rows[0] == ["application_id", "applicant_id", "applicant_name", "applicant_email", "status", "applied_at", "resume_url"]
+    assert rows[2][2] == "Bo, Jr" and rows[1][5] == "2026-01-02T00:00:00"
+    assert len(sessions) == 1 and sessions[0].closed
+
+
+def test_export_applications_zip_bundles_the_uploaded_resumes(client, monkeypatch, tmp_path):
+    import app.controllers.application as app_ctrl
+    monkeypatch.setattr(app_ctrl, "RESUME_DIR", tmp_path)
+    (tmp_path / "r1.pdf").write_bytes(b"%PDF-1 ann")
+    items = [
+        _export_item("Ann Lee", "http://backend/static/resumes/r1.pdf"),
+        _export_item("Bo", "http://backend/static/resumes/gone.pdf"),  # file no longer on disk
+        _export_item("Cy", "http://elsewhere/static/profile_pictures/r1.pdf"),
+        _export_item("Di", None),
+    ]
+    sessions = _export_session_factory(monkeypatch, items)
+
+    resp = client.get("/api/v1/applications/export", params={"job_id": str(uuid4()), "format": "zip"})
+    assert resp.status_code == 200 and resp.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
+        resume = f"resumes/Ann_Lee_{items[0]['application_id']}.pdf"
+        assert zf.namelist() == ["applicants.csv", resume]
+        assert zf.read(resume) == b"%PDF-1 ann"
+        listed = list(csv.DictReader(io.StringIO(zf.read("applicants.csv").decode())))
+    assert [r["resume_file"] for r in listed] == [resume, "", "", ""]
+    # the CSV and the resumes are read in the one REPEATABLE READ session
+    assert len(sessions) == 1 and sessions[0].closed
+
+
+def test_export_applications_checks_the_job_before_streaming(client, monkeypatch):
+    _export_session_factory(monkeypatch, [], missing_job=True)
+    assert client.get("/api/v1/applications/export", params={"job_id": str(uuid4())}).status_code == 404
+    resp = client.get("/api/v1/applications/export", params={"job_id": str(uuid4()), "format": "pdf"})
+    assert resp.status_code == 422
+
+
+def test_export_applications_is_limited_to_the_recruiters_company(client, monkeypatch):
+    sessions = _export_session_factory(monkeypatch, [_export_item("Ann Lee", None)], recruiter_company="c2")
+    resp = client.get("/api/v1/applications/export", params={"job_id": str(uuid4())})
+    assert resp.status_code == 403
+    assert resp.json()["error"]["detail"] == "Not authorized to export this job's applications"
+    assert sessions[0].closed
@@ -3,6 +3,10 @@
 from uuid import uuid4
 from datetime import datetime
 
+from fastapi import Depends
+
+from app.db.session import get_db
+
 
 def test_create_job_listing(client, monkeypatch):
     from app.main import app
@@ -12,12 +16,19 @@ def test_create_job_listing(client, monkeypatch):
     app.dependency_overrides[deps.require_recruiter] = lambda: fake_user
 
     import app.controllers.job_listing as ctrl
+    import app.controllers.saved_search as saved_search_ctrl
     class Job: job_id = uuid4()
     monkeypatch.setattr(ctrl, "create_job_listing_controller", lambda db, current_user, payload: Job())
+    percolated = []
+    monkeypatch.setattr(
+        saved_search_ctrl, "percolate_job_listing_controller", lambda session_factory, job_id: percolated.append(job_id)
+    )
 
     payload = {"title": "Dev", "description": "Desc", "requirements": "Req", "location": "X", "job_type": "full-time"}
     resp = client.post("/api/v1/job-listings/", json=payload)
     assert resp.status_code == 201
+    # saved-search alerts are queued in a background task after the response
+    assert percolated == [Job.job_id]
 
     app.dependency_overrides.pop(deps.require_recruiter, None)
 
@@ -38,9 +49,33 @@ def test_update_job_listing(client, monkeypatch):
     app.dependency_overrides.pop(deps.require_recruiter, None)
 
 
+def test_reopening_a_job_listing_percolates_it(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.require_recruiter] = lambda: types.SimpleNamespace(user_id="r1", user_type="recruiter")
+
+    import app.controllers.job_listing as ctrl
+    import app.controllers.saved_search as saved_search_ctrl
+    monkeypatch.setattr(ctrl, "update_job_listing_controller", lambda db, current_user, job_id, update_data: None)
+    percolated = []
+    monkeypatch.setattr(
+        saved_search_ctrl, "percolate_job_listing_controller", lambda session_factory, job_id: percolated.append(job_id)
+    )
+
+    job_id = uuid4()
+    assert client.put(f"/api/v1/job-listings/{job_id}", json={"status": "closed"}).status_code == 200
+    assert client.put(f"/api/v1/job-listings/{job_id}", json={"title": "New"}).status_code == 200
+    assert percolated == []
+    assert client.put(f"/api/v1/job-listings/{job_id}", json={"status": "open"}).status_code == 200
+    assert percolated == [job_id]
+
+    app.dependency_overrides.pop(deps.require_recruiter, None)
+
+
 def test_list_job_listings(client, monkeypatch):
     import app.controllers.job_listing as ctrl
-    monkeypatch.setattr(ctrl, "list_job_listings_controller", lambda db, company_id=None, limit=None: [])
+    monkeypatch.setattr(ctrl, "list_job_listings_controller", lambda db, company_id=None, limit=None, view="full", fields=None: [])
     resp = client.get("/api/v1/job-listings/")
     assert resp.status_code == 200
     assert isinstance(resp.json(), list)
@@ -105,6 +140,161 @@ def test_apply_to_job(client, monkeypatch):
     app.dependency_overrides.pop(deps.require_applicant, None)
 
 
+def test_apply_to_job_maps_outcomes_to_responses(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.require_applicant] = lambda: types.SimpleNamespace(user_id="a1", user_type="applicant")
+
+    import app.repository.application as app_repo
+    application_id = uuid4()
+    cases = [
+        ((True, True, application_id), 201, None),
+        ((None, False, None), 404, "Job listing not found"),
+        ((True, False, None), 403, "Applicant profile not found"),
+        ((False, True, None), 400, "Job listing is not open for applications"),
+        ((True, True, None), 400, "Already applied to this job"),
+    ]
+    for (job_open, has_profile, app_id), code, detail in cases:
+        outcome = types.SimpleNamespace(job_open=job_open, has_profile=has_profile, application_id=app_id)
+        monkeypatch.setattr(app_repo, "apply_to_job", lambda db, job_id, user_id, cover_letter, o=outcome: o)
+        resp = client.post(f"/api/v1/job-listings/{uuid4()}/apply", json={"cover_letter": "Hi"})
+        assert resp.status_code == code
+        if detail:
+            assert resp.json()["error"]["detail"] == detail
+        else:
+            assert resp.json()["application_id"] == str(application_id)
+
+    app.dependency_overrides.pop(deps.require_applicant, None)
+
+
+def test_apply_to_job_goes_through_the_batcher_when_running(client, monkeypatch):
+    from concurrent.futures import Future
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.require_applicant] = lambda: types.SimpleNamespace(user_id="a1", user_type="applicant")
+
+    import app.controllers.application as app_ctrl
+    application_id, submitted = uuid4(), []
+
+    def submit(job_id, user_id, cover_letter):
+        submitted.append((str(job_id), user_id, cover_letter))
+        future = Future()
+        future.set_result(types.SimpleNamespace(job_open=True, has_profile=True, application_id=application_id))
+        return future
+
+    batcher = types.SimpleNamespace(running=True, submit=submit, result_timeout=5)
+    monkeypatch.setattr(app_ctrl, "get_apply_batcher", lambda: batcher)
+    monkeypatch.setattr(app_ctrl.repo, "apply_to_job", None)  # not used while batching
+    closed = []
+    app.dependency_overrides[get_db] = lambda: types.SimpleNamespace(close=lambda: closed.append(len(submitted)))
+    job_id = uuid4()
+    resp = client.post(f"/api/v1/job-listings/{job_id}/apply", json={"cover_letter": "Hi"})
+    assert resp.status_code == 201 and resp.json()["application_id"] == str(application_id)
+    assert submitted == [(str(job_id), "a1", "Hi")]
+    assert closed == [0]  # the request's session was closed before the apply was queued
+
+    app.dependency_overrides.pop(deps.require_applicant, None)
+
+
+def test_batched_apply_marks_the_request_written_and_gives_up_after_the_result_timeout(monkeypatch):
+    from concurrent.futures import Future
+    import types
+    import pytest
+    from fastapi import HTTPException
+    from app.db import routing
+    import app.controllers.application as app_ctrl
+
+    user = types.SimpleNamespace(user_id="a1")
+    pending = Future()
+    batcher = types.SimpleNamespace(running=True, submit=lambda *args: pending, result_timeout=0.05)
+    monkeypatch.setattr(app_ctrl, "get_apply_batcher", lambda: batcher)
+    db = types.SimpleNamespace(close=lambda: None)
+
+    state = routing.RouteState(read_only=False)
+    token = routing._route.set(state)
+    try:
+        with pytest.raises(HTTPException) as ei:
+            app_ctrl.apply_to_job_controller(db, current_user=user, job_id=uuid4(), cover_letter=None)
+        assert ei.value.status_code == 503 and not state.wrote
+
+        # the INSERT ran on the batcher's session: the client still gets the read-your-writes cookie
+        pending.set_result(types.SimpleNamespace(job_open=True, has_profile=True, application_id=uuid4()))
+        app_ctrl.apply_to_job_controller(db, current_user=user, job_id=uuid4(), cover_letter=None)
+        assert state.wrote
+    finally:
+        routing._route.reset(token)
+
+
+def test_apply_is_written_directly_once_the_batcher_is_stopping(monkeypatch):
+    import types
+    import app.controllers.application as app_ctrl
+
+    outcome = types.SimpleNamespace(job_open=True, has_profile=True, application_id=uuid4())
+    batcher = types.SimpleNamespace(running=True, submit=lambda *args: None, result_timeout=5)
+    monkeypatch.setattr(app_ctrl, "get_apply_batcher", lambda: batcher)
+    monkeypatch.setattr(app_ctrl.repo, "apply_to_job", lambda db, **kwargs: outcome)
+    db = types.SimpleNamespace(close=lambda: None)
+    assert app_ctrl.apply_to_job_controller(db, current_user=types.SimpleNamespace(user_id="a1"), job_id=uuid4(), cover_letter=None) is outcome
+
+
+def test_batched_applies_beyond_the_pool_size_do_not_starve_the_batcher(client, monkeypatch):
+    import threading
+    import types
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session, sessionmaker
+    from sqlalchemy.pool import QueuePool
+    from app.main import app
+    from app.api import deps
+    from app.tasks import apply_batcher
+    import app.controllers.application as app_ctrl
+
+    # two pooled connections shared by the requests and the batcher, like the app's engine
+    engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=0, pool_timeout=2,
+        connect_args={"check_same_thread": False},
+    )
+
+    def request_db():
+        db = Session(engine)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def current_applicant(db: Session = Depends(get_db)):
+        db.execute(text("SELECT 1"))  # the user lookup checks a connection out for the request
+        return types.SimpleNamespace(user_id=uuid4(), user_type="applicant")
+
+    def apply_to_jobs(db, requests):
+        db.execute(text("SELECT 1"))
+        return [types.SimpleNamespace(job_open=True, has_profile=True, application_id=uuid4()) for _ in requests]
+
+    app.dependency_overrides[get_db] = request_db
+    app.dependency_overrides[deps.require_applicant] = current_applicant
+    monkeypatch.setattr(apply_batcher, "apply_to_jobs", apply_to_jobs)
+    batcher = apply_batcher.ApplyBatcher(max_batch_size=100, max_wait_seconds=0.2)
+    monkeypatch.setattr(app_ctrl, "get_apply_batcher", lambda: batcher)
+    batcher.start(sessionmaker(bind=engine))
+
+    codes = []
+    def apply():
+        codes.append(client.post(f"/api/v1/job-listings/{uuid4()}/apply", json={}).status_code)
+
+    threads = [threading.Thread(target=apply) for _ in range(6)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+    finally:
+        batcher.stop()
+        engine.dispose()
+        app.dependency_overrides.pop(deps.require_applicant, None)
+    assert codes == [201] * 6
+
+
 def test_get_my_application_status(client, monkeypatch):
     from app.main import app
     from app.api import deps
@@ -122,3 +312,250 @@ def test_get_my_application_status(client, monkeypatch):
     assert resp.status_code == 200
 
     app.dependency_overrides.pop(deps.require_applicant, None)
+
+
+def test_internal_metrics_hidden_without_token(client):
+    resp = client.get("/api/v1/internal/metrics")
+    assert resp.status_code == 404
+
+
+def test_internal_metrics_reports_cache_stats(client, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_TOKEN", "s3cret")
+
+    assert client.get("/api/v1/internal/metrics", headers={"X-Internal-Token": "nope"}).status_code == 403
+    resp = client.get("/api/v1/internal/metrics", headers={"X-Internal-Token": "s3cret"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert "caches" in body
+    assert {"checked_out", "overflow", "checkout_wait", "connection_lifetime"} <= set(body["db_pool"])
+
+
+def test_job_listing_facets(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.get_current_user] = lambda: types.SimpleNamespace(user_id="u1")
+
+    import app.controllers.job_listing as ctrl
+    seen = {}
+
+    def fake_facets(db, query):
+        seen["query"] = query
+        return {"total": 3, "facets": {"job_type": [{"value": "internship", "count": 3}]}}
+
+    monkeypatch.setattr(ctrl, "job_listing_facets_controller", fake_facets)
+
+    resp = client.get("/api/v1/job-listings/facets?location=Pune&status=open")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] == 3
+    assert body["facets"]["job_type"] == [{"value": "internship", "count": 3}]
+    assert body["facets"]["location"] == []
+    assert seen["query"].location == "Pune" and seen["query"].status == "open"
+
+    app.dependency_overrides.pop(deps.get_current_user, None)
+
+
+def test_feed_sparse_fields_payload(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.get_current_user] = lambda: types.SimpleNamespace(user_id="u1")
+
+    import app.controllers.job_listing as ctrl
+    seen = {}
+
+    def fake_paged(db, query):
+        seen["fields"] = query.fields
+        return [{"job_id": str(uuid4()), "title": "Dev"}], None
+
+    monkeypatch.setattr(ctrl, "list_job_listings_paged_controller", fake_paged)
+
+    resp = client.get("/api/v1/job-listings/feed?fields=job_id,title")
+    assert resp.status_code == 200
+    assert set(resp.json()["items"][0]) == {"job_id", "title"}
+    assert seen["fields"] == "job_id,title"
+
+    app.dependency_overrides.pop(deps.get_current_user, None)
+
+
+def test_sparse_fields_that_satisfy_the_summary_model_keep_exactly_the_selection(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.get_current_user] = lambda: types.SimpleNamespace(user_id="u1")
+
+    import app.controllers.job_listing as ctrl
+    # every required field of JobListingSummary, none of its optional ones
+    selected = "job_id,company_id,company_name,title,location,job_type,status,posted_at,updated_at"
+    item = {"job_id": str(uuid4()), "company_id": str(uuid4()), "company_name": "Acme", "title": "Dev",
+            "location": "Pune", "job_type": "internship", "status": "open",
+            "posted_at": "2024-01-01T00:00:00", "updated_at": "2024-01-01T00:00:00"}
+    monkeypatch.setattr(ctrl, "list_job_listings_paged_controller", lambda db, query: ([dict(item)], "c"))
+    monkeypatch.setattr(ctrl, "list_job_listings_controller", lambda db, **kwargs: [dict(item)])
+
+    body = client.get(f"/api/v1/job-listings/feed?fields={selected}").json()
+    assert set(body["items"][0]) == set(selected.split(","))
+    assert body["next_cursor"] == "c" and body["total"] is None
+    [listed] = client.get(f"/api/v1/job-listings/?fields={selected}").json()
+    assert listed == item
+
+    app.dependency_overrides.pop(deps.get_current_user, None)
+
+
+def test_export_job_listings_streams_csv_and_closes_session(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    from app.db.session import get_session_factory
+    import types
+    app.dependency_overrides[deps.get_current_user] = lambda: types.SimpleNamespace(user_id="u1")
+
+    sessions = []
+
+    class FakeSession:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def factory():
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    app.dependency_overrides[get_session_factory] = lambda: factory
+
+    import app.repository.job_listing as repo
+    rows = [{"job_id": str(uuid4()), "title": f"T{i}"} for i in range(3)]
+    monkeypatch.setattr(repo, "iter_job_listings", lambda db, **kw: iter(rows))
+
+    resp = client.get("/api/v1/job-listings/export?format=csv&fields=title")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    lines = resp.text.splitlines()
+    assert lines[0] == "job_id,title" and len(lines) == 4
+    assert sessions and sessions[0].closed
+
+    resp = client.get("/api/v1/job-listings/export")
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert len(resp.text.splitlines()) == 3
+
+    assert client.get("/api/v1/job-listings/export?fields=nope").status_code == 400
+
+    app.dependency_overrides.pop(deps.get_current_user, None)
+    app.dependency_overrides.pop(get_session_factory, None)
+
+
+def test_job_matches_for_applicant(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.require_applicant] = lambda: types.SimpleNamespace(user_id="a1", user_type="applicant")
+
+    import app.controllers.job_listing as ctrl
+    now = datetime.utcnow()
+    item = {
+        "job_id": str(uuid4()), "company_id": str(uuid4()), "company_name": "Acme", "title": "Dev",
+        "location": "Pune", "job_type": "internship", "status": "open", "posted_at": now.isoformat(),
+        "updated_at": now.isoformat(), "score": 0.5, "matched_skills": ["python"],
+    }
+    monkeypatch.setattr(ctrl, "list_job_matches_controller", lambda db, current_user, limit, cursor: ([item], "0.5|x"))
+
+    resp = client.get("/api/v1/job-listings/matches?limit=5")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["next_cursor"] == "0.5|x"
+    assert body["items"][0]["score"] == 0.5 and body["items"][0]["matched_skills"] == ["python"]
+
+    app.dependency_overrides.pop(deps.require_applicant, None)
+
+
+def test_job_recommendations_for_applicant(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.require_applicant] = lambda: types.SimpleNamespace(user_id="a1", user_type="applicant")
+
+    import app.controllers.job_listing as ctrl
+    now = datetime.utcnow()
+    item = {
+        "job_id": str(uuid4()), "company_id": str(uuid4()), "company_name": "Acme", "title": "Backend Dev",
+        "location": "Pune", "job_type": "internship", "status": "open", "posted_at": now.isoformat(),
+        "updated_at": now.isoformat(), "score": 0.42,
+    }
+    seen = {}
+
+    def fake(db, current_user, limit):
+        seen["limit"] = limit
+        return [item]
+
+    monkeypatch.setattr(ctrl, "list_job_recommendations_controller", fake)
+
+    resp = client.get("/api/v1/job-listings/recommended?limit=3")
+    assert resp.status_code == 200
+    assert seen["limit"] == 3
+    body = resp.json()
+    assert body["items"][0]["score"] == 0.42 and body["items"][0]["title"] == "Backend Dev"
+
+    app.dependency_overrides.pop(deps.require_applicant, None)
+
+
+def test_job_recommendations_empty_until_matrix_is_built(monkeypatch):
+    import types
+    import app.controllers.job_listing as ctrl
+    from app.search.recommend import JobRecommender
+
+    applicant = types.SimpleNamespace(applicant_id="ap1", skills=["python"], headline=None, experience=None, bio=None)
+    monkeypatch.setattr(ctrl, "get_applicant_by_user_id", lambda db, user_id: applicant)
+    monkeypatch.setattr(ctrl, "get_recommender", lambda: JobRecommender(refresh_seconds=0))
+
+    def no_db(*args, **kwargs):
+        raise AssertionError("the request must not query postings while the matrix is building")
+
+    monkeypatch.setattr(ctrl, "list_applied_job_ids", no_db)
+    current_user = types.SimpleNamespace(user_id="a1")
+    assert ctrl.list_job_recommendations_controller(None, current_user=current_user, limit=5) == []
+
+
+def test_feed_include_total(client, monkeypatch):
+    from app.main import app
+    from app.api import deps
+    import types
+    app.dependency_overrides[deps.get_current_user] = lambda: types.SimpleNamespace(user_id="u1")
+
+    import app.controllers.job_listing as ctrl
+    monkeypatch.setattr(ctrl, "list_job_listings_paged_controller", lambda db, query: ([], "c"))
+    monkeypatch.setattr(ctrl, "job_listing_total_controller", lambda db, query: 12400 if query.include_total else None)
+
+    body = client.get("/api/v1/job-listings/feed?include_total=estimate&job_type=internship").json()
+    assert body["total"] == 12400 and body["total_is_estimate"] is True
+    body = client.get("/api/v1/job-listings/feed?include_total=exact").json()
+    assert body["total_is_estimate"] is False
+    body = client.get("/api/v1/job-listings/feed").json()
+    assert body["total"] is None and body["next_cursor"] == "c"
+    assert client.get("/api/v1/job-listings/feed?include_total=maybe").status_code == 422
+
+    app.dependency_overrides.pop(deps.get_current_user, None)
+
+
+def test_similar_job_listings(client, monkeypatch):
+    import app.controllers.job_listing as ctrl
+    now = datetime.utcnow()
+    job_id = uuid4()
+    item = {
+        "job_id": str(uuid4()), "company_id": str(uuid4()), "company_name": "Acme", "title": "Backend Dev",
+        "location": "Pune", "job_type": "internship", "status": "open", "posted_at": now.isoformat(),
+        "updated_at": now.isoformat(), "similarity": 0.81,
+    }
+    seen = {}
+
+    def fake(db, job_id, limit):
+        seen.update(job_id=job_id, limit=limit)
+        return [item]
+
+    monkeypatch.setattr(ctrl, "list_similar_job_listings_controller", fake)
+
+    resp = client.get(f"/api/v1/job-listings/{job_id}/similar?limit=5")
+    assert resp.status_code == 200
+    assert seen == {"job_id": job_id, "limit": 5}
+    assert resp.json()["items"][0]["similarity"] == 0.81
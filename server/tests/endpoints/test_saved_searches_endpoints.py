@@ -0,0 +1,99 @@
+# tests/endpoints/test_saved_searches_endpoints.py
+
+from datetime import datetime
+from uuid import uuid4
+import types
+
+import pytest
+
+
+@pytest.fixture
+def applicant_client(client):
+    from app.main import app
+    from app.api import deps
+    app.dependency_overrides[deps.require_applicant] = lambda: types.SimpleNamespace(user_id="a1", user_type="applicant")
+    yield client
+    app.dependency_overrides.pop(deps.require_applicant, None)
+
+
+def test_create_saved_search(applicant_client, monkeypatch):
+    import app.controllers.saved_search as ctrl
+    seen = {}
+    saved_id = uuid4()
+
+    def fake_create(db, current_user, payload):
+        seen.update(payload)
+        return types.SimpleNamespace(saved_search_id=saved_id)
+
+    monkeypatch.setattr(ctrl, "create_saved_search_controller", fake_create)
+    resp = applicant_client.post("/api/v1/saved-searches/", json={"name": "py", "q": "python", "job_type": "internship"})
+    assert resp.status_code == 201
+    assert resp.json()["saved_search_id"] == str(saved_id)
+    assert seen["q"] == "python" and seen["match"] == "contains" and seen["company_id"] is None
+
+    assert applicant_client.post("/api/v1/saved-searches/", json={"job_type": "gig"}).status_code == 422
+
+
+def test_list_and_delete_saved_searches(applicant_client, monkeypatch):
+    import app.controllers.saved_search as ctrl
+    saved_id = uuid4()
+    row = types.SimpleNamespace(
+        saved_search_id=saved_id, name="py", company_id=None, location="Pune", title=None, match="contains",
+        job_type=None, experience_level=None, q="python", created_at=datetime.utcnow(),
+    )
+    monkeypatch.setattr(ctrl, "list_saved_searches_controller", lambda db, current_user: [row])
+    deleted = []
+    monkeypatch.setattr(ctrl, "delete_saved_search_controller", lambda db, current_user, saved_search_id: deleted.append(saved_search_id))
+
+    body = applicant_client.get("/api/v1/saved-searches/").json()
+    assert body[0]["saved_search_id"] == str(saved_id) and body[0]["location"] == "Pune"
+
+    assert applicant_client.delete(f"/api/v1/saved-searches/{saved_id}").status_code == 204
+    assert deleted == [saved_id]
+
+
+def test_claim_search_alerts(applicant_client, monkeypatch):
+    import app.controllers.saved_search as ctrl
+    now = datetime.utcnow()
+    job = {
+        "job_id": str(uuid4()), "company_id": str(uuid4()), "company_name": "Acme", "title": "Dev",
+        "location": "Pune", "job_type": "internship", "status": "open", "posted_at": now.isoformat(),
+        "updated_at": now.isoformat(),
+    }
+    alert = {"alert_id": 7, "saved_search_id": str(uuid4()), "created_at": now.isoformat(), "job": job}
+    monkeypatch.setattr(ctrl, "claim_search_alerts_controller", lambda db, current_user, limit: [alert][:limit])
+
+    body = applicant_client.get("/api/v1/saved-searches/alerts?limit=5").json()
+    assert body["items"][0]["alert_id"] == 7 and body["items"][0]["job"]["title"] == "Dev"
+
+
+def test_saved_search_limit_per_applicant(monkeypatch):
+    from fastapi import HTTPException
+    import app.controllers.saved_search as ctrl
+    from app.core.config import settings
+
+    monkeypatch.setattr(ctrl, "ensure_applicant_profile", lambda db, user_id: types.SimpleNamespace(applicant_id="a1"))
+    monkeypatch.setattr(ctrl.repo, "count_saved_searches", lambda db, applicant_id: settings.SAVED_SEARCHES_PER_APPLICANT)
+    with pytest.raises(HTTPException) as exc:
+        ctrl.create_saved_search_controller(None, current_user=types.SimpleNamespace(user_id="a1"), payload={})
+    assert exc.value.status_code == 400
+
+
+def test_percolate_controller_swallows_errors(monkeypatch):
+    import app.controllers.saved_search as ctrl
+
+    class Session:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(ctrl.repo, "percolate_job_listing", lambda db, job_id: 4)
+    assert ctrl.percolate_job_listing_controller(Session, uuid4()) == 4
+
+    def boom(db, job_id):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(ctrl.repo, "percolate_job_listing", boom)
+    assert ctrl.percolate_job_listing_controller(Session, uuid4()) == 0
@@ -0,0 +1,19 @@
+# tests/endpoints/test_search_endpoints.py
+import app.controllers.search as ctrl
+
+
+def test_search_suggest(client, monkeypatch):
+    seen = {}
+
+    def fake(prefix, limit):
+        seen.update(prefix=prefix, limit=limit)
+        return [{"text": "Python", "kind": "skill", "weight": 12}]
+
+    monkeypatch.setattr(ctrl, "suggest_controller", fake)
+
+    resp = client.get("/api/v1/search/suggest?prefix=py&limit=5")
+    assert resp.status_code == 200
+    assert seen == {"prefix": "py", "limit": 5}
+    assert resp.json() == {"prefix": "py", "items": [{"text": "Python", "kind": "skill", "weight": 12}]}
+
+    assert client.get("/api/v1/search/suggest?prefix=").status_code == 422
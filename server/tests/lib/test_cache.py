@@ -0,0 +1,275 @@
+# tests/lib/test_cache.py
+
+import asyncio
+import socketserver
+import threading
+import time
+
+import pytest
+
+from app.lib import cache as cache_module
+from app.lib.cache import MISS, InMemoryCache, RedisCache, RespConnection, RespError, TaggedCache
+
+
+def test_get_or_set_counts_hits_and_misses():
+    cache = InMemoryCache(default_ttl=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"items": [1, 2]}
+
+    assert cache.get_or_set("k", compute, tags=["feed"]) == {"items": [1, 2]}
+    assert cache.get_or_set("k", compute, tags=["feed"]) == {"items": [1, 2]}
+    assert len(calls) == 1
+    stats = cache.stats.as_dict()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_ratio"] == 0.5
+
+
+def test_backend_missing_an_interface_method_cannot_be_created():
+    class NoInvalidate(TaggedCache):
+        def get(self, key):
+            return MISS
+
+        def tag_versions(self, tags):
+            return {}
+
+        def set(self, key, value, *, tags, versions, ttl=None):
+            return False
+
+    with pytest.raises(TypeError):
+        NoInvalidate(default_ttl=60)
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = InMemoryCache(default_ttl=5)
+    cache.set("k", "v", tags=[], versions={})
+    assert cache.get("k") == "v"
+    now[0] += 6
+    assert cache.get("k") is MISS
+
+
+def test_lru_eviction_by_entry_count():
+    cache = InMemoryCache(default_ttl=60, max_entries=2)
+    cache.set("a", 1, tags=[], versions={})
+    cache.set("b", 2, tags=[], versions={})
+    cache.get("a")  # a is now most recently used
+    cache.set("c", 3, tags=[], versions={})
+    assert cache.get("b") is MISS
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_memory_bound_evicts_oldest():
+    cache = InMemoryCache(default_ttl=60, max_bytes=3000)
+    cache.set("a", "x" * 1000, tags=[], versions={})
+    cache.set("b", "y" * 1000, tags=[], versions={})
+    cache.set("c", "z" * 1000, tags=[], versions={})
+    assert cache.get("a") is MISS
+    assert cache.info()["bytes"] <= 3000
+    # values larger than the whole budget are never stored
+    assert cache.set("huge", "h" * 5000, tags=[], versions={}) is False
+
+
+def test_invalidate_by_tag():
+    cache = InMemoryCache(default_ttl=60)
+    cache.set("feed:1", 1, tags=["feed", "company:a"], versions={})
+    cache.set("feed:2", 2, tags=["feed", "company:b"], versions={})
+    cache.set("other", 3, tags=["job:x"], versions={})
+
+    cache.invalidate("company:a")
+    assert cache.get("feed:1") is MISS and cache.get("feed:2") == 2
+
+    cache.invalidate("feed")
+    assert cache.get("feed:2") is MISS and cache.get("other") == 3
+
+
+def test_value_tags_allow_invalidating_by_returned_rows():
+    cache = InMemoryCache(default_ttl=60)
+    cache.get_or_set("k", lambda: ["j1", "j2"], tags=["feed"], value_tags=lambda rows: [f"job:{r}" for r in rows])
+    cache.invalidate("job:j2")
+    assert cache.get("k") is MISS
+
+
+def test_set_racing_with_invalidation_is_discarded():
+    cache = InMemoryCache(default_ttl=60)
+
+    def compute():
+        # a write lands while the page is being computed
+        cache.invalidate("feed")
+        return "stale"
+
+    assert cache.get_or_set("k", compute, tags=["feed"]) == "stale"
+    assert cache.get("k") is MISS
+    assert cache.stats.stale_sets == 1
+
+
+def test_aget_or_set_awaits_compute_and_checks_versions():
+    cache = InMemoryCache(default_ttl=60)
+
+    async def page():
+        return ["j1"]
+
+    async def racing():
+        cache.invalidate("feed")
+        return "stale"
+
+    async def run():
+        first = await cache.aget_or_set("k", page, tags=["feed"], value_tags=lambda rows: [f"job:{r}" for r in rows])
+        again = await cache.aget_or_set("k", racing, tags=["feed"])
+        cache.invalidate("job:j1")
+        stale = await cache.aget_or_set("k", racing, tags=["feed"])
+        return first, again, stale
+
+    assert asyncio.run(run()) == (["j1"], ["j1"], "stale")
+    assert cache.get("k") is MISS
+    assert cache.stats.as_dict()["hits"] == 1 and cache.stats.stale_sets == 1
+
+
+def test_aget_or_set_keeps_backend_calls_off_the_event_loop():
+    threads = []
+
+    class RecordingCache(InMemoryCache):
+        def get(self, key):
+            threads.append(threading.get_ident())
+            return super().get(key)
+
+        def tag_versions(self, tags):
+            threads.append(threading.get_ident())
+            return super().tag_versions(tags)
+
+        def set(self, key, value, **kwargs):
+            threads.append(threading.get_ident())
+            return super().set(key, value, **kwargs)
+
+    cache = RecordingCache(default_ttl=60)
+
+    async def page():
+        return ["j1"]
+
+    async def run():
+        loop_thread = threading.get_ident()
+        assert await cache.aget_or_set("k", page, tags=["feed"]) == ["j1"]
+        assert await cache.aget_or_set("k", page, tags=["feed"]) == ["j1"]
+        return loop_thread
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 4 and loop_thread not in threads
+
+
+# --- Redis protocol backend against a minimal local stand-in server ---
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        assert line[:1] == b"*"
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        store, sets, lock = self.server.store, self.server.sets, self.server.lock
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            cmd = args[0].upper()
+            with lock:
+                if cmd == b"GET":
+                    reply = self._bulk(store.get(args[1]))
+                elif cmd == b"SET" and args[1].endswith(b"oom"):
+                    reply = b"-OOM command not allowed when used memory > 'maxmemory'\r\n"
+                elif cmd == b"SET":
+                    store[args[1]] = args[2]
+                    reply = b"+OK\r\n"
+                elif cmd == b"MGET":
+                    reply = b"*%d\r\n" % (len(args) - 1) + b"".join(self._bulk(store.get(k)) for k in args[1:])
+                elif cmd == b"INCR":
+                    store[args[1]] = str(int(store.get(args[1], b"0")) + 1).encode()
+                    reply = b":%s\r\n" % store[args[1]]
+                elif cmd == b"SADD":
+                    sets.setdefault(args[1], set()).update(args[2:])
+                    reply = b":1\r\n"
+                elif cmd == b"SMEMBERS":
+                    members = sets.get(args[1], set())
+                    reply = b"*%d\r\n" % len(members) + b"".join(self._bulk(m) for m in members)
+                elif cmd == b"DEL":
+                    removed = sum(1 for k in args[1:] if store.pop(k, None) is not None or sets.pop(k, None) is not None)
+                    reply = b":%d\r\n" % removed
+                elif cmd == b"PEXPIRE":
+                    reply = b":1\r\n"
+                else:
+                    reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def fake_redis_url():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _FakeRedisHandler)
+    server.daemon_threads = True
+    server.store, server.sets, server.lock = {}, {}, threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+
+def test_redis_cache_roundtrip_and_tag_invalidation(fake_redis_url):
+    cache = RedisCache(fake_redis_url, default_ttl=30)
+    page = ([{"job_id": "j1"}], None)
+
+    assert cache.get_or_set("feed:abc", lambda: page, tags=["feed"], value_tags=lambda p: ["job:j1"]) == page
+    assert cache.get("feed:abc") == page
+    assert cache.get_or_set("feed:abc", lambda: pytest.fail("should hit"), tags=["feed"]) == page
+
+    cache.invalidate("job:j1")
+    assert cache.get("feed:abc") is MISS
+    assert cache.stats.as_dict()["hits"] == 1
+
+
+def test_redis_cache_unreachable_server_degrades_to_miss():
+    cache = RedisCache("redis://127.0.0.1:1/0", default_ttl=30)
+    assert cache.get_or_set("k", lambda: "computed", tags=["feed"]) == "computed"
+    assert cache.get("k") is MISS
+    assert cache.info()["errors"] >= 1
+
+
+def test_error_reply_does_not_leave_the_pipeline_out_of_step(fake_redis_url):
+    conn = RespConnection(fake_redis_url)
+    with pytest.raises(RespError, match="OOM"):
+        conn.pipeline(("SET", "oom", "x"), ("SET", "a", "1"), ("GET", "a"))
+    # the replies queued behind the error were consumed, not left for the next command
+    assert conn.execute("GET", "a") == b"1"
+    assert conn.execute("GET", "missing") is None
+
+
+def test_invalidate_reaches_redis_caches_this_process_never_used(fake_redis_url, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "redis")
+    monkeypatch.setattr(settings, "CACHE_REDIS_URL", fake_redis_url)
+    monkeypatch.setattr(cache_module, "_caches", {})
+    monkeypatch.setattr(cache_module, "_redis_tags", None)
+    reader = cache_module.get_cache("feed", ttl=30)
+    reader.get_or_set("page", lambda: "v1", tags=["feed"])
+    versions = reader.tag_versions(["feed"])
+
+    # another worker: writes before it has created any cache of its own
+    monkeypatch.setattr(cache_module, "_caches", {})
+    cache_module.invalidate("feed")
+
+    assert reader.get("page") is MISS
+    assert reader.tag_versions(["feed"]) != versions
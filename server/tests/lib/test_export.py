@@ -0,0 +1,74 @@
+# tests/lib/test_export.py
+
+import csv
+import io
+import json
+import zipfile
+from datetime import datetime
+from uuid import UUID
+
+from app.lib.export import iter_csv, iter_ndjson, iter_zip
+
+JOB_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+def test_ndjson_encodes_one_object_per_line():
+    rows = [{"job_id": JOB_ID, "posted_at": datetime(2024, 1, 2, 3, 4), "title": "Dev"}, {"job_id": None}]
+    body = b"".join(iter_ndjson(rows)).decode()
+
+    lines = body.splitlines()
+    assert len(lines) == 2 and body.endswith("\n")
+    assert json.loads(lines[0]) == {"job_id": str(JOB_ID), "posted_at": "2024-01-02T03:04:00", "title": "Dev"}
+
+
+def test_csv_writes_header_and_blank_nulls():
+    rows = [{"job_id": JOB_ID, "title": 'Dev, "senior"', "salary_range": None}]
+    body = b"".join(iter_csv(rows, ["job_id", "title", "salary_range"])).decode()
+
+    parsed = list(csv.reader(io.StringIO(body)))
+    assert parsed == [["job_id", "title", "salary_range"], [str(JOB_ID), 'Dev, "senior"', ""]]
+
+
+def test_encoders_are_lazy_and_chunked():
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield {"n": i, "pad": "x" * 100}
+
+    chunks = iter_ndjson(rows(), chunk_bytes=4096)
+    first = next(chunks)
+    assert 4096 <= len(first) < 4096 + 200
+    assert len(consumed) < 1000  # the rest hasn't been pulled yet
+    assert sum(len(c) for c in chunks) + len(first) > 100_000
+
+    csv_chunks = list(iter_csv(({"n": i} for i in range(5000)), ["n"], chunk_bytes=1024))
+    assert len(csv_chunks) > 1 and all(len(c) < 1024 + 16 for c in csv_chunks)
+
+
+def test_zip_streams_entries_that_unzip_back():
+    pdf = bytes(range(256)) * 1000
+    chunks = list(iter_zip([("a.csv", iter([b"n\n", b"1\n"])), ("resumes/a.pdf", [pdf[:100_000], pdf[100_000:]])],
+                           chunk_bytes=16 * 1024))
+    assert len(chunks) > 1
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        assert zf.read("a.csv") == b"n\n1\n" and zf.read("resumes/a.pdf") == pdf
+        assert zf.getinfo("a.csv").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("resumes/a.pdf").compress_type == zipfile.ZIP_STORED
+
+
+def test_zip_is_lazy_and_bounded_by_the_chunk_size():
+    pulled = []
+
+    def entries():
+        for i in range(50):
+            pulled.append(i)
+            yield f"f{i}.pdf", [b"x" * 10_000]
+
+    chunks = iter_zip(entries(), chunk_bytes=8 * 1024)
+    first = next(chunks)
+    assert len(pulled) == 1 and first.startswith(b"PK\x03\x04")  # sent before the entry's data is read
+    assert max(len(c) for c in chunks) < 8 * 1024 + 10_000 + 200
@@ -0,0 +1,22 @@
+# tests/lib/test_metrics.py
+
+from app.lib.metrics import Histogram
+
+
+def test_histogram_buckets_and_quantiles():
+    hist = Histogram((0.01, 0.1, 1.0))
+    for seconds in [0.005] * 90 + [0.05] * 8 + [0.5, 3.0]:
+        hist.observe(seconds)
+
+    data = hist.as_dict()
+    assert data["count"] == 100
+    assert data["buckets_ms"] == {"10": 90, "100": 8, "1000": 1, "+Inf": 1}
+    assert data["max_ms"] == 3000.0
+    assert data["p50_ms"] == 10.0 and data["p95_ms"] == 100.0
+    assert data["p99_ms"] == 1000.0
+    assert hist.quantile(1.0) is None  # beyond the last bound
+
+
+def test_empty_histogram():
+    data = Histogram().as_dict()
+    assert data["count"] == 0 and data["mean_ms"] is None and data["p50_ms"] is None
@@ -0,0 +1,24 @@
+# tests/repository/conftest.py
+
+import pytest
+
+
+@pytest.fixture
+def lookups():
+    """Gives a fake session the db.scalars / db.execute calls of the prebuilt select() lookups.
+
+    ``lookups(db)`` answers both with the session's prepared FakeQuery and records each
+    call in ``db.lookups`` as (stmt, params), so tests can check what was bound.
+    """
+
+    def install(db):
+        db.lookups = []
+
+        def lookup(stmt, params=None):
+            db.lookups.append((stmt, params))
+            return db._next_query
+
+        db.scalars = db.execute = lookup
+        return db
+
+    return install
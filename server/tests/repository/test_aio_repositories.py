@@ -0,0 +1,176 @@
+# tests/repository/test_aio_repositories.py
+
+import asyncio
+import types
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.repository.aio import application as application_repo
+from app.repository.aio import company as company_repo
+from app.repository.aio import dashboard as dashboard_repo
+from app.repository.aio import job_listing as job_listing_repo
+from app.repository.aio import user as user_repo
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class FakeAsyncSession:
+    """Records awaited statements; ``run_sync`` hands ``sync_session`` to the sync function like AsyncSession does."""
+
+    def __init__(self, results=(), sync_session=None):
+        self.results = list(results)
+        self.statements = []
+        self.params = []
+        self.sync_session = sync_session
+        self.added, self.commits, self.refreshed = [], 0, []
+
+    def _next(self, stmt, params):
+        self.statements.append(stmt)
+        self.params.append(params)
+        return self.results.pop(0)
+
+    async def scalar(self, stmt, params=None):
+        return self._next(stmt, params)
+
+    async def scalars(self, stmt, params=None):
+        return iter(self._next(stmt, params))
+
+    async def execute(self, stmt, params=None):
+        return FakeResult(self._next(stmt, params))
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, obj):
+        self.refreshed.append(obj)
+
+
+class FakeResult(list):
+    def first(self):
+        return self[0] if self else None
+
+    def one(self):
+        return self[0]
+
+
+def test_user_lookups_are_single_selects():
+    user = types.SimpleNamespace(email="a@example.com")
+    db = FakeAsyncSession([user, None])
+    assert asyncio.run(user_repo.get_user_by_email(db, "a@example.com")) is user
+    assert asyncio.run(user_repo.get_user_by_id(db, uuid.uuid4())) is None
+    sql = _sql(db.statements[0])
+    assert "WHERE users.email = " in sql and "LIMIT" in sql
+    assert db.params[0] == {"email": "a@example.com"}
+
+
+def test_authenticate_user_checks_password_off_the_loop(monkeypatch):
+    import threading
+
+    seen = {}
+
+    def fake_verify(plain, hashed):
+        seen["thread"] = threading.current_thread()
+        return plain == "secret"
+
+    monkeypatch.setattr(user_repo, "verify_password", fake_verify)
+    user = types.SimpleNamespace(email="a@example.com", password_hash="h")
+    assert asyncio.run(user_repo.authenticate_user(FakeAsyncSession([user]), "a@example.com", "secret")) is user
+    assert seen["thread"] is not threading.main_thread()
+    assert asyncio.run(user_repo.authenticate_user(FakeAsyncSession([user]), "a@example.com", "nope")) is None
+
+
+def test_dashboard_stats_in_one_statement():
+    db = FakeAsyncSession([[(5, 3, 2, None)]])
+    out = asyncio.run(dashboard_repo.get_recruiter_dashboard_stats(db, recruiter_id=uuid.uuid4()))
+    assert out == {"total_jobs": 5, "total_open_jobs": 3, "total_draft_jobs": 2, "total_applications": 0}
+    assert len(db.statements) == 1
+    assert "count(*) FILTER (WHERE" in _sql(db.statements[0])
+
+
+def test_application_helpers():
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(application_repo.ensure_job_exists(FakeAsyncSession([None]), job_id=uuid.uuid4()))
+    assert e.value.status_code == 404
+
+    row = types.SimpleNamespace(
+        application_id="a1", applicant_id="u1", status="applied", resume_url=None,
+        first_name="Ada", last_name="L", email="ada@example.com",
+    )
+    items = asyncio.run(application_repo.list_applications_for_job(FakeAsyncSession([[row]]), job_id=uuid.uuid4()))
+    assert items == [{
+        "application_id": "a1", "applicant_id": "u1", "status": "applied", "resume_url": None,
+        "applicant_name": "Ada L", "applicant_email": "ada@example.com",
+    }]
+
+    db = FakeAsyncSession()
+    app = asyncio.run(application_repo.create_application(db, job_id="j", applicant_id="u", cover_letter=None))
+    assert db.added == [app] and db.commits == 1 and db.refreshed == [app]
+    assert app.status == "applied"
+
+
+def test_company_writes_reuse_the_sync_repository(monkeypatch):
+    sync_session = object()
+    calls = []
+
+    def fake_create(db, *, recruiter_user_id, company_in):
+        calls.append((db, recruiter_user_id, company_in))
+        return "company"
+
+    monkeypatch.setattr(company_repo.sync_repo, "create_company", fake_create)
+    db = FakeAsyncSession(sync_session=sync_session)
+    assert asyncio.run(company_repo.create_company(db, recruiter_user_id="u1", company_in="payload")) == "company"
+    assert calls == [(sync_session, "u1", "payload")]
+
+
+def test_job_listing_reads(monkeypatch):
+    job = types.SimpleNamespace(**{f: f for f in job_listing_repo.sync_repo.RESPONSE_FIELDS if f != "company_name"})
+    db = FakeAsyncSession([[(job, "Acme")], [(job, "Acme")]])
+    item = asyncio.run(job_listing_repo.get_job_listing(db, uuid.uuid4()))
+    assert item["company_name"] == "Acme" and item["title"] == "title"
+
+    monkeypatch.setattr(job_listing_repo.settings, "JOB_LISTINGS_MAX_LIMIT", 7)
+    items = asyncio.run(job_listing_repo.list_job_listings(db, limit=500, fields=("job_id", "title")))
+    assert items == [{"job_id": "job_id", "title": "title"}]
+    sql = _sql(db.statements[1])
+    assert "JOIN companies" in sql and "ORDER BY job_postings.posted_at DESC" in sql
+    assert db.statements[1]._limit == 7
+
+
+def test_job_listing_feed_ranks_search_hits_off_the_event_loop(monkeypatch):
+    import threading
+
+    hits = [(2.0, uuid.uuid4())]
+    search_threads, calls = [], []
+
+    class Backend:
+        def search(self, q):
+            search_threads.append(threading.current_thread())
+            return hits
+
+    def fake_paged(db, **kwargs):
+        calls.append(kwargs)
+        return [], None
+
+    monkeypatch.setattr(job_listing_repo.sync_repo, "get_search_backend", lambda: Backend())
+    monkeypatch.setattr(job_listing_repo.sync_repo, "list_job_listings_paged", fake_paged)
+
+    async def run():
+        await job_listing_repo.list_job_listings_paged(FakeAsyncSession(), q="python", sort_by="relevance")
+        await job_listing_repo.list_job_listings_paged(FakeAsyncSession(), q="python", sort_by="posted_at")
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert len(search_threads) == 1 and search_threads[0] is not loop_thread
+    # date sorts are matched in SQL, so nothing is ranked for them
+    assert calls == [{"q": "python", "sort_by": "relevance", "search_hits": hits}, {"q": "python", "sort_by": "posted_at"}]
@@ -0,0 +1,286 @@
+# tests/repository/test_application_apply.py
+
+import asyncio
+import os
+import threading
+import types
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.models import Applicant, Application, Company, JobPosting, Recruiter, User
+from app.db.session import Base
+from app.repository import application as repo
+from app.repository.aio import application as aio_repo
+from app.tasks.apply_batcher import ApplyBatcher
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class Result:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class ApplyDB:
+    def __init__(self, row):
+        self.row = row
+        self.statements, self.params, self.commits = [], [], 0
+
+    def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        self.params.append(params)
+        return Result(self.row)
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_apply_statement_validates_and_inserts_in_one_statement():
+    sql = " ".join(_sql(repo.APPLY_TO_JOB).split())
+    assert sql.count("INSERT INTO applications") == 1
+    assert "ON CONFLICT (job_id, applicant_id) DO NOTHING RETURNING application_id" in sql
+    # only inserted when the job is open and the applicant has a profile
+    assert "FROM job CROSS JOIN applicant WHERE job.is_open" in sql
+    assert "status = 'open' AND (expires_at IS NULL OR expires_at > LOCALTIMESTAMP)" in sql
+    assert "SELECT %(application_id)s::UUID, job.job_id" in sql and "CAST('applied' AS application_status_enum)" in sql
+    # cacheable, so it is compiled once per engine rather than per call
+    assert repo.APPLY_TO_JOB._generate_cache_key() is not None
+
+
+def test_apply_to_job_runs_one_statement_and_commits():
+    outcome = types.SimpleNamespace(job_open=True, has_profile=True, application_id=uuid.uuid4())
+    db = ApplyDB(outcome)
+    assert repo.apply_to_job(db, job_id="j", user_id="u", cover_letter="Hi") is outcome
+    assert db.statements == [repo.APPLY_TO_JOB] and db.commits == 1
+    params = db.params[0]
+    assert params["job_id"] == "j" and params["user_id"] == "u" and params["cover_letter"] == "Hi"
+    assert isinstance(params["application_id"], uuid.UUID)
+
+
+def test_aio_apply_to_job_runs_one_statement_and_commits():
+    outcome = types.SimpleNamespace(job_open=True, has_profile=True, application_id=uuid.uuid4())
+    db = ApplyDB(outcome)
+
+    async def execute(stmt, params=None):
+        return ApplyDB.execute(db, stmt, params)
+
+    async def commit():
+        db.commits += 1
+
+    fake = types.SimpleNamespace(execute=execute, commit=commit)
+    assert asyncio.run(aio_repo.apply_to_job(fake, job_id="j", user_id="u", cover_letter=None)) is outcome
+    assert db.statements == [repo.APPLY_TO_JOB] and db.commits == 1
+
+
+def test_model_declares_the_conflict_target_as_unique():
+    index = next(i for i in Application.__table__.indexes if i.name == "ux_applications_job_applicant")
+    assert index.unique and [c.name for c in index.columns] == ["job_id", "applicant_id"]
+
+
+# --- against a real Postgres (set TEST_DATABASE_URL to run) ---
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="module")
+def pg_schema():
+    schema = f"apply_test_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(TEST_DATABASE_URL)
+    with admin.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+    try:
+        yield schema
+    finally:
+        with admin.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
+
+
+@pytest.fixture(scope="module")
+def pg_engine(pg_schema):
+    engine = create_engine(
+        TEST_DATABASE_URL, pool_size=20, connect_args={"options": f"-csearch_path={pg_schema},public"}
+    )
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def _user(kind):
+    user_id = uuid.uuid4()
+    return User(user_id=user_id, email=f"{user_id}@example.com", password_hash="x", first_name="A",
+                last_name="B", user_type=kind)
+
+
+def _job(company, recruiter, status="open"):
+    return JobPosting(job_id=uuid.uuid4(), company_id=company.company_id, recruiter_id=recruiter.user_id, title="Intern",
+                      description="d", requirements="r", location="Pune", job_type="internship", status=status)
+
+
+def _seed(pg_engine):
+    """An open and a closed posting, three applicants and a user without an applicant profile."""
+    with Session(pg_engine) as db:
+        recruiter, company = _user("recruiter"), Company(company_id=uuid.uuid4(), name=f"Acme {uuid.uuid4()}")
+        applicants = [_user("applicant") for _ in range(3)]
+        no_profile = _user("applicant")
+        db.add_all([recruiter, company, no_profile, *applicants])
+        db.flush()
+        db.add(Recruiter(recruiter_id=recruiter.user_id, company_id=company.company_id))
+        db.add_all(Applicant(applicant_id=a.user_id) for a in applicants)
+        db.flush()
+        job, closed = _job(company, recruiter), _job(company, recruiter, status="closed")
+        db.add_all([job, closed])
+        db.commit()
+        return job.job_id, closed.job_id, [a.user_id for a in applicants], no_profile.user_id
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+def test_apply_outcomes_and_concurrent_duplicates(pg_engine):
+    job_id, closed_id, applicant_ids, no_profile_id = _seed(pg_engine)
+
+    def apply(job_id, user_id):
+        with Session(pg_engine) as db:
+            return repo.apply_to_job(db, job_id=job_id, user_id=user_id, cover_letter="Hi")
+
+    assert apply(uuid.uuid4(), applicant_ids[0]).job_open is None
+    assert not apply(job_id, no_profile_id).has_profile
+    closed_outcome = apply(closed_id, applicant_ids[0])
+    assert closed_outcome.job_open is False and closed_outcome.application_id is None
+
+    # a burst of the same applicants on one posting: exactly one application each, no errors
+    outcomes, errors = [], []
+
+    def worker(user_id):
+        try:
+            outcomes.append((user_id, apply(job_id, user_id).application_id))
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(user_id,)) for user_id in applicant_ids * 5]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    created = {user_id: app_id for user_id, app_id in outcomes if app_id is not None}
+    assert sorted(created) == sorted(applicant_ids)
+
+    with Session(pg_engine) as db:
+        rows = db.execute(
+            select(Application.applicant_id, Application.application_id, Application.status, Application.cover_letter)
+            .where(Application.job_id == job_id)
+        ).all()
+        assert {r.applicant_id: r.application_id for r in rows} == created
+        assert {(str(r.status), r.cover_letter) for r in rows} == {("applied", "Hi")}
+        assert db.scalar(select(func.count()).select_from(Application).where(Application.job_id == closed_id)) == 0
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+def test_batched_applies_get_the_same_outcomes(pg_engine):
+    job_id, closed_id, applicant_ids, no_profile_id = _seed(pg_engine)
+    batcher = ApplyBatcher(max_batch_size=50, max_wait_seconds=0.05)
+    requests = [(job_id, user_id) for user_id in applicant_ids * 3]
+    requests += [(uuid.uuid4(), applicant_ids[0]), (closed_id, applicant_ids[0]), (job_id, no_profile_id)]
+    futures = [batcher.submit(job, user, "Hi") for job, user in requests]
+    batcher.start(sessionmaker(bind=pg_engine))
+    try:
+        outcomes = [f.result(timeout=10) for f in futures]
+    finally:
+        batcher.stop()
+    assert batcher.batches == 1
+
+    *repeats, missing, closed, no_profile = outcomes
+    created = [o.application_id for o in repeats if o.application_id is not None]
+    assert len(created) == len(applicant_ids)  # the in-batch duplicates insert nothing
+    assert missing.job_open is None and closed.job_open is False and not no_profile.has_profile
+    with Session(pg_engine) as db:
+        stored = db.scalars(select(Application.application_id).where(Application.job_id == job_id)).all()
+    assert sorted(stored) == sorted(created)
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+def test_bulk_status_update_locks_then_updates_in_one_statement(pg_engine, pg_schema):
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.db.async_session import async_database_url
+
+    job_id, _, applicant_ids, _ = _seed(pg_engine)
+    other_job_id = _seed(pg_engine)[0]
+    with Session(pg_engine) as db:
+        app_ids = [
+            repo.apply_to_job(db, job_id=job_id, user_id=user_id, cover_letter=None).application_id
+            for user_id in applicant_ids
+        ]
+        company_id, other_company_id = (db.get(JobPosting, j).company_id for j in (job_id, other_job_id))
+    missing = uuid.uuid4()
+    with Session(pg_engine) as db:
+        # a recruiter of another company updates nothing, though every id exists
+        assert repo.bulk_update_application_status(
+            db, statuses=dict.fromkeys(app_ids, "hired"), company_id=other_company_id
+        ) == {}
+        updated = repo.bulk_update_application_status(
+            db, statuses={app_ids[0]: "shortlisted", app_ids[1]: "rejected", missing: "hired"}, company_id=company_id
+        )
+    assert updated == {app_ids[0]: "shortlisted", app_ids[1]: "rejected"}
+
+    async def run_async():
+        engine = create_async_engine(
+            async_database_url(TEST_DATABASE_URL),
+            connect_args={"server_settings": {"search_path": f"{pg_schema},public"}},
+        )
+        try:
+            async with AsyncSession(engine) as db:
+                return await aio_repo.bulk_update_application_status(
+                    db, statuses=dict.fromkeys(app_ids[1:], "hired"), company_id=company_id
+                )
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run_async()) == dict.fromkeys(app_ids[1:], "hired")
+    with Session(pg_engine) as db:
+        rows = db.execute(select(Application.application_id, Application.status).where(Application.job_id == job_id)).all()
+    assert dict(rows) == {app_ids[0]: "shortlisted", app_ids[1]: "hired", app_ids[2]: "hired"}
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+def test_applications_page_walks_the_keyset_with_counts_on_the_first_page(pg_engine):
+    job_id, _, applicant_ids, _ = _seed(pg_engine)
+    with Session(pg_engine) as db:
+        app_ids = [
+            repo.apply_to_job(db, job_id=job_id, user_id=user_id, cover_letter=None).application_id
+            for user_id in applicant_ids
+        ]
+        # two applications in the same instant: the application_id tiebreaker keeps pages disjoint
+        db.execute(Application.__table__.update().where(Application.application_id.in_(app_ids[:2]))
+                   .values(applied_at=text("'2026-01-01'")))
+        db.execute(Application.__table__.update().where(Application.application_id == app_ids[2])
+                   .values(status="hired"))
+        db.execute(User.__table__.update().where(User.user_id == applicant_ids[0]).values(first_name="Zoë"))
+        db.commit()
+
+        items, cursor, counts = repo.list_applications_page(db, job_id=job_id, limit=1)
+        assert counts["applied"] == 2 and counts["hired"] == 1
+        seen = [i["application_id"] for i in items]
+        while cursor is not None:
+            items, cursor, counts = repo.list_applications_page(db, job_id=job_id, limit=1, cursor=cursor)
+            assert counts is None
+            seen += [i["application_id"] for i in items]
+        assert seen[0] == app_ids[2] and sorted(seen) == sorted(app_ids) and len(seen) == 3
+
+        items, _, counts = repo.list_applications_page(db, job_id=job_id, q="zo", status_value="hired", limit=10)
+        assert items == [] and counts["applied"] == 1 and counts["hired"] == 0
+        items, _, _ = repo.list_applications_page(db, job_id=job_id, q=f"{applicant_ids[1]}@", limit=10)
+        assert [i["application_id"] for i in items] == [app_ids[1]]
+        assert repo.list_applications_page(db, job_id=uuid.uuid4(), limit=10)[2]["applied"] == 0
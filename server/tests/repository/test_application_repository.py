@@ -1,7 +1,12 @@
 # tests/repository/test_application_repository.py
 
 import types
+import uuid
+from datetime import datetime
+
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
 
 from app.repository import application as repo
 from fastapi import HTTPException
@@ -53,19 +58,21 @@ class FakeDB:
         self.refreshed.append(obj)
 
 
-def test_ensure_job_exists_raises_when_missing():
-    db = FakeDB()
+def test_ensure_job_exists_raises_when_missing(lookups):
+    db = lookups(FakeDB())
     db.set_query_result(result=None)
     with pytest.raises(HTTPException) as ei:
         repo.ensure_job_exists(db, job_id="uuid")
     assert ei.value.status_code == 404
+    assert db.lookups == [(repo.JOB_BY_ID, {"job_id": "uuid"})]
 
 
-def test_ensure_job_exists_success():
-    db = FakeDB()
+def test_ensure_job_exists_success(lookups):
+    db = lookups(FakeDB())
     job = types.SimpleNamespace(job_id="jid")
     db.set_query_result(result=job)
     assert repo.ensure_job_exists(db, job_id="jid") is job
+    assert db.lookups == [(repo.JOB_BY_ID, {"job_id": "jid"})]
 
 
 essential_user_fields = {
@@ -75,19 +82,21 @@ essential_user_fields = {
 }
 
 
-def test_ensure_applicant_profile_raises_when_missing():
-    db = FakeDB()
+def test_ensure_applicant_profile_raises_when_missing(lookups):
+    db = lookups(FakeDB())
     db.set_query_result(result=None)
     with pytest.raises(HTTPException) as ei:
         repo.ensure_applicant_profile(db, user_id="uuid")
     assert ei.value.status_code == 403
+    assert db.lookups == [(repo.APPLICANT_BY_USER_ID, {"user_id": "uuid"})]
 
 
-def test_ensure_applicant_profile_success():
-    db = FakeDB()
+def test_ensure_applicant_profile_success(lookups):
+    db = lookups(FakeDB())
     applicant = types.SimpleNamespace(applicant_id="uid")
     db.set_query_result(result=applicant)
     assert repo.ensure_applicant_profile(db, user_id="uid") is applicant
+    assert db.lookups == [(repo.APPLICANT_BY_USER_ID, {"user_id": "uid"})]
 
 
 def test_update_application_status_happy_path():
@@ -103,12 +112,40 @@ def test_update_application_status_happy_path():
     assert db.refreshed == [app_obj]
 
 
-def test_get_application_by_job_and_applicant_returns_row():
+def test_get_application_by_job_and_applicant_returns_row(lookups):
     row = types.SimpleNamespace(application_id="aid")
-    db = FakeDB()
+    db = lookups(FakeDB())
     db.set_query_result(result=row)
     out = repo.get_application_by_job_and_applicant(db, job_id="jid", applicant_id="uid")
     assert out is row
+    assert db.lookups == [(repo.APPLICATION_BY_JOB_AND_APPLICANT, {"job_id": "jid", "applicant_id": "uid"})]
+
+
+class BulkDB(FakeDB):
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        return FakeQuery(rows=self.rows)
+
+
+def test_bulk_update_application_status_locks_in_id_order_then_updates_once():
+    a, b = "00000000-0000-0000-0000-00000000000b", "00000000-0000-0000-0000-00000000000a"
+    db = BulkDB(rows=[Row(application_id=b, status="hired")])
+    result = repo.bulk_update_application_status(db, statuses={a: "rejected", b: "hired"}, company_id="c1")
+    assert result == {b: "hired"}
+    assert db.commits == 1 and len(db.statements) == 2
+    (lock, lock_params), (stmt, params) = db.statements
+    # overlapping bulk updates take their row locks in the same order before the UPDATE's join runs
+    assert lock is repo.LOCK_APPLICATIONS_IN_ORDER and lock_params == {"application_ids": [b, a], "company_id": "c1"}
+    assert "ORDER BY a.application_id FOR UPDATE OF a" in str(lock)
+    assert stmt is repo.BULK_UPDATE_APPLICATION_STATUS
+    assert params == {"application_ids": [b, a], "statuses": ["hired", "rejected"], "company_id": "c1"}
+    # both statements are scoped to the recruiter's company
+    assert "jp.company_id = :company_id" in str(lock) and "jp.company_id = :company_id" in str(stmt)
 
 
 def test_update_application_status_404_when_missing():
@@ -218,3 +255,97 @@ def test_list_applications_for_applicant_maps_rows():
             "company_name": "Company2",
         },
     ]
+
+
+class ExecDB:
+    def __init__(self, rows):
+        self.rows, self.statements = rows, []
+
+    def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        return iter(self.rows)
+
+
+def _page_row(n, **kwargs):
+    base = dict(application_id=f"app{n}", applicant_id=f"u{n}", status="applied", applied_at=datetime(2026, 1, n),
+                resume_url=None, first_name="Ann", last_name=f"L{n}", email=f"a{n}@example.com")
+    return Row(**{**base, **kwargs})
+
+
+def _compiled(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def test_first_applications_page_carries_status_counts_in_the_same_statement():
+    counts = {"applied": 2, "hired": 1}
+    db = ExecDB([_page_row(3, counts=counts), _page_row(2, counts=counts), _page_row(1, counts=counts)])
+    items, next_cursor, out_counts = repo.list_applications_page(db, job_id=uuid.uuid4(), q="ann", limit=2)
+    assert [i["application_id"] for i in items] == ["app3", "app2"]
+    assert items[0]["applied_at"] == datetime(2026, 1, 3) and items[0]["applicant_name"] == "Ann L3"
+    assert next_cursor == f"{datetime(2026, 1, 2).isoformat()}|app2"
+    assert out_counts == {"applied": 2, "under review": 0, "shortlisted": 0, "rejected": 0, "hired": 1}
+
+    sql = _compiled(db.statements[0])
+    assert len(db.statements) == 1
+    assert "json_object_agg(by_status.status, by_status.n)" in sql and "GROUP BY applications.status" in sql
+    assert "LEFT OUTER JOIN" in sql and "ON true" in sql
+    assert "ORDER BY applications.applied_at DESC, applications.application_id DESC" in sql
+
+
+def test_empty_first_page_still_returns_counts():
+    db = ExecDB([_page_row(1, application_id=None, counts=None)])  # the outer join's row, no applications
+    items, next_cursor, counts = repo.list_applications_page(db, job_id=uuid.uuid4(), status_value="hired", limit=20)
+    assert items == [] and next_cursor is None and set(counts.values()) == {0}
+
+
+def test_later_pages_seek_past_the_cursor_without_counts():
+    db = ExecDB([_page_row(1)])
+    cursor = f"{datetime(2026, 1, 2).isoformat()}|{uuid.uuid4()}"
+    items, next_cursor, counts = repo.list_applications_page(
+        db, job_id=uuid.uuid4(), status_value="applied", limit=20, cursor=cursor
+    )
+    assert len(items) == 1 and next_cursor is None and counts is None
+    sql = _compiled(db.statements[0])
+    assert "(applications.applied_at, applications.application_id) < (" in sql
+    assert "json_object_agg" not in sql and "applications.status = %(status_1)s" in sql
+
+
+class StreamingDB:
+    def __init__(self, rows):
+        self.rows, self.sql, self.yield_per = rows, None, None
+
+    def query(self, *entities):
+        db = self
+
+        class StreamingQuery(Query):
+            def __iter__(self):
+                db.yield_per = self.load_options._yield_per
+                db.sql = _compiled(self.statement)
+                return iter(db.rows)
+
+        return StreamingQuery(entities)
+
+
+def test_iter_applications_for_job_streams_newest_first():
+    db = StreamingDB([_page_row(2), _page_row(1)])
+    out = repo.iter_applications_for_job(db, job_id=uuid.uuid4(), status_value="applied", batch_size=500)
+    assert db.sql is None  # nothing runs until the export body is consumed
+    assert [i["application_id"] for i in out] == ["app2", "app1"]
+    assert db.yield_per == 500
+    assert "ORDER BY applications.applied_at DESC, applications.application_id DESC" in db.sql
+    assert "applications.status = %(status_1)s" in db.sql and "LIMIT" not in db.sql
+
+
+def test_begin_repeatable_read_opens_the_transaction_on_the_select_bind():
+    class RoutedDB:
+        def get_bind(self, clause=None):
+            self.clause = clause
+            return "replica"
+
+        def connection(self, bind_arguments=None, execution_options=None):
+            self.opened = (bind_arguments, execution_options)
+
+    db = RoutedDB()
+    repo.begin_repeatable_read(db)
+    assert db.clause.is_select
+    assert db.opened == ({"bind": "replica"}, {"isolation_level": "REPEATABLE READ"})
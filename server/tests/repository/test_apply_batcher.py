@@ -0,0 +1,168 @@
+# tests/repository/test_apply_batcher.py
+
+import threading
+import types
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repository import application as repo
+from app.tasks import apply_batcher as batcher_module
+from app.tasks.apply_batcher import ApplyBatcher
+
+
+class Session:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _outcome(request):
+    job_id, user_id, cover_letter = request
+    return types.SimpleNamespace(job_open=True, has_profile=True, application_id=(job_id, user_id))
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    calls = []
+    release = threading.Event()
+    release.set()
+
+    def fake_apply_to_jobs(db, requests):
+        release.wait(5)
+        calls.append(list(requests))
+        return [_outcome(r) for r in requests]
+
+    monkeypatch.setattr(batcher_module, "apply_to_jobs", fake_apply_to_jobs)
+    return types.SimpleNamespace(calls=calls, release=release)
+
+
+def test_concurrent_submits_share_one_batch_and_get_their_own_outcome(batches):
+    batcher = ApplyBatcher(max_batch_size=10, max_wait_seconds=0.2)
+    futures = [batcher.submit("job", f"user-{i}", None) for i in range(4)]
+    batcher.start(Session)
+    try:
+        assert [f.result(timeout=5).application_id for f in futures] == [("job", f"user-{i}") for i in range(4)]
+    finally:
+        batcher.stop()
+    assert batches.calls == [[("job", f"user-{i}", None) for i in range(4)]]
+    assert batcher.stats() == {"batches": 1, "requests": 4, "avg_batch": 4.0, "largest_batch": 4, "queued": 0}
+
+
+def test_batches_are_capped_and_grow_while_a_flush_runs(batches):
+    batcher = ApplyBatcher(max_batch_size=3, max_wait_seconds=0)
+    batches.release.clear()  # hold the first flush so the rest queue up behind it
+    batcher.start(Session)
+    try:
+        first = batcher.submit("job", "user-0", None)
+        while batcher._queue.qsize():
+            pass
+        rest = [batcher.submit("job", f"user-{i}", None) for i in range(1, 6)]
+        batches.release.set()
+        for f in [first, *rest]:
+            f.result(timeout=5)
+    finally:
+        batcher.stop()
+    assert [len(c) for c in batches.calls] == [1, 3, 2]
+
+
+def test_a_failed_batch_fails_each_caller(monkeypatch):
+    def boom(db, requests):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(batcher_module, "apply_to_jobs", boom)
+    batcher = ApplyBatcher(max_wait_seconds=0.05)
+    futures = [batcher.submit("job", "user", None) for _ in range(2)]
+    batcher.start(Session)
+    try:
+        for f in futures:
+            with pytest.raises(RuntimeError):
+                f.result(timeout=5)
+    finally:
+        batcher.stop()
+    assert batcher.batches == 0
+
+
+def test_stop_drains_queued_applies(batches):
+    batcher = ApplyBatcher(max_batch_size=2, max_wait_seconds=0)
+    futures = [batcher.submit("job", f"user-{i}", None) for i in range(5)]
+    batcher.start(Session)
+    batcher.stop()
+    assert all(f.done() for f in futures)
+    assert sum(len(c) for c in batches.calls) == 5
+
+
+def test_submits_after_stop_are_refused_instead_of_left_waiting(batches):
+    batcher = ApplyBatcher(max_wait_seconds=0)
+    batcher.start(Session)
+    batcher.stop()
+    # the worker has drained the queue and exited: nothing would ever resolve a late submit
+    assert batcher.submit("job", "user", None) is None
+    assert batches.calls == [] and not batcher.running
+
+    batcher.start(Session)
+    try:
+        assert batcher.submit("job", "user", None).result(timeout=5).application_id == ("job", "user")
+    finally:
+        batcher.stop()
+
+
+def test_stop_keeps_the_worker_until_it_has_exited(batches, monkeypatch):
+    monkeypatch.setattr(batcher_module, "STOP_TIMEOUT_SECONDS", 0.05)
+    batcher = ApplyBatcher(max_wait_seconds=0)
+    batches.release.clear()  # the flush outlives stop()'s join
+    batcher.start(Session)
+    future = batcher.submit("job", "user", None)
+    while batcher._queue.qsize():
+        pass
+    batcher.stop()
+    assert batcher.running and batcher.submit("job", "other", None) is None
+    batches.release.set()
+    assert future.result(timeout=5).application_id == ("job", "user")
+    batcher._worker.join(5)
+    batcher.stop()
+    assert not batcher.running
+
+
+class Rows:
+    def __init__(self, db):
+        self.db = db
+
+    def __iter__(self):
+        params = self.db.params
+        # returned in another order than requested
+        rows = [
+            types.SimpleNamespace(request_id=rid, job_open=True, has_profile=True, application_id=rid)
+            for rid in params["application_ids"]
+        ]
+        return iter(reversed(rows))
+
+
+class BatchDB:
+    def __init__(self):
+        self.statements, self.commits = [], 0
+
+    def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        self.params = params
+        return Rows(self)
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_apply_to_jobs_is_one_statement_and_returns_outcomes_in_request_order():
+    db = BatchDB()
+    requests = [(uuid.uuid4(), uuid.uuid4(), None), (uuid.uuid4(), uuid.uuid4(), "Hi")]
+    outcomes = repo.apply_to_jobs(db, requests)
+    assert db.statements == [repo.APPLY_TO_JOBS] and db.commits == 1
+    assert [o.request_id for o in outcomes] == db.params["application_ids"]
+    assert db.params["job_ids"] == [r[0] for r in requests] and db.params["cover_letters"] == [None, "Hi"]
+
+    sql = " ".join(str(repo.APPLY_TO_JOBS.compile(dialect=postgresql.dialect())).split())
+    assert "unnest(%(application_ids)s::UUID[], %(job_ids)s::UUID[], %(user_ids)s::UUID[], %(cover_letters)s::TEXT[])" in sql
+    assert "ORDER BY job_id, user_id ON CONFLICT (job_id, applicant_id) DO NOTHING" in sql
+    assert repo.APPLY_TO_JOBS._generate_cache_key() is not None
@@ -53,20 +53,22 @@ class FakeDB:
         self.flushed += 1
 
 
-def test_get_company_and_list_companies_passthrough():
-    db = FakeDB()
+def test_get_company_and_list_companies_passthrough(lookups):
+    db = lookups(FakeDB())
     row = types.SimpleNamespace(company_id="c1", name="Acme")
     db.set_query_result(result=row, rows=[row])
 
     assert repo.get_company(db, company_id="c1") is row
+    assert db.lookups == [(repo.COMPANY_BY_ID, {"company_id": "c1"})]
     assert repo.list_companies(db) == [row]
 
 
-def test_get_recruiter_by_user_id_passthrough():
-    db = FakeDB()
+def test_get_recruiter_by_user_id_passthrough(lookups):
+    db = lookups(FakeDB())
     rec = types.SimpleNamespace(recruiter_id="u1", company_id=None)
     db.set_query_result(result=rec)
     assert repo.get_recruiter_by_user_id(db, user_id="u1") is rec
+    assert db.lookups == [(repo.RECRUITER_BY_USER_ID, {"user_id": "u1"})]
 
 
 def test_create_company_400_when_name_exists(monkeypatch):
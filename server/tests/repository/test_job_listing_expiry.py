@@ -0,0 +1,154 @@
+# tests/repository/test_job_listing_expiry.py
+
+import threading
+import uuid
+
+from sqlalchemy.dialects import postgresql
+
+from app.controllers import job_listing as ctrl
+from app.lib import cache
+from app.repository import job_listing as repo
+from app.tasks.expiry import ExpirySweeper
+
+
+def _sql(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect()))
+
+
+class Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class SweepDB:
+    """Hands out pre-baked batches of (job_id, company_id) rows per UPDATE."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return Result(self.batches.pop(0) if self.batches else [])
+
+    def commit(self):
+        self.commits += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _rows(n, company_id=None):
+    company_id = company_id or uuid.uuid4()
+    return [(uuid.uuid4(), company_id) for _ in range(n)]
+
+
+def test_close_expired_is_one_batched_skip_locked_update():
+    rows = _rows(2)
+    db = SweepDB([rows])
+    assert repo.close_expired_job_listings(db, batch_size=50) == rows
+    assert db.commits == 1
+
+    sql = _sql(db.statements[0])
+    assert sql.startswith("UPDATE job_postings SET status=")
+    assert "updated_at=now()" in sql
+    assert "job_postings.expires_at < LOCALTIMESTAMP" in sql
+    assert "ORDER BY job_postings.expires_at" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "RETURNING job_postings.job_id, job_postings.company_id" in sql
+    assert db.statements[0].compile().params["param_1"] == 50
+
+
+class RecordingQuery:
+    def __init__(self):
+        self.filters = []
+
+    def join(self, *args, **kwargs):
+        return self
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        self.filters.extend(args)
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def all(self):
+        return []
+
+
+LIVE = "job_postings.expires_at IS NULL OR job_postings.expires_at > LOCALTIMESTAMP"
+
+
+def test_feed_filters_hide_expired_rows_only_from_the_open_feed():
+    assert [_sql(f) for f in repo._apply_feed_filters(None, RecordingQuery()).filters] == [LIVE]
+    opened = [_sql(f) for f in repo._apply_feed_filters(None, RecordingQuery(), status="open").filters]
+    assert opened[0] == LIVE and len(opened) == 2
+    closed = [_sql(f) for f in repo._apply_feed_filters(None, RecordingQuery(), status="closed").filters]
+    assert closed == ["job_postings.status = %(status_1)s"]
+
+
+def test_closed_feed_lists_postings_the_sweeper_closed():
+    class DB:
+        query_ = RecordingQuery()
+
+        def query(self, *args):
+            return self.query_
+
+    db = DB()
+    repo.list_job_listings_paged(db, status="closed")
+    sql = " ".join(_sql(f) for f in db.query_.filters)
+    assert "expires_at" not in sql and "job_postings.status = " in sql
+
+
+def test_controller_sweeps_until_a_short_batch_and_invalidates(monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(cache, "invalidate", lambda *tags: invalidated.extend(tags))
+    stale = []
+    monkeypatch.setattr(ctrl, "get_skill_match_index", lambda: type("I", (), {"mark_stale": lambda s: stale.append("skills")})())
+    monkeypatch.setattr(ctrl, "get_recommender", lambda: type("R", (), {"notify_changed": lambda s: stale.append("recommender")})())
+
+    company_id = uuid.uuid4()
+    batches = [_rows(3, company_id), _rows(3, company_id), _rows(1, company_id)]
+    db = SweepDB(batches)
+    assert ctrl.close_expired_job_listings_controller(db, batch_size=3, max_batches=10) == 7
+    assert len(db.statements) == 3 and db.commits == 3
+
+    assert invalidated[0] == "feed"
+    assert set(invalidated[1:]) == {f"company:{company_id}"} | {f"job:{job_id}" for batch in batches for job_id, _ in batch}
+    assert stale == ["skills", "recommender"]
+
+
+def test_controller_stops_at_max_batches_and_skips_invalidation_when_idle(monkeypatch):
+    db = SweepDB([_rows(2), _rows(2), _rows(2)])
+    assert ctrl.close_expired_job_listings_controller(db, batch_size=2, max_batches=2) == 4
+    assert len(db.statements) == 2
+
+    called = []
+    monkeypatch.setattr(ctrl, "get_recommender", lambda: called.append(1))
+    assert ctrl.close_expired_job_listings_controller(SweepDB([]), batch_size=2) == 0
+    assert called == []
+
+
+def test_sweeper_thread_runs_immediately_and_stops():
+    ran = threading.Event()
+    sweeper = ExpirySweeper(interval_seconds=60)
+    sweeper.sweep = lambda session_factory: ran.set()
+
+    sweeper.start(lambda: SweepDB([]))
+    assert ran.wait(2)
+    sweeper.stop()
+    assert sweeper._worker is None
@@ -0,0 +1,77 @@
+# tests/repository/test_job_listing_export.py
+
+from datetime import datetime
+import types
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.core.config import settings
+from app.repository import job_listing as repo
+
+
+class StreamingQuery(Query):
+    """Session-less ORM query that records how it would be executed."""
+
+    def __iter__(self):
+        self.db.yield_per = self.load_options._yield_per
+        self.db.sql = str(self.statement.compile(dialect=postgresql.dialect()))
+        return iter(self.db.rows)
+
+    def all(self):
+        self.db.sql = str(self.statement.compile(dialect=postgresql.dialect()))
+        return self.db.rows
+
+
+class FakeDB:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.yield_per = None
+        self.sql = None
+
+    def query(self, *entities):
+        StreamingQuery.db = self
+        return StreamingQuery(entities)
+
+
+def _job(i):
+    return types.SimpleNamespace(
+        job_id=f"j{i}", company_id="c1", recruiter_id="r1", title=f"T{i}", description="d", requirements="r",
+        skills_required=None, location="L", experience_level=None, job_type="internship", salary_range=None,
+        expires_at=None, status="open", posted_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1),
+    )
+
+
+def test_iter_job_listings_streams_with_yield_per():
+    db = FakeDB(rows=[(_job(i), "Acme") for i in range(3)])
+    out = repo.iter_job_listings(db, company_id="c1", fields=("job_id", "title"), batch_size=250)
+
+    # nothing is executed until the generator is consumed
+    assert db.sql is None
+    assert list(out) == [{"job_id": f"j{i}", "title": f"T{i}"} for i in range(3)]
+    assert db.yield_per == 250
+    assert "job_postings.description" not in db.sql.split(" FROM ")[0]
+    assert "ORDER BY job_postings.posted_at DESC, job_postings.job_id DESC" in db.sql
+    assert "LIMIT" not in db.sql
+
+
+def test_list_job_listings_without_limit_is_capped():
+    db = FakeDB()
+    repo.list_job_listings(db)
+    assert "LIMIT" in db.sql
+
+    captured = {}
+
+    class Capped(StreamingQuery):
+        def limit(self, n):
+            captured["limit"] = n
+            return super().limit(n)
+
+    db.query = lambda *entities: Capped(entities)
+    StreamingQuery.db = db
+    repo.list_job_listings(db)
+    assert captured["limit"] == settings.JOB_LISTINGS_MAX_LIMIT
+    repo.list_job_listings(db, limit=10_000)
+    assert captured["limit"] == settings.JOB_LISTINGS_MAX_LIMIT
+    repo.list_job_listings(db, limit=5)
+    assert captured["limit"] == 5
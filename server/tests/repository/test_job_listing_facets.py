@@ -0,0 +1,116 @@
+# tests/repository/test_job_listing_facets.py
+
+from collections import namedtuple
+
+from sqlalchemy.dialects import postgresql
+
+from app.controllers import job_listing as ctrl
+from app.lib import cache
+from app.repository import job_listing as repo
+from app.schemas.job_listing import JobListingsQuery
+
+
+def _sql(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect()))
+
+
+Row = namedtuple("Row", "job_type experience_level location grouping count")
+
+
+class GroupingQuery:
+    def __init__(self, rows):
+        self._rows = rows
+        self.columns = []
+        self.filters = []
+        self.group_bys = []
+
+    def filter(self, *args, **kwargs):
+        self.filters.extend(args)
+        return self
+
+    def group_by(self, *args):
+        self.group_bys.extend(args)
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class FakeDB:
+    def __init__(self, rows=None):
+        self.queries = 0
+        self.last_query = GroupingQuery(rows or [])
+
+    def query(self, *cols):
+        self.queries += 1
+        self.last_query.columns = list(cols)
+        return self.last_query
+
+
+ROWS = [
+    Row("internship", None, None, 0b011, 7),
+    Row("full-time", None, None, 0b011, 3),
+    Row(None, "fresher", None, 0b101, 6),
+    Row(None, None, None, 0b101, 4),  # postings without an experience level
+    Row(None, None, "Pune", 0b110, 2),
+    Row(None, None, "Bangalore", 0b110, 8),
+    Row(None, None, None, 0b111, 10),
+]
+
+
+def test_facets_come_from_one_grouping_sets_query():
+    db = FakeDB(ROWS)
+    result = repo.job_listing_facet_counts(db, job_type="internship", status="open")
+
+    assert db.queries == 1
+    group_by = _sql(db.last_query.group_bys[0])
+    assert group_by == (
+        "GROUPING SETS(job_postings.job_type, job_postings.experience_level, job_postings.location, ())"
+    )
+    assert "grouping(job_postings.job_type, job_postings.experience_level, job_postings.location)" in _sql(
+        db.last_query.columns[3]
+    )
+    # job_type, status, and the not-yet-expired filter shared with the feed
+    assert len(db.last_query.filters) == 3
+    assert "expires_at > LOCALTIMESTAMP" in _sql(db.last_query.filters[0])
+
+    assert result["total"] == 10
+    assert result["facets"]["job_type"] == [
+        {"value": "internship", "count": 7},
+        {"value": "full-time", "count": 3},
+    ]
+    assert result["facets"]["experience_level"] == [{"value": "fresher", "count": 6}]
+    assert [v["value"] for v in result["facets"]["location"]] == ["Bangalore", "Pune"]
+
+
+def test_facets_keep_most_common_values():
+    rows = [Row(None, None, f"City {i}", 0b110, i) for i in range(1, 30)] + [Row(None, None, None, 0b111, 435)]
+    result = repo.job_listing_facet_counts(FakeDB(rows), max_values=5)
+    assert [v["count"] for v in result["facets"]["location"]] == [29, 28, 27, 26, 25]
+
+
+def test_facets_search_term_filters_on_search_vector():
+    db = FakeDB([])
+    result = repo.job_listing_facet_counts(db, q="python")
+    assert "@@ websearch_to_tsquery" in _sql(db.last_query.filters[-1])
+    assert result == {"total": 0, "facets": {"job_type": [], "experience_level": [], "location": []}}
+
+
+def test_facets_controller_caches_ignoring_pagination(monkeypatch):
+    monkeypatch.setattr(cache, "_caches", {})
+    calls = []
+    monkeypatch.setattr(
+        repo, "job_listing_facet_counts", lambda db, **kw: calls.append(kw) or {"total": 1, "facets": {}}
+    )
+
+    first = ctrl.job_listing_facets_controller(None, query=JobListingsQuery(location="Pune", limit=10))
+    second = ctrl.job_listing_facets_controller(
+        None, query=JobListingsQuery(location=" pune ", limit=50, cursor="x", sort_order="asc")
+    )
+    assert first == second == {"total": 1, "facets": {}}
+    assert len(calls) == 1
+
+    # job writes invalidate the feed but facets are allowed to lag until the TTL expires
+    cache.invalidate("feed")
+    ctrl.job_listing_facets_controller(None, query=JobListingsQuery(location="Pune"))
+    assert len(calls) == 1
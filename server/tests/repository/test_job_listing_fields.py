@@ -0,0 +1,102 @@
+# tests/repository/test_job_listing_fields.py
+
+from datetime import datetime
+import types
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.controllers import job_listing as ctrl
+from app.repository import job_listing as repo
+from app.schemas.job_listing import PagedJobListingsResponse
+
+
+class CapturingQuery(Query):
+    """A real (session-less) ORM query that records the SELECT it would run."""
+
+    def all(self):
+        self.db.statements.append(str(self.statement.compile(dialect=postgresql.dialect())))
+        return self.db.rows
+
+
+class FakeDB:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.statements = []
+
+    def query(self, *entities):
+        qy = CapturingQuery(entities)
+        CapturingQuery.db = self
+        return qy
+
+
+def _job(**overrides):
+    data = dict(
+        job_id="123e4567-e89b-12d3-a456-426614174000", company_id="c1", recruiter_id="r1", title="Python Intern",
+        description="long text", requirements="more text", skills_required="python", location="Pune",
+        experience_level=None, job_type="internship", salary_range=None, expires_at=None, status="open",
+        posted_at=datetime(2024, 1, 2), updated_at=datetime(2024, 1, 3),
+    )
+    data.update(overrides)
+    return types.SimpleNamespace(**data)
+
+
+def _selected_columns(sql: str) -> str:
+    return sql.split(" FROM ")[0]
+
+
+def test_full_listing_selects_text_columns():
+    db = FakeDB()
+    repo.list_job_listings_paged(db)
+    assert "job_postings.description" in _selected_columns(db.statements[0])
+
+
+def test_summary_view_prunes_text_columns():
+    db = FakeDB(rows=[(_job(), "Acme")])
+    items, _ = repo.list_job_listings_paged(db, fields=repo.SUMMARY_FIELDS)
+
+    columns = _selected_columns(db.statements[0])
+    assert "job_postings.description" not in columns
+    assert "job_postings.requirements" not in columns
+    assert "job_postings.title" in columns and "companies.name" in columns
+    assert set(items[0]) == set(repo.SUMMARY_FIELDS)
+
+
+def test_sparse_fields_still_load_the_cursor_column():
+    rows = [(_job(job_id=f"123e4567-e89b-12d3-a456-42661417400{i}"), "Acme") for i in range(3)]
+    db = FakeDB(rows=rows)
+    items, cursor = repo.list_job_listings_paged(db, fields=("job_id", "title"), sort_by="updated_at", limit=2)
+
+    columns = _selected_columns(db.statements[0])
+    assert "job_postings.updated_at" in columns and "job_postings.location" not in columns
+    assert items == [{"job_id": r[0].job_id, "title": "Python Intern"} for r in rows[:2]]
+    assert cursor == repo._encode_cursor(datetime(2024, 1, 3), rows[1][0].job_id)
+
+
+def test_list_job_listings_accepts_fields():
+    db = FakeDB(rows=[(_job(), "Acme")])
+    out = repo.list_job_listings(db, fields=("job_id", "company_name"))
+    assert "job_postings.description" not in _selected_columns(db.statements[0])
+    assert out == [{"job_id": "123e4567-e89b-12d3-a456-426614174000", "company_name": "Acme"}]
+
+
+def test_resolve_fields():
+    assert ctrl._resolve_fields() is None
+    assert ctrl._resolve_fields("summary") == repo.SUMMARY_FIELDS
+    # explicit fields win over view; job_id is always included
+    assert ctrl._resolve_fields("summary", "title, location,title") == ("job_id", "title", "location")
+    with pytest.raises(HTTPException) as exc:
+        ctrl._resolve_fields(fields="title,password_hash")
+    assert exc.value.status_code == 400
+
+
+def test_response_model_serializes_only_requested_fields():
+    job = _job(company_id="123e4567-e89b-12d3-a456-426614174001")
+    summary = repo._to_response_dict(job, company_name="Acme", fields=repo.SUMMARY_FIELDS)
+    sparse = {"job_id": "123e4567-e89b-12d3-a456-426614174000", "title": "Python Intern"}
+    body = PagedJobListingsResponse(items=[summary, sparse]).model_dump(mode="json")
+
+    assert "description" not in body["items"][0]
+    assert body["items"][1] == sparse
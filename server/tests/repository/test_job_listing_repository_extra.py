@@ -58,13 +58,14 @@ def _job(ns_kwargs):
     return types.SimpleNamespace(**ns_kwargs)
 
 
-def test_get_job_listing_none_when_missing():
-    db = FakeDB()
+def test_get_job_listing_none_when_missing(lookups):
+    db = lookups(FakeDB())
     db.set_query(result=None)
     assert repo.get_job_listing(db, job_id="jid") is None
+    assert db.lookups == [(repo.JOB_WITH_COMPANY_NAME_BY_ID, {"job_id": "jid"})]
 
 
-def test_get_job_listing_maps_response():
+def test_get_job_listing_maps_response(lookups):
     job = _job(
         {
             "job_id": "j1",
@@ -84,10 +85,11 @@ def test_get_job_listing_maps_response():
             "updated_at": datetime(2024, 1, 2),
         }
     )
-    db = FakeDB()
+    db = lookups(FakeDB())
     db.set_query(result=(job, "Acme Inc"))
 
     out = repo.get_job_listing(db, job_id="j1")
+    assert db.lookups == [(repo.JOB_WITH_COMPANY_NAME_BY_ID, {"job_id": "j1"})]
     assert out["job_id"] == "j1"
     assert out["company_name"] == "Acme Inc"
     assert out["title"] == "Title"
@@ -61,11 +61,12 @@ def _job(**kw):
     return types.SimpleNamespace(**kw)
 
 
-def test_get_job_listing_model_passthrough():
-    db = FakeDB()
+def test_get_job_listing_model_passthrough(lookups):
+    db = lookups(FakeDB())
     row = _job(job_id="jid")
     db.set_query(result=row)
     assert repo.get_job_listing_model(db, job_id="jid") is row
+    assert db.lookups == [(repo.JOB_BY_ID, {"job_id": "jid"})]
 
 
 def test_list_job_listings_paged_filters_experience_level():
@@ -0,0 +1,227 @@
+# tests/repository/test_job_listing_search.py
+
+from collections import namedtuple
+from datetime import datetime
+import types
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repository import job_listing as repo
+
+
+def _sql(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect()))
+
+
+class RecordingQuery:
+    def __init__(self, rows=None):
+        self._rows = rows or []
+        self._limit = None
+        self.filters = []
+        self.order_bys = []
+        self.columns = []
+
+    def join(self, *args, **kwargs):
+        return self
+
+    def filter(self, *args, **kwargs):
+        self.filters.extend(args)
+        return self
+
+    def add_columns(self, *cols):
+        self.columns.extend(cols)
+        return self
+
+    def order_by(self, *args, **kwargs):
+        self.order_bys.extend(args)
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def all(self):
+        if self._limit is not None:
+            return self._rows[: self._limit]
+        return self._rows
+
+
+class FakeDB:
+    def __init__(self, rows=None):
+        self.last_query = RecordingQuery(rows=rows)
+
+    def query(self, *args, **kwargs):
+        return self.last_query
+
+
+def _job(job_id, posted_at):
+    return types.SimpleNamespace(
+        job_id=job_id, company_id="c1", recruiter_id="r1", title="Python Intern", description="d",
+        requirements="r", skills_required="python", location="Pune", experience_level=None,
+        job_type="internship", salary_range=None, expires_at=None, status="open",
+        posted_at=posted_at, updated_at=posted_at,
+    )
+
+
+RankedRow = namedtuple("RankedRow", ["JobPosting", "company_name", "rank", "snippet"])
+
+
+def test_rank_cursor_roundtrip_is_exact():
+    rank = 0.1 + 0.2  # not representable exactly as a short decimal
+    cursor = repo._encode_rank_cursor(rank, "123e4567-e89b-12d3-a456-426614174000")
+    decoded = repo._decode_rank_cursor(cursor)
+    assert decoded is not None
+    assert decoded[0] == rank
+    assert str(decoded[1]) == "123e4567-e89b-12d3-a456-426614174000"
+
+
+def test_rank_cursor_rejects_timestamp_cursor():
+    ts_cursor = repo._encode_cursor(datetime(2024, 1, 1), "123e4567-e89b-12d3-a456-426614174000")
+    assert repo._decode_rank_cursor(ts_cursor) is None
+    assert repo._decode_rank_cursor(None) is None
+
+
+def test_q_uses_tsquery_match_instead_of_ilike():
+    db = FakeDB()
+    repo.list_job_listings_paged(db, q="python developer", limit=5)
+
+    sql = " ".join(_sql(f) for f in db.last_query.filters)
+    assert "@@ websearch_to_tsquery" in sql
+    assert "ILIKE" not in sql.upper()
+    # no rank column unless relevance ordering is requested
+    assert db.last_query.columns == []
+
+
+def test_relevance_sort_orders_by_rank_and_encodes_rank_cursor():
+    rows = [
+        RankedRow(_job("123e4567-e89b-12d3-a456-426614174003", datetime(2024, 1, 3)), "Acme", 0.9, "<mark>Python</mark>"),
+        RankedRow(_job("123e4567-e89b-12d3-a456-426614174002", datetime(2024, 1, 2)), "Acme", 0.5, None),
+        RankedRow(_job("123e4567-e89b-12d3-a456-426614174001", datetime(2024, 1, 1)), "Acme", 0.1, None),
+    ]
+    db = FakeDB(rows=rows)
+    items, cursor = repo.list_job_listings_paged(db, q="python", sort_by="relevance", limit=2, snippets=True)
+
+    assert [i["job_id"] for i in items] == [rows[0][0].job_id, rows[1][0].job_id]
+    assert items[0]["snippet"] == "<mark>Python</mark>"
+    assert "ts_rank_cd" in _sql(db.last_query.order_bys[0])
+    assert any("ts_headline" in _sql(c) for c in db.last_query.columns)
+
+    rank, jid = repo._decode_rank_cursor(cursor)
+    assert rank == 0.5 and str(jid) == rows[1][0].job_id
+
+
+def test_relevance_cursor_filters_on_rank():
+    db = FakeDB()
+    cursor = repo._encode_rank_cursor(0.25, "123e4567-e89b-12d3-a456-426614174000")
+    repo.list_job_listings_paged(db, q="python", sort_by="relevance", cursor=cursor)
+
+    sql = " ".join(_sql(f) for f in db.last_query.filters)
+    assert "ts_rank_cd" in sql
+
+
+def test_relevance_without_q_falls_back_to_posted_at():
+    db = FakeDB()
+    repo.list_job_listings_paged(db, sort_by="relevance")
+
+    assert db.last_query.columns == []
+    assert "posted_at" in _sql(db.last_query.order_bys[0])
+
+
+class FakeSearchBackend:
+    def __init__(self, hits):
+        self.hits = hits
+
+    def search(self, q):
+        return None if self.hits is None else list(self.hits)
+
+
+class ChunkQuery(RecordingQuery):
+    """Returns only the rows whose job_id is in the last IN() filter."""
+
+    def __init__(self, rows_by_id):
+        super().__init__()
+        self._rows_by_id = rows_by_id
+        self._ids = None
+
+    def filter(self, *args, **kwargs):
+        for arg in args:
+            right = getattr(arg, "right", None)
+            value = getattr(right, "value", None)
+            if isinstance(value, (list, tuple)):
+                self._ids = list(value)
+        return self
+
+    def all(self):
+        return [self._rows_by_id[i] for i in self._ids if i in self._rows_by_id]
+
+
+def test_memory_backend_relevance_pages_in_rank_order(monkeypatch):
+    ids = [f"123e4567-e89b-12d3-a456-42661417400{i}" for i in range(4)]
+    hits = [(3.0, ids[3]), (2.0, ids[2]), (1.5, ids[1]), (1.0, ids[0])]
+    # ids[2] is excluded by the SQL filters (absent from the DB result)
+    rows_by_id = {jid: (_job(jid, datetime(2024, 1, 1)), "Acme") for jid in (ids[3], ids[1], ids[0])}
+    monkeypatch.setattr(repo, "get_search_backend", lambda: FakeSearchBackend(hits))
+
+    class DB:
+        def query(self, *args, **kwargs):
+            return ChunkQuery(rows_by_id)
+
+    items, cursor = repo.list_job_listings_paged(DB(), q="python", sort_by="relevance", limit=1)
+    assert [i["job_id"] for i in items] == [ids[3]]
+
+    items, cursor = repo.list_job_listings_paged(DB(), q="python", sort_by="relevance", limit=1, cursor=cursor)
+    assert [i["job_id"] for i in items] == [ids[1]]
+    assert repo._decode_rank_cursor(cursor)[0] == 1.5
+
+    items, cursor = repo.list_job_listings_paged(DB(), q="python", sort_by="relevance", limit=1, cursor=cursor)
+    assert [i["job_id"] for i in items] == [ids[0]] and cursor is None
+
+
+def test_memory_backend_without_hits_short_circuits(monkeypatch):
+    monkeypatch.setattr(repo, "get_search_backend", lambda: FakeSearchBackend([]))
+    db = FakeDB()
+    assert repo.list_job_listings_paged(db, q="nothing", sort_by="relevance") == ([], None)
+
+
+def test_memory_backend_still_loading_falls_back_to_tsquery(monkeypatch):
+    monkeypatch.setattr(repo, "get_search_backend", lambda: FakeSearchBackend(None))
+    db = FakeDB()
+    repo.list_job_listings_paged(db, q="python", sort_by="relevance")
+    sql = " ".join(_sql(f) for f in db.last_query.filters)
+    assert "websearch_to_tsquery" in sql
+
+
+def test_memory_backend_leaves_date_sorts_to_tsquery(monkeypatch):
+    # the BM25 hits are capped, so filtering a date-sorted feed by them would drop matches
+    backend = FakeSearchBackend([(1.0, "123e4567-e89b-12d3-a456-426614174000")])
+    backend.search = lambda q: pytest.fail("BM25 used for a date sort")
+    monkeypatch.setattr(repo, "get_search_backend", lambda: backend)
+    db = FakeDB()
+    repo.list_job_listings_paged(db, q="python")
+
+    sql = " ".join(_sql(f) for f in db.last_query.filters)
+    assert "job_postings.job_id IN" not in sql
+    assert "websearch_to_tsquery" in sql
+
+
+SnippetRow = namedtuple("SnippetRow", ["JobPosting", "company_name", "snippet"])
+
+
+def test_memory_backend_returns_the_same_snippets_as_the_sql_path(monkeypatch):
+    jid = "123e4567-e89b-12d3-a456-426614174000"
+    monkeypatch.setattr(repo, "get_search_backend", lambda: FakeSearchBackend([(1.0, jid)]))
+    row = SnippetRow(_job(jid, datetime(2024, 1, 1)), "Acme", "<mark>Python</mark> intern")
+
+    query = ChunkQuery({jid: row})
+
+    class DB:
+        def query(self, *args, **kwargs):
+            return query
+
+    items, _ = repo.list_job_listings_paged(DB(), q="python", sort_by="relevance", snippets=True)
+    assert items[0]["snippet"] == "<mark>Python</mark> intern"
+    [column] = query.columns
+    assert "ts_headline" in _sql(column) and "websearch_to_tsquery" in _sql(column)
+    # rows still come from the BM25 hits, not a tsquery match
+    assert "@@" not in " ".join(_sql(f) for f in query.filters)
@@ -0,0 +1,104 @@
+# tests/repository/test_job_listing_totals.py
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query
+
+from app.controllers import job_listing as ctrl
+from app.lib import cache
+from app.repository import job_listing as repo
+from app.schemas.job_listing import JobListingsQuery
+
+
+def _sql(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect()))
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeDB:
+    """Builds real Query objects (so the SQL can be inspected) and answers scalar()/execute()."""
+
+    def __init__(self, count=0, plan_rows=0):
+        self.count = count
+        self.plan_rows = plan_rows
+        self.queries = []
+        self.executed = []
+
+    def query(self, *cols):
+        db = self
+
+        class Q(Query):
+            def scalar(self):
+                db.queries.append(self)
+                return db.count
+
+        return Q(list(cols))
+
+    def execute(self, stmt, *args):
+        self.executed.append(stmt)
+        return FakeResult([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": self.plan_rows}}])
+
+
+def test_exact_count_applies_feed_filters():
+    db = FakeDB(count=42)
+    assert repo.count_job_listings(db, job_type="internship", location="pune", q="python") == 42
+    sql = _sql(db.queries[0].statement)
+    assert sql.startswith("SELECT count(job_postings.job_id) AS count_1")
+    assert "job_postings.expires_at > LOCALTIMESTAMP" in sql
+    assert "job_postings.job_type = %(job_type_1)s" in sql
+    assert "job_postings.location ILIKE" in sql
+    assert "@@ websearch_to_tsquery" in sql
+    assert "ORDER BY" not in sql and "LIMIT" not in sql
+
+
+def test_estimate_reads_the_planner_row_count():
+    db = FakeDB(plan_rows=12400)
+    assert repo.estimate_job_listings(db, job_type="internship", status="open") == 12400
+    sql = _sql(db.executed[0])
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT job_postings.job_id")
+    assert "job_postings.status = %(status_1)s" in sql
+
+
+def test_totals_count_every_tsquery_match_with_the_memory_backend(monkeypatch):
+    # the in-process index's hits are capped, so they never decide a total
+    backend = type("B", (), {"search": lambda self, q: []})()
+    monkeypatch.setattr(repo, "get_search_backend", lambda: backend)
+    db = FakeDB(count=12000, plan_rows=12000)
+    assert repo.count_job_listings(db, q="python") == 12000
+    assert repo.estimate_job_listings(db, q="python") == 12000
+    assert "@@ websearch_to_tsquery" in _sql(db.queries[0].statement)
+
+
+def test_total_controller_caches_per_mode_ignoring_pagination(monkeypatch):
+    monkeypatch.setattr(cache, "_caches", {})
+    calls = []
+    monkeypatch.setattr(repo, "count_job_listings", lambda db, **kw: calls.append(("exact", kw)) or 7)
+    monkeypatch.setattr(repo, "estimate_job_listings", lambda db, **kw: calls.append(("estimate", kw)) or 9)
+
+    assert ctrl.job_listing_total_controller(None, query=JobListingsQuery(location="Pune")) is None
+    assert calls == []
+
+    first = JobListingsQuery(location="Pune", include_total="exact", limit=10)
+    later_page = JobListingsQuery(location=" pune ", include_total="exact", limit=10, cursor="x")
+    assert ctrl.job_listing_total_controller(None, query=first) == 7
+    assert ctrl.job_listing_total_controller(None, query=later_page) == 7
+    assert ctrl.job_listing_total_controller(None, query=JobListingsQuery(location="Pune", include_total="estimate")) == 9
+    assert [mode for mode, _ in calls] == ["exact", "estimate"]
+    assert calls[0][1]["location"] == "Pune" and "limit" not in calls[0][1]
+
+    # job writes only bump "feed"; totals ride out their TTL like facets
+    cache.invalidate("feed")
+    ctrl.job_listing_total_controller(None, query=first)
+    assert len(calls) == 2
+
+
+def test_feed_cache_key_ignores_include_total():
+    plain = JobListingsQuery(location="Pune")
+    with_total = JobListingsQuery(location="Pune", include_total="estimate")
+    assert ctrl._feed_cache_key(plain, 20, None) == ctrl._feed_cache_key(with_total, 20, None)
@@ -0,0 +1,154 @@
+# tests/repository/test_job_listing_trigram.py
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import JobPosting
+from app.db.session import Base
+from app.repository import job_listing as repo
+
+
+def _sql(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class RecordingQuery:
+    def __init__(self):
+        self.filters = []
+
+    def join(self, *args, **kwargs):
+        return self
+
+    def filter(self, *args, **kwargs):
+        self.filters.extend(args)
+        return self
+
+    def order_by(self, *args, **kwargs):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def all(self):
+        return []
+
+
+class FakeDB:
+    def __init__(self):
+        self.last_query = RecordingQuery()
+        self.executed = []
+
+    def query(self, *args, **kwargs):
+        return self.last_query
+
+    def execute(self, stmt):
+        self.executed.append(stmt)
+
+
+def test_contains_filter_escapes_like_wildcards():
+    expr = repo._text_filter(JobPosting.location, "100%_remote", fuzzy=False)
+    assert expr.right.value == "%100\\%\\_remote%"
+    assert "ILIKE" in _sql(expr) and "ESCAPE" in _sql(expr)
+
+
+def test_fuzzy_filter_uses_word_similarity_operator_on_bare_column():
+    sql = _sql(repo._text_filter(JobPosting.location, "Bangalor", fuzzy=True))
+    assert sql == "'Bangalor' <%% job_postings.location"
+
+
+def test_fuzzy_mode_sets_transaction_local_threshold():
+    db = FakeDB()
+    repo.list_job_listings_paged(db, location="Bangalor", title="Pyhton", match="fuzzy")
+
+    assert len(db.executed) == 1
+    assert "set_config" in _sql(db.executed[0])
+    filters = " ".join(_sql(f) for f in db.last_query.filters)
+    assert "<%% job_postings.location" in filters and "<%% job_postings.title" in filters
+
+
+def test_contains_mode_does_not_touch_threshold():
+    db = FakeDB()
+    repo.list_job_listings_paged(db, location="Pune")
+    assert db.executed == []
+
+
+# --- EXPLAIN checks against a real Postgres (set TEST_DATABASE_URL to run) ---
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+pg = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+CITIES = ["Bangalore", "Pune", "Mumbai", "Delhi", "Hyderabad", "Chennai", "Kolkata", "Noida", "Jaipur", "Indore"]
+
+
+@pytest.fixture(scope="module")
+def pg_conn():
+    engine = create_engine(TEST_DATABASE_URL)
+    schema = f"trgm_test_{uuid.uuid4().hex[:8]}"
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+        conn.execute(text(f"SET search_path TO {schema}, public"))
+        Base.metadata.create_all(conn)
+        conn.execute(text(
+            "INSERT INTO users (user_id, email, password_hash, first_name, last_name, user_type, created_at, updated_at) "
+            "VALUES ('00000000-0000-0000-0000-000000000001', 'r@example.com', 'x', 'R', 'R', 'recruiter', now(), now())"
+        ))
+        conn.execute(text(
+            "INSERT INTO companies (company_id, name, created_at, updated_at) "
+            "VALUES ('00000000-0000-0000-0000-000000000002', 'Acme', now(), now())"
+        ))
+        conn.execute(text(
+            "INSERT INTO recruiters (recruiter_id, company_id, updated_at) "
+            "VALUES ('00000000-0000-0000-0000-000000000001', '00000000-0000-0000-0000-000000000002', now())"
+        ))
+        conn.execute(
+            text(
+                "INSERT INTO job_postings (job_id, company_id, recruiter_id, title, description, requirements, location, "
+                "job_type, posted_at, status, updated_at) "
+                "SELECT gen_random_uuid(), '00000000-0000-0000-0000-000000000002', '00000000-0000-0000-0000-000000000001', "
+                "'Role ' || g, 'desc', 'req', (:cities)[1 + g % 10] || ', India', 'internship', now(), 'open', now() "
+                "FROM generate_series(1, 20000) AS g"
+            ),
+            {"cities": CITIES},
+        )
+        conn.execute(text("ANALYZE job_postings"))
+        # the tiny fixture table would otherwise be cheapest to seq-scan; we only assert the index is usable
+        conn.execute(text("SET enable_seqscan = off"))
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            conn.commit()
+    engine.dispose()
+
+
+def _plan(conn, where) -> str:
+    compiled = select(JobPosting.job_id).where(where).compile(dialect=conn.dialect)
+    return "\n".join(r[0] for r in conn.exec_driver_sql(f"EXPLAIN {compiled}", compiled.params))
+
+
+@pg
+def test_explain_contains_location_uses_trigram_index(pg_conn):
+    plan = _plan(pg_conn, repo._text_filter(JobPosting.location, "ngalor", fuzzy=False))
+    assert "ix_job_postings_location_trgm" in plan
+
+
+@pg
+def test_explain_fuzzy_location_uses_trigram_index_and_matches_typos(pg_conn):
+    pg_conn.execute(text("SELECT set_config('pg_trgm.word_similarity_threshold', '0.6', false)"))
+    where = repo._text_filter(JobPosting.location, "Bangalor", fuzzy=True)
+    assert "ix_job_postings_location_trgm" in _plan(pg_conn, where)
+
+    rows = pg_conn.execute(select(JobPosting.location).where(where).limit(5)).scalars().all()
+    assert rows and all(r.startswith("Bangalore") for r in rows)
+
+
+@pg
+def test_explain_fuzzy_title_uses_trigram_index(pg_conn):
+    where = repo._text_filter(JobPosting.title, "Role 1234", fuzzy=True)
+    assert "ix_job_postings_title_trgm" in _plan(pg_conn, where)
@@ -0,0 +1,132 @@
+# tests/repository/test_saved_search_repository.py
+
+import types
+import uuid
+
+from sqlalchemy.dialects import postgresql
+
+from app.repository import saved_search as repo
+
+
+def _sql(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect()))
+
+
+class Result:
+    def __init__(self, value=None, rows=(), rowcount=0):
+        self.value = value
+        self.rows = list(rows)
+        self.rowcount = rowcount
+
+    def scalar(self):
+        return self.value
+
+    def all(self):
+        return self.rows
+
+
+class Query:
+    def __init__(self, first=None):
+        self._first = first
+        self.filters = []
+
+    def filter(self, *args):
+        self.filters.extend(args)
+        return self
+
+    def first(self):
+        return self._first
+
+
+class FakeDB:
+    def __init__(self, *, results=(), first=None):
+        self.results = list(results)
+        self.statements = []
+        self.added = []
+        self.commits = 0
+        self._first = first
+
+    def query(self, *cols):
+        return Query(self._first)
+
+    def execute(self, stmt, *args):
+        self.statements.append(stmt)
+        return self.results.pop(0) if self.results else Result()
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def commit(self):
+        self.commits += 1
+
+    def refresh(self, obj):
+        pass
+
+
+def test_create_files_search_under_a_query_lexeme():
+    db = FakeDB(results=[Result(["fastapi", "python"])])
+    search = repo.create_saved_search(
+        db,
+        applicant_id=uuid.uuid4(),
+        name="py",
+        filters={"q": "Python FastAPI", "job_type": "internship", "match": None, "status": "open"},
+    )
+    assert "to_tsvector" in _sql(db.statements[0])
+    assert search.anchor_key == "term:fastapi"
+    assert search.match == "contains" and search.job_type == "internship"
+    assert not hasattr(search, "status") and db.commits == 1
+
+
+def test_create_skips_lexeme_lookup_for_optional_terms():
+    db = FakeDB()
+    search = repo.create_saved_search(db, applicant_id=uuid.uuid4(), name=None, filters={"q": "python or java", "job_type": "contract"})
+    assert db.statements == []
+    assert search.anchor_key == "job_type:contract"
+
+
+def _job(**overrides):
+    job = dict(
+        job_id=uuid.uuid4(), company_id=uuid.uuid4(), location="Pune", title="Data Analyst",
+        job_type="internship", experience_level=None,
+    )
+    job.update(overrides)
+    return types.SimpleNamespace(**job)
+
+
+def test_percolate_checks_candidates_in_one_insert_select():
+    job = _job()
+    db = FakeDB(first=(job, ["analyst", "data", "pune"]), results=[Result(), Result(rowcount=3)])
+    assert repo.percolate_job_listing(db, job_id=job.job_id) == 3
+    assert db.commits == 1
+
+    # similarity threshold for fuzzy searches, then the insert
+    assert "set_config" in _sql(db.statements[0])
+    stmt = db.statements[1]
+    sql = _sql(stmt)
+    assert sql.startswith("INSERT INTO search_alerts (saved_search_id, applicant_id, job_id")
+    assert "ON CONFLICT (saved_search_id, job_id) DO NOTHING" in sql
+    assert "saved_searches.anchor_key IN" in sql
+    assert "job_postings.search_vector @@ websearch_to_tsquery" in sql
+    assert "saved_searches.location <%% job_postings.location" in sql
+    assert "job_postings.location ILIKE" in sql
+
+    keys = stmt.compile(dialect=postgresql.dialect()).params["anchor_key_1"]
+    assert "*" in keys and f"company:{job.company_id}" in keys and "term:analyst" in keys and "location:pun" in keys
+
+
+def test_percolate_ignores_postings_that_are_not_live():
+    db = FakeDB(first=None)
+    assert repo.percolate_job_listing(db, job_id=uuid.uuid4()) == 0
+    assert db.statements == [] and db.commits == 0
+
+
+def test_claim_alerts_is_a_skip_locked_update():
+    rows = [(2, uuid.uuid4(), uuid.uuid4(), None), (1, uuid.uuid4(), uuid.uuid4(), None)]
+    db = FakeDB(results=[Result(rows=rows)])
+    claimed = repo.claim_search_alerts(db, applicant_id=uuid.uuid4(), limit=10)
+    assert [row[0] for row in claimed] == [1, 2]
+    sql = _sql(db.statements[0])
+    assert sql.startswith("UPDATE search_alerts SET delivered_at=now()")
+    assert "search_alerts.delivered_at IS NULL ORDER BY search_alerts.alert_id" in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert db.commits == 1
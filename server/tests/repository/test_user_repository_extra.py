@@ -66,22 +66,25 @@ def test_create_user_success(monkeypatch):
     assert db.commits == 1 and db.refreshed == [created]
 
 
-def test_get_user_by_email_passthrough():
-    db = FakeDB()
+def test_get_user_by_email_passthrough(lookups):
+    db = lookups(FakeDB())
     row = types.SimpleNamespace(user_id="u1")
     db.set_query_result(result=row)
     assert repo.get_user_by_email(db, "x@example.com") is row
+    assert db.lookups == [(repo.USER_BY_EMAIL, {"email": "x@example.com"})]
 
 
-def test_get_user_by_id_passthrough():
-    db = FakeDB()
+def test_get_user_by_id_passthrough(lookups):
+    db = lookups(FakeDB())
     row = types.SimpleNamespace(user_id="u1")
     db.set_query_result(result=row)
     assert repo.get_user_by_id(db, "u1") is row
+    assert db.lookups == [(repo.USER_BY_ID, {"user_id": "u1"})]
 
 
-def test_get_applicant_by_user_id_passthrough():
-    db = FakeDB()
+def test_get_applicant_by_user_id_passthrough(lookups):
+    db = lookups(FakeDB())
     row = types.SimpleNamespace(applicant_id="u1")
     db.set_query_result(result=row)
     assert repo.get_applicant_by_user_id(db, "u1") is row
+    assert db.lookups == [(repo.APPLICANT_BY_USER_ID, {"user_id": "u1"})]
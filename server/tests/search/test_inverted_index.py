@@ -0,0 +1,94 @@
+# tests/search/test_inverted_index.py
+
+from datetime import datetime
+
+from app.search.inverted_index import InvertedIndex, tokenize
+
+
+def _doc(title="", description="", requirements="", skills_required=None):
+    return {
+        "title": title,
+        "description": description,
+        "requirements": requirements,
+        "skills_required": skills_required,
+    }
+
+
+def test_tokenize_keeps_tech_terms_and_drops_stopwords():
+    assert tokenize("Senior C++ and Node.js developer for the C# team") == [
+        "senior", "c++", "node.js", "developer", "c#", "team",
+    ]
+    assert tokenize(None) == []
+
+
+def test_search_requires_all_terms():
+    idx = InvertedIndex()
+    idx.add("a", _doc(title="Python developer", description="Django APIs"))
+    idx.add("b", _doc(title="Python data intern", description="pandas"))
+    idx.add("c", _doc(title="Java developer"))
+
+    assert {key for _, key in idx.search("python developer")} == {"a"}
+    assert {key for _, key in idx.search("developer")} == {"a", "c"}
+    assert idx.search("rust") == []
+
+
+def test_title_match_outranks_description_match():
+    idx = InvertedIndex()
+    idx.add("body", _doc(title="Backend intern", description="You will write some python scripts"))
+    idx.add("title", _doc(title="Python intern", description="Backend work"))
+
+    ranked = idx.search("python")
+    assert [key for _, key in ranked] == ["title", "body"]
+    assert ranked[0][0] > ranked[1][0]
+
+
+def test_top_k_limits_results():
+    idx = InvertedIndex()
+    for i in range(20):
+        idx.add(i, _doc(title="python " + "x" * i))
+    assert len(idx.search("python", k=5)) == 5
+
+
+def test_reindex_replaces_previous_terms():
+    idx = InvertedIndex()
+    idx.add("a", _doc(title="Python developer"))
+    idx.add("a", _doc(title="Go developer"))
+
+    assert idx.search("python") == []
+    assert [key for _, key in idx.search("go")] == ["a"]
+    assert len(idx) == 1 and idx.dead_docs == 1
+
+
+def test_compact_drops_tombstones_and_keeps_results():
+    idx = InvertedIndex()
+    idx.add("a", _doc(title="Python developer"))
+    idx.add("b", _doc(title="Python tester"))
+    idx.remove("a")
+    idx.compact()
+
+    assert idx.dead_docs == 0
+    assert [key for _, key in idx.search("python")] == ["b"]
+    assert "a" not in idx and "b" in idx
+
+
+def test_snapshot_roundtrip(tmp_path):
+    idx = InvertedIndex()
+    idx.add("a", _doc(title="Python developer"), updated_at=datetime(2024, 1, 1))
+    idx.add("b", _doc(title="Data analyst", skills_required="python,sql"), updated_at=datetime(2024, 1, 3))
+    idx.remove("a")
+    path = tmp_path / "index.pkl"
+
+    idx.save(path)
+    loaded = InvertedIndex.load(path)
+
+    assert loaded is not None
+    assert loaded.watermark == datetime(2024, 1, 3)
+    assert len(loaded) == 1
+    assert loaded.search("python") == idx.search("python")
+
+
+def test_load_missing_or_corrupt_snapshot_returns_none(tmp_path):
+    assert InvertedIndex.load(tmp_path / "missing.pkl") is None
+    bad = tmp_path / "bad.pkl"
+    bad.write_bytes(b"")
+    assert InvertedIndex.load(bad) is None
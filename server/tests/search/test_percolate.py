@@ -0,0 +1,82 @@
+# tests/search/test_percolate.py
+
+import random
+import uuid
+
+from app.search.percolate import ANY_KEY, anchor_key, has_required_terms, posting_keys
+
+
+COMPANY = uuid.uuid4()
+
+
+def _posting(**overrides):
+    job = {
+        "company_id": COMPANY,
+        "location": "Pune, Maharashtra",
+        "title": "Backend Developer Intern",
+        "job_type": "internship",
+        "experience_level": "fresher",
+        "lexemes": ["backend", "develop", "intern", "python", "fastapi", "pune"],
+    }
+    job.update(overrides)
+    return job
+
+
+def test_anchor_prefers_the_most_selective_predicate():
+    assert anchor_key(company_id=COMPANY, job_type="internship", q_lexemes=["python"]) == f"company:{COMPANY}"
+    assert anchor_key(job_type="internship", location="Pune", q_lexemes=["python", "fastapi"]) == "term:fastapi"
+    assert anchor_key(job_type="internship", location="Pune").startswith("location:")
+    assert anchor_key(title="Developer", experience_level="fresher").startswith("title:")
+    assert anchor_key(experience_level="fresher", job_type="internship") == "experience:fresher"
+    assert anchor_key(job_type="internship") == "job_type:internship"
+    assert anchor_key() == ANY_KEY
+
+
+def test_fuzzy_and_short_text_filters_are_never_anchors():
+    assert anchor_key(location="Pnue", match="fuzzy", job_type="contract") == "job_type:contract"
+    assert anchor_key(location="NY") == ANY_KEY
+
+
+def test_required_terms_exclude_or_and_negation():
+    assert has_required_terms("python intern")
+    assert has_required_terms('"data analyst" sql')
+    assert not has_required_terms("python or java")
+    assert not has_required_terms("python -java")
+    assert not has_required_terms("  ")
+    assert not has_required_terms(None)
+
+
+def test_matching_search_anchor_is_always_among_posting_keys():
+    job = _posting()
+    keys = set(posting_keys(**job))
+    searches = [
+        {"company_id": COMPANY},
+        {"q_lexemes": ["python", "intern"]},
+        {"location": "pune"},
+        {"location": "une, Ma"},
+        {"title": "developer int"},
+        {"experience_level": "fresher", "job_type": "internship"},
+        {"job_type": "internship"},
+        {},
+    ]
+    for search in searches:
+        assert anchor_key(**search) in keys, search
+
+
+def test_substring_anchor_is_a_necessary_condition():
+    rnd = random.Random(5)
+    location = "Bangalore, Karnataka (Hybrid)"
+    keys = set(posting_keys(**_posting(location=location)))
+    for _ in range(200):
+        i = rnd.randrange(len(location) - 3)
+        needle = location[i:i + rnd.randint(3, 10)]
+        assert anchor_key(location=needle.upper()) in keys
+
+    # a location that is not a substring picks an anchor the posting does not emit
+    assert anchor_key(location="Mumbai") not in keys
+
+
+def test_non_matching_postings_skip_the_search():
+    search = anchor_key(company_id=None, q_lexemes=["kotlin"], job_type="internship")
+    assert search not in posting_keys(**_posting())
+    assert search in posting_keys(**_posting(lexemes=["kotlin", "android"]))
@@ -0,0 +1,213 @@
+# tests/search/test_recommend.py
+
+import contextlib
+import random
+import threading
+import time
+import types
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from app.search.recommend import JobRecommender, TfidfJobMatrix, profile_term_counts
+
+
+def _job(job_id, title, description="", requirements="", status="open", updated_at=datetime(2024, 1, 1)):
+    return types.SimpleNamespace(
+        job_id=job_id, title=title, description=description, requirements=requirements,
+        status=status, updated_at=updated_at,
+    )
+
+
+JOBS = [
+    _job("py", "Python backend intern", "build fastapi services", "python sql"),
+    _job("fe", "Frontend intern", "react typescript ui work", "javascript css"),
+    _job("ds", "Data analyst", "pandas sql dashboards", "python excel"),
+    _job("mk", "Marketing associate", "social media campaigns", "communication"),
+]
+
+
+def _profile(**fields):
+    return profile_term_counts(types.SimpleNamespace(**fields))
+
+
+def test_profile_counts_flatten_jsonb_fields():
+    counts = _profile(
+        headline="Backend developer",
+        bio=None,
+        skills=["Python", "SQL"],
+        experience=[{"title": "Intern", "company": "Acme", "description": "fastapi apis"}],
+    )
+    assert counts["python"] == 3 and counts["backend"] == 2 and counts["fastapi"] == 1
+
+
+def test_rows_are_normalized_and_match_dense_product():
+    matrix = TfidfJobMatrix.build(JOBS, batch_size=3)
+    base = matrix.base
+    dense = np.zeros((len(base), len(matrix.idf)), dtype=np.float64)
+    for term in range(len(base.col_ptr) - 1):
+        lo, hi = base.col_ptr[term], base.col_ptr[term + 1]
+        dense[base.row_ids[lo:hi], term] = base.data[lo:hi]
+    assert np.allclose(np.linalg.norm(dense, axis=1), 1.0, atol=1e-5)
+
+    q_ids, q_weights = matrix.profile_vector(_profile(skills=["python", "sql"], headline="backend"))
+    q = np.zeros(len(matrix.idf))
+    q[q_ids] = q_weights
+    assert np.allclose(base.scores(q_ids, q_weights), dense @ q, atol=1e-5)
+
+
+def test_top_k_ranks_by_profile_similarity_and_excludes():
+    matrix = TfidfJobMatrix.build(JOBS)
+    counts = _profile(skills=["python", "sql", "fastapi"], headline="backend developer")
+
+    hits = matrix.top_k(counts, 2)
+    assert [job_id for _, job_id in hits] == ["py", "ds"]
+    assert hits[0][0] > hits[1][0] > 0
+
+    assert [job_id for _, job_id in matrix.top_k(counts, 2, exclude={"py"})] == ["ds"]
+    assert matrix.top_k(_profile(skills=["cobol"]), 5) == []
+
+
+def test_apply_changes_replaces_and_removes_rows():
+    matrix = TfidfJobMatrix.build(JOBS)
+    counts = _profile(skills=["kotlin", "android"])
+    assert matrix.top_k(counts, 3) == []
+
+    later = datetime(2024, 2, 1)
+    matrix.apply_changes([_job("mk", "Android intern", "kotlin apps", updated_at=later)], removals=["py"])
+
+    assert [job_id for _, job_id in matrix.top_k(counts, 3)] == ["mk"]
+    assert "py" not in [job_id for _, job_id in matrix.top_k(_profile(skills=["python"]), 5)]
+    assert len(matrix) == 3 and matrix.delta_size == 1
+    assert matrix.watermark == (later, "mk")
+
+
+def test_top_k_uses_partial_selection_on_large_catalog():
+    rng = random.Random(3)
+    words = [f"w{i}" for i in range(300)]
+    jobs = [_job(i, " ".join(rng.sample(words, 5)), " ".join(rng.sample(words, 20))) for i in range(3000)]
+    matrix = TfidfJobMatrix.build(jobs, batch_size=500)
+    counts = Counter({w: 1 for w in rng.sample(words, 10)})
+
+    hits = matrix.top_k(counts, 25)
+    expected = np.sort(matrix.base.scores(*matrix.profile_vector(counts)))[::-1][:25]
+    assert np.allclose([score for score, _ in hits], expected)
+
+
+class FakeQuery:
+    def __init__(self, db):
+        self.db = db
+        self.after = None
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        for arg in args:
+            if "updated_at" in str(arg):
+                self.after = tuple(bound.value for bound in arg.right.clauses)
+        return self
+
+    def yield_per(self, n):
+        return self
+
+    def __iter__(self):
+        return iter([j for j in self.db.jobs if j.status == "open"])
+
+    def all(self):
+        if self.after is None:
+            return list(self.db.jobs)
+        self.db.reads.append([j for j in self.db.changed if (j.updated_at, j.job_id) > self.after])
+        return self.db.reads[-1]
+
+
+class FakeDB:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.changed = []
+        self.reads = []
+
+    def query(self, *args):
+        return FakeQuery(self)
+
+
+def test_recommender_refresh_applies_delta_then_rebuilds():
+    db = FakeDB(list(JOBS))
+    recommender = JobRecommender(refresh_seconds=60, rebuild_fraction=0.5)
+    assert recommender.matrix() is None  # lookups never build
+    recommender.refresh(db)
+    first = recommender.matrix()
+
+    db.changed = [_job("fe", "Kotlin android intern", updated_at=datetime(2024, 3, 1))]
+    recommender.refresh(db)
+    assert recommender.matrix() is first and first.delta_size == 1
+
+    db.changed = [_job(j.job_id, j.title, status="closed", updated_at=datetime(2024, 3, 2)) for j in JOBS[:3]]
+    db.jobs = [JOBS[3]]
+    recommender.refresh(db)
+    rebuilt = recommender.matrix()
+    assert rebuilt is not first and len(rebuilt) == 1
+
+
+def test_refresh_skips_rows_already_applied():
+    db = FakeDB(list(JOBS))
+    recommender = JobRecommender(refresh_seconds=0, rebuild_fraction=10)
+    recommender.refresh(db)
+    matrix = recommender.matrix()
+    counts = _profile(skills=["campaigns"])
+    assert [job_id for _, job_id in matrix.top_k(counts, 3)] == ["mk"]
+
+    tie = datetime(2024, 3, 1)
+    db.changed = [_job("fe", "Campaigns intern", updated_at=tie), _job("py", "Backend campaigns", updated_at=tie)]
+    recommender.refresh(db)
+    assert sorted(job_id for _, job_id in recommender.matrix().top_k(counts, 3)) == ["fe", "mk", "py"]
+    assert matrix.watermark == (tie, "py") and matrix.delta_size == 2
+
+    # the boundary rows are past the watermark only once
+    recommender.refresh(db)
+    assert len(db.reads) == 2 and db.reads[-1] == []
+
+    later = datetime(2024, 3, 2)
+    db.changed.append(_job("ds", "Kotlin data", status="closed", updated_at=later))
+    recommender.refresh(db)
+    assert len(matrix) == 3 and matrix.watermark == (later, "ds")
+
+
+class Sessions:
+    def __init__(self, db):
+        self.db = db
+        self.opened = 0
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.opened += 1
+        self.release.wait(2)
+        return contextlib.nullcontext(self.db)
+
+
+def test_lookups_do_not_wait_for_the_background_build():
+    sessions = Sessions(FakeDB(list(JOBS)))
+    recommender = JobRecommender(refresh_seconds=0)
+    recommender.start(sessions)
+    try:
+        assert recommender.matrix() is None
+        sessions.release.set()
+        for _ in range(200):
+            if recommender.matrix() is not None:
+                break
+            time.sleep(0.01)
+        assert len(recommender.matrix()) == 4
+
+        # without a periodic refresh the worker waits for a posting change
+        sessions.release.clear()
+        recommender.notify_changed()
+        sessions.release.set()
+        for _ in range(200):
+            if sessions.opened == 2:
+                break
+            time.sleep(0.01)
+        assert sessions.opened == 2
+    finally:
+        recommender.stop()
+    assert recommender._worker is None
@@ -0,0 +1,99 @@
+# tests/search/test_search_backend.py
+
+import contextlib
+import threading
+import types
+from datetime import datetime
+
+from app.search.backend import MemorySearchBackend
+
+
+def _job(job_id, title, updated_at=datetime(2024, 1, 1)):
+    return types.SimpleNamespace(
+        job_id=job_id, title=title, description="", requirements="", skills_required="", updated_at=updated_at
+    )
+
+
+class FakeQuery:
+    def __init__(self, db):
+        self.db = db
+        self.since = None
+
+    def filter(self, *args):
+        # the only filter is the watermark catch-up: updated_at >= :watermark
+        [clause] = args
+        assert ">=" in str(clause)
+        self.since = clause.right.value
+        return self
+
+    def yield_per(self, n):
+        return self
+
+    def __iter__(self):
+        return iter([job for job in self.db.jobs if self.since is None or job.updated_at >= self.since])
+
+
+class FakeDB:
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def query(self, *args):
+        return FakeQuery(self)
+
+
+def test_refresh_catches_up_on_rows_sharing_the_watermark(tmp_path):
+    db = FakeDB([_job("a", "Python intern")])
+    backend = MemorySearchBackend(tmp_path / "index.pkl", refresh_seconds=0, snapshot_every=0)
+    assert backend.search("python") is None  # not loaded yet: callers fall back to Postgres
+    backend.refresh(db)
+    assert [job_id for _, job_id in backend.search("python")] == ["a"]
+
+    # another worker wrote a posting in the same instant as the watermark, and a later one
+    db.jobs += [_job("b", "Python developer"), _job("c", "Python analyst", updated_at=datetime(2024, 1, 2))]
+    backend.refresh(db)
+    assert sorted(job_id for _, job_id in backend.search("python")) == ["a", "b", "c"]
+    # rows already indexed at the watermark are not re-added on every pass
+    assert backend.index().dead_docs == 0
+
+
+def test_snapshot_is_written_by_the_refresh_not_by_writes(tmp_path):
+    path = tmp_path / "index.pkl"
+    db = FakeDB([_job("a", "Python intern")])
+    backend = MemorySearchBackend(path, refresh_seconds=0, snapshot_every=2)
+    backend.refresh(db)
+
+    backend.index_job(_job("b", "Python developer", updated_at=datetime(2024, 1, 2)))
+    backend.index_job(_job("c", "Python analyst", updated_at=datetime(2024, 1, 3)))
+    assert not path.exists()  # the write path only indexes
+    backend.refresh(db)
+    assert path.exists()
+
+    restarted = MemorySearchBackend(path, refresh_seconds=0)
+    restarted.refresh(FakeDB([]))
+    assert sorted(job_id for _, job_id in restarted.search("python")) == ["a", "b", "c"]
+
+
+class Sessions:
+    def __init__(self, db):
+        self.db = db
+        self.opened = 0
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.opened += 1
+        self.release.wait(2)
+        return contextlib.nullcontext(self.db)
+
+
+def test_searches_do_not_wait_for_the_background_load(tmp_path):
+    sessions = Sessions(FakeDB([_job("a", "Python intern")]))
+    backend = MemorySearchBackend(tmp_path / "index.pkl", refresh_seconds=0)
+    backend.start(sessions)
+    try:
+        assert backend.search("python") is None
+        sessions.release.set()
+        backend._worker.join(2)
+        assert not backend._worker.is_alive() and len(backend.search("python")) == 1
+        assert sessions.opened == 1
+    finally:
+        backend.stop()
@@ -0,0 +1,161 @@
+# tests/search/test_similar.py
+
+import contextlib
+import random
+import threading
+import types
+from datetime import datetime
+
+import numpy as np
+
+from app.search.similar import NUM_PERM, LSHIndex, MinHasher, SimilarJobs, band_keys, shingles
+
+
+def _job(job_id, title, description="", skills_required="", status="open", updated_at=datetime(2024, 1, 1)):
+    return types.SimpleNamespace(
+        job_id=job_id, title=title, description=description, skills_required=skills_required,
+        status=status, updated_at=updated_at,
+    )
+
+
+WORDS = [f"w{i}" for i in range(500)]
+
+
+def _text(rng, n=60):
+    return " ".join(rng.choices(WORDS, k=n))
+
+
+def test_shingles_are_adjacent_word_pairs():
+    assert shingles(_job(1, "Python Intern", "build APIs")) == {"python intern", "intern build", "build apis"}
+    assert shingles(_job(2, "Python")) == {"python"}
+    assert shingles(_job(3, "")) == set()
+
+
+def test_signature_agreement_estimates_jaccard():
+    rng = random.Random(5)
+    a = {f"s{i}" for i in range(400)}
+    b = set(rng.sample(sorted(a), 200)) | {f"t{i}" for i in range(100)}
+    jaccard = len(a & b) / len(a | b)
+
+    sigs = MinHasher().signatures([a, b, set()])
+    assert sigs.shape == (3, NUM_PERM)
+    assert abs((sigs[0] == sigs[1]).mean() - jaccard) < 0.12
+    assert (sigs[2] == np.iinfo(np.uint32).max).all()
+
+
+def test_signatures_do_not_depend_on_chunking():
+    rng = random.Random(8)
+    sets = [set(_text(rng).split()) for _ in range(50)]
+    hasher = MinHasher()
+    batched = hasher.signatures(sets)
+    single = np.stack([hasher.signatures([s])[0] for s in sets])
+    assert np.array_equal(batched, single)
+    assert band_keys(batched).shape == (50, NUM_PERM // 4)
+
+
+def test_index_finds_near_duplicate_and_skips_self():
+    rng = random.Random(1)
+    jobs = [_job(i, f"Role {i}", _text(rng)) for i in range(300)]
+    base = jobs[42]
+    copy = _job("copy", base.title, base.description + " apply today")
+    index = LSHIndex()
+    index.upsert(jobs + [copy])
+
+    hits = index.similar(index.signature(base), 3, exclude=base.job_id)
+    assert hits[0][1] == "copy" and hits[0][0] > 0.8
+    assert base.job_id not in [job_id for _, job_id in hits]
+
+
+def test_upsert_replaces_buckets_and_remove_drops_job():
+    rng = random.Random(2)
+    text = _text(rng)
+    index = LSHIndex()
+    index.upsert([_job("a", "Data analyst", text), _job("b", "Data analyst", text)])
+    assert [job_id for _, job_id in index.similar(index.signature(_job("a", "")), 5, exclude="a")] == ["b"]
+
+    later = datetime(2024, 2, 1)
+    index.upsert([_job("b", "Chef", _text(rng), updated_at=later)])
+    assert index.similar(index.signature(_job("a", "")), 5, exclude="a") == []
+    assert index.watermark == later
+
+    index.remove(["b", "missing"])
+    assert len(index) == 1
+    assert all(not bucket or "b" not in set().union(*bucket.values()) for bucket in index._buckets)
+
+
+class FakeQuery:
+    def __init__(self, db):
+        self.db = db
+        self.changed_only = False
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        self.changed_only = any("updated_at" in str(a) for a in args)
+        return self
+
+    def yield_per(self, n):
+        return self
+
+    def __iter__(self):
+        return iter([j for j in self.db.jobs if j.status == "open"])
+
+    def all(self):
+        return list(self.db.changed) if self.changed_only else list(self.db.jobs)
+
+
+class FakeDB:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.changed = []
+
+    def query(self, *args):
+        return FakeQuery(self)
+
+
+def test_similar_jobs_refresh_and_apply():
+    rng = random.Random(4)
+    text = _text(rng)
+    db = FakeDB([_job("a", "Backend intern", text), _job("b", "Designer", _text(rng))])
+    similar = SimilarJobs(refresh_seconds=0)
+    similar.apply(_job("x", "ignored before first build"))
+    assert similar.index() is None
+    similar.refresh(db)
+    index = similar.index()
+    assert len(index) == 2
+
+    db.changed = [_job("c", "Backend intern", text, updated_at=datetime(2024, 3, 1)),
+                  _job("b", "Designer", status="closed", updated_at=datetime(2024, 3, 1))]
+    similar.refresh(db)
+    assert similar.index() is index and len(index) == 2
+    assert [job_id for _, job_id in index.similar(index.signature(_job("a", "")), 5, exclude="a")] == ["c"]
+
+    similar.apply(_job("c", "Backend intern", text, status="closed"))
+    assert len(index) == 1
+
+
+class Sessions:
+    def __init__(self, db):
+        self.db = db
+        self.opened = 0
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.opened += 1
+        self.release.wait(2)
+        return contextlib.nullcontext(self.db)
+
+
+def test_lookups_do_not_wait_for_the_background_build_and_zero_means_build_once():
+    sessions = Sessions(FakeDB([_job("a", "Backend intern", "python apis")]))
+    similar = SimilarJobs(refresh_seconds=0)
+    similar.start(sessions)
+    try:
+        assert similar.index() is None  # build still blocked: lookups return at once
+        sessions.release.set()
+        similar._worker.join(2)
+        assert not similar._worker.is_alive() and len(similar.index()) == 1
+        assert sessions.opened == 1
+    finally:
+        similar.stop()
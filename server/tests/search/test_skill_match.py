@@ -0,0 +1,137 @@
+# tests/search/test_skill_match.py
+
+import random
+import uuid
+
+import numpy as np
+
+from app.search import skill_match
+from app.search.skill_match import SkillMatcher, SkillMatchIndex
+from app.search.skills import normalize_skills, parse_skills_required
+
+
+def test_parse_skills_required_normalizes_and_dedupes():
+    assert parse_skills_required("Python, ReactJS;  node.js |py\nSQL, ,") == ["python", "react", "node.js", "sql"]
+    assert parse_skills_required(None) == []
+    assert normalize_skills(["C++", " Machine   Learning ", "ML", 42, ""]) == ["c++", "machine learning"]
+
+
+def _brute_force(rows, have):
+    scored = []
+    for job_id, ids in rows:
+        ids = set(ids)
+        if not ids:
+            continue
+        matched = len(ids & have)
+        if matched:
+            scored.append((matched / len(ids), str(job_id)))
+    return sorted(scored, reverse=True)
+
+
+def test_top_k_orders_by_score_then_job_id():
+    rows = [
+        ("00000000-0000-0000-0000-000000000001", [1, 5]),      # 1/2
+        ("00000000-0000-0000-0000-000000000002", [1]),         # 1/1
+        ("00000000-0000-0000-0000-000000000003", [1, 3]),      # 1/2
+        ("00000000-0000-0000-0000-000000000004", [3, 4]),      # no match
+        ("00000000-0000-0000-0000-000000000005", []),          # no skills
+        ("00000000-0000-0000-0000-000000000006", [1, 2, 2]),   # duplicate ids count once: 2/2
+    ]
+    matcher = SkillMatcher(rows)
+    assert len(matcher) == 5
+
+    top = matcher.top_k([1, 2], 10)
+    assert [job_id[-1] for _, job_id in top] == ["6", "2", "3", "1"]
+    assert [score for score, _ in top] == [1.0, 1.0, 0.5, 0.5]
+    assert matcher.top_k([99], 10) == []
+
+
+def test_keyset_pages_cover_brute_force_ranking():
+    rng = random.Random(7)
+    rows = [(uuid.UUID(int=rng.getrandbits(128)), rng.sample(range(1, 60), rng.randint(1, 8))) for _ in range(2000)]
+    have = set(rng.sample(range(1, 60), 6))
+    matcher = SkillMatcher(rows)
+
+    pages, after = [], None
+    while True:
+        page = matcher.top_k(have, 37, after=after)
+        if not page:
+            break
+        pages.extend(page)
+        after = page[-1]
+
+    assert pages == _brute_force(rows, have)
+
+
+def test_scores_are_vectorized_counts():
+    matcher = SkillMatcher([("a", [1, 2, 3]), ("b", [3])])
+    matched, score = matcher.scores([3, 2])
+    assert matched.tolist() == [2, 1]
+    assert np.allclose(score, [2 / 3, 1.0])
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *args):
+        return self
+
+    def yield_per(self, n):
+        return iter(self.rows)
+
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def query(self, *cols):
+        self.queries += 1
+        return FakeQuery(self.rows)
+
+
+def test_index_rebuilds_only_when_marked_stale_or_expired(monkeypatch):
+    db = FakeDB([("j1", [1])])
+    index = SkillMatchIndex(max_age_seconds=60)
+
+    first = index.matcher(db)
+    assert index.matcher(db) is first and db.queries == 1
+
+    db.rows = [("j1", [1]), ("j2", [1])]
+    index.mark_stale()
+    assert len(index.matcher(db)) == 2 and db.queries == 2
+
+    now = skill_match.time.monotonic() + 61
+    monkeypatch.setattr(skill_match.time, "monotonic", lambda: now)
+    index.matcher(db)
+    assert db.queries == 3
+
+
+def test_matches_controller_pages_and_reports_matched_skills(monkeypatch):
+    import types
+    from app.controllers import job_listing as ctrl
+
+    job_ids = [uuid.UUID(int=i) for i in range(1, 6)]
+    rows = [(job_ids[0], [1, 2]), (job_ids[1], [1]), (job_ids[2], [2, 3]), (job_ids[3], [3]), (job_ids[4], [1, 3])]
+    index = SkillMatchIndex(max_age_seconds=60)
+    monkeypatch.setattr(index, "matcher", lambda db: SkillMatcher(rows))
+    monkeypatch.setattr(ctrl, "get_skill_match_index", lambda: index)
+    monkeypatch.setattr(ctrl.skill_repo, "get_applicant_skills", lambda db, applicant_id: ["Python", "SQL"])
+    monkeypatch.setattr(ctrl.skill_repo, "get_skill_ids", lambda db, names: {"python": 1, "sql": 2})
+    # job 2 was closed after the matcher was built
+    skills = dict(rows)
+    monkeypatch.setattr(
+        ctrl.repo,
+        "get_open_job_listings_by_ids",
+        lambda db, ids: {i: ({"job_id": i}, skills[i]) for i in ids if i != job_ids[1]},
+    )
+
+    user = types.SimpleNamespace(user_id="a1")
+    items, cursor = ctrl.list_job_matches_controller(None, current_user=user, limit=2)
+    assert [i["job_id"] for i in items] == [job_ids[0]]
+    assert items[0]["score"] == 1.0 and items[0]["matched_skills"] == ["python", "sql"]
+
+    items, cursor = ctrl.list_job_matches_controller(None, current_user=user, limit=2, cursor=cursor)
+    assert [(i["job_id"], i["score"]) for i in items] == [(job_ids[4], 0.5), (job_ids[2], 0.5)]
+    assert cursor is None
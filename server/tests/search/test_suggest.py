@@ -0,0 +1,205 @@
+# tests/search/test_suggest.py
+
+import random
+import types
+import uuid
+from datetime import datetime
+
+import app.search.suggest as suggest
+from app.search.suggest import FULL_DEPTH, SuggestTrie, Suggester, indexed_strings
+
+ACME, GLOBEX = uuid.UUID(int=1), uuid.UUID(int=2)
+
+
+def _job(job_id, title, location="Pune", skills_required="", company_id=ACME, status="open",
+         updated_at=datetime(2024, 1, 1)):
+    return types.SimpleNamespace(
+        job_id=job_id, company_id=company_id, title=title, location=location,
+        skills_required=skills_required, status=status, updated_at=updated_at,
+    )
+
+
+def _company(company_id, name, updated_at=datetime(2024, 1, 1)):
+    return types.SimpleNamespace(company_id=company_id, name=name, updated_at=updated_at)
+
+
+def _texts(hits):
+    return [text for text, _, _ in hits]
+
+
+def test_indexed_strings_cover_word_starts():
+    assert indexed_strings("senior backend developer") == {"senior backend developer", "backend developer", "developer"}
+    assert len(indexed_strings("a b c d e f")) == 4
+
+
+def test_trie_ranks_by_weight_and_matches_inner_words():
+    trie = SuggestTrie()
+    trie.apply(
+        {("title", "backend developer"): 5, ("title", "backend intern"): 2, ("skill", "django"): 7},
+        {("title", "backend developer"): "Backend Developer"},
+    )
+    assert trie.suggest("back") == [("Backend Developer", "title", 5), ("backend intern", "title", 2)]
+    assert _texts(trie.suggest("d")) == ["django", "Backend Developer"]
+    assert _texts(trie.suggest("  DEV")) == ["Backend Developer"]
+    assert trie.suggest("x") == []
+
+
+def test_trie_updates_drop_entries_and_prune_nodes():
+    trie = SuggestTrie()
+    trie.apply({("title", "data analyst"): 2, ("title", "data engineer"): 1})
+    trie.apply({("title", "data engineer"): 3, ("title", "data analyst"): -2})
+    assert trie.suggest("data") == [("data engineer", "title", 4)]
+    assert "a" not in trie._root.children  # "analyst" subtree removed with its last entry
+    trie.apply({("title", "data engineer"): -4})
+    assert len(trie) == 0 and trie._root.top == () and trie._root.children == {}
+
+
+def test_prefix_longer_than_full_depth_scans_leaf_bucket():
+    trie = SuggestTrie()
+    long_a = "software engineering intern"
+    long_b = "software engineering manager"
+    trie.apply({("title", long_a): 1, ("title", long_b): 3})
+    assert len("software engineering") > FULL_DEPTH
+    assert _texts(trie.suggest("software engineering")) == [long_b, long_a]
+    assert _texts(trie.suggest("software engineering i")) == [long_a]
+    assert trie.suggest("software engineering x") == []
+
+
+def _brute_force(weights, prefix, k):
+    expected = sorted(
+        (-w, kind, key) for (kind, key), w in weights.items()
+        if w > 0 and any(s.startswith(prefix) for s in indexed_strings(key))
+    )[:k]
+    return [(key, kind, -neg) for neg, kind, key in expected]
+
+
+def test_cached_lists_match_brute_force():
+    rng = random.Random(3)
+    words = ["data", "dev", "design", "devops", "django", "docker", "backend", "frontend", "intern", "lead"]
+    weights = {}
+    trie = SuggestTrie(top_k=5)
+    for _ in range(30):
+        batch = {}
+        for _ in range(10):
+            entry = ("title", " ".join(rng.sample(words, rng.randint(1, 3))))
+            delta = rng.randint(-2, 3)
+            if weights.get(entry, 0) + batch.get(entry, 0) + delta < 0:
+                continue
+            batch[entry] = batch.get(entry, 0) + delta
+        for entry, delta in batch.items():
+            weights[entry] = weights.get(entry, 0) + delta
+        trie.apply(batch)
+
+    for prefix in ["d", "de", "dev", "b", "intern", "lead d", "z", "frontend devops", "backend data d"]:
+        assert trie.suggest(prefix, 5) == _brute_force(weights, prefix, 5)
+
+
+def test_crowded_leaves_burst_and_stay_consistent(monkeypatch):
+    monkeypatch.setattr(suggest, "BUCKET_SIZE", 4)
+    rng = random.Random(9)
+    teams = ["alpha", "alps", "alto", "beta", "bet", "gamma", "gam", "delta"]
+    weights = {}
+    trie = SuggestTrie(top_k=3)
+    for _ in range(40):
+        batch = {}
+        for _ in range(6):
+            entry = ("title", f"senior platform engineer {rng.choice(teams)} {rng.choice(teams)}")
+            delta = rng.randint(-1, 2)
+            if weights.get(entry, 0) + batch.get(entry, 0) + delta < 0:
+                continue
+            batch[entry] = batch.get(entry, 0) + delta
+        for entry, delta in batch.items():
+            weights[entry] = weights.get(entry, 0) + delta
+        trie.apply(batch)
+
+    node = trie._root
+    for ch in "senior platform":
+        node = node.children[ch]
+    assert node.children  # grew past FULL_DEPTH instead of holding every string in one leaf
+    for prefix in ["senior platform engineer al", "senior platform engineer alp", "engineer gam",
+                   "platform engineer beta b", "senior platform engineer delta delta", "alto"]:
+        assert trie.suggest(prefix, 3) == _brute_force(weights, prefix, 3)
+
+
+class FakeQuery:
+    def __init__(self, rows, changed):
+        self.rows, self.changed = rows, changed
+        self.changed_only = False
+        self.on_read = None
+
+    def options(self, *args):
+        return self
+
+    def filter(self, *args):
+        self.changed_only = any("updated_at" in str(a) for a in args)
+        return self
+
+    def yield_per(self, n):
+        return iter([r for r in self.rows if getattr(r, "status", "open") == "open"])
+
+    def all(self):
+        if self.changed_only and self.on_read is not None:
+            self.on_read()
+        return list(self.changed if self.changed_only else self.rows)
+
+
+class FakeDB:
+    def __init__(self, jobs, companies):
+        self.jobs, self.companies = jobs, companies
+        self.changed_jobs, self.changed_companies = [], []
+        self.on_read = None
+
+    def query(self, model):
+        if model.__name__ == "JobPosting":
+            query = FakeQuery(self.jobs, self.changed_jobs)
+            query.on_read = self.on_read
+            return query
+        return FakeQuery(self.companies, self.changed_companies)
+
+
+def test_suggester_build_refresh_and_local_writes():
+    db = FakeDB(
+        [
+            _job(1, "Backend Intern", skills_required="Python, SQL"),
+            _job(2, "Backend Developer", location="Mumbai", skills_required="python", company_id=GLOBEX),
+        ],
+        [_company(ACME, "Acme"), _company(GLOBEX, "Globex")],
+    )
+    suggester = Suggester(refresh_seconds=60)
+    assert suggester.suggest("b") == []  # nothing before the first build
+    suggester.refresh(db)
+
+    assert suggester.suggest("py") == [("python", "skill", 2)]
+    assert suggester.suggest("acme") == [("Acme", "company", 2)]
+    assert _texts(suggester.suggest("backend")) == ["Backend Developer", "Backend Intern"]
+
+    # another worker closed a posting and renamed a company
+    db.changed_jobs = [_job(2, "Backend Developer", location="Mumbai", status="closed", company_id=GLOBEX)]
+    db.changed_companies = [_company(GLOBEX, "Initech", updated_at=datetime(2024, 2, 1))]
+    suggester.refresh(db)
+    assert suggester.suggest("py") == [("python", "skill", 1)]
+    assert suggester.suggest("mum") == [] and suggester.suggest("glo") == []
+    assert suggester.suggest("init") == [("Initech", "company", 1)]
+
+    # a write in this process, moving the posting to another company
+    suggester.apply_jobs([_job(1, "Backend Intern", skills_required="Python, Go", company_id=GLOBEX)])
+    assert suggester.suggest("go") == [("go", "skill", 1)] and suggester.suggest("sql") == []
+    assert suggester.suggest("acme") == [("Acme", "company", 1)]
+    assert suggester.suggest("init") == [("Initech", "company", 2)]
+
+
+def test_refresh_reads_without_the_lock_and_keeps_newer_local_writes():
+    db = FakeDB([_job(1, "Backend Intern", skills_required="Python")], [_company(ACME, "Acme")])
+    suggester = Suggester(refresh_seconds=60)
+    suggester.refresh(db)
+
+    def local_write():
+        # a request applying its own write while the worker's delta query runs
+        assert not suggester._lock.locked()
+        suggester.apply_jobs([_job(1, "Backend Intern", skills_required="Go", updated_at=datetime(2024, 3, 2))])
+
+    db.on_read = local_write
+    db.changed_jobs = [_job(1, "Backend Intern", skills_required="Rust", updated_at=datetime(2024, 3, 1))]
+    suggester.refresh(db)
+    assert suggester.suggest("go") == [("go", "skill", 1)]
+    assert suggester.suggest("rust") == [] and suggester.suggest("py") == []